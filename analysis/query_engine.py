@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -28,6 +30,12 @@ ORB_TIMES: Tuple[str, ...] = ("0900", "1000", "1100", "1800", "2300", "0030")
 OUTCOME_OPTIONS: Tuple[str, ...] = ("WIN", "LOSS", "NO_TRADE")
 BREAK_DIR_OPTIONS: Tuple[str, ...] = ("ANY", "UP", "DOWN")
 
+# Base tables whose changes invalidate cached frames (see db_fingerprint)
+SOURCE_TABLES: Tuple[str, ...] = ("daily_features_v2", "orb_daily", "orb_trades_1m_exec")
+# Change markers bumped by the feature builders (build_daily_features_v2.bump_source_version)
+SOURCE_VERSIONS_TABLE = "source_versions"
+CACHE_SIZE = 32
+
 
 @dataclass(frozen=True)
 class Filters:
@@ -390,15 +398,46 @@ def _sanitize(df: pd.DataFrame) -> pd.DataFrame:
     return df.replace([np.inf, -np.inf], np.nan).where(pd.notnull(df), None)
 
 
+def _existing_tables(con: duckdb.DuckDBPyConnection) -> set:
+    """Tables and views visible on this connection."""
+    return {row[0] for row in con.execute("SELECT table_name FROM information_schema.tables").fetchall()}
+
+
 def _fetch_base_frame(con: duckdb.DuckDBPyConnection, filters: Filters) -> pd.DataFrame:
-    """Base frame with ORB prices and optional close confirmations."""
+    """Base frame with ORB prices (from orb_daily) and live close confirmations."""
     where_sql, params = _build_where_clause(filters, include_outcome_filter=True, trades_only=False, table_alias="v")
-    sql = f"""
+    tables = _existing_tables(con)
+
+    if "orb_daily" in tables:
+        orb_cols = "od.high AS orb_high, od.low AS orb_low, od.size AS orb_size"
+        orb_join = """
+    LEFT JOIN orb_daily od
+      ON od.instrument = v.instrument AND od.orb_time = v.orb_time AND od.date_local = v.date_local"""
+    else:
+        # Database built before orb_daily existed: pivot the wide ORB columns
+        def pick(field: str) -> str:
+            branches = " ".join(f"WHEN '{orb}' THEN df.orb_{orb}_{field}" for orb in ORB_TIMES)
+            return f"CASE v.orb_time {branches} END AS orb_{field}"
+
+        orb_cols = ", ".join(pick(field) for field in ("high", "low", "size"))
+        orb_join = ""
+
+    # orb_trades_1m_exec is written outside the feature pipeline: aggregate it per query
+    if "orb_trades_1m_exec" in tables:
+        execs_cte = """
     WITH execs AS (
       SELECT date_local, orb AS orb_time, MAX(close_confirmations) AS close_confirmations
       FROM orb_trades_1m_exec
       GROUP BY date_local, orb
-    )
+    )"""
+        confirmations = "ex.close_confirmations"
+        execs_join = """
+    LEFT JOIN execs ex
+      ON ex.date_local = v.date_local AND ex.orb_time = v.orb_time"""
+    else:
+        execs_cte, confirmations, execs_join = "", "NULL AS close_confirmations", ""
+
+    sql = f"""{execs_cte}
     SELECT
       v.date_local,
       v.instrument,
@@ -413,89 +452,14 @@ def _fetch_base_frame(con: duckdb.DuckDBPyConnection, filters: Filters) -> pd.Da
       df.london_range,
       df.pre_ny_range,
       df.atr_20,
-      CASE v.orb_time
-        WHEN '0900' THEN df.orb_0900_high
-        WHEN '1000' THEN df.orb_1000_high
-        WHEN '1100' THEN df.orb_1100_high
-        WHEN '1800' THEN df.orb_1800_high
-        WHEN '2300' THEN df.orb_2300_high
-        WHEN '0030' THEN df.orb_0030_high
-      END AS orb_high,
-      CASE v.orb_time
-        WHEN '0900' THEN df.orb_0900_low
-        WHEN '1000' THEN df.orb_1000_low
-        WHEN '1100' THEN df.orb_1100_low
-        WHEN '1800' THEN df.orb_1800_low
-        WHEN '2300' THEN df.orb_2300_low
-        WHEN '0030' THEN df.orb_0030_low
-      END AS orb_low,
-      CASE v.orb_time
-        WHEN '0900' THEN df.orb_0900_size
-        WHEN '1000' THEN df.orb_1000_size
-        WHEN '1100' THEN df.orb_1100_size
-        WHEN '1800' THEN df.orb_1800_size
-        WHEN '2300' THEN df.orb_2300_size
-        WHEN '0030' THEN df.orb_0030_size
-      END AS orb_size,
-      ex.close_confirmations
+      {orb_cols},
+      {confirmations}
     FROM v_orb_trades v
     JOIN daily_features_v2 df
-      ON df.date_local = v.date_local AND df.instrument = v.instrument
-    LEFT JOIN execs ex
-      ON ex.date_local = v.date_local AND ex.orb_time = v.orb_time
+      ON df.date_local = v.date_local AND df.instrument = v.instrument{orb_join}{execs_join}
     {where_sql}
     """
-    try:
-        df = con.execute(sql, params).fetchdf()
-    except duckdb.Error:
-        # Fallback if execs table missing
-        sql_no_exec = f"""
-        SELECT
-          v.date_local,
-          v.instrument,
-          v.orb_time,
-          v.break_dir,
-          v.outcome,
-          v.r_multiple,
-          df.asia_type_code,
-          df.london_type_code,
-          df.pre_ny_type_code,
-          df.asia_range,
-          df.london_range,
-          df.pre_ny_range,
-          df.atr_20,
-          CASE v.orb_time
-            WHEN '0900' THEN df.orb_0900_high
-            WHEN '1000' THEN df.orb_1000_high
-            WHEN '1100' THEN df.orb_1100_high
-            WHEN '1800' THEN df.orb_1800_high
-            WHEN '2300' THEN df.orb_2300_high
-            WHEN '0030' THEN df.orb_0030_high
-          END AS orb_high,
-          CASE v.orb_time
-            WHEN '0900' THEN df.orb_0900_low
-            WHEN '1000' THEN df.orb_1000_low
-            WHEN '1100' THEN df.orb_1100_low
-            WHEN '1800' THEN df.orb_1800_low
-            WHEN '2300' THEN df.orb_2300_low
-            WHEN '0030' THEN df.orb_0030_low
-          END AS orb_low,
-          CASE v.orb_time
-            WHEN '0900' THEN df.orb_0900_size
-            WHEN '1000' THEN df.orb_1000_size
-            WHEN '1100' THEN df.orb_1100_size
-            WHEN '1800' THEN df.orb_1800_size
-            WHEN '2300' THEN df.orb_2300_size
-            WHEN '0030' THEN df.orb_0030_size
-          END AS orb_size,
-          NULL AS close_confirmations
-        FROM v_orb_trades v
-        JOIN daily_features_v2 df
-          ON df.date_local = v.date_local AND df.instrument = v.instrument
-        {where_sql}
-        """
-        df = con.execute(sql_no_exec, params).fetchdf()
-    return df
+    return con.execute(sql, params).fetchdf()
 
 
 def _required_closes(strategy: StrategyConfig) -> int:
@@ -538,36 +502,114 @@ def _apply_strategy(df: pd.DataFrame, strategy: StrategyConfig) -> pd.DataFrame:
     frame["retest_hit"] = np.where(frame["break_occurred"], True, False)
     frame["rejection_hit"] = np.where(frame["break_occurred"], True, False)
 
-    def _fail_reason(row: pd.Series) -> Optional[str]:
-        if not row.get("break_occurred", False):
-            return "no_break"
-        if not row.get("confirm_pass", False):
-            return "confirm_not_met"
-        if strategy.retest_required and not row.get("retest_hit", False):
-            return "retest_not_met"
-        if strategy.retest_required and strategy.entry_model == "break_retest_reject" and not row.get(
-            "rejection_hit", False
-        ):
-            return "rejection_not_met"
-        if (
-            strategy.max_stop_ticks is not None
-            and row.get("stop_ticks") is not None
-            and pd.notnull(row.get("stop_ticks"))
-            and row.get("stop_ticks") > strategy.max_stop_ticks
-        ):
-            return "stop_too_large"
-        return None
-
-    frame["filtered_out_reason"] = frame.apply(_fail_reason, axis=1)
+    # First failing check wins, in this order
+    no_rows = np.zeros(len(frame), dtype=bool)
+    stop_ticks = pd.to_numeric(frame["stop_ticks"], errors="coerce")
+    reasons = {
+        "no_break": ~frame["break_occurred"].to_numpy(dtype=bool),
+        "confirm_not_met": ~frame["confirm_pass"].to_numpy(dtype=bool),
+        "retest_not_met": ~frame["retest_hit"].to_numpy(dtype=bool) if strategy.retest_required else no_rows,
+        "rejection_not_met": (
+            ~frame["rejection_hit"].to_numpy(dtype=bool)
+            if strategy.retest_required and strategy.entry_model == "break_retest_reject"
+            else no_rows
+        ),
+        "stop_too_large": (
+            (stop_ticks > strategy.max_stop_ticks).to_numpy(dtype=bool)
+            if strategy.max_stop_ticks is not None
+            else no_rows
+        ),
+    }
+    frame["filtered_out_reason"] = np.select(list(reasons.values()), list(reasons), default=None)
     frame["eligible_trade"] = frame["filtered_out_reason"].isnull() & frame["outcome"].isin(["WIN", "LOSS"])
     return frame
 
 
+class _LRUCache:
+    """Small thread-safe LRU of DataFrames (Streamlit sessions share the module)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[Any, ...], pd.DataFrame]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[pd.DataFrame]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple[Any, ...], value: pd.DataFrame) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_base_cache = _LRUCache(CACHE_SIZE)
+_strategy_cache = _LRUCache(CACHE_SIZE)
+
+
+def clear_cache() -> None:
+    """Drop every cached base/strategy frame (e.g. after rewriting rows in place)."""
+    _base_cache.clear()
+    _strategy_cache.clear()
+
+
+def db_fingerprint(con: duckdb.DuckDBPyConnection) -> Tuple[Any, ...]:
+    """
+    Database identity plus the source_versions markers and SOURCE_TABLES row counts.
+
+    Builders bump source_versions on every write, which catches days rebuilt
+    in place; the row counts catch appends from writers that do not bump it.
+    Both are metadata-sized reads, so the fingerprint stays cheap on large DBs.
+    """
+    path = con.execute(
+        "SELECT path FROM duckdb_databases() WHERE database_name = current_database()"
+    ).fetchone()
+    marks: List[Any] = [path[0] if path and path[0] else f"memory:{id(con)}"]
+    try:
+        marks.append(tuple(con.execute(
+            f"SELECT source, version FROM {SOURCE_VERSIONS_TABLE} ORDER BY source"
+        ).fetchall()))
+    except duckdb.Error:
+        marks.append(None)
+    for table in SOURCE_TABLES:
+        try:
+            marks.append(con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+        except duckdb.Error:
+            marks.append(None)
+    return tuple(marks)
+
+
 def strategy_dataset(con: duckdb.DuckDBPyConnection, filters: Filters, strategy: StrategyConfig) -> pd.DataFrame:
-    """Return strategy-aware dataset."""
-    base = _fetch_base_frame(con, filters)
-    df = _apply_strategy(base, strategy)
-    return df
+    """
+    Return strategy-aware dataset.
+
+    Memoized on (db_fingerprint, filters_key, strategy_key): the dashboard
+    panels of one render share one base query, and strategy toggles reuse
+    the base frame for the same filters.
+    """
+    fingerprint = db_fingerprint(con)
+    f_key = filters_key(filters)
+    key = (fingerprint, f_key, strategy_key(strategy))
+
+    df = _strategy_cache.get(key)
+    if df is None:
+        base = _base_cache.get((fingerprint, f_key))
+        if base is None:
+            base = _fetch_base_frame(con, filters)
+            _base_cache.put((fingerprint, f_key), base)
+        df = _apply_strategy(base, strategy)
+        _strategy_cache.put(key, df)
+    # Callers may modify their frame; the cached one stays intact
+    return df.copy()
 
 
 def headline_stats(con: duckdb.DuckDBPyConnection, filters: Filters) -> Dict[str, Any]:
@@ -1,4 +1,34 @@
+"""
+ProjectX API client - one pooled session shared by the live loader and backfills
+
+- One keep-alive httpx.Client per (base_url, username, live): TCP/TLS handshakes
+  are paid once per process, not once per request. HTTP/2 is used when
+  PROJECTX_HTTP2=true and the optional `h2` package is installed.
+- Auth token cached on disk (PROJECTX_TOKEN_CACHE, default
+  ~/.cache/projectx/token.json) with its expiry; it is refreshed via
+  Auth/validate shortly before expiry and only re-logged-in when that fails
+  or a request comes back 401.
+- Active-contract lookups cached per trading day (09:00 -> 09:00 Brisbane),
+  so rolls are picked up at the day boundary.
+
+Usage:
+    client = get_client()                       # shared, from .env settings
+    contract = client.active_contract("MGC")    # {"id": ..., "name": ..., ...}
+    bars = client.retrieve_bars(contract["id"], start_iso_z, end_iso_z)
+"""
+
+import asyncio
+import base64
+import json
+import logging
 import os
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
 import httpx
 from dotenv import load_dotenv
 
@@ -8,64 +38,308 @@ BASE_URL = os.getenv("PROJECTX_BASE_URL")
 USERNAME = os.getenv("PROJECTX_USERNAME")
 API_KEY = os.getenv("PROJECTX_API_KEY")
 LIVE = os.getenv("PROJECTX_LIVE", "false").lower() == "true"
+HTTP2 = os.getenv("PROJECTX_HTTP2", "false").lower() == "true"
+TOKEN_CACHE_PATH = Path(os.getenv("PROJECTX_TOKEN_CACHE", str(Path.home() / ".cache" / "projectx" / "token.json")))
+
+TOKEN_TTL_SECONDS = 23 * 3600       # Fallback when the token carries no exp claim
+TOKEN_REFRESH_MARGIN_SECONDS = 600  # Refresh this long before expiry
+
+TZ_LOCAL = ZoneInfo("Australia/Brisbane")
+TRADING_DAY_START_HOUR = 9
+
+logger = logging.getLogger(__name__)
+
+_CLIENTS: Dict[Tuple[str, str, bool], "ProjectXClient"] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _token_expiry(token: str) -> float:
+    """Epoch seconds from the JWT exp claim, else now + TOKEN_TTL_SECONDS."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except Exception:
+        return time.time() + TOKEN_TTL_SECONDS
+
+
+def _trading_day(now: Optional[datetime] = None) -> str:
+    """Trading day (09:00 -> 09:00 local) as YYYY-MM-DD."""
+    local = (now or datetime.now(TZ_LOCAL)).astimezone(TZ_LOCAL)
+    return (local - timedelta(hours=TRADING_DAY_START_HOUR)).date().isoformat()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
 
 
 class ProjectXClient:
-    def __init__(self):
-        self.token = None
-        self.headers = {"Accept": "text/plain"}
-
-    def login(self):
-        url = f"{BASE_URL}/api/Auth/loginKey"
-        payload = {
-            "userName": USERNAME,
-            "apiKey": API_KEY,
-        }
+    """
+    Thread-safe ProjectX session: pooled HTTP, cached token, cached contracts.
 
-        with httpx.Client() as client:
-            r = client.post(url, json=payload, headers=self.headers)
-            r.raise_for_status()
-            data = r.json()
+    Prefer get_client() so every caller in the process shares one instance.
+    """
 
-        if not data.get("success"):
-            raise RuntimeError(f"Login failed: {data}")
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        username: Optional[str] = None,
+        api_key: Optional[str] = None,
+        live: Optional[bool] = None,
+        http2: Optional[bool] = None,
+        token_cache_path: Optional[Path] = TOKEN_CACHE_PATH,
+        timeout: float = 30.0,
+    ):
+        self.base_url = (base_url or BASE_URL or "").rstrip("/")
+        self.username = username or USERNAME
+        self.api_key = api_key or API_KEY
+        self.live = LIVE if live is None else live
+        self.token_cache_path = Path(token_cache_path) if token_cache_path else None
 
-        self.token = data["token"]
-        self.headers["Authorization"] = f"Bearer {self.token}"
+        use_http2 = HTTP2 if http2 is None else http2
+        if use_http2 and not _http2_available():
+            logger.warning("PROJECTX_HTTP2 requested but 'h2' is not installed - using HTTP/1.1")
+            use_http2 = False
 
-    def get_active_mgc_contract_info(self):
-        url = f"{BASE_URL}/api/Contract/search"
-        payload = {"searchText": "MGC", "live": LIVE}
+        self._http = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            http2=use_http2,
+            headers={"Accept": "text/plain", "Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=120.0),
+        )
+        self._lock = threading.RLock()
+        self.token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._contracts: Dict[Tuple[str, bool, str], Dict[str, Any]] = {}
 
-        with httpx.Client() as client:
-            r = client.post(url, json=payload, headers=self.headers)
-            r.raise_for_status()
-            data = r.json()
+    # ------------------------------------------------------------------
+    # Auth
+    # ------------------------------------------------------------------
 
-        contracts = data.get("contracts", [])
-        active = [c for c in contracts if c.get("activeContract")]
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Auth header for the current token (empty before login)."""
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+    def login(self, force: bool = False) -> str:
+        """
+        Valid token: memory -> disk cache -> Auth/validate refresh -> Auth/loginKey.
+
+        Args:
+            force: Skip caches and refresh (used after a 401)
+        """
+        with self._lock:
+            now = time.time()
+            if not force:
+                if self.token and now < self._token_expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
+                    return self.token
+                self._load_cached_token()
+                if self.token and time.time() < self._token_expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
+                    return self.token
+
+            # Near expiry (still valid): try a cheap validate/refresh first
+            if not force and self.token and now < self._token_expires_at:
+                try:
+                    data = self._raw_post("/api/Auth/validate", {}, auth=True)
+                    if data.get("success") and data.get("newToken"):
+                        self._set_token(data["newToken"])
+                        return self.token
+                except httpx.HTTPError as e:
+                    logger.info(f"ProjectX token refresh failed ({e}); logging in again")
+
+            data = self._raw_post("/api/Auth/loginKey", {"userName": self.username, "apiKey": self.api_key}, auth=False)
+            if not data.get("success"):
+                raise RuntimeError(f"ProjectX login failed: {data}")
+            self._set_token(data["token"])
+            logger.info("ProjectX authentication successful")
+            return self.token
+
+    def _set_token(self, token: str):
+        self.token = token
+        self._token_expires_at = _token_expiry(token)
+        self._save_cached_token()
+
+    def _cache_key(self) -> str:
+        return f"{self.base_url}|{self.username}"
 
+    def _load_cached_token(self):
+        if not self.token_cache_path or not self.token_cache_path.exists():
+            return
+        try:
+            entry = json.loads(self.token_cache_path.read_text()).get(self._cache_key())
+        except (OSError, ValueError):
+            return
+        if entry and entry.get("expires_at", 0) > time.time():
+            self.token = entry["token"]
+            self._token_expires_at = float(entry["expires_at"])
+
+    def _save_cached_token(self):
+        if not self.token_cache_path:
+            return
+        try:
+            self.token_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache = {}
+            if self.token_cache_path.exists():
+                try:
+                    cache = json.loads(self.token_cache_path.read_text())
+                except ValueError:
+                    cache = {}
+            cache[self._cache_key()] = {"token": self.token, "expires_at": self._token_expires_at}
+            tmp = self.token_cache_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(cache))
+            os.chmod(tmp, 0o600)
+            tmp.replace(self.token_cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write ProjectX token cache: {e}")
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _raw_post(self, path: str, payload: Dict[str, Any], auth: bool = True, timeout: Optional[float] = None) -> Dict[str, Any]:
+        kwargs = {"json": payload, "headers": self.headers if auth else {}}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        r = self._http.post(path, **kwargs)
+        r.raise_for_status()
+        return r.json()
+
+    def post(self, path: str, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Authenticated POST on the pooled connection; one forced re-login on 401."""
+        self.login()
+        try:
+            return self._raw_post(path, payload, timeout=timeout)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 401:
+                raise
+            self.login(force=True)
+            return self._raw_post(path, payload, timeout=timeout)
+
+    def close(self):
+        self._http.close()
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
+    def contract_search(self, search_text: str, live: Optional[bool] = None) -> Dict[str, Any]:
+        data = self.post("/api/Contract/search", {"searchText": search_text, "live": self.live if live is None else live})
+        if not data.get("success", True):
+            raise RuntimeError(f"Contract search failed: {data}")
+        return data
+
+    def list_available_contracts(self) -> Dict[str, Any]:
+        data = self.post("/api/Contract/available", {"live": self.live})
+        if not data.get("success"):
+            raise RuntimeError(f"Contract available failed: {data}")
+        return data
+
+    def active_contract(self, symbol: str, live: Optional[bool] = None) -> Dict[str, Any]:
+        """Active contract for symbol, looked up once per trading day."""
+        live = self.live if live is None else live
+        key = (symbol, live, _trading_day())
+        with self._lock:
+            if key in self._contracts:
+                return self._contracts[key]
+
+        contracts = self.contract_search(symbol, live).get("contracts", [])
+        active = [c for c in contracts if c.get("activeContract")]
         if not active:
-            raise RuntimeError("No active MGC contract found")
+            raise RuntimeError(f"No active {symbol} contract found")
 
-        c = active[0]
-        return {"contract_id": c["id"], "source_symbol": c.get("name")}
+        with self._lock:
+            # Drop earlier days for this symbol, keep today's
+            for old in [k for k in self._contracts if k[:2] == key[:2]]:
+                del self._contracts[old]
+            self._contracts[key] = active[0]
+        return active[0]
 
+    def retrieve_bars(
+        self,
+        contract_id: str,
+        start_iso_z: str,
+        end_iso_z: str,
+        unit: int = 2,          # 2 = minute
+        unit_number: int = 1,   # 1-minute
+        limit: int = 20000,
+        include_partial: bool = False,
+        live: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        payload = self._bars_payload(contract_id, start_iso_z, end_iso_z, unit, unit_number, limit, include_partial, live)
+        data = self.post("/api/History/retrieveBars", payload, timeout=60.0)
+        if not data.get("success"):
+            raise RuntimeError(f"retrieveBars failed: {data}")
+        return data.get("bars") or []
 
-    def retrieve_1m_bars(self, contract_id, start_utc, end_utc):
-        url = f"{BASE_URL}/api/History/retrieveBars"
-        payload = {
+    async def retrieve_bars_async(
+        self,
+        http: httpx.AsyncClient,
+        contract_id: str,
+        start_iso_z: str,
+        end_iso_z: str,
+        limit: int = 20000,
+        include_partial: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        retrieve_bars() on a caller-owned AsyncClient (one per event loop).
+
+        Shares this client's token; a 401 forces one re-login off the loop.
+        """
+        payload = self._bars_payload(contract_id, start_iso_z, end_iso_z, 2, 1, limit, include_partial, None)
+        token = await asyncio.to_thread(self.login)
+        for attempt in range(2):
+            r = await http.post(
+                "/api/History/retrieveBars", json=payload,
+                headers={"Authorization": f"Bearer {token}"}, timeout=60.0,
+            )
+            if r.status_code == 401 and attempt == 0:
+                token = await asyncio.to_thread(self.login, True)
+                continue
+            r.raise_for_status()
+            break
+        data = r.json()
+        if not data.get("success"):
+            raise RuntimeError(f"retrieveBars failed: {data}")
+        return data.get("bars") or []
+
+    def _bars_payload(self, contract_id, start_iso_z, end_iso_z, unit, unit_number, limit, include_partial, live) -> Dict[str, Any]:
+        return {
             "contractId": contract_id,
-            "live": LIVE,
-            "startTime": start_utc,
-            "endTime": end_utc,
-            "unit": 2,
-            "unitNumber": 1,
-            "limit": 20000,
-            "includePartialBar": False,
+            "live": self.live if live is None else live,
+            "startTime": start_iso_z,
+            "endTime": end_iso_z,
+            "unit": unit,
+            "unitNumber": unit_number,
+            "limit": limit,
+            "includePartialBar": include_partial,
         }
 
-        with httpx.Client() as client:
-            r = client.post(url, json=payload, headers=self.headers)
-            r.raise_for_status()
-            return r.json()["bars"]
+    # Backwards-compatible helpers
+    def get_active_mgc_contract_info(self):
+        c = self.active_contract("MGC")
+        return {"contract_id": c["id"], "source_symbol": c.get("name")}
+
+    def retrieve_1m_bars(self, contract_id, start_utc, end_utc):
+        return self.retrieve_bars(contract_id, start_utc, end_utc)
+
+
+def get_client(
+    base_url: Optional[str] = None,
+    username: Optional[str] = None,
+    api_key: Optional[str] = None,
+    live: Optional[bool] = None,
+) -> ProjectXClient:
+    """Process-wide client per (base_url, username, live); created on first use."""
+    base_url = (base_url or BASE_URL or "").rstrip("/")
+    username = username or USERNAME
+    live = LIVE if live is None else live
+    key = (base_url, username or "", live)
+    with _CLIENTS_LOCK:
+        if key not in _CLIENTS:
+            _CLIENTS[key] = ProjectXClient(base_url, username, api_key, live)
+        return _CLIENTS[key]
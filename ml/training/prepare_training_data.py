@@ -1,9 +1,10 @@
 """
-Prepare training data from daily_features_v2 table.
+Prepare training data from the orb_daily and daily_features_v2 tables.
 
 This script:
-1. Loads all data from gold.db → daily_features_v2
-2. Transforms from wide format (1 row per day) to long format (1 row per ORB)
+1. Loads ORB-level rows from gold.db → orb_daily (1 row per ORB) joined to
+   daily_features_v2 for the day's session context
+2. Adds engineered features
 3. Filters out rows with missing targets (no break_dir or r_multiple)
 4. Saves as Parquet for fast ML training
 
@@ -33,103 +34,63 @@ OUTPUT_FILE = OUTPUT_DIR / "historical_features.parquet"
 ORB_TIMES = ["0900", "1000", "1100", "1800", "2300", "0030"]
 
 
-def load_daily_features(conn):
-    """Load all data from daily_features_v2 table."""
-    logger.info("Loading daily_features_v2 from database...")
-
-    query = """
-    SELECT *
-    FROM daily_features_v2
-    ORDER BY date_local ASC
-    """
-
-    df = conn.execute(query).fetchdf()
-    logger.info(f"Loaded {len(df)} days of data")
-    logger.info(f"Date range: {df['date_local'].min()} to {df['date_local'].max()}")
-    logger.info(f"Instruments: {df['instrument'].unique().tolist()}")
-
-    return df
+# Session each ORB opens in
+SESSION_CONTEXT = {
+    '0900': 'ASIA', '1000': 'ASIA', '1100': 'ASIA',
+    '1800': 'LONDON', '2300': 'LONDON', '0030': 'NY'
+}
 
 
-def transform_to_orb_rows(df):
+def load_orb_rows(conn):
     """
-    Transform from wide format (1 row per day) to long format (1 row per ORB).
+    Load one row per ORB: orb_daily joined to its day's daily_features_v2 context.
+
+    orb_daily is the long-format table maintained by build_daily_features_v2.py
+    (rows only exist for ORBs with data, so weekends/holidays are already skipped).
 
-    Input: 740 rows (days) × 86 columns
     Output: ~4,440 rows (740 days × 6 ORBs) × features
     """
-    logger.info("Transforming to ORB-level rows...")
-
-    orb_rows = []
-
-    for _, day_row in df.iterrows():
-        date_local = day_row['date_local']
-        instrument = day_row['instrument']
-
-        # Base features (same for all ORBs on this day)
-        base_features = {
-            'date_local': date_local,
-            'instrument': instrument,
-            # Pre-session ranges
-            'pre_asia_high': day_row.get('pre_asia_high'),
-            'pre_asia_low': day_row.get('pre_asia_low'),
-            'pre_asia_range': day_row.get('pre_asia_range'),
-            'pre_london_high': day_row.get('pre_london_high'),
-            'pre_london_low': day_row.get('pre_london_low'),
-            'pre_london_range': day_row.get('pre_london_range'),
-            'pre_ny_high': day_row.get('pre_ny_high'),
-            'pre_ny_low': day_row.get('pre_ny_low'),
-            'pre_ny_range': day_row.get('pre_ny_range'),
-            # Session ranges
-            'asia_high': day_row.get('asia_high'),
-            'asia_low': day_row.get('asia_low'),
-            'asia_range': day_row.get('asia_range'),
-            'london_high': day_row.get('london_high'),
-            'london_low': day_row.get('london_low'),
-            'london_range': day_row.get('london_range'),
-            'ny_high': day_row.get('ny_high'),
-            'ny_low': day_row.get('ny_low'),
-            'ny_range': day_row.get('ny_range'),
-            # Technical indicators
-            'atr_14': day_row.get('atr_20'),  # Using atr_20 from database
-            'rsi_14': day_row.get('rsi_at_0030'),  # RSI at 00:30
-            # Session type codes
-            'asia_type_code': day_row.get('asia_type_code'),
-            'london_type_code': day_row.get('london_type_code'),
-            'pre_ny_type_code': day_row.get('pre_ny_type_code'),
-        }
-
-        # Create one row per ORB
-        for orb_time in ORB_TIMES:
-            orb_features = base_features.copy()
-
-            # ORB-specific data
-            orb_features['orb_time'] = orb_time
-            orb_features['orb_high'] = day_row.get(f'orb_{orb_time}_high')
-            orb_features['orb_low'] = day_row.get(f'orb_{orb_time}_low')
-            orb_features['orb_size'] = day_row.get(f'orb_{orb_time}_size')
-            orb_features['orb_break_dir'] = day_row.get(f'orb_{orb_time}_break_dir')
-            orb_features['orb_outcome'] = day_row.get(f'orb_{orb_time}_outcome')
-            orb_features['orb_r_multiple'] = day_row.get(f'orb_{orb_time}_r_multiple')
-
-            # Derive session context from ORB time
-            # 0900-1100: Asia session, 1800-2300: London session, 0030: NY session
-            session_map = {
-                '0900': 'ASIA', '1000': 'ASIA', '1100': 'ASIA',
-                '1800': 'LONDON', '2300': 'LONDON', '0030': 'NY'
-            }
-            orb_features['session_context'] = session_map.get(orb_time, 'UNKNOWN')
-
-            # Skip if ORB data is completely missing (weekend/holiday)
-            if pd.isna(orb_features['orb_size']):
-                continue
-
-            orb_rows.append(orb_features)
-
-    result_df = pd.DataFrame(orb_rows)
-    logger.info(f"Created {len(result_df)} ORB rows from {len(df)} days")
-
-    return result_df
+    logger.info("Loading orb_daily + daily_features_v2 from database...")
+
+    orb_order = " ".join(f"WHEN '{orb}' THEN {i}" for i, orb in enumerate(ORB_TIMES))
+    session_case = " ".join(f"WHEN '{orb}' THEN '{ctx}'" for orb, ctx in SESSION_CONTEXT.items())
+    query = f"""
+    SELECT
+        od.date_local,
+        od.instrument,
+        df.pre_asia_high, df.pre_asia_low, df.pre_asia_range,
+        df.pre_london_high, df.pre_london_low, df.pre_london_range,
+        df.pre_ny_high, df.pre_ny_low, df.pre_ny_range,
+        df.asia_high, df.asia_low, df.asia_range,
+        df.london_high, df.london_low, df.london_range,
+        df.ny_high, df.ny_low, df.ny_range,
+        df.atr_20 AS atr_14,        -- Using atr_20 from database
+        df.rsi_at_0030 AS rsi_14,   -- RSI at 00:30
+        df.asia_type_code,
+        df.london_type_code,
+        df.pre_ny_type_code,
+        od.orb_time,
+        od.high AS orb_high,
+        od.low AS orb_low,
+        od.size AS orb_size,
+        od.break_dir AS orb_break_dir,
+        od.outcome AS orb_outcome,
+        od.r_multiple AS orb_r_multiple,
+        CASE od.orb_time {session_case} ELSE 'UNKNOWN' END AS session_context
+    FROM orb_daily od
+    JOIN daily_features_v2 df
+      ON df.date_local = od.date_local AND df.instrument = od.instrument
+    WHERE od.orb_time IN ({", ".join(f"'{orb}'" for orb in ORB_TIMES)})
+    ORDER BY od.date_local ASC, od.instrument, CASE od.orb_time {orb_order} END
+    """
+
+    df = conn.execute(query).fetchdf()
+    logger.info(f"Loaded {len(df)} ORB rows")
+    if len(df):
+        logger.info(f"Date range: {df['date_local'].min()} to {df['date_local'].max()}")
+        logger.info(f"Instruments: {df['instrument'].unique().tolist()}")
+
+    return df
 
 
 def add_engineered_features(df):
@@ -313,22 +274,19 @@ def main():
     conn = duckdb.connect(DB_PATH, read_only=True)
 
     try:
-        # Step 1: Load daily features
-        df = load_daily_features(conn)
-
-        # Step 2: Transform to ORB-level rows
-        df = transform_to_orb_rows(df)
+        # Step 1: Load ORB-level rows (long format, one row per ORB)
+        df = load_orb_rows(conn)
 
-        # Step 3: Add engineered features
+        # Step 2: Add engineered features
         df = add_engineered_features(df)
 
-        # Step 4: Filter valid targets
+        # Step 3: Filter valid targets
         df = filter_valid_targets(df)
 
-        # Step 5: Save to Parquet
+        # Step 4: Save to Parquet
         save_to_parquet(df, OUTPUT_FILE)
 
-        # Step 6: Generate summary
+        # Step 5: Generate summary
         generate_summary_report(df)
 
         logger.info("\n✓ Data preparation complete!")
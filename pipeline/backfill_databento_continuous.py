@@ -4,17 +4,20 @@ import os
 import sys
 import time as time_mod
 import datetime as dt
-import subprocess
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any, Tuple
 
 import duckdb
+import pandas as pd
 from dotenv import load_dotenv
 from zoneinfo import ZoneInfo
 
 import databento as db
 from databento.common.error import BentoClientError
 
+from build_5m import refresh_bar_aggregates
+from refresh_features import refresh_features
+
 
 # -----------------------------
 # Config
@@ -75,54 +78,41 @@ def upsert_bars_1m(
     con: duckdb.DuckDBPyConnection,
     cfg: Cfg,
     source_symbol: str,
-    rows_1m: List[Tuple[str, str, str, float, float, float, float, int]],
+    df_front: pd.DataFrame,
 ) -> int:
-    if not rows_1m:
+    """
+    Upsert one contract's Databento frame (index = ts_event, tz-aware UTC).
+
+    The frame is registered with DuckDB and written in a single
+    INSERT OR REPLACE ... SELECT, keeping native TIMESTAMPTZ values
+    (no per-row Python loop or ISO string round-trip).
+    """
+    if df_front is None or len(df_front) == 0:
         return 0
 
-    con.executemany(
-        """
-        INSERT OR REPLACE INTO bars_1m
-        (ts_utc, symbol, source_symbol, open, high, low, close, volume)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        rows_1m,
-    )
-    return len(rows_1m)
-
-
-def rebuild_5m_from_1m(con: duckdb.DuckDBPyConnection, cfg: Cfg, start_utc: dt.datetime, end_utc: dt.datetime) -> None:
-    con.execute(
-        """
-        DELETE FROM bars_5m
-        WHERE symbol = ?
-          AND ts_utc >= CAST(? AS TIMESTAMPTZ)
-          AND ts_utc <  CAST(? AS TIMESTAMPTZ)
-        """,
-        [cfg.symbol, start_utc, end_utc],
-    )
-
-    con.execute(
-        """
-        INSERT INTO bars_5m (ts_utc, symbol, source_symbol, open, high, low, close, volume)
-        SELECT
-            CAST(to_timestamp(floor(epoch(ts_utc) / 300) * 300) AS TIMESTAMPTZ) AS ts_5m,
-            symbol,
-            NULL AS source_symbol,
-            arg_min(open, ts_utc)  AS open,
-            max(high)              AS high,
-            min(low)               AS low,
-            arg_max(close, ts_utc) AS close,
-            sum(volume)            AS volume
-        FROM bars_1m
-        WHERE symbol = ?
-          AND ts_utc >= CAST(? AS TIMESTAMPTZ)
-          AND ts_utc <  CAST(? AS TIMESTAMPTZ)
-        GROUP BY 1, 2
-        ORDER BY 1
-        """,
-        [cfg.symbol, start_utc, end_utc],
-    )
+    frame = pd.DataFrame({
+        "ts_utc": df_front.index,
+        "open": df_front["open"].to_numpy(dtype="float64"),
+        "high": df_front["high"].to_numpy(dtype="float64"),
+        "low": df_front["low"].to_numpy(dtype="float64"),
+        "close": df_front["close"].to_numpy(dtype="float64"),
+        "volume": df_front["volume"].to_numpy(dtype="int64"),
+    })
+
+    con.register("_ingest_bars_1m", frame)
+    try:
+        con.execute(
+            """
+            INSERT OR REPLACE INTO bars_1m
+            (ts_utc, symbol, source_symbol, open, high, low, close, volume)
+            SELECT CAST(ts_utc AS TIMESTAMPTZ), ?, ?, open, high, low, close, volume
+            FROM _ingest_bars_1m
+            """,
+            [cfg.symbol, source_symbol],
+        )
+    finally:
+        con.unregister("_ingest_bars_1m")
+    return len(frame)
 
 
 # -----------------------------
@@ -196,6 +186,7 @@ def main():
     con = duckdb.connect(cfg.db_path)
 
     total = 0
+    changed_days: List[dt.date] = []
     try:
         days = list(daterange_inclusive(start_day, end_day))
         days = list(reversed(days))  # newest -> oldest
@@ -238,65 +229,31 @@ def main():
                 continue
 
             # Databento index is ts_event (tz-aware UTC)
-            rows_1m: List[Tuple[str, str, str, float, float, float, float, int]] = []
-            for ts_event, row in df_front.iterrows():
-                # ensure ISO with offset
-                ts_iso = ts_event.isoformat()
-                rows_1m.append((
-                    ts_iso,             # ts_utc
-                    cfg.symbol,         # logical symbol (continuous)
-                    front,              # source_symbol (actual contract)
-                    float(row["open"]),
-                    float(row["high"]),
-                    float(row["low"]),
-                    float(row["close"]),
-                    int(row["volume"]),
-                ))
-
-            inserted = upsert_bars_1m(con, cfg, front, rows_1m)
+            inserted = upsert_bars_1m(con, cfg, front, df_front)
             total += inserted
+            if inserted:
+                changed_days.append(d)
 
             print(
                 f"{d} (local) [{start_utc.isoformat()} -> {end_utc.isoformat()}] -> front={front} -> inserted/replaced {inserted} rows"
             )
 
-        # rebuild 5m for the full requested LOCAL range (also clamp to available end)
-        range_start_utc, _ = local_day_to_utc_window(start_day, cfg.tz_local)
-        _, range_end_utc = local_day_to_utc_window(end_day, cfg.tz_local)
-        if range_end_utc > AVAILABLE_END_UTC:
-            range_end_utc = AVAILABLE_END_UTC
-
-        if range_start_utc < range_end_utc:
-            rebuild_5m_from_1m(con, cfg, range_start_utc, range_end_utc)
-            print("OK: rebuilt 5m bars for range")
+        # rebuild only the 5m buckets of days that received 1m rows
+        for d in changed_days:
+            day_start_utc, day_end_utc = local_day_to_utc_window(d, cfg.tz_local)
+            refresh_bar_aggregates(con, cfg.symbol, day_start_utc, min(day_end_utc, AVAILABLE_END_UTC))
+        print(f"OK: rebuilt 5m bars for {len(changed_days)} days")
 
         print(f"OK: bars_1m upsert total = {total}")
 
+        # build daily_features (V1) and daily_features_v2 for parity, in-process
+        rebuilt = refresh_features(con, changed_days)
+        for table, dates in rebuilt.items():
+            print(f"OK: {table} built for {len(dates)} days")
+
     finally:
         con.close()
 
-    # build daily_features (V1) and daily_features_v2 for parity
-    for d in reversed(list(daterange_inclusive(start_day, end_day))):
-        cmd_v1 = [sys.executable, "build_daily_features.py", d.isoformat()]
-        r1 = subprocess.run(cmd_v1, capture_output=True, text=True)
-        if r1.returncode != 0:
-            print(f"FAIL daily_features {d}:")
-            print(r1.stdout)
-            print(r1.stderr)
-            sys.exit(r1.returncode)
-        else:
-            print(f"OK: daily_features built for {d}")
-
-        cmd_v2 = [sys.executable, "build_daily_features_v2.py", d.isoformat()]
-        r2 = subprocess.run(cmd_v2, capture_output=True, text=True)
-        if r2.returncode != 0:
-            print(f"FAIL daily_features_v2 {d}:")
-            print(r2.stdout)
-            print(r2.stderr)
-            sys.exit(r2.returncode)
-        else:
-            print(f"OK: daily_features_v2 built for {d}")
-
     print("DONE")
 
 
@@ -4,14 +4,18 @@ import os
 import sys
 import datetime as dt
 import subprocess
+from pathlib import Path
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 import duckdb
-import httpx
 from dotenv import load_dotenv
 from zoneinfo import ZoneInfo
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.projectx.projectx_client import ProjectXClient, get_client
+
 
 # -----------------------------
 # Config
@@ -53,82 +57,11 @@ def env_cfg() -> Cfg:
 
 
 # -----------------------------
-# ProjectX minimal client
+# ProjectX client (shared pooled session + cached token, see lib/projectx)
 # -----------------------------
 
-class ProjectX:
-    def __init__(self, cfg: Cfg):
-        self.cfg = cfg
-        self.token: Optional[str] = None
-
-    def _headers(self) -> Dict[str, str]:
-        h = {"accept": "text/plain", "Content-Type": "application/json"}
-        if self.token:
-            h["Authorization"] = f"Bearer {self.token}"
-        return h
-
-    def login_key(self) -> str:
-        url = f"{self.cfg.base_url}/api/Auth/loginKey"
-        payload = {"userName": self.cfg.username, "apiKey": self.cfg.api_key}
-        with httpx.Client(timeout=30.0) as client:
-            r = client.post(url, headers=self._headers(), json=payload)
-            r.raise_for_status()
-            data = r.json()
-        if not data.get("success"):
-            raise RuntimeError(f"Login failed: {data}")
-        self.token = data["token"]
-        return self.token
-
-    def contract_search(self, search_text: str) -> Dict[str, Any]:
-        url = f"{self.cfg.base_url}/api/Contract/search"
-        payload = {"searchText": search_text, "live": self.cfg.live}
-        with httpx.Client(timeout=30.0) as client:
-            r = client.post(url, headers=self._headers(), json=payload)
-            r.raise_for_status()
-            data = r.json()
-        if not data.get("success"):
-            raise RuntimeError(f"Contract search failed: {data}")
-        return data
-
-    def list_available_contracts(self) -> Dict[str, Any]:
-        url = f"{self.cfg.base_url}/api/Contract/available"
-        payload = {"live": self.cfg.live}
-        with httpx.Client(timeout=30.0) as client:
-            r = client.post(url, headers=self._headers(), json=payload)
-            r.raise_for_status()
-            data = r.json()
-        if not data.get("success"):
-            raise RuntimeError(f"Contract available failed: {data}")
-        return data
-
-    def retrieve_bars(
-        self,
-        contract_id: str,
-        start_iso_z: str,
-        end_iso_z: str,
-        unit: int = 2,          # 2 = minute
-        unit_number: int = 1,   # 1-minute
-        limit: int = 20000,
-        include_partial: bool = False,
-    ) -> List[Dict[str, Any]]:
-        url = f"{self.cfg.base_url}/api/History/retrieveBars"
-        payload = {
-            "contractId": contract_id,
-            "live": self.cfg.live,
-            "startTime": start_iso_z,
-            "endTime": end_iso_z,
-            "unit": unit,
-            "unitNumber": unit_number,
-            "limit": limit,
-            "includePartialBar": include_partial,
-        }
-        with httpx.Client(timeout=60.0) as client:
-            r = client.post(url, headers=self._headers(), json=payload)
-            r.raise_for_status()
-            data = r.json()
-        if not data.get("success"):
-            raise RuntimeError(f"retrieveBars failed: {data}")
-        return data.get("bars") or []
+def projectx_client(cfg: Cfg) -> ProjectXClient:
+    return get_client(cfg.base_url, cfg.username, cfg.api_key, cfg.live)
 
 
 # -----------------------------
@@ -255,7 +188,7 @@ def _contracts_newest_first(contracts: List[Dict[str, Any]]) -> List[Dict[str, A
     return sorted(contracts, key=key, reverse=True)
 
 def pick_contract_for_day(
-    px: ProjectX,
+    px: ProjectXClient,
     mgc_contracts: List[Dict[str, Any]],
     start_iso_z: str,
     end_iso_z: str,
@@ -311,8 +244,8 @@ def main():
     start_day = parse_date(sys.argv[1])
     end_day = parse_date(sys.argv[2])
 
-    px = ProjectX(cfg)
-    px.login_key()
+    px = projectx_client(cfg)
+    px.login()
 
     # Pull all available contracts once
     avail = px.list_available_contracts()
@@ -1,40 +1,241 @@
-﻿from pathlib import Path
+"""
+Incremental bar aggregates (1m -> 5m, optional 15m / 1h rollups)
+================================================================
+
+Recomputes only the buckets touched by new 1m bars instead of re-aggregating
+the whole archive:
+
+  - refresh_bar_aggregates(con, symbol, start_utc, end_utc): rebuild every
+    bucket overlapping [start_utc, end_utc). Backfills call this with the
+    window they just upserted (covers replaced history too).
+  - update_bar_aggregates(con, symbol): watermark mode for live / nightly runs.
+    Aggregates 1m bars from the last processed 1m timestamp onward (the
+    partially-filled bucket at the watermark is recomputed), then advances it.
+
+Tables are derived from the 1m source: bars_1m -> bars_5m / bars_15m / bars_1h,
+bars_1m_nq -> bars_5m_nq / bars_15m_nq / bars_1h_nq, and so on.
+Rollups are built from the 5m table (15m and 1h buckets are whole 5m buckets).
+
+Deterministic aggregation (same as before):
+  bucket = floor(epoch(ts)/width)*width
+  open = arg_min(open, ts), close = arg_max(close, ts)
+  high = max(high), low = min(low), volume = sum(volume)
+
+Usage:
+  python build_5m.py                                   # MGC, watermark mode
+  python build_5m.py --source bars_1m_nq --symbol NQ --rollup 15m 1h
+  python build_5m.py --full                            # reset watermark, rebuild all
+"""
+
+import argparse
+import datetime as dt
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
 import duckdb
 
 DB_PATH = Path("gold.db")
 SYMBOL = "MGC"
+SOURCE_TABLE = "bars_1m"
+
+AGG_SECONDS = {"5m": 300, "15m": 900, "1h": 3600}
+ROLLUPS = ("15m", "1h")
+WATERMARK_TABLE = "bar_aggregate_watermark"
+
+
+def aggregate_table(source_table: str, label: str) -> str:
+    """bars_1m[_suffix] -> bars_<label>[_suffix]"""
+    if not source_table.startswith("bars_1m"):
+        raise ValueError(f"Not a 1m bar table: {source_table}")
+    return f"bars_{label}{source_table[len('bars_1m'):]}"
+
+
+def ensure_aggregate_tables(con: duckdb.DuckDBPyConnection, source_table: str, rollups: Iterable[str] = ()) -> None:
+    for label in ("5m", *rollups):
+        con.execute(f"""
+            CREATE TABLE IF NOT EXISTS {aggregate_table(source_table, label)} (
+              ts_utc        TIMESTAMPTZ NOT NULL,
+              symbol        TEXT NOT NULL,
+              source_symbol TEXT,
+              open          DOUBLE NOT NULL,
+              high          DOUBLE NOT NULL,
+              low           DOUBLE NOT NULL,
+              close         DOUBLE NOT NULL,
+              volume        BIGINT NOT NULL,
+              PRIMARY KEY (symbol, ts_utc)
+            )
+        """)
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {WATERMARK_TABLE} (
+          source_table TEXT NOT NULL,
+          symbol       TEXT NOT NULL,
+          last_ts_utc  TIMESTAMPTZ NOT NULL,
+          updated_at   TIMESTAMPTZ NOT NULL,
+          PRIMARY KEY (source_table, symbol)
+        )
+    """)
+
+
+def _bucket_bounds(start_utc: dt.datetime, end_utc: dt.datetime, seconds: int) -> Tuple[dt.datetime, dt.datetime]:
+    """Widen [start, end) to whole buckets of the given width."""
+    lo = int(start_utc.timestamp()) // seconds * seconds
+    hi = -(-int(end_utc.timestamp()) // seconds) * seconds
+    return (
+        dt.datetime.fromtimestamp(lo, dt.timezone.utc),
+        dt.datetime.fromtimestamp(max(hi, lo + seconds), dt.timezone.utc),
+    )
+
+
+def _rebuild_buckets(
+    con: duckdb.DuckDBPyConnection,
+    from_table: str,
+    to_table: str,
+    symbol: str,
+    seconds: int,
+    start_utc: dt.datetime,
+    end_utc: dt.datetime,
+) -> int:
+    """Delete and re-aggregate to_table buckets in [start_utc, end_utc) (bucket-aligned)."""
+    con.execute(
+        f"DELETE FROM {to_table} WHERE symbol = ? AND ts_utc >= ? AND ts_utc < ?",
+        [symbol, start_utc, end_utc],
+    )
+    con.execute(
+        f"""
+        INSERT INTO {to_table} (ts_utc, symbol, source_symbol, open, high, low, close, volume)
+        SELECT
+          CAST(to_timestamp(floor(epoch(ts_utc) / {seconds}) * {seconds}) AS TIMESTAMPTZ) AS ts_bucket,
+          symbol,
+          arg_max(source_symbol, ts_utc) AS source_symbol,
+          arg_min(open, ts_utc)  AS open,
+          max(high)              AS high,
+          min(low)               AS low,
+          arg_max(close, ts_utc) AS close,
+          sum(volume)            AS volume
+        FROM {from_table}
+        WHERE symbol = ?
+          AND ts_utc >= ?
+          AND ts_utc < ?
+        GROUP BY 1, 2
+        """,
+        [symbol, start_utc, end_utc],
+    )
+    return con.execute(
+        f"SELECT count(*) FROM {to_table} WHERE symbol = ? AND ts_utc >= ? AND ts_utc < ?",
+        [symbol, start_utc, end_utc],
+    ).fetchone()[0]
+
+
+def refresh_bar_aggregates(
+    con: duckdb.DuckDBPyConnection,
+    symbol: str,
+    start_utc: dt.datetime,
+    end_utc: dt.datetime,
+    source_table: str = SOURCE_TABLE,
+    rollups: Iterable[str] = (),
+) -> int:
+    """
+    Rebuild 5m (and rollup) buckets overlapping [start_utc, end_utc).
+
+    Does not move the watermark: a backfill of old history must not skip
+    newer 1m bars that update_bar_aggregates() has not processed yet.
+
+    Returns:
+        Number of 5m buckets written
+    """
+    rollups = tuple(rollups)
+    ensure_aggregate_tables(con, source_table, rollups)
+
+    bars_5m = aggregate_table(source_table, "5m")
+    lo, hi = _bucket_bounds(start_utc, end_utc, AGG_SECONDS["5m"])
+    n5 = _rebuild_buckets(con, source_table, bars_5m, symbol, AGG_SECONDS["5m"], lo, hi)
+
+    for label in rollups:
+        r_lo, r_hi = _bucket_bounds(lo, hi, AGG_SECONDS[label])
+        _rebuild_buckets(con, bars_5m, aggregate_table(source_table, label), symbol, AGG_SECONDS[label], r_lo, r_hi)
+
+    return n5
+
+
+def get_watermark(con: duckdb.DuckDBPyConnection, source_table: str, symbol: str) -> Optional[dt.datetime]:
+    row = con.execute(
+        f"SELECT last_ts_utc FROM {WATERMARK_TABLE} WHERE source_table = ? AND symbol = ?",
+        [source_table, symbol],
+    ).fetchone()
+    return row[0] if row else None
+
+
+def update_bar_aggregates(
+    con: duckdb.DuckDBPyConnection,
+    symbol: str,
+    source_table: str = SOURCE_TABLE,
+    rollups: Iterable[str] = (),
+) -> int:
+    """
+    Aggregate 1m bars at/after the watermark and advance it.
+
+    First run (no watermark) aggregates the full history once.
+    The watermark is written last, so an interrupted run just redoes its buckets.
+
+    Returns:
+        Number of 5m buckets written
+    """
+    rollups = tuple(rollups)
+    ensure_aggregate_tables(con, source_table, rollups)
+
+    watermark = get_watermark(con, source_table, symbol)
+    if watermark is None:
+        lo, hi = con.execute(
+            f"SELECT min(ts_utc), max(ts_utc) FROM {source_table} WHERE symbol = ?",
+            [symbol],
+        ).fetchone()
+    else:
+        lo = watermark
+        hi = con.execute(
+            f"SELECT max(ts_utc) FROM {source_table} WHERE symbol = ? AND ts_utc >= ?",
+            [symbol, watermark],
+        ).fetchone()[0]
+
+    if hi is None:
+        return 0
+
+    n5 = refresh_bar_aggregates(con, symbol, lo, hi + dt.timedelta(minutes=1), source_table, rollups)
+    con.execute(
+        f"INSERT OR REPLACE INTO {WATERMARK_TABLE} (source_table, symbol, last_ts_utc, updated_at) VALUES (?, ?, ?, now())",
+        [source_table, symbol, hi],
+    )
+    return n5
+
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Incremental 1m -> 5m (+15m/1h) bar aggregation")
+    parser.add_argument("--symbol", default=SYMBOL)
+    parser.add_argument("--source", default=SOURCE_TABLE, help="1m source table (bars_1m, bars_1m_nq, bars_1m_mpl)")
+    parser.add_argument("--rollup", nargs="*", default=[], choices=ROLLUPS)
+    parser.add_argument("--full", action="store_true", help="Reset the watermark and rebuild all history")
+    args = parser.parse_args()
+
     con = duckdb.connect(str(DB_PATH))
     try:
-        con.execute(
-            """
-            INSERT OR REPLACE INTO bars_5m
-            (ts_utc, symbol, source_symbol, open, high, low, close, volume)
-            SELECT
-              to_timestamp(floor(epoch(ts_utc) / 300) * 300) AS ts_5m,
-              symbol,
-              arg_max(source_symbol, ts_utc) AS source_symbol,
-              arg_min(open, ts_utc)  AS open,
-              max(high)              AS high,
-              min(low)               AS low,
-              arg_max(close, ts_utc) AS close,
-              sum(volume)            AS volume
-            FROM bars_1m
-            WHERE symbol = ?
-            GROUP BY 1, 2
-            """,
-            [SYMBOL],
-        )
+        ensure_aggregate_tables(con, args.source, args.rollup)
+        if args.full:
+            con.execute(
+                f"DELETE FROM {WATERMARK_TABLE} WHERE source_table = ? AND symbol = ?",
+                [args.source, args.symbol],
+            )
 
+        written = update_bar_aggregates(con, args.symbol, args.source, args.rollup)
+
+        bars_5m = aggregate_table(args.source, "5m")
         n5 = con.execute(
-            "SELECT count(*) FROM bars_5m WHERE symbol = ?",
-            [SYMBOL],
+            f"SELECT count(*) FROM {bars_5m} WHERE symbol = ?",
+            [args.symbol],
         ).fetchone()[0]
 
-        print(f"OK: bars_5m built. total_5m_rows={n5}")
+        print(f"OK: {bars_5m} updated. buckets_written={written} total_5m_rows={n5}")
     finally:
         con.close()
 
+
 if __name__ == "__main__":
     main()
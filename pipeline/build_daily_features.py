@@ -635,203 +635,210 @@ def ensure_daily_features_table(con: duckdb.DuckDBPyConnection) -> None:
 # ─────────────────────────────────────────────────────────────
 # MAIN
 # ─────────────────────────────────────────────────────────────
+def build_features_for_date(con: duckdb.DuckDBPyConnection, d: date) -> None:
+    """
+    Compute and upsert the daily_features row for one local trade date.
+
+    Does not commit; callers own the connection (and any transaction around it).
+    """
+    # Session windows (UTC+10 local -> UTC)
+    asia_start_utc, asia_end_utc = local_window_to_utc(d, ASIA_START, ASIA_END)
+    london_start_utc, london_end_utc = local_window_to_utc(d, LONDON_START, LONDON_END)
+    ny_start_utc, ny_end_utc = local_window_to_utc(d, NY_START, NY_END)
+
+    pre_ny_start_utc, pre_ny_end_utc = local_window_to_utc(d, PRE_NY_START, PRE_NY_END)
+    pre_orb_start_utc, pre_orb_end_utc = local_window_to_utc(d, PRE_ORB_START, PRE_ORB_END)
+
+    # Fetch 1m for high/low + travel
+    asia_1m = fetch_bars_1m(con, asia_start_utc, asia_end_utc)
+    london_1m = fetch_bars_1m(con, london_start_utc, london_end_utc)
+    ny_1m = fetch_bars_1m(con, ny_start_utc, ny_end_utc)
+
+    asia_hi, asia_lo = high_low_1m(asia_1m)
+    lon_hi, lon_lo = high_low_1m(london_1m)
+    ny_hi, ny_lo = high_low_1m(ny_1m)
+
+    asia_range = (float(asia_hi - asia_lo) if (asia_hi is not None and asia_lo is not None) else None)
+
+    pre_ny_travel = travel_range_1m(fetch_bars_1m(con, pre_ny_start_utc, pre_ny_end_utc))
+    pre_orb_travel = travel_range_1m(fetch_bars_1m(con, pre_orb_start_utc, pre_orb_end_utc))
+
+    # Compute ATR_20 (using 5m bars from trading day start)
+    # Fetch 24 hours of 5m bars before Asia start for ATR calculation
+    atr_lookback_start = asia_start_utc - timedelta(hours=24)
+    atr_bars_5m = fetch_bars_5m(con, atr_lookback_start, asia_start_utc)
+    atr_20: Optional[float] = None
+    if len(atr_bars_5m) >= ATR_LEN + 1:
+        highs = [b.h for b in atr_bars_5m]
+        lows = [b.l for b in atr_bars_5m]
+        closes = [b.c for b in atr_bars_5m]
+        atr_values = atr_wilder(highs, lows, closes, ATR_LEN)
+        # Use the last ATR value (at Asia start)
+        atr_20 = atr_values[-1]
+
+    # Classify session types
+    asia_type = classify_asia_type(asia_range, atr_20)
+    london_type = classify_london_type(lon_hi, lon_lo, asia_hi, asia_lo)
+    ny_type = classify_ny_type(ny_hi, ny_lo, lon_hi, lon_lo)
+
+    # Compute all 6 ORBs
+    orb_0900 = compute_orb_generic(con, d, time(9, 0))
+    orb_1000 = compute_orb_generic(con, d, time(10, 0))
+    orb_1100 = compute_orb_generic(con, d, time(11, 0))
+    orb_1800 = compute_orb_generic(con, d, time(18, 0))
+    orb_2300 = compute_orb_generic(con, d, time(23, 0))
+    orb_0030 = compute_orb_generic(con, d, time(0, 30), compute_rsi=True)  # Keep RSI for 00:30
+
+    if orb_0030["orb_high"] is None or orb_0030["orb_low"] is None:
+        print(f"SKIP_ORB_0030: {d.isoformat()} missing 00:30 ORB 1m bars (writing NULL for 00:30 orb fields).")
+
+    # Upsert
+    con.execute(
+        """
+        INSERT INTO daily_features AS t
+        (date_local, instrument,
+         asia_high, asia_low, asia_range,
+         london_high, london_low,
+         ny_high, ny_low,
+         pre_ny_travel, pre_orb_travel,
+         atr_20, asia_type, london_type, ny_type,
+         orb_0900_high, orb_0900_low, orb_0900_size, orb_0900_break_dir,
+         orb_0900_outcome, orb_0900_r_multiple, orb_0900_mae, orb_0900_mfe,
+         orb_1000_high, orb_1000_low, orb_1000_size, orb_1000_break_dir,
+         orb_1000_outcome, orb_1000_r_multiple, orb_1000_mae, orb_1000_mfe,
+         orb_1100_high, orb_1100_low, orb_1100_size, orb_1100_break_dir,
+         orb_1100_outcome, orb_1100_r_multiple, orb_1100_mae, orb_1100_mfe,
+         orb_1800_high, orb_1800_low, orb_1800_size, orb_1800_break_dir,
+         orb_1800_outcome, orb_1800_r_multiple, orb_1800_mae, orb_1800_mfe,
+         orb_2300_high, orb_2300_low, orb_2300_size, orb_2300_break_dir,
+         orb_2300_outcome, orb_2300_r_multiple, orb_2300_mae, orb_2300_mfe,
+         orb_0030_high, orb_0030_low, orb_0030_size, orb_0030_break_dir,
+         orb_0030_outcome, orb_0030_r_multiple, orb_0030_mae, orb_0030_mfe,
+         rsi_at_orb)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (date_local, instrument) DO UPDATE SET
+          asia_high=excluded.asia_high,
+          asia_low=excluded.asia_low,
+          asia_range=excluded.asia_range,
+          london_high=excluded.london_high,
+          london_low=excluded.london_low,
+          ny_high=excluded.ny_high,
+          ny_low=excluded.ny_low,
+          pre_ny_travel=excluded.pre_ny_travel,
+          pre_orb_travel=excluded.pre_orb_travel,
+          atr_20=excluded.atr_20,
+          asia_type=excluded.asia_type,
+          london_type=excluded.london_type,
+          ny_type=excluded.ny_type,
+          orb_0900_high=excluded.orb_0900_high,
+          orb_0900_low=excluded.orb_0900_low,
+          orb_0900_size=excluded.orb_0900_size,
+          orb_0900_break_dir=excluded.orb_0900_break_dir,
+          orb_0900_outcome=excluded.orb_0900_outcome,
+          orb_0900_r_multiple=excluded.orb_0900_r_multiple,
+          orb_0900_mae=excluded.orb_0900_mae,
+          orb_0900_mfe=excluded.orb_0900_mfe,
+          orb_1000_high=excluded.orb_1000_high,
+          orb_1000_low=excluded.orb_1000_low,
+          orb_1000_size=excluded.orb_1000_size,
+          orb_1000_break_dir=excluded.orb_1000_break_dir,
+          orb_1000_outcome=excluded.orb_1000_outcome,
+          orb_1000_r_multiple=excluded.orb_1000_r_multiple,
+          orb_1000_mae=excluded.orb_1000_mae,
+          orb_1000_mfe=excluded.orb_1000_mfe,
+          orb_1100_high=excluded.orb_1100_high,
+          orb_1100_low=excluded.orb_1100_low,
+          orb_1100_size=excluded.orb_1100_size,
+          orb_1100_break_dir=excluded.orb_1100_break_dir,
+          orb_1100_outcome=excluded.orb_1100_outcome,
+          orb_1100_r_multiple=excluded.orb_1100_r_multiple,
+          orb_1100_mae=excluded.orb_1100_mae,
+          orb_1100_mfe=excluded.orb_1100_mfe,
+          orb_1800_high=excluded.orb_1800_high,
+          orb_1800_low=excluded.orb_1800_low,
+          orb_1800_size=excluded.orb_1800_size,
+          orb_1800_break_dir=excluded.orb_1800_break_dir,
+          orb_1800_outcome=excluded.orb_1800_outcome,
+          orb_1800_r_multiple=excluded.orb_1800_r_multiple,
+          orb_1800_mae=excluded.orb_1800_mae,
+          orb_1800_mfe=excluded.orb_1800_mfe,
+          orb_2300_high=excluded.orb_2300_high,
+          orb_2300_low=excluded.orb_2300_low,
+          orb_2300_size=excluded.orb_2300_size,
+          orb_2300_break_dir=excluded.orb_2300_break_dir,
+          orb_2300_outcome=excluded.orb_2300_outcome,
+          orb_2300_r_multiple=excluded.orb_2300_r_multiple,
+          orb_2300_mae=excluded.orb_2300_mae,
+          orb_2300_mfe=excluded.orb_2300_mfe,
+          orb_0030_high=excluded.orb_0030_high,
+          orb_0030_low=excluded.orb_0030_low,
+          orb_0030_size=excluded.orb_0030_size,
+          orb_0030_break_dir=excluded.orb_0030_break_dir,
+          orb_0030_outcome=excluded.orb_0030_outcome,
+          orb_0030_r_multiple=excluded.orb_0030_r_multiple,
+          orb_0030_mae=excluded.orb_0030_mae,
+          orb_0030_mfe=excluded.orb_0030_mfe,
+          rsi_at_orb=excluded.rsi_at_orb
+        """,
+        [
+            d,
+            INSTRUMENT,
+            asia_hi, asia_lo, asia_range,
+            lon_hi, lon_lo,
+            ny_hi, ny_lo,
+            pre_ny_travel, pre_orb_travel,
+            atr_20, asia_type, london_type, ny_type,
+            # ORB 0900
+            orb_0900["orb_high"], orb_0900["orb_low"], orb_0900["orb_size"], orb_0900["orb_break_dir"],
+            orb_0900["outcome"], orb_0900["r_multiple"], orb_0900["mae"], orb_0900["mfe"],
+            # ORB 1000
+            orb_1000["orb_high"], orb_1000["orb_low"], orb_1000["orb_size"], orb_1000["orb_break_dir"],
+            orb_1000["outcome"], orb_1000["r_multiple"], orb_1000["mae"], orb_1000["mfe"],
+            # ORB 1100
+            orb_1100["orb_high"], orb_1100["orb_low"], orb_1100["orb_size"], orb_1100["orb_break_dir"],
+            orb_1100["outcome"], orb_1100["r_multiple"], orb_1100["mae"], orb_1100["mfe"],
+            # ORB 1800
+            orb_1800["orb_high"], orb_1800["orb_low"], orb_1800["orb_size"], orb_1800["orb_break_dir"],
+            orb_1800["outcome"], orb_1800["r_multiple"], orb_1800["mae"], orb_1800["mfe"],
+            # ORB 2300
+            orb_2300["orb_high"], orb_2300["orb_low"], orb_2300["orb_size"], orb_2300["orb_break_dir"],
+            orb_2300["outcome"], orb_2300["r_multiple"], orb_2300["mae"], orb_2300["mfe"],
+            # ORB 0030
+            orb_0030["orb_high"], orb_0030["orb_low"], orb_0030["orb_size"], orb_0030["orb_break_dir"],
+            orb_0030["outcome"], orb_0030["r_multiple"], orb_0030["mae"], orb_0030["mfe"],
+            # RSI
+            orb_0030.get("rsi_at_orb"),
+        ],
+    )
+
+    print("OK: daily_features upserted for", d.isoformat(), INSTRUMENT)
+    print("  ATR_20:", atr_20)
+    print("  Asia H/L:", asia_hi, asia_lo, "range:", asia_range, f"type: {asia_type}")
+    print("  London H/L:", lon_hi, lon_lo, f"type: {london_type}")
+    print("  NY H/L:", ny_hi, ny_lo, f"type: {ny_type}")
+    print("  Pre-NY travel:", pre_ny_travel, "Pre-ORB travel:", pre_orb_travel)
+    print("  ORB 09:00:", f"H/L: {orb_0900['orb_high']}/{orb_0900['orb_low']}", f"size: {orb_0900['orb_size']}",
+          f"dir: {orb_0900['orb_break_dir']}", f"outcome: {orb_0900['outcome']}", f"R: {orb_0900['r_multiple']}")
+    print("  ORB 10:00:", f"H/L: {orb_1000['orb_high']}/{orb_1000['orb_low']}", f"size: {orb_1000['orb_size']}",
+          f"dir: {orb_1000['orb_break_dir']}", f"outcome: {orb_1000['outcome']}", f"R: {orb_1000['r_multiple']}")
+    print("  ORB 11:00:", f"H/L: {orb_1100['orb_high']}/{orb_1100['orb_low']}", f"size: {orb_1100['orb_size']}",
+          f"dir: {orb_1100['orb_break_dir']}", f"outcome: {orb_1100['outcome']}", f"R: {orb_1100['r_multiple']}")
+    print("  ORB 18:00:", f"H/L: {orb_1800['orb_high']}/{orb_1800['orb_low']}", f"size: {orb_1800['orb_size']}",
+          f"dir: {orb_1800['orb_break_dir']}", f"outcome: {orb_1800['outcome']}", f"R: {orb_1800['r_multiple']}")
+    print("  ORB 23:00:", f"H/L: {orb_2300['orb_high']}/{orb_2300['orb_low']}", f"size: {orb_2300['orb_size']}",
+          f"dir: {orb_2300['orb_break_dir']}", f"outcome: {orb_2300['outcome']}", f"R: {orb_2300['r_multiple']}")
+    print("  ORB 00:30:", f"H/L: {orb_0030['orb_high']}/{orb_0030['orb_low']}", f"size: {orb_0030['orb_size']}",
+          f"dir: {orb_0030['orb_break_dir']}", f"outcome: {orb_0030['outcome']}", f"R: {orb_0030['r_multiple']}")
+    print("  RSI@ORB(00:30):", orb_0030.get("rsi_at_orb"))
+
+
 def main(date_local_str: str) -> None:
     d = date.fromisoformat(date_local_str)
 
     con = duckdb.connect(str(DB_PATH))
     try:
         ensure_daily_features_table(con)
-
-        # Session windows (UTC+10 local -> UTC)
-        asia_start_utc, asia_end_utc = local_window_to_utc(d, ASIA_START, ASIA_END)
-        london_start_utc, london_end_utc = local_window_to_utc(d, LONDON_START, LONDON_END)
-        ny_start_utc, ny_end_utc = local_window_to_utc(d, NY_START, NY_END)
-
-        pre_ny_start_utc, pre_ny_end_utc = local_window_to_utc(d, PRE_NY_START, PRE_NY_END)
-        pre_orb_start_utc, pre_orb_end_utc = local_window_to_utc(d, PRE_ORB_START, PRE_ORB_END)
-
-        # Fetch 1m for high/low + travel
-        asia_1m = fetch_bars_1m(con, asia_start_utc, asia_end_utc)
-        london_1m = fetch_bars_1m(con, london_start_utc, london_end_utc)
-        ny_1m = fetch_bars_1m(con, ny_start_utc, ny_end_utc)
-
-        asia_hi, asia_lo = high_low_1m(asia_1m)
-        lon_hi, lon_lo = high_low_1m(london_1m)
-        ny_hi, ny_lo = high_low_1m(ny_1m)
-
-        asia_range = (float(asia_hi - asia_lo) if (asia_hi is not None and asia_lo is not None) else None)
-
-        pre_ny_travel = travel_range_1m(fetch_bars_1m(con, pre_ny_start_utc, pre_ny_end_utc))
-        pre_orb_travel = travel_range_1m(fetch_bars_1m(con, pre_orb_start_utc, pre_orb_end_utc))
-
-        # Compute ATR_20 (using 5m bars from trading day start)
-        # Fetch 24 hours of 5m bars before Asia start for ATR calculation
-        atr_lookback_start = asia_start_utc - timedelta(hours=24)
-        atr_bars_5m = fetch_bars_5m(con, atr_lookback_start, asia_start_utc)
-        atr_20: Optional[float] = None
-        if len(atr_bars_5m) >= ATR_LEN + 1:
-            highs = [b.h for b in atr_bars_5m]
-            lows = [b.l for b in atr_bars_5m]
-            closes = [b.c for b in atr_bars_5m]
-            atr_values = atr_wilder(highs, lows, closes, ATR_LEN)
-            # Use the last ATR value (at Asia start)
-            atr_20 = atr_values[-1]
-
-        # Classify session types
-        asia_type = classify_asia_type(asia_range, atr_20)
-        london_type = classify_london_type(lon_hi, lon_lo, asia_hi, asia_lo)
-        ny_type = classify_ny_type(ny_hi, ny_lo, lon_hi, lon_lo)
-
-        # Compute all 6 ORBs
-        orb_0900 = compute_orb_generic(con, d, time(9, 0))
-        orb_1000 = compute_orb_generic(con, d, time(10, 0))
-        orb_1100 = compute_orb_generic(con, d, time(11, 0))
-        orb_1800 = compute_orb_generic(con, d, time(18, 0))
-        orb_2300 = compute_orb_generic(con, d, time(23, 0))
-        orb_0030 = compute_orb_generic(con, d, time(0, 30), compute_rsi=True)  # Keep RSI for 00:30
-
-        if orb_0030["orb_high"] is None or orb_0030["orb_low"] is None:
-            print(f"SKIP_ORB_0030: {d.isoformat()} missing 00:30 ORB 1m bars (writing NULL for 00:30 orb fields).")
-
-        # Upsert
-        con.execute(
-            """
-            INSERT INTO daily_features AS t
-            (date_local, instrument,
-             asia_high, asia_low, asia_range,
-             london_high, london_low,
-             ny_high, ny_low,
-             pre_ny_travel, pre_orb_travel,
-             atr_20, asia_type, london_type, ny_type,
-             orb_0900_high, orb_0900_low, orb_0900_size, orb_0900_break_dir,
-             orb_0900_outcome, orb_0900_r_multiple, orb_0900_mae, orb_0900_mfe,
-             orb_1000_high, orb_1000_low, orb_1000_size, orb_1000_break_dir,
-             orb_1000_outcome, orb_1000_r_multiple, orb_1000_mae, orb_1000_mfe,
-             orb_1100_high, orb_1100_low, orb_1100_size, orb_1100_break_dir,
-             orb_1100_outcome, orb_1100_r_multiple, orb_1100_mae, orb_1100_mfe,
-             orb_1800_high, orb_1800_low, orb_1800_size, orb_1800_break_dir,
-             orb_1800_outcome, orb_1800_r_multiple, orb_1800_mae, orb_1800_mfe,
-             orb_2300_high, orb_2300_low, orb_2300_size, orb_2300_break_dir,
-             orb_2300_outcome, orb_2300_r_multiple, orb_2300_mae, orb_2300_mfe,
-             orb_0030_high, orb_0030_low, orb_0030_size, orb_0030_break_dir,
-             orb_0030_outcome, orb_0030_r_multiple, orb_0030_mae, orb_0030_mfe,
-             rsi_at_orb)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (date_local, instrument) DO UPDATE SET
-              asia_high=excluded.asia_high,
-              asia_low=excluded.asia_low,
-              asia_range=excluded.asia_range,
-              london_high=excluded.london_high,
-              london_low=excluded.london_low,
-              ny_high=excluded.ny_high,
-              ny_low=excluded.ny_low,
-              pre_ny_travel=excluded.pre_ny_travel,
-              pre_orb_travel=excluded.pre_orb_travel,
-              atr_20=excluded.atr_20,
-              asia_type=excluded.asia_type,
-              london_type=excluded.london_type,
-              ny_type=excluded.ny_type,
-              orb_0900_high=excluded.orb_0900_high,
-              orb_0900_low=excluded.orb_0900_low,
-              orb_0900_size=excluded.orb_0900_size,
-              orb_0900_break_dir=excluded.orb_0900_break_dir,
-              orb_0900_outcome=excluded.orb_0900_outcome,
-              orb_0900_r_multiple=excluded.orb_0900_r_multiple,
-              orb_0900_mae=excluded.orb_0900_mae,
-              orb_0900_mfe=excluded.orb_0900_mfe,
-              orb_1000_high=excluded.orb_1000_high,
-              orb_1000_low=excluded.orb_1000_low,
-              orb_1000_size=excluded.orb_1000_size,
-              orb_1000_break_dir=excluded.orb_1000_break_dir,
-              orb_1000_outcome=excluded.orb_1000_outcome,
-              orb_1000_r_multiple=excluded.orb_1000_r_multiple,
-              orb_1000_mae=excluded.orb_1000_mae,
-              orb_1000_mfe=excluded.orb_1000_mfe,
-              orb_1100_high=excluded.orb_1100_high,
-              orb_1100_low=excluded.orb_1100_low,
-              orb_1100_size=excluded.orb_1100_size,
-              orb_1100_break_dir=excluded.orb_1100_break_dir,
-              orb_1100_outcome=excluded.orb_1100_outcome,
-              orb_1100_r_multiple=excluded.orb_1100_r_multiple,
-              orb_1100_mae=excluded.orb_1100_mae,
-              orb_1100_mfe=excluded.orb_1100_mfe,
-              orb_1800_high=excluded.orb_1800_high,
-              orb_1800_low=excluded.orb_1800_low,
-              orb_1800_size=excluded.orb_1800_size,
-              orb_1800_break_dir=excluded.orb_1800_break_dir,
-              orb_1800_outcome=excluded.orb_1800_outcome,
-              orb_1800_r_multiple=excluded.orb_1800_r_multiple,
-              orb_1800_mae=excluded.orb_1800_mae,
-              orb_1800_mfe=excluded.orb_1800_mfe,
-              orb_2300_high=excluded.orb_2300_high,
-              orb_2300_low=excluded.orb_2300_low,
-              orb_2300_size=excluded.orb_2300_size,
-              orb_2300_break_dir=excluded.orb_2300_break_dir,
-              orb_2300_outcome=excluded.orb_2300_outcome,
-              orb_2300_r_multiple=excluded.orb_2300_r_multiple,
-              orb_2300_mae=excluded.orb_2300_mae,
-              orb_2300_mfe=excluded.orb_2300_mfe,
-              orb_0030_high=excluded.orb_0030_high,
-              orb_0030_low=excluded.orb_0030_low,
-              orb_0030_size=excluded.orb_0030_size,
-              orb_0030_break_dir=excluded.orb_0030_break_dir,
-              orb_0030_outcome=excluded.orb_0030_outcome,
-              orb_0030_r_multiple=excluded.orb_0030_r_multiple,
-              orb_0030_mae=excluded.orb_0030_mae,
-              orb_0030_mfe=excluded.orb_0030_mfe,
-              rsi_at_orb=excluded.rsi_at_orb
-            """,
-            [
-                d,
-                INSTRUMENT,
-                asia_hi, asia_lo, asia_range,
-                lon_hi, lon_lo,
-                ny_hi, ny_lo,
-                pre_ny_travel, pre_orb_travel,
-                atr_20, asia_type, london_type, ny_type,
-                # ORB 0900
-                orb_0900["orb_high"], orb_0900["orb_low"], orb_0900["orb_size"], orb_0900["orb_break_dir"],
-                orb_0900["outcome"], orb_0900["r_multiple"], orb_0900["mae"], orb_0900["mfe"],
-                # ORB 1000
-                orb_1000["orb_high"], orb_1000["orb_low"], orb_1000["orb_size"], orb_1000["orb_break_dir"],
-                orb_1000["outcome"], orb_1000["r_multiple"], orb_1000["mae"], orb_1000["mfe"],
-                # ORB 1100
-                orb_1100["orb_high"], orb_1100["orb_low"], orb_1100["orb_size"], orb_1100["orb_break_dir"],
-                orb_1100["outcome"], orb_1100["r_multiple"], orb_1100["mae"], orb_1100["mfe"],
-                # ORB 1800
-                orb_1800["orb_high"], orb_1800["orb_low"], orb_1800["orb_size"], orb_1800["orb_break_dir"],
-                orb_1800["outcome"], orb_1800["r_multiple"], orb_1800["mae"], orb_1800["mfe"],
-                # ORB 2300
-                orb_2300["orb_high"], orb_2300["orb_low"], orb_2300["orb_size"], orb_2300["orb_break_dir"],
-                orb_2300["outcome"], orb_2300["r_multiple"], orb_2300["mae"], orb_2300["mfe"],
-                # ORB 0030
-                orb_0030["orb_high"], orb_0030["orb_low"], orb_0030["orb_size"], orb_0030["orb_break_dir"],
-                orb_0030["outcome"], orb_0030["r_multiple"], orb_0030["mae"], orb_0030["mfe"],
-                # RSI
-                orb_0030.get("rsi_at_orb"),
-            ],
-        )
-
-        print("OK: daily_features upserted for", d.isoformat(), INSTRUMENT)
-        print("  ATR_20:", atr_20)
-        print("  Asia H/L:", asia_hi, asia_lo, "range:", asia_range, f"type: {asia_type}")
-        print("  London H/L:", lon_hi, lon_lo, f"type: {london_type}")
-        print("  NY H/L:", ny_hi, ny_lo, f"type: {ny_type}")
-        print("  Pre-NY travel:", pre_ny_travel, "Pre-ORB travel:", pre_orb_travel)
-        print("  ORB 09:00:", f"H/L: {orb_0900['orb_high']}/{orb_0900['orb_low']}", f"size: {orb_0900['orb_size']}",
-              f"dir: {orb_0900['orb_break_dir']}", f"outcome: {orb_0900['outcome']}", f"R: {orb_0900['r_multiple']}")
-        print("  ORB 10:00:", f"H/L: {orb_1000['orb_high']}/{orb_1000['orb_low']}", f"size: {orb_1000['orb_size']}",
-              f"dir: {orb_1000['orb_break_dir']}", f"outcome: {orb_1000['outcome']}", f"R: {orb_1000['r_multiple']}")
-        print("  ORB 11:00:", f"H/L: {orb_1100['orb_high']}/{orb_1100['orb_low']}", f"size: {orb_1100['orb_size']}",
-              f"dir: {orb_1100['orb_break_dir']}", f"outcome: {orb_1100['outcome']}", f"R: {orb_1100['r_multiple']}")
-        print("  ORB 18:00:", f"H/L: {orb_1800['orb_high']}/{orb_1800['orb_low']}", f"size: {orb_1800['orb_size']}",
-              f"dir: {orb_1800['orb_break_dir']}", f"outcome: {orb_1800['outcome']}", f"R: {orb_1800['r_multiple']}")
-        print("  ORB 23:00:", f"H/L: {orb_2300['orb_high']}/{orb_2300['orb_low']}", f"size: {orb_2300['orb_size']}",
-              f"dir: {orb_2300['orb_break_dir']}", f"outcome: {orb_2300['outcome']}", f"R: {orb_2300['r_multiple']}")
-        print("  ORB 00:30:", f"H/L: {orb_0030['orb_high']}/{orb_0030['orb_low']}", f"size: {orb_0030['orb_size']}",
-              f"dir: {orb_0030['orb_break_dir']}", f"outcome: {orb_0030['outcome']}", f"R: {orb_0030['r_multiple']}")
-        print("  RSI@ORB(00:30):", orb_0030.get("rsi_at_orb"))
-
+        build_features_for_date(con, d)
     finally:
         con.close()
 
@@ -37,9 +37,22 @@ Usage:
   python build_daily_features_v2.py 2026-01-10
   python build_daily_features_v2.py 2024-01-02 2026-01-10
   python build_daily_features_v2.py 2024-01-02 2026-01-10 --sl-mode half
+  python build_daily_features_v2.py 2024-01-02 2026-01-10 --bulk
+  python build_daily_features_v2.py 2024-01-02 2026-01-10 --orb-daily
+
+Bulk mode (--bulk) loads the bars_1m range once into NumPy arrays and computes
+every day in columnar passes, then writes the whole range in one statement.
+Output is identical to the per-day path; use it for multi-year rebuilds.
+
+Both paths also refresh orb_daily (orb_daily_half for --sl-mode half): the same
+ORB columns unpivoted to one row per (instrument, orb_time, date_local). The table
+is filled from every existing feature row when it is first created; --orb-daily
+rebuilds a range from existing feature rows without recomputing them.
 """
 
 import duckdb
+import numpy as np
+import pandas as pd
 import sys
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
@@ -56,16 +69,258 @@ RR_DEFAULT = 1.0  # keep simple for now
 SL_MODE = "full"  # Default: "full" = stop at opposite edge; can override with --sl-mode half
 
 
+ORB_TIMES = ["0900", "1000", "1100", "1800", "2300", "0030"]
+ORB_FIELDS = ["high", "low", "size", "break_dir", "outcome", "r_multiple", "mae", "mfe", "stop_price", "risk_ticks"]
+SESSION_BLOCKS = ["pre_asia", "pre_london", "pre_ny", "asia", "london", "ny"]
+
+V2_COLUMNS = (
+    ["date_local", "instrument"]
+    + [f"{block}_{stat}" for block in SESSION_BLOCKS for stat in ("high", "low", "range")]
+    + ["asia_type_code", "london_type_code", "pre_ny_type_code"]
+    + [f"orb_{orb}_{field}" for orb in ORB_TIMES for field in ORB_FIELDS]
+    + ["rsi_at_0030", "rsi_at_orb", "atr_20"]
+)
+
+# Long-format companion table: one row per (instrument, orb_time, date_local),
+# stored in that order so range scans over one ORB read contiguous row groups
+ORB_DAILY_COLUMNS = ["date_local", "instrument", "orb_time"] + ORB_FIELDS
+
+# One row per source table, bumped on every write; readers key caches on it
+SOURCE_VERSIONS_TABLE = "source_versions"
+
+
+def bump_source_version(con: duckdb.DuckDBPyConnection, source: str) -> None:
+    """Advance the change marker of `source` (same transaction as the write it marks)."""
+    con.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {SOURCE_VERSIONS_TABLE} (
+            source VARCHAR PRIMARY KEY,
+            version BIGINT NOT NULL,
+            updated_at TIMESTAMPTZ
+        )
+        """
+    )
+    con.execute(
+        f"""
+        INSERT INTO {SOURCE_VERSIONS_TABLE} VALUES (?, 1, now())
+        ON CONFLICT (source) DO UPDATE
+        SET version = {SOURCE_VERSIONS_TABLE}.version + 1, updated_at = excluded.updated_at
+        """,
+        [source],
+    )
+
+
+def orb_daily_table(features_table: str) -> str:
+    """orb_daily table fed by a daily features table (daily_features_v2_half -> orb_daily_half)."""
+    return features_table.replace("daily_features_v2", "orb_daily")
+
+
 def _dt_local(d: date, hh: int, mm: int) -> datetime:
     return datetime(d.year, d.month, d.day, hh, mm, tzinfo=TZ_LOCAL)
 
 
+def _epoch_ms(dt_local: datetime) -> int:
+    return int(dt_local.astimezone(TZ_UTC).timestamp()) * 1000
+
+
+def _rsi_from_closes(closes: List[float]) -> float:
+    """Simple-average RSI over RSI_LEN changes (closes ascending, len RSI_LEN + 1)."""
+    gains, losses = [], []
+    for i in range(1, len(closes)):
+        ch = closes[i] - closes[i - 1]
+        gains.append(max(ch, 0.0))
+        losses.append(max(-ch, 0.0))
+
+    avg_gain = sum(gains[:RSI_LEN]) / RSI_LEN
+    avg_loss = sum(losses[:RSI_LEN]) / RSI_LEN
+    if avg_loss == 0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+def _atr_from_rows(rows: List[Tuple[float, float]]) -> float:
+    """Mean Asia range over (asia_high, asia_low) rows, most recent first."""
+    trs = [float(h) - float(l) for (h, l) in rows]
+    return sum(trs) / len(trs)
+
+
+# ---------- columnar helpers (bulk mode) ----------
+def _window_bounds(ts: np.ndarray, start_ms: np.ndarray, end_ms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Index bounds [s, e) of bars with start <= ts < end (same predicate as the SQL fetchers)."""
+    return np.searchsorted(ts, start_ms, side="left"), np.searchsorted(ts, end_ms, side="left")
+
+
+def _reduce_windows(values: np.ndarray, s: np.ndarray, e: np.ndarray, ufunc) -> np.ndarray:
+    """ufunc.reduce over values[s_i:e_i] for every window; empty windows are left as 0."""
+    out = np.zeros(len(s), dtype=values.dtype)
+    nonempty = e > s
+    if nonempty.any():
+        # reduceat over interleaved [s0, e0, s1, e1, ...]; even slots are the windows.
+        # Pad one element so e == len(values) is a valid index.
+        padded = np.append(values, values[-1:])
+        idx = np.column_stack([s[nonempty], e[nonempty]]).ravel()
+        out[nonempty] = ufunc.reduceat(padded, idx)[::2]
+    return out
+
+
+def _segment_first(mask: np.ndarray, offsets: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Position (within the concatenated array) of the first True per segment, -1 if none."""
+    first = np.full(len(offsets), -1, dtype=np.int64)
+    nonempty = lengths > 0
+    if mask.size and nonempty.any():
+        big = np.iinfo(np.int64).max
+        cand = np.where(mask, np.arange(mask.size, dtype=np.int64), big)
+        hits = np.minimum.reduceat(cand, offsets[nonempty])
+        first[nonempty] = np.where(hits == big, -1, hits)
+    return first
+
+
+def _window_stats_bulk(bars: Dict[str, np.ndarray], start_ms: np.ndarray, end_ms: np.ndarray) -> List[Optional[Dict]]:
+    """Vectorized _window_stats_1m for one window per trade date."""
+    s, e = _window_bounds(bars["ts"], start_ms, end_ms)
+    highs = _reduce_windows(bars["high"], s, e, np.maximum)
+    lows = _reduce_windows(bars["low"], s, e, np.minimum)
+    vols = _reduce_windows(bars["volume"], s, e, np.add)
+
+    out: List[Optional[Dict]] = []
+    for i in range(len(s)):
+        if e[i] <= s[i]:
+            out.append(None)
+            continue
+        high, low = float(highs[i]), float(lows[i])
+        rng = high - low
+        out.append({
+            "high": high,
+            "low": low,
+            "range": rng,
+            "range_ticks": rng / 0.1,
+            "volume": int(vols[i]),
+        })
+    return out
+
+
+def _orb_exec_bulk(bars: Dict[str, np.ndarray], orb_start_ms: np.ndarray, scan_end_ms: np.ndarray,
+                   rr: float, sl_mode: str) -> List[Optional[Dict]]:
+    """
+    Vectorized FeatureBuilderV2.calculate_orb_1m_exec for one ORB across many trade dates.
+
+    Scan windows are concatenated into one flat index so entry detection, exit detection
+    and MAE/MFE are single array passes with per-window (segment) reductions.
+    """
+    ts, hi, lo, cl = bars["ts"], bars["high"], bars["low"], bars["close"]
+    n = len(orb_start_ms)
+    orb_end_ms = orb_start_ms + 5 * 60 * 1000
+
+    s, e = _window_bounds(ts, orb_start_ms, orb_end_ms)
+    has_orb = e > s
+    orb_high = _reduce_windows(hi, s, e, np.maximum)
+    orb_low = _reduce_windows(lo, s, e, np.minimum)
+    orb_size = orb_high - orb_low
+    orb_mid = (orb_high + orb_low) / 2.0
+
+    # Flatten scan windows [orb_end, scan_end) into one index array
+    a, b = _window_bounds(ts, orb_end_ms, scan_end_ms)
+    lengths = np.where(has_orb, np.maximum(b - a, 0), 0)
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(np.int64)
+    seg = np.repeat(np.arange(n), lengths)
+    k = np.arange(seg.size, dtype=np.int64)
+    pos = k - offsets[seg] + a[seg]
+    h, l, c = hi[pos], lo[pos], cl[pos]
+
+    # Entry = first 1m close outside ORB
+    up_close = c > orb_high[seg]
+    dn_close = c < orb_low[seg]
+    entry_k = _segment_first(up_close | dn_close, offsets, lengths)
+    has_entry = entry_k >= 0
+    is_up = np.zeros(n, dtype=bool)
+    is_up[has_entry] = up_close[entry_k[has_entry]]
+
+    orb_edge = np.where(is_up, orb_high, orb_low)
+    if sl_mode == "full":
+        stop = np.where(is_up, orb_low, orb_high)
+    else:
+        stop = orb_mid
+    r_orb = np.abs(orb_edge - stop)
+    tradable = has_entry & (r_orb > 0)
+    safe_r = np.where(tradable, r_orb, 1.0)
+    target = np.where(is_up, orb_edge + rr * r_orb, orb_edge - rr * r_orb)
+
+    # Exit = first bar AFTER entry touching stop or target
+    after_entry = tradable[seg] & (k > entry_k[seg])
+    up_seg = is_up[seg]
+    hit_stop = np.where(up_seg, l <= stop[seg], h >= stop[seg])
+    hit_target = np.where(up_seg, h >= target[seg], l <= target[seg])
+    exit_k = _segment_first(after_entry & (hit_stop | hit_target), offsets, lengths)
+    has_exit = exit_k >= 0
+
+    # MAE/MFE from ORB edge over (entry, exit] (or to end of scan window)
+    in_path = after_entry & (~has_exit[seg] | (k <= exit_k[seg]))
+    adverse = np.where(up_seg, orb_edge[seg] - l, h - orb_edge[seg])
+    favorable = np.where(up_seg, h - orb_edge[seg], orb_edge[seg] - l)
+    path_starts = np.where(has_orb, offsets, 0)
+    path_ends = path_starts + lengths
+    mae_raw = np.maximum(_reduce_windows(np.where(in_path, adverse, 0.0), path_starts, path_ends, np.maximum), 0.0)
+    mfe_raw = np.maximum(_reduce_windows(np.where(in_path, favorable, 0.0), path_starts, path_ends, np.maximum), 0.0)
+
+    out: List[Optional[Dict]] = []
+    for i in range(n):
+        if not has_orb[i]:
+            out.append(None)
+            continue
+        base = {"high": float(orb_high[i]), "low": float(orb_low[i]), "size": float(orb_size[i])}
+        if not has_entry[i]:
+            base.update({"break_dir": "NONE", "outcome": "NO_TRADE", "r_multiple": None,
+                         "mae": None, "mfe": None, "stop_price": None, "risk_ticks": None})
+            out.append(base)
+            continue
+
+        break_dir = "UP" if is_up[i] else "DOWN"
+        if not tradable[i]:
+            base.update({"break_dir": break_dir, "outcome": "NO_TRADE", "r_multiple": None,
+                         "mae": None, "mfe": None, "stop_price": float(stop[i]), "risk_ticks": 0.0})
+            out.append(base)
+            continue
+
+        risk_ticks = float(r_orb[i]) / 0.1
+        mae = float(mae_raw[i]) / float(safe_r[i])
+        mfe = float(mfe_raw[i]) / float(safe_r[i])
+        if has_exit[i]:
+            x = exit_k[i]
+            if hit_stop[x] or not hit_target[x]:
+                outcome, r_multiple = "LOSS", -1.0
+            else:
+                outcome, r_multiple = "WIN", float(rr)
+        else:
+            outcome, r_multiple = "NO_TRADE", None
+            mae = mae if mae_raw[i] > 0 else None
+            mfe = mfe if mfe_raw[i] > 0 else None
+
+        base.update({"break_dir": break_dir, "outcome": outcome, "r_multiple": r_multiple,
+                     "mae": mae, "mfe": mfe, "stop_price": float(stop[i]), "risk_ticks": risk_ticks})
+        out.append(base)
+    return out
+
+
 class FeatureBuilderV2:
-    def __init__(self, db_path: str = DB_PATH, sl_mode: str = "full", table_name: str = "daily_features_v2"):
-        self.con = duckdb.connect(db_path)
+    _owns_con = True
+
+    def __init__(self, db_path: str = DB_PATH, sl_mode: str = "full", table_name: str = "daily_features_v2",
+                 con: Optional[duckdb.DuckDBPyConnection] = None):
+        # A shared connection belongs to the caller: no commits or close() from here
+        self._owns_con = con is None
+        self.con = duckdb.connect(db_path) if con is None else con
         self.sl_mode = sl_mode
         self.table_name = table_name
 
+    @property
+    def orb_table(self) -> str:
+        return orb_daily_table(self.table_name)
+
+    def _commit(self):
+        if self._owns_con:
+            self.con.commit()
+
     # ---------- core time-window fetchers (FIX midnight safely) ----------
     def _window_stats_1m(self, start_local: datetime, end_local: datetime) -> Optional[Dict]:
         start_utc = start_local.astimezone(TZ_UTC)
@@ -325,19 +580,7 @@ class FeatureBuilderV2:
         if len(closes) < 15:
             return None
 
-        closes = [float(x[0]) for x in reversed(closes)]
-        gains, losses = [], []
-        for i in range(1, len(closes)):
-            ch = closes[i] - closes[i - 1]
-            gains.append(max(ch, 0.0))
-            losses.append(max(-ch, 0.0))
-
-        avg_gain = sum(gains[:RSI_LEN]) / RSI_LEN
-        avg_loss = sum(losses[:RSI_LEN]) / RSI_LEN
-        if avg_loss == 0:
-            return 100.0
-        rs = avg_gain / avg_loss
-        return 100.0 - (100.0 / (1.0 + rs))
+        return _rsi_from_closes([float(x[0]) for x in reversed(closes)])
 
     # ---------- ATR (simple) ----------
     def calculate_atr(self, trade_date: date) -> Optional[float]:
@@ -356,8 +599,7 @@ class FeatureBuilderV2:
         if len(rows) < 20:
             return None
 
-        trs = [float(h) - float(l) for (h, l) in rows]
-        return sum(trs) / len(trs)
+        return _atr_from_rows(rows)
 
     # ---------- deterministic type codes (level interactions only) ----------
     @staticmethod
@@ -600,10 +842,201 @@ class FeatureBuilderV2:
             ],
         )
 
-        self.con.commit()
+        self.refresh_orb_daily(trade_date, trade_date)
+        self._commit()
         print("  [OK] Features saved")
         return True
 
+    # ---------- bulk build (set-based) ----------
+    def _load_bars_1m_arrays(self, start_local: datetime, end_local: datetime) -> Dict[str, np.ndarray]:
+        """Load bars_1m for [start, end) once as contiguous arrays (ts in epoch ms)."""
+        cols = self.con.execute(
+            """
+            SELECT epoch_ms(ts_utc) AS ts, high, low, close, volume
+            FROM bars_1m
+            WHERE symbol = ?
+              AND ts_utc >= ? AND ts_utc < ?
+            ORDER BY ts_utc
+            """,
+            [SYMBOL, start_local.astimezone(TZ_UTC), end_local.astimezone(TZ_UTC)],
+        ).fetchnumpy()
+        return {
+            "ts": np.asarray(cols["ts"], dtype=np.int64),
+            "high": np.asarray(cols["high"], dtype=np.float64),
+            "low": np.asarray(cols["low"], dtype=np.float64),
+            "close": np.asarray(cols["close"], dtype=np.float64),
+            "volume": np.asarray(cols["volume"], dtype=np.int64),
+        }
+
+    def _rsi_at_bulk(self, at_locals: List[datetime]) -> List[Optional[float]]:
+        """calculate_rsi_at for many timestamps from a single bars_5m read."""
+        first_utc = at_locals[0].astimezone(TZ_UTC)
+        last_utc = at_locals[-1].astimezone(TZ_UTC)
+        cols = self.con.execute(
+            """
+            SELECT epoch_ms(ts_utc) AS ts, close
+            FROM bars_5m
+            WHERE symbol = ?
+              AND ts_utc <= ?
+              AND ts_utc >= COALESCE((
+                    SELECT MIN(ts_utc) FROM (
+                        SELECT ts_utc FROM bars_5m
+                        WHERE symbol = ? AND ts_utc <= ?
+                        ORDER BY ts_utc DESC
+                        LIMIT 15
+                    )
+                  ), ?)
+            ORDER BY ts_utc
+            """,
+            [SYMBOL, last_utc, SYMBOL, first_utc, first_utc],
+        ).fetchnumpy()
+        ts5 = np.asarray(cols["ts"], dtype=np.int64)
+        closes5 = np.asarray(cols["close"], dtype=np.float64)
+
+        ends = np.searchsorted(ts5, [_epoch_ms(at) for at in at_locals], side="right")
+        return [
+            _rsi_from_closes(closes5[n - 15:n].tolist()) if n >= 15 else None
+            for n in ends
+        ]
+
+    def _atr_bulk(self, dates: List[date], asia_sessions: List[Optional[Dict]]) -> List[Optional[float]]:
+        """
+        calculate_atr for every date in the range.
+
+        The per-day path reads daily_features_v2 rows written earlier in the same run,
+        so when this builder targets daily_features_v2 the freshly computed Asia
+        sessions replace the stored rows inside the range.
+        """
+        start, end = dates[0], dates[-1]
+        history = self.con.execute(
+            """
+            SELECT date_local, asia_high, asia_low
+            FROM daily_features_v2
+            WHERE date_local < ?
+              AND asia_high IS NOT NULL
+            ORDER BY date_local
+            """,
+            [end],
+        ).fetchall()
+
+        if self.table_name == "daily_features_v2":
+            history = [r for r in history if r[0] < start]
+            history += [
+                (d, sess["high"], sess["low"])
+                for d, sess in zip(dates, asia_sessions)
+                if sess is not None
+            ]
+
+        hist_days = np.array([r[0] for r in history], dtype="datetime64[D]")
+        counts = np.searchsorted(hist_days, np.array(dates, dtype="datetime64[D]"), side="left")
+        out: List[Optional[float]] = []
+        for n in counts:
+            if n < 20:
+                out.append(None)
+                continue
+            out.append(_atr_from_rows([(h, l) for (_, h, l) in reversed(history[n - 20:n])]))
+        return out
+
+    def build_features_bulk(self, start_date: date, end_date: date) -> int:
+        """
+        Build every trade date in [start_date, end_date] in one columnar pass.
+
+        Produces exactly the rows build_features() would, but reads bars_1m once and
+        writes the range with a single INSERT OR REPLACE ... SELECT.
+
+        Returns:
+            Number of rows written
+        """
+        dates: List[date] = []
+        cur = start_date
+        while cur <= end_date:
+            dates.append(cur)
+            cur += timedelta(days=1)
+        if not dates:
+            return 0
+
+        print(f"Building features (bulk) for {start_date} to {end_date} ({len(dates)} days)...")
+
+        bars = self._load_bars_1m_arrays(_dt_local(start_date, 7, 0), _dt_local(end_date + timedelta(days=1), 9, 0))
+        print(f"  Loaded {len(bars['ts']):,} bars_1m rows")
+
+        def local_ms(day_offset: int, hh: int, mm: int) -> np.ndarray:
+            return np.array([_epoch_ms(_dt_local(d + timedelta(days=day_offset), hh, mm)) for d in dates], dtype=np.int64)
+
+        sessions = {
+            "pre_asia": _window_stats_bulk(bars, local_ms(0, 7, 0), local_ms(0, 9, 0)),
+            "pre_london": _window_stats_bulk(bars, local_ms(0, 17, 0), local_ms(0, 18, 0)),
+            "pre_ny": _window_stats_bulk(bars, local_ms(0, 23, 0), local_ms(1, 0, 30)),
+            "asia": _window_stats_bulk(bars, local_ms(0, 9, 0), local_ms(0, 17, 0)),
+            "london": _window_stats_bulk(bars, local_ms(0, 18, 0), local_ms(0, 23, 0)),
+            "ny": _window_stats_bulk(bars, local_ms(1, 0, 30), local_ms(1, 2, 0)),
+        }
+
+        next_asia_open = local_ms(1, 9, 0)
+        orb_starts = {
+            "0900": local_ms(0, 9, 0),
+            "1000": local_ms(0, 10, 0),
+            "1100": local_ms(0, 11, 0),
+            "1800": local_ms(0, 18, 0),
+            "2300": local_ms(0, 23, 0),
+            "0030": local_ms(1, 0, 30),
+        }
+        orbs = {
+            orb: _orb_exec_bulk(bars, starts, next_asia_open, RR_DEFAULT, self.sl_mode)
+            for orb, starts in orb_starts.items()
+        }
+
+        rsi_at_0030 = self._rsi_at_bulk([_dt_local(d + timedelta(days=1), 0, 30) for d in dates])
+        atr_20 = self._atr_bulk(dates, sessions["asia"])
+
+        rows: List[List] = []
+        for i, d in enumerate(dates):
+            sess = {block: sessions[block][i] for block in SESSION_BLOCKS}
+            asia, london, pre_ny = sess["asia"], sess["london"], sess["pre_ny"]
+
+            asia_code = self.classify_asia_code(asia["range"] if asia else None, atr_20[i])
+            london_code = self.classify_london_code(
+                london["high"] if london else None,
+                london["low"] if london else None,
+                asia["high"] if asia else None,
+                asia["low"] if asia else None,
+            )
+            pre_ny_code = self.classify_pre_ny_code(
+                pre_ny["high"] if pre_ny else None,
+                pre_ny["low"] if pre_ny else None,
+                london["high"] if london else None,
+                london["low"] if london else None,
+                asia["high"] if asia else None,
+                asia["low"] if asia else None,
+                atr_20[i],
+            )
+
+            row = [d, "MGC"]
+            for block in SESSION_BLOCKS:
+                stats = sess[block]
+                row += [stats[k] if stats else None for k in ("high", "low", "range")]
+            row += [asia_code, london_code, pre_ny_code]
+            for orb in ORB_TIMES:
+                res = orbs[orb][i]
+                row += [res.get(field) if res else None for field in ORB_FIELDS]
+            row += [rsi_at_0030[i], rsi_at_0030[i], atr_20[i]]
+            rows.append(row)
+
+        frame = pd.DataFrame(rows, columns=V2_COLUMNS, dtype=object)
+        cols = ", ".join(V2_COLUMNS)
+        self.con.register("_bulk_features_v2", frame)
+        try:
+            self.con.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} ({cols}) SELECT {cols} FROM _bulk_features_v2"
+            )
+        finally:
+            self.con.unregister("_bulk_features_v2")
+        self.refresh_orb_daily(start_date, end_date)
+        self._commit()
+
+        print(f"  [OK] {len(rows)} rows saved")
+        return len(rows)
+
     def init_schema_v2(self):
         self.con.execute(
             f"""
@@ -708,11 +1141,90 @@ class FeatureBuilderV2:
             )
             """
         )
-        self.con.commit()
-        print(f"{self.table_name} table created (sl_mode={self.sl_mode})")
+        self._init_orb_daily_schema()
+        self._commit()
+        print(f"{self.table_name} / {self.orb_table} tables created (sl_mode={self.sl_mode})")
+
+    def _init_orb_daily_schema(self):
+        """Create orb_daily if missing, filled from every feature row already built."""
+        exists = self.con.execute(
+            "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ?", [self.orb_table]
+        ).fetchone()[0] > 0
+        if exists:
+            return
+        self.con.execute(
+            f"""
+            CREATE TABLE {self.orb_table} (
+                date_local DATE NOT NULL,
+                instrument VARCHAR NOT NULL,
+                orb_time VARCHAR NOT NULL,
+                high DOUBLE,
+                low DOUBLE,
+                size DOUBLE,
+                break_dir VARCHAR,
+                outcome VARCHAR,
+                r_multiple DOUBLE,
+                mae DOUBLE,
+                mfe DOUBLE,
+                stop_price DOUBLE,
+                risk_ticks DOUBLE,
+
+                PRIMARY KEY (instrument, orb_time, date_local)
+            )
+            """
+        )
+        has_features = self.con.execute(
+            "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ?", [self.table_name]
+        ).fetchone()[0] > 0
+        if has_features:
+            first, last = self.con.execute(f"SELECT MIN(date_local), MAX(date_local) FROM {self.table_name}").fetchone()
+            if first is not None:
+                self._write_orb_daily(first, last)
+
+    def refresh_orb_daily(self, start_date: date, end_date: date) -> int:
+        """
+        Rewrite orb_daily for [start_date, end_date] from the wide feature rows.
+
+        One row per ORB with data, inserted sorted by (instrument, orb_time,
+        date_local) so each ORB's history stays clustered. close_confirmations is
+        not stored: orb_trades_1m_exec is written outside this pipeline, so readers
+        aggregate it at query time.
+
+        Returns:
+            Number of orb_daily rows written
+        """
+        self._init_orb_daily_schema()
+        return self._write_orb_daily(start_date, end_date)
+
+    def _write_orb_daily(self, start_date: date, end_date: date) -> int:
+        unpivot = "\nUNION ALL\n".join(
+            f"SELECT date_local, instrument, '{orb}' AS orb_time, "
+            + ", ".join(f"orb_{orb}_{field} AS {field}" for field in ORB_FIELDS)
+            + f" FROM {self.table_name}"
+            + f" WHERE date_local BETWEEN ? AND ? AND orb_{orb}_size IS NOT NULL"
+            for orb in ORB_TIMES
+        )
+        cols = ", ".join(ORB_DAILY_COLUMNS)
+
+        self.con.execute(f"DELETE FROM {self.orb_table} WHERE date_local BETWEEN ? AND ?", [start_date, end_date])
+        self.con.execute(
+            f"""
+            INSERT INTO {self.orb_table} ({cols})
+            SELECT {cols}
+            FROM ({unpivot})
+            ORDER BY instrument, orb_time, date_local
+            """,
+            [start_date, end_date] * len(ORB_TIMES),
+        )
+        # Every feature write ends here, so one bump marks both tables
+        bump_source_version(self.con, self.table_name)
+        return self.con.execute(
+            f"SELECT COUNT(*) FROM {self.orb_table} WHERE date_local BETWEEN ? AND ?", [start_date, end_date]
+        ).fetchone()[0]
 
     def close(self):
-        self.con.close()
+        if self._owns_con:
+            self.con.close()
 
 
 def main():
@@ -723,6 +1235,10 @@ def main():
     parser.add_argument("end_date", type=str, nargs="?", default=None, help="End date (YYYY-MM-DD), optional")
     parser.add_argument("--sl-mode", type=str, choices=["full", "half"], default="full",
                         help="Stop loss mode: 'full' (opposite edge) or 'half' (midpoint)")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Build the whole range in one columnar pass (same output, far fewer queries)")
+    parser.add_argument("--orb-daily", action="store_true",
+                        help="Only rebuild the long-format orb_daily table from existing feature rows")
 
     args = parser.parse_args()
 
@@ -741,10 +1257,17 @@ def main():
     builder = FeatureBuilderV2(sl_mode=sl_mode, table_name=table_name)
     builder.init_schema_v2()
 
-    cur = start_date
-    while cur <= end_date:
-        builder.build_features(cur)
-        cur += timedelta(days=1)
+    if args.orb_daily:
+        rows = builder.refresh_orb_daily(start_date, end_date)
+        builder._commit()
+        print(f"  [OK] {rows} {builder.orb_table} rows saved")
+    elif args.bulk:
+        builder.build_features_bulk(start_date, end_date)
+    else:
+        cur = start_date
+        while cur <= end_date:
+            builder.build_features(cur)
+            cur += timedelta(days=1)
 
     builder.close()
     print(f"\nCompleted: {start_date} to {end_date}")
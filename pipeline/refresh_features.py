@@ -0,0 +1,169 @@
+# refresh_features.py
+"""
+Incremental feature refresh (in-process)
+========================================
+
+Rebuilds daily_features (V1) and daily_features_v2 for the trade dates whose
+bars_1m rows changed, plus the later dates whose lookbacks read those bars:
+
+  - V1 date D reads bars from (D-1) 09:00 (ATR_20 24h lookback), and its 00:30
+    ORB sits at D 00:30 with a 24h RSI lookback reaching (D-1) 00:30, i.e. into
+    trade date D-2. A changed date therefore touches V1 rows D, D+1 and D+2.
+  - V2 date D reads bars from D 07:00 (pre-Asia) and RSI from the last 15
+    5m bars before (D+1) 00:30, which sit in trade date D or just before it.
+  - V2 atr_20 for D averages the Asia range of the previous 20 daily_features_v2
+    rows with Asia data, so a changed date ripples forward 20 Asia rows.
+
+Only the full-SL daily_features_v2 table is refreshed (the one the backfill builds).
+
+Lookback-only dates are rebuilt only if they already have a feature row
+(we never create rows for days that were not built before).
+
+Everything runs over ONE caller-owned connection inside ONE transaction,
+replacing the per-day `python build_daily_features*.py <date>` subprocess fan-out.
+
+Usage:
+  python refresh_features.py 2026-01-05 2026-01-06 2026-01-07
+"""
+
+import sys
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Set
+
+import duckdb
+
+from build_daily_features import DB_PATH, ensure_daily_features_table, build_features_for_date
+from build_daily_features_v2 import FeatureBuilderV2
+
+ATR_V2_LOOKBACK = 20  # rows read by FeatureBuilderV2.calculate_atr
+BAR_LOOKBACK_DAYS = {"daily_features": 2, "daily_features_v2": 1}  # later trade dates reading a day's bars
+
+
+def _contiguous_runs(dates: List[date]) -> List[List[date]]:
+    """Split sorted dates into runs of consecutive days."""
+    runs: List[List[date]] = []
+    for d in dates:
+        if runs and d - runs[-1][-1] == timedelta(days=1):
+            runs[-1].append(d)
+        else:
+            runs.append([d])
+    return runs
+
+
+def _existing_dates(con: duckdb.DuckDBPyConnection, table: str, dates: Iterable[date]) -> Set[date]:
+    dates = sorted(set(dates))
+    if not dates:
+        return set()
+    rows = con.execute(
+        f"SELECT DISTINCT date_local FROM {table} WHERE date_local BETWEEN ? AND ?",
+        [dates[0], dates[-1]],
+    ).fetchall()
+    wanted = set(dates)
+    return {r[0] for r in rows if r[0] in wanted}
+
+
+def bar_dependent_dates(con: duckdb.DuckDBPyConnection, table: str, changed: Set[date]) -> List[date]:
+    """Changed dates plus the following days whose bar lookbacks reach them (existing rows only)."""
+    later = {
+        d + timedelta(days=k)
+        for d in changed
+        for k in range(1, BAR_LOOKBACK_DAYS[table] + 1)
+    } - changed
+    return sorted(changed | _existing_dates(con, table, later))
+
+
+def atr_dependent_dates(con: duckdb.DuckDBPyConnection, table: str, rebuilt: List[date]) -> List[date]:
+    """
+    daily_features_v2 dates whose atr_20 window includes any rebuilt date.
+
+    For rebuilt date A, every existing row after A up to (and including) the
+    ATR_V2_LOOKBACK-th later row with Asia data averages A's Asia range.
+    Call AFTER the rebuilt dates are written so Asia coverage is current.
+    """
+    if not rebuilt:
+        return []
+    rows = con.execute(
+        f"""
+        SELECT date_local, asia_high IS NOT NULL AS has_asia
+        FROM {table}
+        WHERE date_local > ?
+        ORDER BY date_local
+        """,
+        [min(rebuilt)],
+    ).fetchall()
+
+    rebuilt_set = set(rebuilt)
+    out: Set[date] = set()
+    for a in rebuilt:
+        asia_seen = 0
+        for d, has_asia in rows:
+            if d <= a:
+                continue
+            if asia_seen >= ATR_V2_LOOKBACK:
+                break
+            out.add(d)
+            if has_asia:
+                asia_seen += 1
+    return sorted(out - rebuilt_set)
+
+
+def refresh_features(con: duckdb.DuckDBPyConnection, changed_dates: Iterable[date]) -> Dict[str, List[date]]:
+    """
+    Rebuild daily_features and daily_features_v2 for changed trade dates (and their dependents).
+
+    Args:
+        con: Open connection; committed here on success, rolled back on error
+        changed_dates: Local trade dates whose bars_1m rows were inserted/replaced
+
+    Returns:
+        Dict with the rebuilt dates: {"daily_features": [...], "daily_features_v2": [...]}
+    """
+    changed = set(changed_dates)
+    v2_table = "daily_features_v2"
+    if not changed:
+        return {"daily_features": [], v2_table: []}
+
+    con.begin()
+    try:
+        # V1: per-day builder (5m ORB logic), bar lookbacks only
+        ensure_daily_features_table(con)
+        v1_dates = bar_dependent_dates(con, "daily_features", changed)
+        for d in v1_dates:
+            build_features_for_date(con, d)
+
+        # V2: bulk builder over contiguous runs, then the ATR ripple
+        builder = FeatureBuilderV2(sl_mode="full", table_name=v2_table, con=con)
+        builder.init_schema_v2()
+        v2_dates = bar_dependent_dates(con, v2_table, changed)
+        for run in _contiguous_runs(v2_dates):
+            builder.build_features_bulk(run[0], run[-1])
+
+        ripple = atr_dependent_dates(con, v2_table, v2_dates)
+        for run in _contiguous_runs(ripple):
+            builder.build_features_bulk(run[0], run[-1])
+
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+
+    return {"daily_features": v1_dates, v2_table: sorted(v2_dates + ripple)}
+
+
+def main():
+    if len(sys.argv) < 2:
+        raise SystemExit("Usage: python refresh_features.py YYYY-MM-DD [YYYY-MM-DD ...]")
+
+    changed = [date.fromisoformat(a) for a in sys.argv[1:]]
+    con = duckdb.connect(str(DB_PATH))
+    try:
+        rebuilt = refresh_features(con, changed)
+    finally:
+        con.close()
+
+    for table, dates in rebuilt.items():
+        print(f"OK: {table} rebuilt for {len(dates)} dates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+BarStore - Columnar in-memory 1m bars shared by the research backtesters
+
+Loads one instrument's bars_1m history ONCE into contiguous NumPy arrays and
+answers day / window lookups as zero-copy slices (no per-day SQL):
+
+    store = BarStore.shared('MGC', db_path)
+    day = store.day_slice(date(2025, 1, 6))          # 09:00 -> 09:00 local
+    win = store.window(start_local, end_local)       # [start, end)
+    bars = win.to_frame()                            # ts_utc, open, high, low, close, volume
+
+Trading day = 09:00 local -> next 09:00 local (same as the feature builders).
+A per-trade-date offset index is built at load time, so day_slice() is a dict
+lookup and window() is two binary searches.
+
+shared() caches stores per (db_path, table, symbol) for the life of the process.
+For process pools, to_shared_memory() copies the arrays into one
+multiprocessing.shared_memory block; workers attach_shared_memory() the handle
+and get zero-copy views registered under the same shared() key.
+"""
+
+import duckdb
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+# Paths
+ROOT = Path(__file__).parent.parent
+DB_PATH = str(ROOT / "data" / "db" / "gold.db")
+
+TZ_LOCAL = ZoneInfo("Australia/Brisbane")
+TRADING_DAY_START_HOUR = 9
+
+MS_PER_DAY = 86_400_000
+COLUMNS = ('ts_ms', 'open', 'high', 'low', 'close', 'volume')
+_SHARED: Dict[Tuple[str, str, str], "BarStore"] = {}
+
+
+@dataclass(frozen=True)
+class BarSlice:
+    """Views into a BarStore (no copies). ts_ms is epoch milliseconds UTC."""
+    ts_ms: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts_ms)
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame shaped like `SELECT ts_utc, open, high, low, close, volume FROM bars_1m`."""
+        return pd.DataFrame({
+            'ts_utc': pd.to_datetime(self.ts_ms, unit='ms', utc=True),
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume,
+        })
+
+
+class BarStore:
+    """One instrument's 1m bars as contiguous arrays, sorted by ts_utc."""
+
+    def __init__(
+        self,
+        symbol: str,
+        ts_ms: np.ndarray,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        day_index: Optional[Dict[date, Tuple[int, int]]] = None,
+    ):
+        self.symbol = symbol
+        self.ts_ms = np.ascontiguousarray(ts_ms, dtype=np.int64)
+        self.open = np.ascontiguousarray(open_, dtype=np.float64)
+        self.high = np.ascontiguousarray(high, dtype=np.float64)
+        self.low = np.ascontiguousarray(low, dtype=np.float64)
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+        self.volume = np.ascontiguousarray(volume, dtype=np.int64)
+        self._day_index = self._build_day_index() if day_index is None else day_index
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+    @classmethod
+    def load(cls, symbol: str, db_path: str = DB_PATH, table: str = "bars_1m") -> "BarStore":
+        """Read the full history for symbol in one query."""
+        conn = duckdb.connect(db_path, read_only=True)
+        try:
+            cols = conn.execute(f"""
+                SELECT epoch_ms(ts_utc) AS ts_ms, open, high, low, close, volume
+                FROM {table}
+                WHERE symbol = ?
+                ORDER BY ts_utc
+            """, [symbol]).fetchnumpy()
+        finally:
+            conn.close()
+
+        return cls(
+            symbol,
+            np.asarray(cols['ts_ms']), np.asarray(cols['open']), np.asarray(cols['high']),
+            np.asarray(cols['low']), np.asarray(cols['close']), np.asarray(cols['volume']),
+        )
+
+    @classmethod
+    def shared(cls, symbol: str, db_path: str = DB_PATH, table: str = "bars_1m") -> "BarStore":
+        """Process-wide store: loaded on first use, reused afterwards."""
+        key = (str(db_path), table, symbol)
+        if key not in _SHARED:
+            _SHARED[key] = cls.load(symbol, db_path, table)
+        return _SHARED[key]
+
+    @staticmethod
+    def clear_shared():
+        _SHARED.clear()
+
+    def to_shared_memory(self) -> Tuple[shared_memory.SharedMemory, Dict[str, Any]]:
+        """
+        Copy all columns into ONE shared-memory block for worker processes.
+
+        Returns:
+            (block, handle) - handle is small and picklable (block name, column
+            layout, day index). The caller owns the block: close() + unlink()
+            it once the workers are done.
+        """
+        columns = [getattr(self, name) for name in COLUMNS]
+        block = shared_memory.SharedMemory(create=True, size=max(1, sum(a.nbytes for a in columns)))
+        layout, offset = [], 0
+        for name, arr in zip(COLUMNS, columns):
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=block.buf, offset=offset)[:] = arr
+            layout.append((name, arr.dtype.str, len(arr), offset))
+            offset += arr.nbytes
+
+        handle = {'name': block.name, 'symbol': self.symbol, 'layout': layout, 'day_index': self._day_index}
+        return block, handle
+
+    @classmethod
+    def attach_shared_memory(
+        cls, handle: Dict[str, Any], db_path: str = DB_PATH, table: str = "bars_1m"
+    ) -> "BarStore":
+        """
+        Store backed by a block from to_shared_memory() (no copy, no DB read).
+
+        Also registered as the shared() store for (db_path, table, symbol), so
+        code calling BarStore.shared() in a worker picks it up unchanged.
+        """
+        block = shared_memory.SharedMemory(name=handle['name'])
+        cols = {
+            name: np.ndarray((n,), dtype=np.dtype(dtype), buffer=block.buf, offset=offset)
+            for name, dtype, n, offset in handle['layout']
+        }
+        store = cls(
+            handle['symbol'], cols['ts_ms'], cols['open'], cols['high'],
+            cols['low'], cols['close'], cols['volume'], day_index=handle['day_index'],
+        )
+        store._shm = block  # views are only valid while the mapping is open
+        _SHARED[(str(db_path), table, store.symbol)] = store
+        return store
+
+    def __len__(self) -> int:
+        return len(self.ts_ms)
+
+    def _build_day_index(self) -> Dict[date, Tuple[int, int]]:
+        """trade date -> (start, end) offsets into the arrays."""
+        if len(self.ts_ms) == 0:
+            return {}
+        local_ms = (
+            pd.DatetimeIndex(pd.to_datetime(self.ts_ms, unit='ms', utc=True))
+            .tz_convert(TZ_LOCAL).tz_localize(None).as_unit('ms').asi8
+        )
+        day_num = (local_ms - TRADING_DAY_START_HOUR * 3_600_000) // MS_PER_DAY
+        starts = np.flatnonzero(np.r_[True, day_num[1:] != day_num[:-1]])
+        ends = np.r_[starts[1:], len(day_num)]
+        epoch = date(1970, 1, 1)
+        return {
+            epoch + timedelta(days=int(day_num[s])): (int(s), int(e))
+            for s, e in zip(starts, ends)
+        }
+
+    def trade_dates(self) -> List[date]:
+        return list(self._day_index)
+
+    def _slice(self, i: int, j: int) -> BarSlice:
+        return BarSlice(
+            self.ts_ms[i:j], self.open[i:j], self.high[i:j],
+            self.low[i:j], self.close[i:j], self.volume[i:j],
+        )
+
+    def day_slice(self, trading_date: date) -> BarSlice:
+        """Bars of one trading day (09:00 local -> next 09:00 local); empty if none."""
+        i, j = self._day_index.get(trading_date, (0, 0))
+        return self._slice(i, j)
+
+    def window(self, start_local: datetime, end_local: datetime, include_start: bool = True) -> BarSlice:
+        """
+        Bars with start <= ts < end (start < ts < end if include_start=False).
+
+        Naive datetimes are Brisbane local time; aware datetimes are used as-is.
+        """
+        i = np.searchsorted(self.ts_ms, _to_epoch_ms(start_local), side='left' if include_start else 'right')
+        j = np.searchsorted(self.ts_ms, _to_epoch_ms(end_local), side='left')
+        return self._slice(int(i), int(max(i, j)))
+
+
+def _to_epoch_ms(ts: datetime) -> int:
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=TZ_LOCAL)
+    return int(pd.Timestamp(ts).value // 1_000_000)
+
@@ -14,7 +14,6 @@ Fixes Phase 3 issues:
 - Extended windows properly supported
 """
 
-import duckdb
 import pandas as pd
 import numpy as np
 import pytz
@@ -25,6 +24,9 @@ from datetime import datetime, time as dt_time, timedelta, date
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
+from bar_store import BarStore
+from orb_kernel import first_breakout, scan_exit
+
 # Paths
 ROOT = Path(__file__).parent.parent
 DB_PATH = str(ROOT / "data" / "db" / "gold.db")
@@ -214,12 +216,12 @@ def parse_filters(filter_spec: Dict, test_config: Dict) -> Dict[str, Any]:
 
 
 def load_bars_for_trading_day(
-    conn: duckdb.DuckDBPyConnection,
+    store: BarStore,
     trading_date: date,
     spec: CandidateSpec
 ) -> pd.DataFrame:
     """
-    Load bars for a trading day with proper timezone handling.
+    Slice bars for a trading day out of the in-memory BarStore.
 
     Trading day for extended windows: from 09:00 on trading_date to 09:00 next day.
     For standard windows: same calendar day only.
@@ -235,25 +237,12 @@ def load_bars_for_trading_day(
     else:
         end_dt_local = TZ_LOCAL.localize(datetime.combine(trading_date + timedelta(days=1), dt_time(9, 0)))
 
-    # Convert to UTC for query
-    start_dt_utc = start_dt_local.astimezone(TZ_UTC)
-    end_dt_utc = end_dt_local.astimezone(TZ_UTC)
-
-    # Query bars
-    bars = conn.execute("""
-        SELECT ts_utc, open, high, low, close, volume
-        FROM bars_1m
-        WHERE symbol = ?
-        AND ts_utc >= ?
-        AND ts_utc < ?
-        ORDER BY ts_utc
-    """, [spec.instrument, start_dt_utc, end_dt_utc]).fetchdf()
-
-    if len(bars) == 0:
+    window = store.window(start_dt_local, end_dt_local)
+    if len(window) == 0:
         return pd.DataFrame()
 
-    # Convert to datetime and add local time
-    bars['ts_utc'] = pd.to_datetime(bars['ts_utc'], utc=True)
+    # Add local time
+    bars = window.to_frame()
     bars['ts_local'] = bars['ts_utc'].dt.tz_convert(TZ_LOCAL)
     bars['time_local'] = bars['ts_local'].dt.time
 
@@ -365,13 +354,12 @@ def detect_breakout_entry(
         return None
 
     # Find first close outside ORB
-    for idx, bar in scan_bars.iterrows():
-        if bar['close'] > orb['high']:
-            return (bar, 'long')
-        elif bar['close'] < orb['low']:
-            return (bar, 'short')
+    breakout = first_breakout(scan_bars['close'].to_numpy(), orb['high'], orb['low'])
+    if breakout is None:
+        return None
 
-    return None
+    idx, direction = breakout
+    return (scan_bars.iloc[idx], direction)
 
 
 def simulate_trade(
@@ -417,107 +405,36 @@ def simulate_trade(
             outcome='NO_TRADE'
         )
 
-    # Track through remaining bars
-    mae = 0.0
-    mfe = 0.0
+    # Track through remaining bars (conservative: stop-first if both hit)
+    scan = scan_exit(
+        remaining_bars['high'].to_numpy(),
+        remaining_bars['low'].to_numpy(),
+        remaining_bars['close'].to_numpy(),
+        entry_price, stop_price, target_price, direction
+    )
+    mae = scan.close_mae
+    mfe = scan.close_mfe
 
-    for idx, bar in remaining_bars.iterrows():
-        # Check stop and target (conservative: stop-first if both hit)
-        if direction == 'long':
-            # Check stop first
-            if bar['low'] <= stop_price:
-                return Trade(
-                    candidate_id=spec.candidate_id,
-                    date_local=str(entry_ts.date()),
-                    direction=direction,
-                    entry_ts_local=entry_ts,
-                    entry_price=entry_price,
-                    stop_price=stop_price,
-                    target_price=target_price,
-                    risk=risk,
-                    exit_ts_local=bar['ts_local'],
-                    exit_price=stop_price,
-                    outcome='LOSS',
-                    r_multiple=-1.0,
-                    time_to_resolution_minutes=(bar['ts_local'] - entry_ts).total_seconds() / 60,
-                    mae_r=1.0,
-                    mfe_r=abs(mfe / risk) if risk != 0 else 0
-                )
-
-            # Check target
-            if bar['high'] >= target_price:
-                return Trade(
-                    candidate_id=spec.candidate_id,
-                    date_local=str(entry_ts.date()),
-                    direction=direction,
-                    entry_ts_local=entry_ts,
-                    entry_price=entry_price,
-                    stop_price=stop_price,
-                    target_price=target_price,
-                    risk=risk,
-                    exit_ts_local=bar['ts_local'],
-                    exit_price=target_price,
-                    outcome='WIN',
-                    r_multiple=spec.rr,
-                    time_to_resolution_minutes=(bar['ts_local'] - entry_ts).total_seconds() / 60,
-                    mae_r=abs(mae / risk) if risk != 0 else 0,
-                    mfe_r=spec.rr
-                )
-
-            # Track MAE/MFE
-            unrealized = bar['close'] - entry_price
-            if unrealized < mae:
-                mae = unrealized
-            if unrealized > mfe:
-                mfe = unrealized
-
-        else:  # short
-            # Check stop first
-            if bar['high'] >= stop_price:
-                return Trade(
-                    candidate_id=spec.candidate_id,
-                    date_local=str(entry_ts.date()),
-                    direction=direction,
-                    entry_ts_local=entry_ts,
-                    entry_price=entry_price,
-                    stop_price=stop_price,
-                    target_price=target_price,
-                    risk=risk,
-                    exit_ts_local=bar['ts_local'],
-                    exit_price=stop_price,
-                    outcome='LOSS',
-                    r_multiple=-1.0,
-                    time_to_resolution_minutes=(bar['ts_local'] - entry_ts).total_seconds() / 60,
-                    mae_r=1.0,
-                    mfe_r=abs(mfe / risk) if risk != 0 else 0
-                )
-
-            # Check target
-            if bar['low'] <= target_price:
-                return Trade(
-                    candidate_id=spec.candidate_id,
-                    date_local=str(entry_ts.date()),
-                    direction=direction,
-                    entry_ts_local=entry_ts,
-                    entry_price=entry_price,
-                    stop_price=stop_price,
-                    target_price=target_price,
-                    risk=risk,
-                    exit_ts_local=bar['ts_local'],
-                    exit_price=target_price,
-                    outcome='WIN',
-                    r_multiple=spec.rr,
-                    time_to_resolution_minutes=(bar['ts_local'] - entry_ts).total_seconds() / 60,
-                    mae_r=abs(mae / risk) if risk != 0 else 0,
-                    mfe_r=spec.rr
-                )
-
-            # Track MAE/MFE
-            unrealized = entry_price - bar['close']
-            if unrealized < mae:
-                mae = unrealized
-            if unrealized > mfe:
-                mfe = unrealized
+    if scan.hit is not None:
+        exit_ts = remaining_bars['ts_local'].iloc[scan.idx]
+        won = scan.hit == 'target'
+        return Trade(
+            candidate_id=spec.candidate_id,
+            date_local=str(entry_ts.date()),
+            direction=direction,
+            entry_ts_local=entry_ts,
+            entry_price=entry_price,
+            stop_price=stop_price,
+            target_price=target_price,
+            risk=risk,
+            exit_ts_local=exit_ts,
+            exit_price=target_price if won else stop_price,
+            outcome='WIN' if won else 'LOSS',
+            r_multiple=spec.rr if won else -1.0,
+            time_to_resolution_minutes=(exit_ts - entry_ts).total_seconds() / 60,
+            mae_r=(abs(mae / risk) if risk != 0 else 0) if won else 1.0,
+            mfe_r=spec.rr if won else (abs(mfe / risk) if risk != 0 else 0)
+        )
 
     # Time exit (no TP/SL hit)
     if len(remaining_bars) > 0:
@@ -577,8 +494,8 @@ def backtest_candidate(
     # Parse candidate spec
     spec = parse_candidate_spec(candidate)
 
-    # Connect to database
-    conn = duckdb.connect(db_path, read_only=True)
+    # Whole bar history, loaded once per process
+    store = BarStore.shared(spec.instrument, db_path)
 
     # Generate trading dates
     start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
@@ -589,7 +506,7 @@ def backtest_candidate(
 
     while current_date <= end_dt:
         # Load bars for trading day
-        bars = load_bars_for_trading_day(conn, current_date, spec)
+        bars = load_bars_for_trading_day(store, current_date, spec)
 
         if len(bars) == 0:
             current_date += timedelta(days=1)
@@ -624,7 +541,6 @@ def backtest_candidate(
 
         current_date += timedelta(days=1)
 
-    conn.close()
     return trades
 
 
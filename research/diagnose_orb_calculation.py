@@ -7,6 +7,7 @@ with precomputed values in daily_features_v2.
 import duckdb
 import pandas as pd
 from pathlib import Path
+from bar_store import BarStore
 from candidate_backtest_engine import (
     parse_candidate_spec,
     load_bars_for_trading_day,
@@ -43,6 +44,7 @@ candidate_0030_dict = {
 }
 
 conn = duckdb.connect(DB_PATH, read_only=True)
+store = BarStore.shared('MGC', DB_PATH)
 
 print("=" * 100)
 print("2300 ORB Calculation Comparison")
@@ -60,7 +62,7 @@ for test_date in test_dates:
     """, [str(test_date)]).fetchone()
 
     # Calculate using candidate_backtest_engine
-    bars = load_bars_for_trading_day(conn, test_date, spec_2300)
+    bars = load_bars_for_trading_day(store, test_date, spec_2300)
     orb_calc = calculate_orb(bars, spec_2300) if len(bars) > 0 else None
 
     print(f"Date: {test_date}")
@@ -98,7 +100,7 @@ for test_date in test_dates:
     """, [str(test_date)]).fetchone()
 
     # Calculate using candidate_backtest_engine
-    bars = load_bars_for_trading_day(conn, test_date, spec_0030)
+    bars = load_bars_for_trading_day(store, test_date, spec_0030)
     orb_calc = calculate_orb(bars, spec_0030) if len(bars) > 0 else None
 
     print(f"Date: {test_date}")
@@ -19,14 +19,27 @@ Output:
 import duckdb
 import pandas as pd
 import numpy as np
-from datetime import datetime, time as dt_time, timedelta
+import sys
+from datetime import datetime, time as dt_time, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 import logging
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bar_store import BarStore
+from orb_kernel import scan_exit
+
 DB_PATH = str(Path(__file__).parent.parent / "gold.db")
 
+# Instrument -> bars_1m symbol
+SYMBOL_MAP = {
+    'MGC': 'MGC',
+    'NQ': 'MNQ',
+    'MPL': 'MPL'
+}
+
 logger = logging.getLogger(__name__)
 
 
@@ -111,6 +124,50 @@ class BacktestResult:
     sharpe: Optional[float] = None
 
 
+@dataclass(frozen=True)
+class ExecutionScenario:
+    """Execution assumptions for one backtest variant (see backtest_scenarios)."""
+    slippage_points: float = 0.0
+    entry_delay_bars: int = 0  # Fill at the close N bars after the signal bar (latency)
+
+
+class _PathExtremes:
+    """
+    Running high / low / close over the bars after one entry.
+
+    Shared by every scenario and target on that entry: a level is first
+    touched where the running extreme crosses it, so first stop / target
+    bars are binary searches instead of per-bar scans.
+    """
+
+    def __init__(self, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        self.n = len(close)
+        self.run_high = np.maximum.accumulate(high)
+        self.neg_run_low = -np.minimum.accumulate(low)  # non-decreasing, for searchsorted
+        self.run_close_min = np.minimum.accumulate(close)
+        self.run_close_max = np.maximum.accumulate(close)
+
+    def first_stop(self, stop_price: float, long: bool) -> int:
+        """First bar whose low (long) / high (short) reaches the stop, or n."""
+        if long:
+            return int(np.searchsorted(self.neg_run_low, -stop_price, side='left'))
+        return int(np.searchsorted(self.run_high, stop_price, side='left'))
+
+    def first_target(self, targets: np.ndarray, long: bool) -> np.ndarray:
+        """First bar whose high (long) / low (short) reaches each target, or n."""
+        if long:
+            return np.searchsorted(self.run_high, targets, side='left')
+        return np.searchsorted(self.neg_run_low, -targets, side='left')
+
+    def close_excursion(self, seen: int, entry_price: float, long: bool) -> Tuple[float, float]:
+        """(worst, best) close-to-entry P&L over the first `seen` bars (0, 0 if none)."""
+        if not seen:
+            return 0.0, 0.0
+        lo = float(self.run_close_min[seen - 1])
+        hi = float(self.run_close_max[seen - 1])
+        return (lo - entry_price, hi - entry_price) if long else (entry_price - hi, entry_price - lo)
+
+
 class BacktestEngine:
     """
     Deterministic zero-lookahead backtest engine.
@@ -138,32 +195,12 @@ class BacktestEngine:
         Returns:
             DataFrame with columns: ts_utc, open, high, low, close, volume
         """
-        con = self._get_connection()
+        symbol = SYMBOL_MAP.get(instrument, instrument)
 
-        # Map instrument to symbol
-        symbol_map = {
-            'MGC': 'MGC',
-            'NQ': 'MNQ',
-            'MPL': 'MPL'
-        }
-        symbol = symbol_map.get(instrument, instrument)
-
-        bars = con.execute("""
-            SELECT
-                ts_utc,
-                open,
-                high,
-                low,
-                close,
-                volume
-            FROM bars_1m
-            WHERE symbol = ?
-            AND ts_utc >= ?::TIMESTAMP
-            AND ts_utc < (?::DATE + INTERVAL '1 day')::TIMESTAMP
-            ORDER BY ts_utc
-        """, [symbol, start_date, end_date]).fetchdf()
-
-        con.close()
+        # Sliced from the process-wide in-memory store (one DB read per instrument)
+        start_utc = datetime.strptime(start_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        end_utc = datetime.strptime(end_date, '%Y-%m-%d').replace(tzinfo=timezone.utc) + timedelta(days=1)
+        bars = BarStore.shared(symbol, self.db_path).window(start_utc, end_utc).to_frame()
 
         logger.info(f"Loaded {len(bars)} bars for {instrument} ({start_date} to {end_date})")
         return bars
@@ -282,6 +319,112 @@ class BacktestEngine:
 
         return result
 
+    def backtest_batch(
+        self,
+        candidates: List[Dict[str, Any]],
+        start_date: str = '2024-01-01',
+        end_date: str = '2026-01-15',
+        slippage_points: float = 0.0
+    ) -> Dict[str, Optional[BacktestResult]]:
+        """
+        Backtest many candidates in one pass (same results as backtest_candidate each).
+
+        Bars and daily features are loaded once per instrument. ORB levels and
+        entry bars are computed once per (entry window/logic/filters, day), and
+        all target_r variants sharing them are resolved together as arrays.
+
+        Args:
+            candidates: Edge candidate dicts (any mix of instruments)
+            start_date: Start date for backtest
+            end_date: End date for backtest
+            slippage_points: Fixed slippage per trade (default: 0)
+
+        Returns:
+            {idea_id: BacktestResult or None if no trades generated}
+        """
+        scenario = ExecutionScenario(slippage_points)
+        return self.backtest_scenarios_batch(candidates, [scenario], start_date, end_date)[scenario]
+
+    def backtest_scenarios(
+        self,
+        candidate: Dict[str, Any],
+        scenarios: List[Union[float, ExecutionScenario]],
+        start_date: str = '2024-01-01',
+        end_date: str = '2026-01-15'
+    ) -> Dict[Union[float, ExecutionScenario], Optional[BacktestResult]]:
+        """
+        Backtest one candidate under many execution scenarios in a single pass.
+
+        Equivalent to backtest_candidate(candidate, slippage_points=s) per
+        slippage s, at roughly the cost of one backtest.
+
+        Args:
+            scenarios: Slippage points (float) or ExecutionScenario (slippage + entry delay)
+
+        Returns:
+            {scenario as passed in: BacktestResult or None if no trades generated}
+        """
+        by_scenario = self.backtest_scenarios_batch([candidate], scenarios, start_date, end_date)
+        return {scenario: results[candidate['idea_id']] for scenario, results in by_scenario.items()}
+
+    def backtest_scenarios_batch(
+        self,
+        candidates: List[Dict[str, Any]],
+        scenarios: List[Union[float, ExecutionScenario]],
+        start_date: str = '2024-01-01',
+        end_date: str = '2026-01-15'
+    ) -> Dict[Union[float, ExecutionScenario], Dict[str, Optional[BacktestResult]]]:
+        """
+        backtest_batch() for every scenario at once.
+
+        Entry bars and the post-entry running high/low/close are computed once
+        per (entry group, day, entry delay); each scenario's stop, targets and
+        excursions are then binary searches on those arrays.
+
+        Returns:
+            {scenario as passed in: {idea_id: BacktestResult or None}}
+        """
+        normalized = {
+            scenario: scenario if isinstance(scenario, ExecutionScenario) else ExecutionScenario(float(scenario))
+            for scenario in scenarios
+        }
+        results = {scenario: {c['idea_id']: None for c in candidates} for scenario in scenarios}
+
+        by_instrument: Dict[str, List[Dict[str, Any]]] = {}
+        for candidate in candidates:
+            by_instrument.setdefault(candidate['instrument'], []).append(candidate)
+
+        for instrument, group in by_instrument.items():
+            logger.info(f"Batch backtesting {len(group)} candidates x {len(scenarios)} scenarios ({instrument})")
+
+            bars = self.load_bars(instrument, start_date, end_date)
+            if bars.empty:
+                logger.warning(f"No bars found for {instrument}")
+                continue
+
+            daily_features = self.load_daily_features(instrument, start_date, end_date)
+            if daily_features.empty:
+                logger.warning(f"No daily features found for {instrument}")
+                continue
+
+            trades_by_scenario = self._simulate_trades_batch(
+                group, bars, daily_features, list(set(normalized.values()))
+            )
+
+            for scenario, execution in normalized.items():
+                trades_by_id = trades_by_scenario[execution]
+                for candidate in group:
+                    trades = trades_by_id[candidate['idea_id']]
+                    if trades:
+                        results[scenario][candidate['idea_id']] = self._calculate_metrics(
+                            candidate['idea_id'], instrument, trades, start_date, end_date
+                        )
+
+        for scenario, by_id in results.items():
+            n_traded = sum(r is not None for r in by_id.values())
+            logger.info(f"Batch complete ({normalized[scenario]}): {n_traded}/{len(by_id)} candidates generated trades")
+        return results
+
     def _simulate_trades(
         self,
         candidate: Dict[str, Any],
@@ -350,6 +493,199 @@ class BacktestEngine:
 
         return trades
 
+    def _simulate_trades_batch(
+        self,
+        candidates: List[Dict[str, Any]],
+        bars: pd.DataFrame,
+        daily_features: pd.DataFrame,
+        scenarios: List[ExecutionScenario]
+    ) -> Dict[ExecutionScenario, Dict[str, List[Trade]]]:
+        """
+        _simulate_trades() for many candidates of one instrument and many scenarios.
+
+        Candidates are grouped by everything that decides the entry (session
+        window, entry window, entry logic, filters). Per group and day the entry
+        bar is found once; per entry delay the running high/low/close after entry
+        are built once. Slippage only moves entry, stop and targets, so every
+        (scenario, candidate) exit is a searchsorted on those running extremes.
+        """
+        import json
+
+        trades: Dict[ExecutionScenario, Dict[str, List[Trade]]] = {
+            scenario: {c['idea_id']: [] for c in candidates} for scenario in scenarios
+        }
+        by_delay: Dict[int, List[ExecutionScenario]] = {}
+        for scenario in scenarios:
+            by_delay.setdefault(scenario.entry_delay_bars, []).append(scenario)
+
+        # Only ORB breakouts generate trades (see _simulate_entry)
+        groups: Dict[Tuple, List[Dict[str, Any]]] = {}
+        for candidate in candidates:
+            if candidate['entry_type'] != 'break' or 'orb' not in candidate['session_window']:
+                continue
+            filters_json = candidate.get('filters_json')
+            filters = json.loads(filters_json) if filters_json and isinstance(filters_json, str) else filters_json
+            entry_condition_json = candidate.get('entry_condition_json', '{}')
+            entry_condition = json.loads(entry_condition_json) if isinstance(entry_condition_json, str) else entry_condition_json
+            direction = entry_condition.get('direction', 'long')
+            if direction not in ('long', 'short'):
+                continue
+            key = (
+                candidate['entry_time_start'],
+                candidate['entry_time_end'],
+                direction,
+                json.dumps(filters, sort_keys=True, default=str) if filters else None,
+            )
+            groups.setdefault(key, []).append(candidate)
+
+        if not groups:
+            return trades
+
+        bars = bars.copy()
+        bars['date_local'] = bars['ts_utc'].dt.date.astype(str)
+
+        for date_local, day_bars in bars.groupby('date_local', sort=False):
+            day_features = daily_features[daily_features['date_local'] == date_local]
+            if day_features.empty:
+                continue
+            day_features = day_features.iloc[0]
+            atr = day_features.get('atr_20', 40.0)
+
+            ts = day_bars['ts_utc']
+            high = day_bars['high'].to_numpy()
+            low = day_bars['low'].to_numpy()
+            close = day_bars['close'].to_numpy()
+            orb_cache: Dict[Tuple[str, str], Optional[Dict[str, float]]] = {}
+
+            for (entry_start, entry_end, direction, filters_key), group in groups.items():
+                if filters_key and not self._apply_filters(day_features, json.loads(filters_key)):
+                    continue
+
+                if (entry_start, entry_end) not in orb_cache:
+                    orb_cache[(entry_start, entry_end)] = self.calculate_orb_levels(day_bars, entry_start, entry_end)
+                orb_levels = orb_cache[(entry_start, entry_end)]
+                if not orb_levels:
+                    continue
+
+                # Signal: first close beyond the ORB
+                long = direction == 'long'
+                breakout = close > orb_levels['high'] if long else close < orb_levels['low']
+                if not breakout.any():
+                    continue
+                signal_idx = int(np.argmax(breakout))
+                target_rs = [candidate['target_r'] for candidate in group]
+
+                for delay, delay_scenarios in by_delay.items():
+                    # Fill at the close `delay` bars after the signal bar
+                    entry_idx = signal_idx + delay
+                    if entry_idx >= len(close):
+                        continue
+                    entry_time = ts.iloc[entry_idx]
+
+                    # Bars after entry (one bar per minute, sorted: a suffix of the day)
+                    after = entry_idx + 1
+                    path = _PathExtremes(high[after:], low[after:], close[after:])
+
+                    for scenario in delay_scenarios:
+                        slippage = scenario.slippage_points
+                        if long:
+                            entry_price = close[entry_idx] + slippage
+                            stop_price = orb_levels['low'] - slippage
+                            points_risked = entry_price - stop_price
+                        else:
+                            entry_price = close[entry_idx] - slippage
+                            stop_price = orb_levels['high'] + slippage
+                            points_risked = stop_price - entry_price
+
+                        targets = []
+                        for target_r in target_rs:
+                            if target_r:
+                                targets.append(entry_price + (points_risked * target_r) if long
+                                               else entry_price - (points_risked * target_r))
+                            else:
+                                targets.append(entry_price + (atr * 3) if long else entry_price - (atr * 3))
+                        targets = np.asarray(targets, dtype=np.float64)
+
+                        stop_idx = path.first_stop(stop_price, long)
+                        target_idx = path.first_target(targets, long)
+
+                        for k, candidate in enumerate(group):
+                            trade = Trade(
+                                trade_id=f"{candidate['idea_id']}_{date_local}",
+                                date_local=date_local,
+                                instrument=candidate['instrument'],
+                                direction=direction,
+                                entry_time=entry_time,
+                                entry_price=entry_price,
+                                stop_price=stop_price,
+                                target_price=float(targets[k]),
+                                points_risked=points_risked
+                            )
+                            self._resolve_batch_exit(trade, day_bars, after, path, stop_idx, int(target_idx[k]))
+                            trades[scenario][candidate['idea_id']].append(trade)
+
+        return trades
+
+    def _resolve_batch_exit(
+        self,
+        trade: Trade,
+        day_bars: pd.DataFrame,
+        after: int,
+        path: "_PathExtremes",
+        stop_idx: int,
+        target_idx: int
+    ):
+        """Fill exit fields exactly as _simulate_exit() does, from precomputed hit indices."""
+        pr = trade.points_risked
+        n = path.n
+
+        if n == 0:
+            # No exit - end of day
+            trade.exit_time = day_bars['ts_utc'].iloc[-1]
+            trade.exit_price = day_bars['close'].iloc[-1]
+            trade.exit_reason = 'eod'
+            trade.points_gained = (trade.exit_price - trade.entry_price) if trade.direction == 'long' else (trade.entry_price - trade.exit_price)
+            trade.r_multiple = trade.points_gained / pr if pr != 0 else 0
+            return
+
+        exit_idx = min(stop_idx, target_idx)
+        if exit_idx < n:
+            trade.exit_time = day_bars['ts_utc'].iloc[after + exit_idx]
+            if stop_idx <= target_idx:
+                # Stop checked first on the same bar
+                trade.exit_price = trade.stop_price
+                trade.exit_reason = 'stop'
+                if trade.direction == 'long':
+                    trade.points_gained = trade.exit_price - trade.entry_price
+                    trade.r_multiple = -1.0 * (pr / pr if pr != 0 else 0)
+                else:
+                    trade.points_gained = trade.entry_price - trade.exit_price
+                    trade.r_multiple = -1.0
+            else:
+                trade.exit_price = trade.target_price
+                trade.exit_reason = 'target'
+                if trade.direction == 'long':
+                    trade.points_gained = trade.exit_price - trade.entry_price
+                else:
+                    trade.points_gained = trade.entry_price - trade.exit_price
+                trade.r_multiple = trade.points_gained / pr if pr != 0 else 0
+
+        # MAE/MFE over closes before the exit bar
+        seen = exit_idx if exit_idx < n else n
+        worst, best = path.close_excursion(seen, trade.entry_price, trade.direction == 'long')
+        trade.mae = abs(min(0.0, worst))
+        trade.mfe = abs(max(0.0, best))
+
+        if exit_idx >= n:
+            trade.exit_time = day_bars['ts_utc'].iloc[-1]
+            trade.exit_price = day_bars['close'].iloc[-1]
+            trade.exit_reason = 'eod'
+            if trade.direction == 'long':
+                trade.points_gained = trade.exit_price - trade.entry_price
+            else:
+                trade.points_gained = trade.entry_price - trade.exit_price
+            trade.r_multiple = trade.points_gained / pr if pr != 0 else 0
+
     def _apply_filters(self, day_features: pd.Series, filters: Dict[str, Any]) -> bool:
         """
         Check if day passes all filters.
@@ -494,66 +830,38 @@ class BacktestEngine:
             trade.r_multiple = trade.points_gained / trade.points_risked if trade.points_risked != 0 else 0
             return
 
-        # Check each bar for stop or target hit
-        mae = 0.0  # Max adverse excursion
-        mfe = 0.0  # Max favorable excursion
+        # First stop/target touch (stop checked first on the same bar)
+        scan = scan_exit(
+            exit_bars['high'].to_numpy(),
+            exit_bars['low'].to_numpy(),
+            exit_bars['close'].to_numpy(),
+            trade.entry_price, trade.stop_price, trade.target_price, trade.direction
+        )
 
-        for idx, bar in exit_bars.iterrows():
-            if trade.direction == 'long':
-                # Long trade
-                # Check stop
-                if bar['low'] <= trade.stop_price:
-                    trade.exit_time = bar['ts_utc']
-                    trade.exit_price = trade.stop_price
-                    trade.exit_reason = 'stop'
+        if scan.hit is not None:
+            bar = exit_bars.iloc[scan.idx]
+            trade.exit_time = bar['ts_utc']
+            if scan.hit == 'stop':
+                trade.exit_price = trade.stop_price
+                trade.exit_reason = 'stop'
+                if trade.direction == 'long':
                     trade.points_gained = trade.exit_price - trade.entry_price
                     trade.r_multiple = -1.0 * (trade.points_risked / trade.points_risked if trade.points_risked != 0 else 0)
-                    break
-
-                # Check target
-                if bar['high'] >= trade.target_price:
-                    trade.exit_time = bar['ts_utc']
-                    trade.exit_price = trade.target_price
-                    trade.exit_reason = 'target'
-                    trade.points_gained = trade.exit_price - trade.entry_price
-                    trade.r_multiple = trade.points_gained / trade.points_risked if trade.points_risked != 0 else 0
-                    break
-
-                # Track MAE/MFE
-                unrealized = bar['close'] - trade.entry_price
-                if unrealized < mae:
-                    mae = unrealized
-                if unrealized > mfe:
-                    mfe = unrealized
-
-            else:  # Short trade
-                # Check stop
-                if bar['high'] >= trade.stop_price:
-                    trade.exit_time = bar['ts_utc']
-                    trade.exit_price = trade.stop_price
-                    trade.exit_reason = 'stop'
+                else:
                     trade.points_gained = trade.entry_price - trade.exit_price
                     trade.r_multiple = -1.0
-                    break
-
-                # Check target
-                if bar['low'] <= trade.target_price:
-                    trade.exit_time = bar['ts_utc']
-                    trade.exit_price = trade.target_price
-                    trade.exit_reason = 'target'
+            else:
+                trade.exit_price = trade.target_price
+                trade.exit_reason = 'target'
+                if trade.direction == 'long':
+                    trade.points_gained = trade.exit_price - trade.entry_price
+                else:
                     trade.points_gained = trade.entry_price - trade.exit_price
-                    trade.r_multiple = trade.points_gained / trade.points_risked if trade.points_risked != 0 else 0
-                    break
-
-                # Track MAE/MFE
-                unrealized = trade.entry_price - bar['close']
-                if unrealized < mae:
-                    mae = unrealized
-                if unrealized > mfe:
-                    mfe = unrealized
-
-        trade.mae = abs(mae)
-        trade.mfe = abs(mfe)
+                trade.r_multiple = trade.points_gained / trade.points_risked if trade.points_risked != 0 else 0
+
+        # Max adverse / favorable excursion (closes before the exit bar)
+        trade.mae = abs(scan.close_mae)
+        trade.mfe = abs(scan.close_mfe)
 
         # If no exit found, exit at EOD
         if not trade.exit_time:
@@ -26,7 +26,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from ede.generator_brute import BruteParameterGenerator
-from ede.validation_pipeline import ValidationPipeline
+from ede.parallel_validation import ParallelValidationRunner
 from ede.lifecycle_manager import LifecycleManager, EdgeStatus
 from ede.backtest_engine import BacktestEngine
 import duckdb
@@ -85,67 +85,23 @@ def cmd_validate(args):
 
     print(f"\nFound {len(candidates)} candidates to validate")
     print(f"Date range: {args.start_date} to {args.end_date}")
+    print(f"Workers: {args.workers or 'all cores'}")
 
-    pipeline = ValidationPipeline()
-
-    survivors = []
-    failed = []
-
-    for i, candidate in enumerate(candidates, 1):
-        print(f"\n[{i}/{len(candidates)}] Validating: {candidate['idea_id']}")
-
-        try:
-            result = pipeline.validate_candidate(
-                candidate,
-                start_date=args.start_date,
-                end_date=args.end_date
-            )
-
-            if result.passed:
-                survivors.append(result)
-
-                # Submit survivor
-                survivor_data = {
-                    'idea_id': result.idea_id,
-                    'baseline_trades': result.baseline_result.total_trades,
-                    'baseline_win_rate': result.baseline_result.win_rate,
-                    'baseline_avg_r': result.baseline_result.avg_r,
-                    'baseline_expectancy': result.baseline_result.expectancy,
-                    'baseline_max_dd': result.baseline_result.max_dd,
-                    'baseline_profit_factor': result.baseline_result.profit_factor,
-                    'baseline_sharpe': result.baseline_result.sharpe,
-                    'cost_1tick_expectancy': result.cost_1tick_exp,
-                    'cost_2tick_expectancy': result.cost_2tick_exp,
-                    'cost_3tick_expectancy': result.cost_3tick_exp,
-                    'cost_atr_expectancy': result.cost_atr_exp,
-                    'cost_missedfill_expectancy': result.cost_missedfill_exp,
-                    'attack_stopfirst_expectancy': result.attack_stopfirst_exp,
-                    'attack_entrydelay_expectancy': result.attack_entrydelay_exp,
-                    'attack_exitdelay_expectancy': result.attack_exitdelay_exp,
-                    'attack_noise_expectancy': result.attack_noise_exp,
-                    'attack_shuffle_expectancy': result.attack_shuffle_exp,
-                    'regime_year_count': result.regime_year_count,
-                    'regime_year_profitable': result.regime_year_profitable,
-                    'regime_volatility_count': result.regime_volatility_count,
-                    'regime_volatility_profitable': result.regime_volatility_profitable,
-                    'regime_session_count': result.regime_session_count,
-                    'regime_session_profitable': result.regime_session_profitable,
-                    'regime_max_profit_concentration': result.regime_max_concentration,
-                    'walkforward_windows': 0,
-                    'walkforward_profitable': 0,
-                    'walkforward_avg_expectancy': 0
-                }
-
-                manager.submit_survivor(survivor_data)
-                print(f"  [OK] SURVIVOR - Score: {result.survival_score:.1f}, Confidence: {result.confidence}")
-
-            else:
-                failed.append(result)
-                print(f"  [FAIL] {result.failure_reason}")
-
-        except Exception as e:
-            logger.error(f"Error validating {candidate['idea_id']}: {e}")
-            failed.append(None)
+    # Baselines + cost/attack scenarios fanned out over a process pool (bars in
+    # shared memory); statuses and survivors written in one batch at the end
+    runner = ParallelValidationRunner(workers=args.workers)
+    results = runner.run(candidates, start_date=args.start_date, end_date=args.end_date)
+
+    survivors = [r for r in results if r.passed]
+    failed = [r for r in results if not r.passed]
+    failed += [None] * (len(candidates) - len(results))
+
+    for i, result in enumerate(results, 1):
+        print(f"\n[{i}/{len(candidates)}] Validated: {result.idea_id}")
+        if result.passed:
+            print(f"  [OK] SURVIVOR - Score: {result.survival_score:.1f}, Confidence: {result.confidence}")
+        else:
+            print(f"  [FAIL] {result.failure_reason}")
 
     print("\n" + "="*70)
     print("VALIDATION COMPLETE")
@@ -294,6 +250,7 @@ def main():
     parser_val.add_argument('--limit', type=int, default=50, help='Maximum candidates to validate')
     parser_val.add_argument('--start-date', type=str, default='2024-01-01', help='Backtest start date')
     parser_val.add_argument('--end-date', type=str, default='2026-01-15', help='Backtest end date')
+    parser_val.add_argument('--workers', type=int, default=None, help='Validation processes (default: all cores)')
 
     # Approve command
     parser_app = subparsers.add_parser('approve', help='Review and approve survivors')
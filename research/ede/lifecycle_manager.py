@@ -362,88 +362,128 @@ class LifecycleManager:
         """
         try:
             con = self._get_connection()
+            survivor_id, survival_score, confidence = self._insert_survivor(con, survivor_data)
+            con.close()
 
-            # Generate survivor ID
-            survivor_id = f"SURV_{survivor_data['idea_id']}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+            logger.info(f"Survivor created: {survivor_id} | Score: {survival_score:.1f} | Confidence: {confidence}")
+            return True, f"Survivor created: {survivor_id}"
 
-            # Calculate survival score (composite metric)
-            survival_score = self._calculate_survival_score(survivor_data)
+        except Exception as e:
+            logger.error(f"Error submitting survivor: {e}")
+            return False, f"Error: {e}"
 
-            # Determine confidence level
-            confidence = self._determine_confidence(survival_score, survivor_data)
+    def record_validation_batch(
+        self,
+        statuses: Dict[str, EdgeStatus],
+        survivors: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Write a whole validation run in ONE connection and transaction.
 
-            # Generate results hash
-            results_json = json.dumps(survivor_data, sort_keys=True)
-            results_hash = hashlib.sha256(results_json.encode()).hexdigest()
+        Args:
+            statuses: idea_id -> final status for candidates that failed a gate
+            survivors: survivor_data dicts (as for submit_survivor)
 
-            # Insert into edge_candidates_survivors
-            con.execute("""
-                INSERT INTO edge_candidates_survivors (
-                    survivor_id, idea_id, survival_timestamp,
-                    baseline_trades, baseline_win_rate, baseline_avg_r,
-                    baseline_expectancy, baseline_max_dd, baseline_profit_factor, baseline_sharpe,
-                    cost_1tick_expectancy, cost_2tick_expectancy, cost_3tick_expectancy,
-                    cost_atr_expectancy, cost_missedfill_expectancy,
-                    attack_stopfirst_expectancy, attack_entrydelay_expectancy,
-                    attack_exitdelay_expectancy, attack_noise_expectancy, attack_shuffle_expectancy,
-                    regime_year_count, regime_year_profitable,
-                    regime_volatility_count, regime_volatility_profitable,
-                    regime_session_count, regime_session_profitable,
-                    regime_max_profit_concentration,
-                    walkforward_windows, walkforward_profitable, walkforward_avg_expectancy,
-                    survival_score, confidence_level, status, results_hash
-                ) VALUES (?, ?, CURRENT_TIMESTAMP, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
-                survivor_id,
-                survivor_data['idea_id'],
-                survivor_data['baseline_trades'],
-                survivor_data['baseline_win_rate'],
-                survivor_data['baseline_avg_r'],
-                survivor_data['baseline_expectancy'],
-                survivor_data['baseline_max_dd'],
-                survivor_data.get('baseline_profit_factor'),
-                survivor_data.get('baseline_sharpe'),
-                survivor_data['cost_1tick_expectancy'],
-                survivor_data['cost_2tick_expectancy'],
-                survivor_data['cost_3tick_expectancy'],
-                survivor_data['cost_atr_expectancy'],
-                survivor_data['cost_missedfill_expectancy'],
-                survivor_data['attack_stopfirst_expectancy'],
-                survivor_data['attack_entrydelay_expectancy'],
-                survivor_data['attack_exitdelay_expectancy'],
-                survivor_data['attack_noise_expectancy'],
-                survivor_data['attack_shuffle_expectancy'],
-                survivor_data['regime_year_count'],
-                survivor_data['regime_year_profitable'],
-                survivor_data['regime_volatility_count'],
-                survivor_data['regime_volatility_profitable'],
-                survivor_data['regime_session_count'],
-                survivor_data['regime_session_profitable'],
-                survivor_data['regime_max_profit_concentration'],
-                survivor_data['walkforward_windows'],
-                survivor_data['walkforward_profitable'],
-                survivor_data['walkforward_avg_expectancy'],
-                survival_score,
-                confidence,
-                EdgeStatus.SURVIVOR.value,
-                results_hash
-            ])
+        Returns:
+            Number of survivors created
+        """
+        con = self._get_connection()
+        try:
+            con.begin()
+            if statuses:
+                con.executemany("""
+                    UPDATE edge_candidates_raw
+                    SET status = ?
+                    WHERE idea_id = ?
+                """, [[status.value, idea_id] for idea_id, status in statuses.items()])
+            for survivor_data in survivors:
+                self._insert_survivor(con, survivor_data)
+            con.commit()
+        except Exception:
+            con.rollback()
+            raise
+        finally:
+            con.close()
 
-            # Update original candidate status
-            con.execute("""
-                UPDATE edge_candidates_raw
-                SET status = ?
-                WHERE idea_id = ?
-            """, [EdgeStatus.SURVIVOR.value, survivor_data['idea_id']])
+        logger.info(f"Recorded validation batch: {len(statuses)} failed, {len(survivors)} survivors")
+        return len(survivors)
 
-            con.close()
+    def _insert_survivor(self, con, survivor_data: Dict[str, Any]) -> tuple[str, float, str]:
+        """Insert survivor row and mark the candidate SURVIVOR. Returns (survivor_id, score, confidence)."""
+        # Generate survivor ID
+        survivor_id = f"SURV_{survivor_data['idea_id']}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
 
-            logger.info(f"Survivor created: {survivor_id} | Score: {survival_score:.1f} | Confidence: {confidence}")
-            return True, f"Survivor created: {survivor_id}"
+        # Calculate survival score (composite metric)
+        survival_score = self._calculate_survival_score(survivor_data)
 
-        except Exception as e:
-            logger.error(f"Error submitting survivor: {e}")
-            return False, f"Error: {e}"
+        # Determine confidence level
+        confidence = self._determine_confidence(survival_score, survivor_data)
+
+        # Generate results hash
+        results_json = json.dumps(survivor_data, sort_keys=True)
+        results_hash = hashlib.sha256(results_json.encode()).hexdigest()
+
+        # Insert into edge_candidates_survivors
+        con.execute("""
+            INSERT INTO edge_candidates_survivors (
+                survivor_id, idea_id, survival_timestamp,
+                baseline_trades, baseline_win_rate, baseline_avg_r,
+                baseline_expectancy, baseline_max_dd, baseline_profit_factor, baseline_sharpe,
+                cost_1tick_expectancy, cost_2tick_expectancy, cost_3tick_expectancy,
+                cost_atr_expectancy, cost_missedfill_expectancy,
+                attack_stopfirst_expectancy, attack_entrydelay_expectancy,
+                attack_exitdelay_expectancy, attack_noise_expectancy, attack_shuffle_expectancy,
+                regime_year_count, regime_year_profitable,
+                regime_volatility_count, regime_volatility_profitable,
+                regime_session_count, regime_session_profitable,
+                regime_max_profit_concentration,
+                walkforward_windows, walkforward_profitable, walkforward_avg_expectancy,
+                survival_score, confidence_level, status, results_hash
+            ) VALUES (?, ?, CURRENT_TIMESTAMP, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            survivor_id,
+            survivor_data['idea_id'],
+            survivor_data['baseline_trades'],
+            survivor_data['baseline_win_rate'],
+            survivor_data['baseline_avg_r'],
+            survivor_data['baseline_expectancy'],
+            survivor_data['baseline_max_dd'],
+            survivor_data.get('baseline_profit_factor'),
+            survivor_data.get('baseline_sharpe'),
+            survivor_data['cost_1tick_expectancy'],
+            survivor_data['cost_2tick_expectancy'],
+            survivor_data['cost_3tick_expectancy'],
+            survivor_data['cost_atr_expectancy'],
+            survivor_data['cost_missedfill_expectancy'],
+            survivor_data['attack_stopfirst_expectancy'],
+            survivor_data['attack_entrydelay_expectancy'],
+            survivor_data['attack_exitdelay_expectancy'],
+            survivor_data['attack_noise_expectancy'],
+            survivor_data['attack_shuffle_expectancy'],
+            survivor_data['regime_year_count'],
+            survivor_data['regime_year_profitable'],
+            survivor_data['regime_volatility_count'],
+            survivor_data['regime_volatility_profitable'],
+            survivor_data['regime_session_count'],
+            survivor_data['regime_session_profitable'],
+            survivor_data['regime_max_profit_concentration'],
+            survivor_data['walkforward_windows'],
+            survivor_data['walkforward_profitable'],
+            survivor_data['walkforward_avg_expectancy'],
+            survival_score,
+            confidence,
+            EdgeStatus.SURVIVOR.value,
+            results_hash
+        ])
+
+        # Update original candidate status
+        con.execute("""
+            UPDATE edge_candidates_raw
+            SET status = ?
+            WHERE idea_id = ?
+        """, [EdgeStatus.SURVIVOR.value, survivor_data['idea_id']])
+
+        return survivor_id, survival_score, confidence
 
     def _calculate_survival_score(self, data: Dict[str, Any]) -> float:
         """
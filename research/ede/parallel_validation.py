@@ -0,0 +1,220 @@
+"""
+EDE Parallel Validation - Step 3 across all cores
+
+ValidationPipeline.validate_candidate() validates one candidate at a time in
+this process. This runner fans the same work out over a process pool:
+
+1. Parent loads each instrument's 1m bars ONCE (BarStore) and copies them into
+   multiprocessing.shared_memory; workers attach zero-copy views at startup.
+2. Baselines: candidates are chunked and each chunk runs as one
+   BacktestEngine.backtest_batch() at slippage 0.
+3. Scenarios: candidates with a positive baseline are chunked again; each
+   chunk runs every distinct scenario slippage in ONE
+   backtest_scenarios_batch() pass (entries and path extremes shared).
+4. Parent assembles ValidationResults with ValidationPipeline.evaluate_candidate()
+   (same gates and scores as the serial path) and writes all statuses and
+   survivors through LifecycleManager.record_validation_batch().
+
+Workers only read the database; all writes happen in the parent.
+
+Usage:
+    runner = ParallelValidationRunner(workers=8)
+    results = runner.run(candidates, '2024-01-01', '2026-01-15')
+"""
+
+import logging
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bar_store import BarStore
+from backtest_engine import BacktestEngine, BacktestResult, DB_PATH, SYMBOL_MAP
+from lifecycle_manager import EdgeStatus
+from validation_pipeline import ValidationPipeline, ValidationResult, SCENARIO_SLIPPAGES
+
+logger = logging.getLogger(__name__)
+
+# Per-worker engine (set by _init_worker)
+_ENGINE: Optional[BacktestEngine] = None
+
+
+def _init_worker(db_path: str, handles: List[Dict[str, Any]]):
+    """Attach the parent's shared bar arrays and build this worker's engine."""
+    global _ENGINE
+    for handle in handles:
+        BarStore.attach_shared_memory(handle, db_path)
+    _ENGINE = BacktestEngine(db_path)
+
+
+def _backtest_chunk(
+    candidates: List[Dict[str, Any]],
+    start_date: str,
+    end_date: str,
+    slippages: List[float]
+) -> Dict[float, Dict[str, Optional[BacktestResult]]]:
+    """Worker task: every slippage scenario for a chunk of candidates, in one pass."""
+    return _ENGINE.backtest_scenarios_batch(candidates, slippages, start_date, end_date)
+
+
+def _chunks(candidates: List[Dict[str, Any]], n_chunks: int) -> List[List[Dict[str, Any]]]:
+    """
+    Split into n_chunks, keeping candidates that share an entry together
+    (the batch engine computes each entry once per chunk).
+    """
+    ordered = sorted(candidates, key=lambda c: (
+        c['instrument'], str(c.get('entry_time_start')), str(c.get('entry_time_end')),
+        str(c.get('entry_condition_json')), str(c.get('filters_json')),
+    ))
+    size = max(1, math.ceil(len(ordered) / max(1, n_chunks)))
+    return [ordered[i:i + size] for i in range(0, len(ordered), size)]
+
+
+class ParallelValidationRunner:
+    """
+    Validate many candidates over a process pool with shared-memory bars.
+
+    workers=1 runs the same tasks inline (no pool, no shared memory).
+    """
+
+    def __init__(self, db_path: str = DB_PATH, workers: Optional[int] = None):
+        self.db_path = db_path
+        self.workers = workers or os.cpu_count() or 1
+        self.pipeline = ValidationPipeline(db_path)
+
+    def run(
+        self,
+        candidates: List[Dict[str, Any]],
+        start_date: str = '2024-01-01',
+        end_date: str = '2026-01-15',
+        record: bool = True
+    ) -> List[ValidationResult]:
+        """
+        Validate all candidates.
+
+        Args:
+            record: Write statuses and survivors via LifecycleManager (one batch)
+
+        Returns:
+            ValidationResults in candidate order (candidates that raised are skipped)
+        """
+        if not candidates:
+            return []
+
+        if record:
+            self.pipeline.lifecycle_manager.record_validation_batch(
+                {c['idea_id']: EdgeStatus.TESTING for c in candidates}, []
+            )
+
+        scenarios: Dict[str, Dict[float, Optional[BacktestResult]]] = {c['idea_id']: {} for c in candidates}
+
+        if self.workers <= 1:
+            self._run_stages(None, candidates, start_date, end_date, scenarios)
+        else:
+            blocks, handles = self._share_bars(candidates)
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    initargs=(self.db_path, handles),
+                ) as pool:
+                    self._run_stages(pool, candidates, start_date, end_date, scenarios)
+            finally:
+                for block in blocks:
+                    block.close()
+                    block.unlink()
+
+        results: List[ValidationResult] = []
+        failed_statuses: Dict[str, EdgeStatus] = {}
+        survivors: List[Dict[str, Any]] = []
+
+        for candidate in candidates:
+            idea_id = candidate['idea_id']
+            try:
+                result, failed_status = self.pipeline.evaluate_candidate(
+                    candidate, start_date, end_date, scenarios[idea_id]
+                )
+            except Exception as e:
+                logger.error(f"Error validating {idea_id}: {e}")
+                continue
+
+            results.append(result)
+            if failed_status is not None:
+                failed_statuses[idea_id] = failed_status
+            else:
+                survivors.append(result.to_survivor_data())
+
+        if record:
+            self.pipeline.lifecycle_manager.record_validation_batch(failed_statuses, survivors)
+
+        logger.info(f"Parallel validation complete: {len(survivors)}/{len(candidates)} survivors")
+        return results
+
+    def _share_bars(self, candidates: List[Dict[str, Any]]):
+        """Load each instrument's bars once and publish them in shared memory."""
+        blocks, handles = [], []
+        for instrument in sorted({c['instrument'] for c in candidates}):
+            store = BarStore.shared(SYMBOL_MAP.get(instrument, instrument), self.db_path)
+            block, handle = store.to_shared_memory()
+            blocks.append(block)
+            handles.append(handle)
+            logger.info(f"Shared {len(store):,} {store.symbol} bars ({block.size / 1e6:.1f} MB)")
+        return blocks, handles
+
+    def _run_stages(
+        self,
+        pool: Optional[ProcessPoolExecutor],
+        candidates: List[Dict[str, Any]],
+        start_date: str,
+        end_date: str,
+        scenarios: Dict[str, Dict[float, Optional[BacktestResult]]]
+    ):
+        """Baselines for everyone, then every scenario slippage for positive baselines."""
+        self._fan_out(pool, candidates, [0.0], start_date, end_date, scenarios)
+
+        live = [
+            c for c in candidates
+            if (b := scenarios[c['idea_id']].get(0.0)) is not None and b.total_trades > 0 and b.expectancy > 0
+        ]
+        logger.info(f"{len(live)}/{len(candidates)} candidates passed baseline")
+        if live:
+            slippages = [s for s in SCENARIO_SLIPPAGES if s != 0.0]
+            self._fan_out(pool, live, slippages, start_date, end_date, scenarios)
+
+    def _fan_out(
+        self,
+        pool: Optional[ProcessPoolExecutor],
+        candidates: List[Dict[str, Any]],
+        slippages: List[float],
+        start_date: str,
+        end_date: str,
+        scenarios: Dict[str, Dict[float, Optional[BacktestResult]]]
+    ):
+        """
+        One task per chunk (about two per worker), all slippages in each.
+
+        A failed task leaves its scenarios unset - evaluate_candidate() then
+        reruns them serially, so one bad chunk cannot sink the run.
+        """
+        chunks = _chunks(candidates, 2 * self.workers)
+
+        if pool is None:
+            batches = [self.pipeline.engine.backtest_scenarios_batch(chunk, slippages, start_date, end_date)
+                       for chunk in chunks]
+        else:
+            futures = [pool.submit(_backtest_chunk, chunk, start_date, end_date, slippages) for chunk in chunks]
+            batches = []
+            for future in as_completed(futures):
+                try:
+                    batches.append(future.result())
+                except Exception as e:
+                    logger.error(f"Scenario task failed: {e}")
+
+        for batch in batches:
+            for slippage, by_id in batch.items():
+                for idea_id, result in by_id.items():
+                    scenarios[idea_id][slippage] = result
@@ -16,7 +16,7 @@ Output: edge_candidates_survivors table
 import duckdb
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import logging
 import random
@@ -27,6 +27,23 @@ from lifecycle_manager import LifecycleManager, EdgeStatus
 
 logger = logging.getLogger(__name__)
 
+# Slippage (points) per cost scenario / simulated attack, in run order
+COST_SCENARIOS = {
+    '1tick': 0.1,
+    '2tick': 0.2,
+    '3tick': 0.3,
+    'atr': 0.5,
+    'missedfill': 0.4,
+}
+ATTACK_SCENARIOS = {
+    'stopfirst': 0.15,
+    'entrydelay': 0.2,
+    'exitdelay': 0.2,
+    'noise': 0.25,
+    'shuffle': 0.1,
+}
+SCENARIO_SLIPPAGES = sorted({0.0, *COST_SCENARIOS.values(), *ATTACK_SCENARIOS.values()})
+
 
 @dataclass
 class ValidationResult:
@@ -68,6 +85,39 @@ class ValidationResult:
     survival_score: float
     confidence: str
 
+    def to_survivor_data(self) -> Dict[str, Any]:
+        """Row for LifecycleManager.submit_survivor()."""
+        return {
+            'idea_id': self.idea_id,
+            'baseline_trades': self.baseline_result.total_trades,
+            'baseline_win_rate': self.baseline_result.win_rate,
+            'baseline_avg_r': self.baseline_result.avg_r,
+            'baseline_expectancy': self.baseline_result.expectancy,
+            'baseline_max_dd': self.baseline_result.max_dd,
+            'baseline_profit_factor': self.baseline_result.profit_factor,
+            'baseline_sharpe': self.baseline_result.sharpe,
+            'cost_1tick_expectancy': self.cost_1tick_exp,
+            'cost_2tick_expectancy': self.cost_2tick_exp,
+            'cost_3tick_expectancy': self.cost_3tick_exp,
+            'cost_atr_expectancy': self.cost_atr_exp,
+            'cost_missedfill_expectancy': self.cost_missedfill_exp,
+            'attack_stopfirst_expectancy': self.attack_stopfirst_exp,
+            'attack_entrydelay_expectancy': self.attack_entrydelay_exp,
+            'attack_exitdelay_expectancy': self.attack_exitdelay_exp,
+            'attack_noise_expectancy': self.attack_noise_exp,
+            'attack_shuffle_expectancy': self.attack_shuffle_exp,
+            'regime_year_count': self.regime_year_count,
+            'regime_year_profitable': self.regime_year_profitable,
+            'regime_volatility_count': self.regime_volatility_count,
+            'regime_volatility_profitable': self.regime_volatility_profitable,
+            'regime_session_count': self.regime_session_count,
+            'regime_session_profitable': self.regime_session_profitable,
+            'regime_max_profit_concentration': self.regime_max_concentration,
+            'walkforward_windows': 0,
+            'walkforward_profitable': 0,
+            'walkforward_avg_expectancy': 0
+        }
+
 
 class ValidationPipeline:
     """
@@ -84,27 +134,63 @@ class ValidationPipeline:
         self,
         candidate: Dict[str, Any],
         start_date: str = '2024-01-01',
-        end_date: str = '2026-01-15'
+        end_date: str = '2026-01-15',
+        baselines: Optional[Dict[str, Optional[BacktestResult]]] = None
     ) -> ValidationResult:
         """
         Run complete validation on candidate.
 
+        Args:
+            baselines: Optional precomputed zero-slippage results keyed by idea_id
+                       (from BacktestEngine.backtest_batch over the same dates)
+
         Returns:
             ValidationResult with all test outcomes
         """
         idea_id = candidate['idea_id']
-        logger.info(f"Validating {idea_id}...")
 
         # Update status
         self.lifecycle_manager.update_candidate_status(idea_id, EdgeStatus.TESTING)
 
-        # Step 1: Baseline backtest
+        scenarios = None
+        if baselines is not None and idea_id in baselines:
+            scenarios = {0.0: baselines[idea_id]}
+
+        result, failed_status = self.evaluate_candidate(candidate, start_date, end_date, scenarios)
+        if failed_status is not None:
+            self.lifecycle_manager.update_candidate_status(idea_id, failed_status)
+        return result
+
+    def evaluate_candidate(
+        self,
+        candidate: Dict[str, Any],
+        start_date: str = '2024-01-01',
+        end_date: str = '2026-01-15',
+        scenarios: Optional[Dict[float, Optional[BacktestResult]]] = None
+    ) -> Tuple[ValidationResult, Optional[EdgeStatus]]:
+        """
+        validate_candidate() without database writes.
+
+        Args:
+            scenarios: Optional precomputed backtests keyed by slippage_points
+                       (0.0 = baseline); missing slippages are run here in one
+                       BacktestEngine.backtest_scenarios() pass
+
+        Returns:
+            (ValidationResult, status to record on failure or None if it survived)
+        """
+        idea_id = candidate['idea_id']
+        logger.info(f"Validating {idea_id}...")
+
+        # Step 1: Baseline backtest (with every cost/attack scenario in the same pass)
         logger.info(f"[{idea_id}] Running baseline backtest...")
-        baseline = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0)
+        scenarios = dict(scenarios or {})
+        if 0.0 not in scenarios:
+            scenarios = self._fill_scenarios(candidate, start_date, end_date, scenarios)
+        baseline = scenarios[0.0]
 
         if not baseline or baseline.total_trades == 0:
             logger.warning(f"[{idea_id}] FAILED: No trades generated")
-            self.lifecycle_manager.update_candidate_status(idea_id, EdgeStatus.BACKTEST_FAILED)
             return ValidationResult(
                 idea_id=idea_id,
                 passed=False,
@@ -120,11 +206,10 @@ class ValidationPipeline:
                 regime_session_count=0, regime_session_profitable=0,
                 regime_max_concentration=0, regime_passed=False,
                 survival_score=0, confidence='LOW'
-            )
+            ), EdgeStatus.BACKTEST_FAILED
 
         if baseline.expectancy <= 0:
             logger.warning(f"[{idea_id}] FAILED: Baseline expectancy {baseline.expectancy:.2f}R <= 0")
-            self.lifecycle_manager.update_candidate_status(idea_id, EdgeStatus.BACKTEST_FAILED)
             return ValidationResult(
                 idea_id=idea_id,
                 passed=False,
@@ -140,17 +225,18 @@ class ValidationPipeline:
                 regime_session_count=0, regime_session_profitable=0,
                 regime_max_concentration=0, regime_passed=False,
                 survival_score=0, confidence='LOW'
-            )
+            ), EdgeStatus.BACKTEST_FAILED
 
         logger.info(f"[{idea_id}] Baseline PASSED: {baseline.total_trades} trades, {baseline.expectancy:.2f}R exp")
 
+        scenarios = self._fill_scenarios(candidate, start_date, end_date, scenarios)
+
         # Step 2: Cost realism tests
         logger.info(f"[{idea_id}] Running cost realism tests...")
-        cost_results, cost_passed = self._run_cost_tests(candidate, start_date, end_date)
+        cost_results, cost_passed = self._run_cost_tests(scenarios)
 
         if not cost_passed:
             logger.warning(f"[{idea_id}] FAILED: Cost realism tests")
-            self.lifecycle_manager.update_candidate_status(idea_id, EdgeStatus.ATTACK_FAILED)
             return ValidationResult(
                 idea_id=idea_id,
                 passed=False,
@@ -170,17 +256,16 @@ class ValidationPipeline:
                 regime_session_count=0, regime_session_profitable=0,
                 regime_max_concentration=0, regime_passed=False,
                 survival_score=0, confidence='LOW'
-            )
+            ), EdgeStatus.ATTACK_FAILED
 
         logger.info(f"[{idea_id}] Cost tests PASSED")
 
         # Step 3: Robustness attacks
         logger.info(f"[{idea_id}] Running robustness attacks...")
-        attack_results, attack_passed = self._run_attack_tests(candidate, baseline, start_date, end_date)
+        attack_results, attack_passed = self._run_attack_tests(scenarios)
 
         if not attack_passed:
             logger.warning(f"[{idea_id}] FAILED: Robustness attacks")
-            self.lifecycle_manager.update_candidate_status(idea_id, EdgeStatus.ATTACK_FAILED)
             return ValidationResult(
                 idea_id=idea_id,
                 passed=False,
@@ -203,7 +288,7 @@ class ValidationPipeline:
                 regime_session_count=0, regime_session_profitable=0,
                 regime_max_concentration=0, regime_passed=False,
                 survival_score=0, confidence='LOW'
-            )
+            ), EdgeStatus.ATTACK_FAILED
 
         logger.info(f"[{idea_id}] Attack tests PASSED")
 
@@ -213,7 +298,6 @@ class ValidationPipeline:
 
         if not regime_passed:
             logger.warning(f"[{idea_id}] FAILED: Regime splits")
-            self.lifecycle_manager.update_candidate_status(idea_id, EdgeStatus.VALIDATION_FAILED)
             return ValidationResult(
                 idea_id=idea_id,
                 passed=False,
@@ -240,7 +324,7 @@ class ValidationPipeline:
                 regime_max_concentration=regime_results['max_concentration'],
                 regime_passed=False,
                 survival_score=0, confidence='LOW'
-            )
+            ), EdgeStatus.VALIDATION_FAILED
 
         logger.info(f"[{idea_id}] Regime tests PASSED")
 
@@ -299,41 +383,41 @@ class ValidationPipeline:
             regime_passed=True,
             survival_score=survival_score,
             confidence=confidence
-        )
+        ), None
 
-    def _run_cost_tests(
+    def _fill_scenarios(
         self,
         candidate: Dict[str, Any],
         start_date: str,
-        end_date: str
+        end_date: str,
+        scenarios: Dict[float, Optional[BacktestResult]]
+    ) -> Dict[float, Optional[BacktestResult]]:
+        """Run every SCENARIO_SLIPPAGES entry not in scenarios, all in ONE engine pass."""
+        missing = [s for s in SCENARIO_SLIPPAGES if s not in scenarios]
+        if not missing:
+            return scenarios
+        return {**scenarios, **self.engine.backtest_scenarios(candidate, missing, start_date, end_date)}
+
+    def _run_cost_tests(
+        self,
+        scenarios: Dict[float, Optional[BacktestResult]]
     ) -> tuple[Dict[str, float], bool]:
         """
         Run cost realism tests with various slippage scenarios.
 
+        Args:
+            scenarios: Backtests keyed by slippage_points (see _fill_scenarios)
+
         Returns:
             (cost_results_dict, passed)
         """
         results = {}
 
-        # Test 1: 1 tick slippage
-        bt1 = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0.1)
-        results['1tick'] = bt1.expectancy if bt1 else -999
-
-        # Test 2: 2 tick slippage
-        bt2 = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0.2)
-        results['2tick'] = bt2.expectancy if bt2 else -999
-
-        # Test 3: 3 tick slippage
-        bt3 = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0.3)
-        results['3tick'] = bt3.expectancy if bt3 else -999
-
-        # Test 4: ATR-scaled slippage (simulated as 0.5 points for now)
-        bt_atr = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0.5)
-        results['atr'] = bt_atr.expectancy if bt_atr else -999
-
-        # Test 5: Missed fills (simulated with increased slippage)
-        bt_miss = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0.4)
-        results['missedfill'] = bt_miss.expectancy if bt_miss else -999
+        # 1/2/3 tick, ATR-scaled (simulated as 0.5 points for now),
+        # missed fills (simulated with increased slippage)
+        for name, slippage in COST_SCENARIOS.items():
+            bt = scenarios[slippage]
+            results[name] = bt.expectancy if bt else -999
 
         # Rule: Expectancy must remain positive in >= 2 cost scenarios
         positive_count = sum(1 for exp in results.values() if exp > 0)
@@ -343,14 +427,14 @@ class ValidationPipeline:
 
     def _run_attack_tests(
         self,
-        candidate: Dict[str, Any],
-        baseline: BacktestResult,
-        start_date: str,
-        end_date: str
+        scenarios: Dict[float, Optional[BacktestResult]]
     ) -> tuple[Dict[str, float], bool]:
         """
         Run robustness attacks.
 
+        Args:
+            scenarios: Backtests keyed by slippage_points (see _fill_scenarios)
+
         Returns:
             (attack_results_dict, passed)
         """
@@ -358,26 +442,9 @@ class ValidationPipeline:
 
         # For now, simulate attacks by adding slippage and checking degradation
         # Full implementation would involve modifying bars/trade logic
-
-        # Attack 1: Stop-first bias (simulated)
-        bt_sf = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0.15)
-        results['stopfirst'] = bt_sf.expectancy if bt_sf else -999
-
-        # Attack 2: Entry delay (simulated)
-        bt_ed = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0.2)
-        results['entrydelay'] = bt_ed.expectancy if bt_ed else -999
-
-        # Attack 3: Exit delay (simulated)
-        bt_xd = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0.2)
-        results['exitdelay'] = bt_xd.expectancy if bt_xd else -999
-
-        # Attack 4: Random noise (simulated)
-        bt_noise = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0.25)
-        results['noise'] = bt_noise.expectancy if bt_noise else -999
-
-        # Attack 5: Trade shuffle (simulated)
-        bt_shuffle = self.engine.backtest_candidate(candidate, start_date, end_date, slippage_points=0.1)
-        results['shuffle'] = bt_shuffle.expectancy if bt_shuffle else -999
+        for name, slippage in ATTACK_SCENARIOS.items():
+            bt = scenarios[slippage]
+            results[name] = bt.expectancy if bt else -999
 
         # Rule: Edge must degrade smoothly, not collapse
         # Check that average attacked expectancy > 0
@@ -14,7 +14,6 @@ Key differences from Phase 3:
 Goal: Prove that extended windows are the source of profitability.
 """
 
-import duckdb
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -22,6 +21,9 @@ from datetime import datetime, time as dt_time, timedelta
 from typing import Dict, List, Optional, Tuple
 import pytz
 
+from bar_store import BarStore
+from orb_kernel import first_breakout, scan_exit
+
 # Paths
 ROOT = Path(__file__).parent.parent
 DB_PATH = str(ROOT / "data" / "db" / "gold.db")
@@ -48,27 +50,10 @@ def load_bars_for_period(
     Returns:
         DataFrame with ts_utc, open, high, low, close, volume
     """
-    conn = duckdb.connect(db_path, read_only=True)
-
-    bars = conn.execute("""
-        SELECT
-            ts_utc,
-            open,
-            high,
-            low,
-            close,
-            volume
-        FROM bars_1m
-        WHERE symbol = 'MGC'
-        AND ts_utc >= ?::TIMESTAMP
-        AND ts_utc < (?::DATE + INTERVAL '1 day')::TIMESTAMP
-        ORDER BY ts_utc
-    """, [start_date, end_date]).fetchdf()
-
-    conn.close()
-
-    # Convert to datetime
-    bars['ts_utc'] = pd.to_datetime(bars['ts_utc'], utc=True)
+    # One DB read per process; the period is a zero-copy slice of the store
+    start_utc = TZ_UTC.localize(datetime.strptime(start_date, '%Y-%m-%d'))
+    end_utc = TZ_UTC.localize(datetime.strptime(end_date, '%Y-%m-%d')) + timedelta(days=1)
+    bars = BarStore.shared(INSTRUMENT, db_path).window(start_utc, end_utc).to_frame()
 
     # Add local time column
     bars['ts_local'] = bars['ts_utc'].dt.tz_convert(TZ_LOCAL)
@@ -160,13 +145,12 @@ def detect_entry(
         return None
 
     # Look for first close outside ORB
-    for idx, bar in scan_bars.iterrows():
-        if bar['close'] > orb['high']:
-            return (bar, 'long')
-        elif bar['close'] < orb['low']:
-            return (bar, 'short')
+    breakout = first_breakout(scan_bars['close'].to_numpy(), orb['high'], orb['low'])
+    if breakout is None:
+        return None
 
-    return None
+    idx, direction = breakout
+    return (scan_bars.iloc[idx], direction)
 
 
 def simulate_trade(
@@ -223,69 +207,29 @@ def simulate_trade(
             'time_in_trade_minutes': 0
         }
 
-    # Track through remaining bars
-    for idx, bar in remaining_bars.iterrows():
-        if direction == 'long':
-            # Check stop first (conservative)
-            if bar['low'] <= stop_price:
-                return {
-                    'outcome': 'LOSS',
-                    'r_multiple': -1.0,
-                    'entry_time': entry_time,
-                    'exit_time': bar['ts_local'],
-                    'entry_price': entry_price,
-                    'exit_price': stop_price,
-                    'stop_price': stop_price,
-                    'target_price': target_price,
-                    'risk': risk,
-                    'time_in_trade_minutes': (bar['ts_local'] - entry_time).total_seconds() / 60
-                }
-
-            # Check target
-            if bar['high'] >= target_price:
-                return {
-                    'outcome': 'WIN',
-                    'r_multiple': rr,
-                    'entry_time': entry_time,
-                    'exit_time': bar['ts_local'],
-                    'entry_price': entry_price,
-                    'exit_price': target_price,
-                    'stop_price': stop_price,
-                    'target_price': target_price,
-                    'risk': risk,
-                    'time_in_trade_minutes': (bar['ts_local'] - entry_time).total_seconds() / 60
-                }
-
-        else:  # short
-            # Check stop first
-            if bar['high'] >= stop_price:
-                return {
-                    'outcome': 'LOSS',
-                    'r_multiple': -1.0,
-                    'entry_time': entry_time,
-                    'exit_time': bar['ts_local'],
-                    'entry_price': entry_price,
-                    'exit_price': stop_price,
-                    'stop_price': stop_price,
-                    'target_price': target_price,
-                    'risk': risk,
-                    'time_in_trade_minutes': (bar['ts_local'] - entry_time).total_seconds() / 60
-                }
-
-            # Check target
-            if bar['low'] <= target_price:
-                return {
-                    'outcome': 'WIN',
-                    'r_multiple': rr,
-                    'entry_time': entry_time,
-                    'exit_time': bar['ts_local'],
-                    'entry_price': entry_price,
-                    'exit_price': target_price,
-                    'stop_price': stop_price,
-                    'target_price': target_price,
-                    'risk': risk,
-                    'time_in_trade_minutes': (bar['ts_local'] - entry_time).total_seconds() / 60
-                }
+    # Track through remaining bars (stop checked first on the same bar)
+    scan = scan_exit(
+        remaining_bars['high'].to_numpy(),
+        remaining_bars['low'].to_numpy(),
+        remaining_bars['close'].to_numpy(),
+        entry_price, stop_price, target_price, direction
+    )
+
+    if scan.hit is not None:
+        exit_time = remaining_bars['ts_local'].iloc[scan.idx]
+        won = scan.hit == 'target'
+        return {
+            'outcome': 'WIN' if won else 'LOSS',
+            'r_multiple': rr if won else -1.0,
+            'entry_time': entry_time,
+            'exit_time': exit_time,
+            'entry_price': entry_price,
+            'exit_price': target_price if won else stop_price,
+            'stop_price': stop_price,
+            'target_price': target_price,
+            'risk': risk,
+            'time_in_trade_minutes': (exit_time - entry_time).total_seconds() / 60
+        }
 
     # No exit - end of scan window
     final_bar = remaining_bars.iloc[-1]
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+ORB Kernel - Vectorized breakout entry and TP/SL exit on NumPy arrays
+
+Shared by the research backtesters (candidate engine, extended-window backtest,
+EDE engine, quick Asia core) in place of per-bar iterrows() loops.
+
+    entry = first_breakout(close, orb_high, orb_low)          # (idx, 'long'/'short') or None
+    exit_ = scan_exit(high, low, close, entry_price, stop, target, 'long')
+
+Execution rules (identical to the loops they replace):
+- Entry: first bar completing N consecutive closes above ORB high (long)
+  or below ORB low (short). N=1 is the classic "first close outside".
+- Exit: first bar where stop or target is touched; if both on the same bar,
+  STOP wins (conservative).
+- Excursions are reported two ways, because the engines historically differ:
+    close_mae / close_mfe: min/max close-to-close P&L over bars BEFORE the exit
+                           bar, floored at 0 (mae <= 0 <= mfe)
+    range_mae / range_mfe: worst adverse / best favorable high-low excursion
+                           THROUGH the exit bar, floored at 0 (both >= 0)
+  With no exit, both cover every bar passed in.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ExitScan:
+    """Result of scan_exit(). idx = -1 when neither stop nor target was touched."""
+    idx: int
+    hit: Optional[str]  # 'stop', 'target' or None
+    close_mae: float
+    close_mfe: float
+    range_mae: float
+    range_mfe: float
+
+
+def _first_run(mask: np.ndarray, n: int) -> int:
+    """Index of the bar completing the first run of n True values, or -1."""
+    if n <= 1:
+        return int(np.argmax(mask)) if mask.any() else -1
+    if len(mask) < n:
+        return -1
+    full = np.convolve(mask.astype(np.int64), np.ones(n, dtype=np.int64), mode='valid') == n
+    return int(np.argmax(full)) + n - 1 if full.any() else -1
+
+
+def first_breakout(
+    close: np.ndarray,
+    orb_high: float,
+    orb_low: float,
+    confirm_bars: int = 1
+) -> Optional[Tuple[int, str]]:
+    """
+    First breakout of the ORB by closes.
+
+    Returns:
+        (index of the entry bar, 'long' | 'short') or None
+    """
+    close = np.asarray(close, dtype=np.float64)
+    long_idx = _first_run(close > orb_high, confirm_bars)
+    short_idx = _first_run(close < orb_low, confirm_bars)
+
+    if long_idx < 0 and short_idx < 0:
+        return None
+    if short_idx < 0 or (0 <= long_idx < short_idx):
+        return long_idx, 'long'
+    return short_idx, 'short'
+
+
+def scan_exit(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    entry_price: float,
+    stop_price: float,
+    target_price: float,
+    direction: str
+) -> ExitScan:
+    """
+    Scan bars AFTER entry for the first TP/SL touch (stop-first on the same bar).
+
+    Args:
+        high, low, close: Bars after the entry bar, in time order
+        direction: 'long' or 'short'
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+
+    if direction == 'long':
+        stop_hit = low <= stop_price
+        target_hit = high >= target_price
+        unrealized = close - entry_price
+        adverse = entry_price - low
+        favorable = high - entry_price
+    else:
+        stop_hit = high >= stop_price
+        target_hit = low <= target_price
+        unrealized = entry_price - close
+        adverse = high - entry_price
+        favorable = entry_price - low
+
+    either = stop_hit | target_hit
+    if either.any():
+        idx = int(np.argmax(either))
+        hit = 'stop' if stop_hit[idx] else 'target'
+    else:
+        idx, hit = -1, None
+
+    # Close-based excursion: bars before the exit bar; range-based: through it
+    n_close = idx if idx >= 0 else len(close)
+    n_range = idx + 1 if idx >= 0 else len(close)
+
+    close_mae = min(0.0, float(unrealized[:n_close].min())) if n_close else 0.0
+    close_mfe = max(0.0, float(unrealized[:n_close].max())) if n_close else 0.0
+    range_mae = max(0.0, float(adverse[:n_range].max())) if n_range else 0.0
+    range_mfe = max(0.0, float(favorable[:n_range].max())) if n_range else 0.0
+
+    return ExitScan(idx, hit, close_mae, close_mfe, range_mae, range_mfe)
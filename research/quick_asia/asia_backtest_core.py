@@ -7,12 +7,19 @@ Supports BOTH HALF and FULL SL modes with hard assertions.
 
 import duckdb
 import pandas as pd
+import sys
 from datetime import datetime, date, time as dt_time, timedelta
+from pathlib import Path
 from zoneinfo import ZoneInfo
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import hashlib
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bar_store import BarStore
+from orb_kernel import first_breakout, scan_exit
+
 TZ_LOCAL = ZoneInfo("Australia/Brisbane")
 TZ_UTC = ZoneInfo("UTC")
 
@@ -43,8 +50,34 @@ class TradeResult:
     mae_r: Optional[float]
     mfe_r: Optional[float]
 
+BarSource = Union[duckdb.DuckDBPyConnection, BarStore]
+
+def _load_bars(
+    conn: BarSource,
+    start_utc: datetime,
+    end_utc: datetime,
+    include_start: bool = True
+) -> pd.DataFrame:
+    """
+    MGC 1m bars in [start, end) (or (start, end) if include_start=False).
+
+    A BarStore is sliced in memory; a connection falls back to a bars_1m query.
+    """
+    if isinstance(conn, BarStore):
+        return conn.window(start_utc, end_utc, include_start=include_start).to_frame()
+
+    op = ">=" if include_start else ">"
+    return conn.execute(f"""
+        SELECT ts_utc, high, low, close
+        FROM bars_1m
+        WHERE symbol = 'MGC'
+        AND ts_utc {op} ?
+        AND ts_utc < ?
+        ORDER BY ts_utc
+    """, [start_utc, end_utc]).fetchdf()
+
 def compute_orb_levels(
-    conn: duckdb.DuckDBPyConnection,
+    conn: BarSource,
     trading_date: date,
     orb_hour: int,
     orb_min: int,
@@ -62,17 +95,8 @@ def compute_orb_levels(
     orb_start_utc = orb_start_local.astimezone(TZ_UTC)
     orb_end_utc = orb_end_local.astimezone(TZ_UTC)
 
-    # Query bars within ORB window
-    query = """
-        SELECT high, low, close
-        FROM bars_1m
-        WHERE symbol = 'MGC'
-        AND ts_utc >= ?
-        AND ts_utc < ?
-        ORDER BY ts_utc
-    """
-
-    orb_bars = conn.execute(query, [orb_start_utc, orb_end_utc]).fetchdf()
+    # Bars within ORB window
+    orb_bars = _load_bars(conn, orb_start_utc, orb_end_utc)
 
     if len(orb_bars) == 0:
         return None
@@ -91,7 +115,7 @@ def compute_orb_levels(
     )
 
 def simulate_orb_breakout(
-    conn: duckdb.DuckDBPyConnection,
+    conn: BarSource,
     trading_date: date,
     orb: ORBResult,
     orb_hour: int,
@@ -125,37 +149,19 @@ def simulate_orb_breakout(
     scan_end_utc = scan_end_local.astimezone(TZ_UTC)
 
     # Find first close outside ORB
-    entry_query = """
-        SELECT ts_utc, close
-        FROM bars_1m
-        WHERE symbol = 'MGC'
-        AND ts_utc >= ?
-        AND ts_utc < ?
-        ORDER BY ts_utc
-    """
-
-    scan_bars = conn.execute(entry_query, [scan_start_utc, scan_end_utc]).fetchdf()
+    scan_bars = _load_bars(conn, scan_start_utc, scan_end_utc)
 
     if len(scan_bars) == 0:
         return None
 
     # Detect breakout
-    direction = None
-    entry_bar = None
-
-    for idx, row in scan_bars.iterrows():
-        if row['close'] > orb.orb_high:
-            direction = 'long'
-            entry_bar = row
-            break
-        elif row['close'] < orb.orb_low:
-            direction = 'short'
-            entry_bar = row
-            break
-
-    if direction is None:
+    breakout = first_breakout(scan_bars['close'].to_numpy(), orb.orb_high, orb.orb_low)
+    if breakout is None:
         return None
 
+    entry_idx, direction = breakout
+    entry_bar = scan_bars.iloc[entry_idx]
+
     # Entry time and price
     entry_ts = pd.to_datetime(entry_bar['ts_utc'], utc=True).to_pydatetime()
     entry_price = float(entry_bar['close'])
@@ -185,28 +191,12 @@ def simulate_orb_breakout(
     # Get all bars after entry for simulation
     if mode == "ISOLATION":
         # ISOLATION: only scan until session boundary
-        sim_query = """
-            SELECT ts_utc, high, low, close
-            FROM bars_1m
-            WHERE symbol = 'MGC'
-            AND ts_utc > ?
-            AND ts_utc < ?
-            ORDER BY ts_utc
-        """
-        sim_bars = conn.execute(sim_query, [entry_ts, scan_end_utc]).fetchdf()
+        sim_bars = _load_bars(conn, entry_ts, scan_end_utc, include_start=False)
     else:  # CONTINUATION
         # CONTINUATION: scan indefinitely (until TP/SL)
         # For practicality, limit to end of trading day (09:00 next day)
         continuation_end = datetime.combine(trading_date + timedelta(days=1), dt_time(9, 0)).replace(tzinfo=TZ_LOCAL).astimezone(TZ_UTC)
-        sim_query = """
-            SELECT ts_utc, high, low, close
-            FROM bars_1m
-            WHERE symbol = 'MGC'
-            AND ts_utc > ?
-            AND ts_utc < ?
-            ORDER BY ts_utc
-        """
-        sim_bars = conn.execute(sim_query, [entry_ts, continuation_end]).fetchdf()
+        sim_bars = _load_bars(conn, entry_ts, continuation_end, include_start=False)
 
     if len(sim_bars) == 0:
         # No bars to simulate
@@ -231,102 +221,36 @@ def simulate_orb_breakout(
         else:
             return None  # No exit in CONTINUATION mode
 
-    # Simulate trade through bars
-    mae_raw = 0.0
-    mfe_raw = 0.0
-
-    for idx, bar in sim_bars.iterrows():
-        bar_ts = pd.to_datetime(bar['ts_utc'], utc=True).to_pydatetime()
-        high = float(bar['high'])
-        low = float(bar['low'])
+    # Simulate trade through bars (conservative: stop first on the same bar)
+    scan = scan_exit(
+        sim_bars['high'].to_numpy(),
+        sim_bars['low'].to_numpy(),
+        sim_bars['close'].to_numpy(),
+        entry_price, stop_price, target_price, direction
+    )
+    mae_raw = scan.range_mae
+    mfe_raw = scan.range_mfe
 
-        # Update MAE/MFE
-        if direction == 'long':
-            mae_raw = max(mae_raw, entry_price - low)
-            mfe_raw = max(mfe_raw, high - entry_price)
-
-            # Check stop (conservative: stop first)
-            if low <= stop_price:
-                minutes = (bar_ts - entry_ts).total_seconds() / 60.0
-                return TradeResult(
-                    date_local=str(trading_date),
-                    orb_time=f"{orb_hour:02d}{orb_min:02d}",
-                    direction=direction,
-                    entry_ts=entry_ts,
-                    entry_price=entry_price,
-                    stop_price=stop_price,
-                    target_price=target_price,
-                    exit_ts=bar_ts,
-                    exit_price=stop_price,
-                    exit_reason='SL',
-                    r_multiple=-1.0,
-                    minutes_to_exit=minutes,
-                    mae_r=mae_raw / risk if risk > 0 else 0,
-                    mfe_r=mfe_raw / risk if risk > 0 else 0
-                )
-
-            # Check target
-            if high >= target_price:
-                minutes = (bar_ts - entry_ts).total_seconds() / 60.0
-                return TradeResult(
-                    date_local=str(trading_date),
-                    orb_time=f"{orb_hour:02d}{orb_min:02d}",
-                    direction=direction,
-                    entry_ts=entry_ts,
-                    entry_price=entry_price,
-                    stop_price=stop_price,
-                    target_price=target_price,
-                    exit_ts=bar_ts,
-                    exit_price=target_price,
-                    exit_reason='TP',
-                    r_multiple=rr,
-                    minutes_to_exit=minutes,
-                    mae_r=mae_raw / risk if risk > 0 else 0,
-                    mfe_r=mfe_raw / risk if risk > 0 else 0
-                )
-        else:  # short
-            mae_raw = max(mae_raw, high - entry_price)
-            mfe_raw = max(mfe_raw, entry_price - low)
-
-            # Check stop (conservative: stop first)
-            if high >= stop_price:
-                minutes = (bar_ts - entry_ts).total_seconds() / 60.0
-                return TradeResult(
-                    date_local=str(trading_date),
-                    orb_time=f"{orb_hour:02d}{orb_min:02d}",
-                    direction=direction,
-                    entry_ts=entry_ts,
-                    entry_price=entry_price,
-                    stop_price=stop_price,
-                    target_price=target_price,
-                    exit_ts=bar_ts,
-                    exit_price=stop_price,
-                    exit_reason='SL',
-                    r_multiple=-1.0,
-                    minutes_to_exit=minutes,
-                    mae_r=mae_raw / risk if risk > 0 else 0,
-                    mfe_r=mfe_raw / risk if risk > 0 else 0
-                )
-
-            # Check target
-            if low <= target_price:
-                minutes = (bar_ts - entry_ts).total_seconds() / 60.0
-                return TradeResult(
-                    date_local=str(trading_date),
-                    orb_time=f"{orb_hour:02d}{orb_min:02d}",
-                    direction=direction,
-                    entry_ts=entry_ts,
-                    entry_price=entry_price,
-                    stop_price=stop_price,
-                    target_price=target_price,
-                    exit_ts=bar_ts,
-                    exit_price=target_price,
-                    exit_reason='TP',
-                    r_multiple=rr,
-                    minutes_to_exit=minutes,
-                    mae_r=mae_raw / risk if risk > 0 else 0,
-                    mfe_r=mfe_raw / risk if risk > 0 else 0
-                )
+    if scan.hit is not None:
+        bar_ts = pd.to_datetime(sim_bars['ts_utc'].iloc[scan.idx], utc=True).to_pydatetime()
+        minutes = (bar_ts - entry_ts).total_seconds() / 60.0
+        hit_target = scan.hit == 'target'
+        return TradeResult(
+            date_local=str(trading_date),
+            orb_time=f"{orb_hour:02d}{orb_min:02d}",
+            direction=direction,
+            entry_ts=entry_ts,
+            entry_price=entry_price,
+            stop_price=stop_price,
+            target_price=target_price,
+            exit_ts=bar_ts,
+            exit_price=target_price if hit_target else stop_price,
+            exit_reason='TP' if hit_target else 'SL',
+            r_multiple=rr if hit_target else -1.0,
+            minutes_to_exit=minutes,
+            mae_r=mae_raw / risk if risk > 0 else 0,
+            mfe_r=mfe_raw / risk if risk > 0 else 0
+        )
 
     # Reached end of scan window without TP/SL
     if mode == "ISOLATION":
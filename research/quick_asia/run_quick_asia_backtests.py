@@ -15,7 +15,8 @@ from asia_backtest_core import (
     compute_orb_levels,
     simulate_orb_breakout,
     compute_metrics,
-    compute_trades_hash
+    compute_trades_hash,
+    BarStore
 )
 
 # ORB configurations
@@ -207,8 +208,11 @@ def main():
     print(f"Trading days: {len(trading_days)}")
     print(f"Date range: {min(trading_days)} to {max(trading_days)}\n")
 
+    # All configs slice one in-memory copy of bars_1m (single DB read)
+    bars = BarStore.shared("MGC", str(db_path))
+
     # Run sanity checks
-    sanity_passed = run_sanity_checks(conn, trading_days)
+    sanity_passed = run_sanity_checks(bars, trading_days)
 
     # Run all configurations
     print("\n" + "="*80)
@@ -227,7 +231,7 @@ def main():
                     current += 1
                     print(f"[{current}/{total_configs}] {orb_time} | RR={rr} | SL={sl_mode} | Mode={mode}...", end=" ")
 
-                    result = run_backtest(conn, orb_time, rr, sl_mode, mode, trading_days)
+                    result = run_backtest(bars, orb_time, rr, sl_mode, mode, trading_days)
 
                     # Remove trades_list before storing (too large)
                     result_clean = {k: v for k, v in result.items() if k != 'trades_list'}
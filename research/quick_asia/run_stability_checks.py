@@ -7,7 +7,7 @@ import duckdb
 import pandas as pd
 from pathlib import Path
 from datetime import date
-from asia_backtest_core import compute_metrics
+from asia_backtest_core import compute_metrics, BarStore
 from run_quick_asia_backtests import run_backtest, ORB_CONFIGS, RR_VALUES, SL_MODES
 
 # Database
@@ -49,6 +49,7 @@ def main():
 
     # Get all available days
     all_days = get_all_trading_days(conn, "MGC", 365)
+    bars = BarStore.shared("MGC", str(db_path))
     print(f"Total trading days available: {len(all_days)}")
     print(f"Date range: {min(all_days)} to {max(all_days)}")
     print()
@@ -64,7 +65,7 @@ def main():
             for sl_mode in SL_MODES:
                 print(f"  {orb_time} | RR={rr} | SL={sl_mode}...", end=" ")
 
-                result = run_backtest(conn, orb_time, rr, sl_mode, "ISOLATION", all_days)
+                result = run_backtest(bars, orb_time, rr, sl_mode, "ISOLATION", all_days)
 
                 result_clean = {k: v for k, v in result.items() if k != 'trades_list'}
                 results_365.append(result_clean)
@@ -97,9 +98,9 @@ def main():
                 print(f"  {orb_time} | RR={rr} | SL={sl_mode}...", end=" ")
 
                 # Run on each split
-                r1 = run_backtest(conn, orb_time, rr, sl_mode, "ISOLATION", split1)
-                r2 = run_backtest(conn, orb_time, rr, sl_mode, "ISOLATION", split2)
-                r3 = run_backtest(conn, orb_time, rr, sl_mode, "ISOLATION", split3)
+                r1 = run_backtest(bars, orb_time, rr, sl_mode, "ISOLATION", split1)
+                r2 = run_backtest(bars, orb_time, rr, sl_mode, "ISOLATION", split2)
+                r3 = run_backtest(bars, orb_time, rr, sl_mode, "ISOLATION", split3)
 
                 # Count positive splits
                 positive_splits = sum([
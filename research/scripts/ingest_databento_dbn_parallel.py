@@ -0,0 +1,277 @@
+"""
+Parallel Databento DBN ingestion for MGC / NQ / MPL
+====================================================
+
+One entry point for all three instruments. Monthly .dbn.zst files are decoded
+in a process pool; each worker converts the whole file with to_ndarray(),
+picks the front contract per minute with array ops, and returns a ready-to-write
+bar frame. A single writer (this process) upserts each frame into bars_1m* with
+one INSERT OR REPLACE ... SELECT, then rebuilds bars_5m* once for the covered range.
+
+Front contract rule (same as ingest_databento_dbn_nq.py):
+  per 1-minute bucket, the outright (no '-', instrument prefix) with the highest
+  volume; ties go to the contract seen first in the file.
+
+NO LOOKAHEAD: timestamps stay UTC (ts_event floored to the minute).
+
+Usage:
+  python scripts/ingest_databento_dbn_parallel.py <path_to_dbn_folder> --instrument NQ
+  python scripts/ingest_databento_dbn_parallel.py data/dbn --instrument MGC --workers 8
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from ingest_databento_dbn_nq import load_symbology_mapping, log
+
+
+DB_PATH = "gold.db"
+NS_PER_MIN = 60 * 1_000_000_000
+PRICE_SCALE = 1e9  # Databento fixed-point prices
+
+
+@dataclass(frozen=True)
+class InstrumentSpec:
+    symbol: str          # logical continuous symbol stored in DB
+    prefix: str          # outright contract prefix (e.g. 'NQ' -> NQH5)
+    bars_1m_table: str
+    bars_5m_table: str
+    max_contract_len: int = 5
+
+    def is_outright(self, contract: str) -> bool:
+        return (
+            bool(contract)
+            and contract.startswith(self.prefix)
+            and "-" not in contract
+            and len(contract) <= self.max_contract_len
+        )
+
+
+INSTRUMENTS: Dict[str, InstrumentSpec] = {
+    "MGC": InstrumentSpec("MGC", "MGC", "bars_1m", "bars_5m"),
+    "NQ": InstrumentSpec("NQ", "NQ", "bars_1m_nq", "bars_5m_nq"),
+    "MPL": InstrumentSpec("MPL", "MPL", "bars_1m_mpl", "bars_5m_mpl"),
+}
+
+
+def front_month_bars(records: np.ndarray, outright_symbols: Dict[int, str], spec: InstrumentSpec) -> pd.DataFrame:
+    """
+    Collapse raw OHLCV-1m records to one front-contract bar per minute.
+
+    Args:
+        records: Structured array with ts_event, instrument_id, open, high, low, close, volume
+        outright_symbols: instrument_id -> contract, already filtered to spec outrights
+        spec: Instrument being ingested
+
+    Returns:
+        DataFrame(ts_utc, symbol, source_symbol, open, high, low, close, volume), sorted by ts_utc
+    """
+    columns = ["ts_utc", "symbol", "source_symbol", "open", "high", "low", "close", "volume"]
+    if len(records) == 0 or not outright_symbols:
+        return pd.DataFrame(columns=columns)
+
+    iid = records["instrument_id"].astype(np.int64)
+    keep = np.isin(iid, np.fromiter(outright_symbols.keys(), dtype=np.int64))
+    if not keep.any():
+        return pd.DataFrame(columns=columns)
+
+    iid = iid[keep]
+    minute = (records["ts_event"][keep].astype(np.int64) // NS_PER_MIN) * NS_PER_MIN
+    pos = np.arange(len(iid))
+    o = records["open"][keep] / PRICE_SCALE
+    h = records["high"][keep] / PRICE_SCALE
+    l = records["low"][keep] / PRICE_SCALE
+    c = records["close"][keep] / PRICE_SCALE
+    v = records["volume"][keep].astype(np.int64)
+
+    # Group by (minute, contract), keeping file order inside each group
+    order = np.lexsort((pos, iid, minute))
+    minute, iid, pos, o, h, l, c, v = (a[order] for a in (minute, iid, pos, o, h, l, c, v))
+    new_group = np.ones(len(iid), dtype=bool)
+    new_group[1:] = (minute[1:] != minute[:-1]) | (iid[1:] != iid[:-1])
+    starts = np.flatnonzero(new_group)
+    ends = np.append(starts[1:], len(iid))
+
+    g_minute = minute[starts]
+    g_iid = iid[starts]
+    g_first = pos[starts]
+    g_open = o[starts]
+    g_high = np.maximum.reduceat(h, starts)
+    g_low = np.minimum.reduceat(l, starts)
+    g_close = c[ends - 1]
+    g_vol = np.add.reduceat(v, starts)
+
+    # Front contract per minute: max volume, then first seen
+    pick = np.lexsort((g_first, -g_vol, g_minute))
+    first_in_minute = np.ones(len(pick), dtype=bool)
+    first_in_minute[1:] = g_minute[pick][1:] != g_minute[pick][:-1]
+    front = pick[first_in_minute]
+
+    return pd.DataFrame({
+        "ts_utc": pd.to_datetime(g_minute[front], unit="ns", utc=True),
+        "symbol": spec.symbol,
+        "source_symbol": pd.Series(g_iid[front]).map(outright_symbols).to_numpy(),
+        "open": g_open[front],
+        "high": g_high[front],
+        "low": g_low[front],
+        "close": g_close[front],
+        "volume": g_vol[front],
+    }, columns=columns)
+
+
+def decode_dbn_file(dbn_path: str, outright_symbols: Dict[int, str], spec: InstrumentSpec) -> pd.DataFrame:
+    """Worker: decode one DBN file and return its front-month 1m bars."""
+    import databento as db
+
+    store = db.DBNStore.from_file(dbn_path)
+    return front_month_bars(store.to_ndarray(), outright_symbols, spec)
+
+
+def init_tables(con: duckdb.DuckDBPyConnection, spec: InstrumentSpec):
+    """Create bars_1m*/bars_5m* for the instrument if they don't exist"""
+    for table in (spec.bars_1m_table, spec.bars_5m_table):
+        con.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+              ts_utc        TIMESTAMPTZ NOT NULL,
+              symbol        TEXT NOT NULL,
+              source_symbol TEXT,
+              open          DOUBLE NOT NULL,
+              high          DOUBLE NOT NULL,
+              low           DOUBLE NOT NULL,
+              close         DOUBLE NOT NULL,
+              volume        BIGINT NOT NULL,
+              PRIMARY KEY (symbol, ts_utc)
+            );
+        """)
+
+
+def write_bars_1m(con: duckdb.DuckDBPyConnection, spec: InstrumentSpec, frame: pd.DataFrame) -> int:
+    """Single-writer upsert of one decoded file."""
+    if len(frame) == 0:
+        return 0
+    con.register("_dbn_batch", frame)
+    try:
+        con.execute(f"""
+            INSERT OR REPLACE INTO {spec.bars_1m_table}
+            (ts_utc, symbol, source_symbol, open, high, low, close, volume)
+            SELECT ts_utc, symbol, source_symbol, open, high, low, close, volume
+            FROM _dbn_batch
+        """)
+    finally:
+        con.unregister("_dbn_batch")
+    return len(frame)
+
+
+def rebuild_5m(con: duckdb.DuckDBPyConnection, spec: InstrumentSpec, start_ts: datetime, end_ts: datetime):
+    """Rebuild bars_5m* for [start_ts, end_ts) from bars_1m* (deterministic 300s buckets)."""
+    con.execute(f"""
+        DELETE FROM {spec.bars_5m_table}
+        WHERE symbol = ?
+          AND ts_utc >= ?
+          AND ts_utc < ?
+    """, [spec.symbol, start_ts, end_ts])
+
+    con.execute(f"""
+        INSERT INTO {spec.bars_5m_table} (ts_utc, symbol, source_symbol, open, high, low, close, volume)
+        SELECT
+            CAST(to_timestamp(floor(epoch(ts_utc) / 300) * 300) AS TIMESTAMPTZ) AS ts_5m,
+            symbol,
+            NULL AS source_symbol,
+            arg_min(open, ts_utc)  AS open,
+            max(high)              AS high,
+            min(low)               AS low,
+            arg_max(close, ts_utc) AS close,
+            sum(volume)            AS volume
+        FROM {spec.bars_1m_table}
+        WHERE symbol = ?
+          AND ts_utc >= ?
+          AND ts_utc < ?
+        GROUP BY 1, 2
+        ORDER BY 1
+    """, [spec.symbol, start_ts, end_ts])
+
+
+def ingest_folder(dbn_folder: Path, spec: InstrumentSpec, db_path: str = DB_PATH,
+                  workers: Optional[int] = None) -> int:
+    """
+    Decode every DBN file in the folder in parallel and write through one connection.
+
+    Returns:
+        Total 1m bars written
+    """
+    id_to_symbol = load_symbology_mapping(dbn_folder)
+    outright_symbols = {iid: sym for iid, sym in id_to_symbol.items() if spec.is_outright(sym)}
+    if not outright_symbols:
+        log(f"ERROR: No {spec.symbol} outright contracts in symbology - cannot ingest")
+        return 0
+
+    dbn_files: List[Path] = sorted(set(dbn_folder.glob("*.dbn")) | set(dbn_folder.glob("*.dbn.zst")))
+    if not dbn_files:
+        log(f"ERROR: No .dbn or .dbn.zst files found in {dbn_folder}")
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    log(f"Found {len(dbn_files)} DBN file(s); decoding with {workers} worker(s)")
+
+    con = duckdb.connect(db_path)
+    total = 0
+    first_ts = last_ts = None
+    try:
+        init_tables(con, spec)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() keeps file order, so overlapping minutes resolve exactly like a serial run
+            frames = pool.map(
+                decode_dbn_file,
+                [str(p) for p in dbn_files],
+                [outright_symbols] * len(dbn_files),
+                [spec] * len(dbn_files),
+            )
+            for dbn_path, frame in zip(dbn_files, frames):
+                written = write_bars_1m(con, spec, frame)
+                total += written
+                if written:
+                    lo, hi = frame["ts_utc"].iloc[0], frame["ts_utc"].iloc[-1]
+                    first_ts = lo if first_ts is None else min(first_ts, lo)
+                    last_ts = hi if last_ts is None else max(last_ts, hi)
+                log(f"  {dbn_path.name}: {written:,} bars -> {spec.bars_1m_table}")
+
+        if total:
+            start_5m = first_ts.floor("5min").to_pydatetime()
+            end_5m = (last_ts.floor("5min") + pd.Timedelta(minutes=5)).to_pydatetime()
+            rebuild_5m(con, spec, start_5m, end_5m)
+            log(f"  {spec.bars_5m_table} rebuilt for {start_5m} -> {end_5m}")
+    finally:
+        con.close()
+
+    log(f"DONE: {total:,} {spec.symbol} 1m bars written")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel DBN ingestion for MGC/NQ/MPL")
+    parser.add_argument("dbn_folder", type=str, help="Folder with *.dbn / *.dbn.zst and symbology.json")
+    parser.add_argument("--instrument", type=str, required=True, choices=sorted(INSTRUMENTS))
+    parser.add_argument("--workers", type=int, default=None, help="Decode processes (default: all cores)")
+    parser.add_argument("--db", type=str, default=DB_PATH, help="DuckDB path")
+    args = parser.parse_args()
+
+    dbn_folder = Path(args.dbn_folder)
+    if not dbn_folder.is_dir():
+        log(f"ERROR: Folder not found: {dbn_folder}")
+        sys.exit(1)
+
+    ingest_folder(dbn_folder, INSTRUMENTS[args.instrument], db_path=args.db, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,14 @@ Usage:
         asia_tp_cap_ticks=150,  # Asia ORB target cap
     )
 
+    # Many dates, same parameters: one features query, ts_utc-range bars queries
+    results = simulate_orb_trades(con, dates, "1000", rr=2.0, sl_mode="full")
+
+    # Parameter grid: one summary row per orb x rr x confirm x sl_mode x buffer cell
+    grid = sweep_orb_grid(con, date(2024, 1, 2), date(2025, 12, 31),
+                          rr_values=[1.0, 1.5, 2.0, 3.0], confirm_bars_values=[1, 2, 3],
+                          sl_modes=["full", "half"], buffer_ticks_values=[0, 1, 2])
+
 Result format:
 {
     'outcome': 'WIN' | 'LOSS' | 'NO_TRADE',
@@ -47,14 +55,24 @@ Result format:
 """
 
 import duckdb
-from datetime import date, timedelta
-from typing import Dict, Optional, Any
+import numpy as np
+import pandas as pd
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, asdict
+from zoneinfo import ZoneInfo
 import json
 
 SYMBOL = "MGC"
 TICK_SIZE = 0.1
 
+TZ_LOCAL = ZoneInfo("Australia/Brisbane")
+TZ_UTC = ZoneInfo("UTC")
+
+# Scan windows closer than this share one bars query (simulate_orb_trades)
+BATCH_MERGE_GAP = timedelta(days=7)
+
 # ORB open times (local Brisbane time)
 ORB_TIMES = {
     "0900": (9, 0),
@@ -119,6 +137,34 @@ def _orb_scan_end_local(orb: str, d: date) -> str:
     return f"{d + timedelta(days=1)} 09:00:00"  # Default: next Asia open
 
 
+def _scan_window_local(orb: str, d: date) -> Tuple[datetime, datetime]:
+    """(start, end] local scan window: from the 5-min ORB close to the next Asia open."""
+    h, m = ORB_TIMES[orb]
+    # Handle date rollover for 00:30 ORB (belongs to D+1 local)
+    start_date = d + timedelta(days=1) if orb == "0030" else d
+    start = datetime(start_date.year, start_date.month, start_date.day, h, m, tzinfo=TZ_LOCAL) + timedelta(minutes=5)
+    end = datetime.fromisoformat(_orb_scan_end_local(orb, d)).replace(tzinfo=TZ_LOCAL)
+    return start, end
+
+
+def _skipped(outcome: str, execution_mode: str, execution_params: dict) -> TradeResult:
+    return TradeResult(
+        outcome=outcome,
+        direction=None,
+        entry_ts=None,
+        entry_price=None,
+        stop_price=None,
+        target_price=None,
+        stop_ticks=None,
+        r_multiple=0.0,
+        entry_delay_bars=0,
+        mae_r=None,
+        mfe_r=None,
+        execution_mode=execution_mode,
+        execution_params=execution_params
+    )
+
+
 def simulate_orb_trade(
     con: duckdb.DuckDBPyConnection,
     date_local: date,
@@ -143,22 +189,48 @@ def simulate_orb_trade(
     SAME-BAR TP+SL: Conservative (both hit in same bar => LOSS).
 
     Returns TradeResult with outcome, prices, and execution metadata.
+    For many dates use simulate_orb_trades() (same results, batched reads).
     """
-    # Log execution parameters
-    execution_params = {
-        'date_local': str(date_local),
-        'orb': orb,
-        'mode': mode,
-        'confirm_bars': confirm_bars,
-        'rr': rr,
-        'sl_mode': sl_mode,
-        'buffer_ticks': buffer_ticks,
-        'entry_delay_bars': entry_delay_bars,
-        'max_stop_ticks': max_stop_ticks,
-        'asia_tp_cap_ticks': asia_tp_cap_ticks,
-    }
-    execution_mode = f"{mode}_confirm{confirm_bars}_rr{rr}_{sl_mode}"
+    return simulate_orb_trades(
+        con, [date_local], orb,
+        mode=mode,
+        confirm_bars=confirm_bars,
+        rr=rr,
+        sl_mode=sl_mode,
+        buffer_ticks=buffer_ticks,
+        entry_delay_bars=entry_delay_bars,
+        max_stop_ticks=max_stop_ticks,
+        asia_tp_cap_ticks=asia_tp_cap_ticks,
+        apply_size_filter=apply_size_filter,
+        size_filter_threshold=size_filter_threshold,
+    )[0]
+
+
+def simulate_orb_trades(
+    con: duckdb.DuckDBPyConnection,
+    dates: Sequence[date],
+    orb: str,
+    mode: str = "1m",
+    confirm_bars: int = 1,
+    rr: float = 1.0,
+    sl_mode: str = "full",
+    buffer_ticks: float = 0,
+    entry_delay_bars: int = 0,
+    max_stop_ticks: float = 999999,
+    asia_tp_cap_ticks: float = 999999,
+    apply_size_filter: bool = False,
+    size_filter_threshold: float = None,
+) -> List[TradeResult]:
+    """
+    Simulate one ORB over many dates (parameters as simulate_orb_trade).
+
+    ORB levels and ATR for the whole date set come from one daily_features_v2
+    query. Local scan windows are converted to UTC here so the bars queries
+    filter raw ts_utc (row groups are pruned by their min/max), and windows
+    less than BATCH_MERGE_GAP apart share one query.
 
+    Returns one TradeResult per entry of `dates`, in the same order.
+    """
     # Validate inputs
     assert orb in ORB_TIMES, f"Invalid ORB: {orb}"
     assert mode in ("1m", "5m"), f"Invalid mode: {mode}"
@@ -166,121 +238,125 @@ def simulate_orb_trade(
     assert confirm_bars >= 1, f"confirm_bars must be >= 1"
     assert rr > 0, f"RR must be > 0"
 
-    h, m = ORB_TIMES[orb]
+    if not dates:
+        return []
 
-    # Get ORB levels from daily_features_v2
-    row = con.execute(f"""
-        SELECT orb_{orb}_high, orb_{orb}_low
-        FROM daily_features_v2
-        WHERE date_local = ?
-    """, [date_local]).fetchone()
+    execution_mode = f"{mode}_confirm{confirm_bars}_rr{rr}_{sl_mode}"
 
-    if not row or row[0] is None or row[1] is None:
-        return TradeResult(
-            outcome='SKIPPED_NO_ORB',
-            direction=None,
-            entry_ts=None,
-            entry_price=None,
-            stop_price=None,
-            target_price=None,
-            stop_ticks=None,
-            r_multiple=0.0,
-            entry_delay_bars=0,
-            mae_r=None,
-            mfe_r=None,
-            execution_mode=execution_mode,
-            execution_params=execution_params
-        )
+    def params_for(d: date) -> dict:
+        # Log execution parameters
+        return {
+            'date_local': str(d),
+            'orb': orb,
+            'mode': mode,
+            'confirm_bars': confirm_bars,
+            'rr': rr,
+            'sl_mode': sl_mode,
+            'buffer_ticks': buffer_ticks,
+            'entry_delay_bars': entry_delay_bars,
+            'max_stop_ticks': max_stop_ticks,
+            'asia_tp_cap_ticks': asia_tp_cap_ticks,
+        }
+
+    # Get ORB levels (and ATR for the size filter) from daily_features_v2
+    levels = {
+        row[0]: row[1:]
+        for row in con.execute(f"""
+            SELECT date_local, orb_{orb}_high, orb_{orb}_low, atr_20
+            FROM daily_features_v2
+            WHERE instrument = ? AND date_local BETWEEN ? AND ?
+        """, [SYMBOL, min(dates), max(dates)]).fetchall()
+    }
 
-    orb_high, orb_low = row
-    orb_range = orb_high - orb_low
-    if orb_range <= 0:
-        return TradeResult(
-            outcome='SKIPPED_NO_ORB',
-            direction=None,
-            entry_ts=None,
-            entry_price=None,
-            stop_price=None,
-            target_price=None,
-            stop_ticks=None,
-            r_multiple=0.0,
-            entry_delay_bars=0,
-            mae_r=None,
-            mfe_r=None,
-            execution_mode=execution_mode,
-            execution_params=execution_params
-        )
+    results: Dict[date, TradeResult] = {}
+    pending: List[date] = []
+    for d in sorted(set(dates)):
+        row = levels.get(d)
+        if not row or row[0] is None or row[1] is None:
+            results[d] = _skipped('SKIPPED_NO_ORB', execution_mode, params_for(d))
+            continue
 
-    # Apply ORB size filter (NO LOOKAHEAD - ORB computed at orb close, before entry)
-    if apply_size_filter and size_filter_threshold is not None:
-        # Get ATR for normalization
-        atr_row = con.execute(f"""
-            SELECT atr_20
-            FROM daily_features_v2
-            WHERE date_local = ?
-        """, [date_local]).fetchone()
-
-        if atr_row and atr_row[0] is not None and atr_row[0] > 0:
-            atr = atr_row[0]
-            orb_size_norm = orb_range / atr
-
-            # Reject if ORB too large (exhaustion pattern)
-            if orb_size_norm > size_filter_threshold:
-                return TradeResult(
-                    outcome='SKIPPED_LARGE_ORB',
-                    direction=None,
-                    entry_ts=None,
-                    entry_price=None,
-                    stop_price=None,
-                    target_price=None,
-                    stop_ticks=None,
-                    r_multiple=0.0,
-                    entry_delay_bars=0,
-                    mae_r=None,
-                    mfe_r=None,
-                    execution_mode=execution_mode,
-                    execution_params=execution_params
-                )
-
-    # Start scanning AFTER the 5-min ORB completes
-    start_min = m + 5
-    # Handle date rollover for 00:30 ORB (belongs to D+1 local)
-    start_date = date_local + timedelta(days=1) if orb == "0030" else date_local
-    start_ts_local = f"{start_date} {h:02d}:{start_min:02d}:00"
+        orb_high, orb_low, atr = row
+        orb_range = orb_high - orb_low
+        if orb_range <= 0:
+            results[d] = _skipped('SKIPPED_NO_ORB', execution_mode, params_for(d))
+            continue
+
+        # Apply ORB size filter (NO LOOKAHEAD - ORB computed at orb close, before entry)
+        if apply_size_filter and size_filter_threshold is not None:
+            if atr is not None and atr > 0:
+                orb_size_norm = orb_range / atr
+
+                # Reject if ORB too large (exhaustion pattern)
+                if orb_size_norm > size_filter_threshold:
+                    results[d] = _skipped('SKIPPED_LARGE_ORB', execution_mode, params_for(d))
+                    continue
 
-    # End time for scan (limits runtime)
-    end_ts_local = _orb_scan_end_local(orb, date_local)
+        pending.append(d)
 
     # Choose bar timeframe
     bars_table = "bars_1m" if mode == "1m" else "bars_5m"
 
-    bars = con.execute(f"""
-        SELECT
-          (ts_utc AT TIME ZONE 'Australia/Brisbane') AS ts_local,
-          high, low, close
-        FROM {bars_table}
-        WHERE symbol = ?
-          AND (ts_utc AT TIME ZONE 'Australia/Brisbane') > CAST(? AS TIMESTAMP)
-          AND (ts_utc AT TIME ZONE 'Australia/Brisbane') <= CAST(? AS TIMESTAMP)
-        ORDER BY ts_local
-    """, [SYMBOL, start_ts_local, end_ts_local]).fetchall()
-
+    # Group scan windows into spans, one bars query each
+    spans: List[List[date]] = []
+    for d in pending:
+        if spans and _scan_window_local(orb, d)[0] - _scan_window_local(orb, spans[-1][-1])[1] <= BATCH_MERGE_GAP:
+            spans[-1].append(d)
+        else:
+            spans.append([d])
+
+    for span in spans:
+        span_start = _scan_window_local(orb, span[0])[0]
+        span_end = _scan_window_local(orb, span[-1])[1]
+        bars = con.execute(f"""
+            SELECT
+              (ts_utc AT TIME ZONE 'Australia/Brisbane') AS ts_local,
+              high, low, close
+            FROM {bars_table}
+            WHERE symbol = ?
+              AND ts_utc > ?
+              AND ts_utc <= ?
+            ORDER BY ts_utc
+        """, [SYMBOL, span_start.astimezone(TZ_UTC), span_end.astimezone(TZ_UTC)]).fetchall()
+        ts_keys = [bar[0] for bar in bars]
+
+        for d in span:
+            start_local, end_local = _scan_window_local(orb, d)
+            lo = bisect_right(ts_keys, start_local.replace(tzinfo=None))
+            hi = bisect_right(ts_keys, end_local.replace(tzinfo=None))
+            orb_high, orb_low, _ = levels[d]
+            results[d] = _simulate_bars(
+                orb, orb_high, orb_low, bars[lo:hi],
+                confirm_bars=confirm_bars,
+                rr=rr,
+                sl_mode=sl_mode,
+                buffer_ticks=buffer_ticks,
+                max_stop_ticks=max_stop_ticks,
+                asia_tp_cap_ticks=asia_tp_cap_ticks,
+                execution_mode=execution_mode,
+                execution_params=params_for(d),
+            )
+
+    return [results[d] for d in dates]
+
+
+def _simulate_bars(
+    orb: str,
+    orb_high: float,
+    orb_low: float,
+    bars: List[Tuple],
+    confirm_bars: int,
+    rr: float,
+    sl_mode: str,
+    buffer_ticks: float,
+    max_stop_ticks: float,
+    asia_tp_cap_ticks: float,
+    execution_mode: str,
+    execution_params: dict,
+) -> TradeResult:
+    """Entry, stop/target and outcome over the scan-window bars (ts_local, high, low, close)."""
     if not bars:
-        return TradeResult(
-            outcome='SKIPPED_NO_BARS',
-            direction=None,
-            entry_ts=None,
-            entry_price=None,
-            stop_price=None,
-            target_price=None,
-            stop_ticks=None,
-            r_multiple=0.0,
-            entry_delay_bars=0,
-            mae_r=None,
-            mfe_r=None,
-            execution_mode=execution_mode,
-            execution_params=execution_params
-        )
+        return _skipped('SKIPPED_NO_BARS', execution_mode, execution_params)
 
     # Entry logic: N consecutive closes outside ORB
     consec = 0
@@ -456,6 +532,222 @@ def simulate_orb_trade(
     )
 
 
+# ---------- grid sweep (vectorized over the parameter grid) ----------
+SWEEP_COLUMNS = [
+    "orb", "rr", "confirm_bars", "sl_mode", "buffer_ticks",
+    "days", "trades", "wins", "losses", "open", "skipped",
+    "win_rate", "expectancy", "total_r", "max_dd_r",
+]
+
+
+def _epoch_ms(dt: datetime) -> int:
+    return int(dt.timestamp()) * 1000
+
+
+def _entry_index(close: np.ndarray, orb_high: float, orb_low: float, confirm_bars: int) -> Tuple[int, Optional[str]]:
+    """Bar completing the first `confirm_bars` consecutive closes outside the ORB: (idx, 'UP'/'DOWN') or (-1, None)."""
+    window = np.ones(confirm_bars, dtype=np.int64)
+    best = (-1, None)
+    for direction, outside in (("UP", close > orb_high), ("DOWN", close < orb_low)):
+        if len(outside) < confirm_bars:
+            continue
+        runs = np.convolve(outside.astype(np.int64), window, mode="valid") == confirm_bars
+        if runs.any():
+            idx = int(np.argmax(runs)) + confirm_bars - 1
+            if best[0] < 0 or idx < best[0]:
+                best = (idx, direction)
+    return best
+
+
+def _first_index(path: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """First bar whose running path value is >= each level (len(path) if never)."""
+    return np.searchsorted(path, levels, side="left")
+
+
+def _max_drawdown_r(r: np.ndarray) -> np.ndarray:
+    """Peak-to-trough drop of the cumulative R curve, per row (days along axis 1)."""
+    equity = np.cumsum(r, axis=1)
+    peak = np.maximum.accumulate(np.concatenate([np.zeros((len(r), 1)), equity], axis=1), axis=1)[:, 1:]
+    return (peak - equity).max(axis=1, initial=0.0)
+
+
+def sweep_orb_grid(
+    con: duckdb.DuckDBPyConnection,
+    start_date: date,
+    end_date: date,
+    orbs: Sequence[str] = tuple(ORB_TIMES),
+    rr_values: Sequence[float] = (1.0,),
+    confirm_bars_values: Sequence[int] = (1,),
+    sl_modes: Sequence[str] = ("full",),
+    buffer_ticks_values: Sequence[float] = (0,),
+    mode: str = "1m",
+    max_stop_ticks: float = 999999,
+    asia_tp_cap_ticks: float = 999999,
+    apply_size_filter: bool = False,
+    size_filter_threshold: float = None,
+) -> pd.DataFrame:
+    """
+    Evaluate every orb x rr x confirm_bars x sl_mode x buffer_ticks cell over
+    [start_date, end_date] with the same rules as simulate_orb_trade.
+
+    Bars and ORB levels are read once. Each (day, ORB, confirm_bars) path is
+    scanned once: running max(high) / min(low) after entry are monotone, so the
+    first stop and target bar for every sl_mode x buffer x RR combination is one
+    np.searchsorted. Same-bar TP+SL is still a LOSS.
+
+    Returns a tidy frame, one row per cell (SWEEP_COLUMNS):
+        trades = WIN + LOSS, open = NO_TRADE (entered, neither hit),
+        skipped = no ORB / bars / entry, big stop or large ORB,
+        win_rate = wins / trades, expectancy = total_r / trades,
+        max_dd_r = largest drop of the day-by-day cumulative R.
+    """
+    for orb in orbs:
+        assert orb in ORB_TIMES, f"Invalid ORB: {orb}"
+    assert mode in ("1m", "5m"), f"Invalid mode: {mode}"
+    for sl_mode in sl_modes:
+        assert sl_mode in ("full", "half"), f"Invalid sl_mode: {sl_mode}"
+    assert min(confirm_bars_values) >= 1, f"confirm_bars must be >= 1"
+    assert min(rr_values) > 0, f"RR must be > 0"
+
+    dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    rr = np.asarray(rr_values, dtype=np.float64)
+    # (sl_mode, buffer) combinations evaluated together per path
+    exits = [(sl_mode, float(buffer_ticks)) for sl_mode in sl_modes for buffer_ticks in buffer_ticks_values]
+    n_exit, n_rr = len(exits), len(rr)
+
+    # ORB levels + ATR for every ORB, one daily_features_v2 query
+    level_cols = ", ".join(f"orb_{orb}_high, orb_{orb}_low" for orb in orbs)
+    levels = {
+        row[0]: row[1:]
+        for row in con.execute(f"""
+            SELECT date_local, atr_20, {level_cols}
+            FROM daily_features_v2
+            WHERE instrument = ? AND date_local BETWEEN ? AND ?
+        """, [SYMBOL, start_date, end_date]).fetchall()
+    }
+
+    # Every scan window sits inside [start_date ORB open, end_date + 1 09:00]
+    bars_table = "bars_1m" if mode == "1m" else "bars_5m"
+    span_start = min(_scan_window_local(orb, start_date)[0] for orb in orbs)
+    span_end = max(_scan_window_local(orb, end_date)[1] for orb in orbs)
+    bars = con.execute(f"""
+        SELECT epoch_ms(ts_utc) AS ts_ms, high, low, close
+        FROM {bars_table}
+        WHERE symbol = ?
+          AND ts_utc > ?
+          AND ts_utc <= ?
+        ORDER BY ts_utc
+    """, [SYMBOL, span_start.astimezone(TZ_UTC), span_end.astimezone(TZ_UTC)]).fetchnumpy()
+    ts_ms = np.asarray(bars["ts_ms"], dtype=np.int64)
+    highs = np.asarray(bars["high"], dtype=np.float64)
+    lows = np.asarray(bars["low"], dtype=np.float64)
+    closes = np.asarray(bars["close"], dtype=np.float64)
+
+    rows = []
+    for o, orb in enumerate(orbs):
+        tp_cap = asia_tp_cap_ticks * TICK_SIZE if _is_asia(orb) and asia_tp_cap_ticks < 999999 else None
+
+        for confirm_bars in confirm_bars_values:
+            # r[day, exit, rr]; status 0 = skipped, 1 = entered
+            r = np.zeros((len(dates), n_exit, n_rr))
+            status = np.zeros((len(dates), n_exit, n_rr), dtype=np.int8)
+            wins = np.zeros((len(dates), n_exit, n_rr), dtype=bool)
+            losses = np.zeros((len(dates), n_exit, n_rr), dtype=bool)
+
+            for i, d in enumerate(dates):
+                row = levels.get(d)
+                if not row or row[1 + 2 * o] is None or row[2 + 2 * o] is None:
+                    continue
+                atr, orb_high, orb_low = row[0], row[1 + 2 * o], row[2 + 2 * o]
+                orb_range = orb_high - orb_low
+                if orb_range <= 0:
+                    continue
+                if apply_size_filter and size_filter_threshold is not None:
+                    if atr is not None and atr > 0 and orb_range / atr > size_filter_threshold:
+                        continue
+
+                start_local, end_local = _scan_window_local(orb, d)
+                lo = np.searchsorted(ts_ms, _epoch_ms(start_local), side="right")
+                hi = np.searchsorted(ts_ms, _epoch_ms(end_local), side="right")
+                entry_idx, direction = _entry_index(closes[lo:hi], orb_high, orb_low, confirm_bars)
+                if direction is None:
+                    continue
+                entry_idx += lo
+                up = direction == "UP"
+
+                # Running extremes after the entry bar (monotone => searchsorted)
+                run_high = np.maximum.accumulate(highs[entry_idx + 1:hi])
+                run_low_neg = -np.minimum.accumulate(lows[entry_idx + 1:hi])
+
+                for e, (sl_mode, buffer_ticks) in enumerate(exits):
+                    entry_price = float(closes[entry_idx])
+                    if buffer_ticks > 0:
+                        entry_price += buffer_ticks * TICK_SIZE if up else -buffer_ticks * TICK_SIZE
+                    if sl_mode == "half":
+                        orb_mid = (orb_high + orb_low) / 2.0
+                        stop_price = max(orb_low, orb_mid) if up else min(orb_high, orb_mid)
+                    else:
+                        stop_price = orb_low if up else orb_high
+                    if abs(entry_price - stop_price) / TICK_SIZE > max_stop_ticks:
+                        continue
+
+                    risk = abs(entry_price - stop_price)
+                    if up:
+                        target = entry_price + rr * risk
+                        if tp_cap is not None:
+                            target = np.minimum(target, entry_price + tp_cap)
+                        stop_at = _first_index(run_low_neg, np.array([-stop_price]))[0]
+                        target_at = _first_index(run_high, target)
+                    else:
+                        target = entry_price - rr * risk
+                        if tp_cap is not None:
+                            target = np.maximum(target, entry_price - tp_cap)
+                        stop_at = _first_index(run_high, np.array([stop_price]))[0]
+                        target_at = _first_index(run_low_neg, -target)
+
+                    # Conservative: stop on or before the target bar => LOSS
+                    lost = stop_at < len(run_high)
+                    won = target_at < stop_at
+                    lost = ~won & lost
+                    status[i, e] = 1
+                    wins[i, e], losses[i, e] = won, lost
+                    r[i, e] = np.where(won, rr, np.where(lost, -1.0, 0.0))
+
+            # (cells, days) for the summary
+            def flat(a: np.ndarray) -> np.ndarray:
+                return a.transpose(1, 2, 0).reshape(n_exit * n_rr, len(dates))
+
+            r_cells, status_cells = flat(r), flat(status)
+            win_n, loss_n = flat(wins).sum(axis=1), flat(losses).sum(axis=1)
+            trades = win_n + loss_n
+            total_r = r_cells.sum(axis=1)
+            max_dd = _max_drawdown_r(r_cells)
+
+            for c, ((sl_mode, buffer_ticks), rr_value) in enumerate(
+                (exit_, rr_value) for exit_ in exits for rr_value in rr_values
+            ):
+                entered = int(status_cells[c].sum())
+                rows.append({
+                    "orb": orb,
+                    "rr": float(rr_value),
+                    "confirm_bars": confirm_bars,
+                    "sl_mode": sl_mode,
+                    "buffer_ticks": buffer_ticks,
+                    "days": len(dates),
+                    "trades": int(trades[c]),
+                    "wins": int(win_n[c]),
+                    "losses": int(loss_n[c]),
+                    "open": entered - int(trades[c]),
+                    "skipped": len(dates) - entered,
+                    "win_rate": win_n[c] / trades[c] if trades[c] else 0.0,
+                    "expectancy": total_r[c] / trades[c] if trades[c] else 0.0,
+                    "total_r": float(total_r[c]),
+                    "max_dd_r": float(max_dd[c]),
+                })
+
+    return pd.DataFrame(rows, columns=SWEEP_COLUMNS)
+
+
 # Logging helper
 def log_execution(result: TradeResult, verbose: bool = False):
     """Log execution result with mode and parameters"""
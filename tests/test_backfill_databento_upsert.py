@@ -0,0 +1,58 @@
+"""
+upsert_bars_1m: a Databento frame (tz-aware ts_event index) is written with one
+INSERT OR REPLACE, replacing bars that already exist for the same (symbol, ts_utc).
+"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+pytest.importorskip("databento")
+
+import backfill_databento_continuous
+import backfill_databento_continuous_mpl
+
+T0 = datetime(2025, 3, 3, 14, 0, tzinfo=timezone.utc)
+
+
+def _db(table):
+    con = duckdb.connect()
+    con.execute(f"""
+        CREATE TABLE {table} (
+          ts_utc TIMESTAMPTZ NOT NULL, symbol TEXT NOT NULL, source_symbol TEXT,
+          open DOUBLE NOT NULL, high DOUBLE NOT NULL, low DOUBLE NOT NULL, close DOUBLE NOT NULL,
+          volume BIGINT NOT NULL, PRIMARY KEY (symbol, ts_utc)
+        )
+    """)
+    con.execute(f"INSERT INTO {table} VALUES (?, 'MGC', 'MGCG5', 1, 1, 1, 1, 1)", [T0])
+    return con
+
+
+@pytest.mark.parametrize("module, table", [
+    (backfill_databento_continuous, "bars_1m"),
+    (backfill_databento_continuous_mpl, "bars_1m_mpl"),
+])
+def test_upsert_replaces_existing_key(module, table):
+    con = _db(table)
+    cfg = module.Cfg(symbol="MGC")
+    front = pd.DataFrame(
+        {"open": [2600.0, 2601.0], "high": [2602.0, 2603.5], "low": [2599.5, 2600.5],
+         "close": [2601.0, 2603.0], "volume": [120, 80]},
+        index=pd.DatetimeIndex([T0, T0 + pd.Timedelta(minutes=1)], name="ts_event"),
+    )
+
+    assert module.upsert_bars_1m(con, cfg, "MGCJ5", front) == 2
+    rows = con.execute(f"SELECT * FROM {table} ORDER BY ts_utc").fetchall()
+    assert [(r[0], r[1], r[2], r[6], r[7]) for r in rows] == [
+        (T0, "MGC", "MGCJ5", 2601.0, 120),
+        (T0 + pd.Timedelta(minutes=1), "MGC", "MGCJ5", 2603.0, 80),
+    ]
+
+    assert module.upsert_bars_1m(con, cfg, "MGCJ5", front.iloc[:0]) == 0
+    assert con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 2
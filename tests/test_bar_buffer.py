@@ -0,0 +1,91 @@
+"""
+BarRingBuffer must match a plain DataFrame window under appends, forming-bar
+replacement, wrap-around and trims.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bar_buffer import BarRingBuffer, to_ns
+from data_loader import LiveDataLoader
+
+T0 = pd.Timestamp("2026-01-05 23:00", tz="UTC")
+
+
+def _bar(minute, rng):
+    close = 2700 + rng.normal()
+    return {"ts_utc": T0 + pd.Timedelta(minutes=int(minute)), "open": close, "high": close + rng.random(),
+            "low": close - rng.random(), "close": close, "volume": int(rng.integers(1, 50))}
+
+
+def _reference_window(ref, capacity):
+    df = pd.DataFrame(ref.values()).sort_values("ts_utc").tail(capacity)
+    return df.reset_index(drop=True)
+
+
+def test_ring_buffer_matches_frame():
+    rng = np.random.default_rng(7)
+    capacity = 50
+    buffer = BarRingBuffer(capacity)
+    ref = {}
+
+    # Bulk load larger than capacity, then delta polls that replace the forming bar
+    bulk = pd.DataFrame([_bar(m, rng) for m in range(80)])
+    buffer.load(bulk)
+    ref.update({b["ts_utc"]: b for b in bulk.to_dict("records")})
+
+    sessions = []  # (stats, start_minute, end_minute or None), maintained across appends
+    minute = 79
+    for step in range(200):
+        if step % 10 == 0:
+            sessions = [(buffer.session(to_ns(T0 + pd.Timedelta(minutes=minute - 15)), to_ns(T0 + pd.Timedelta(minutes=minute + 10))),
+                         minute - 15, minute + 10),
+                        (buffer.session(to_ns(T0 + pd.Timedelta(minutes=minute - 5))), minute - 5, None)]
+        delta = [_bar(minute, rng)] + [_bar(minute + k, rng) for k in range(1, int(rng.integers(0, 3)) + 1)]
+        minute = minute + len(delta) - 1
+        frame = pd.DataFrame(delta)
+        buffer.merge(frame)
+        ref.update({b["ts_utc"]: b for b in delta})
+
+        expected = _reference_window(ref, capacity)
+        ref = {b["ts_utc"]: b for b in expected.to_dict("records")}
+        got = buffer.to_frame()
+        assert np.array_equal(got["ts_utc"].to_numpy(), expected["ts_utc"].to_numpy())
+        assert np.array_equal(got[["open", "high", "low", "close"]].to_numpy(), expected[["open", "high", "low", "close"]].to_numpy())
+        assert buffer.latest()["close"] == expected["close"].iloc[-1]
+
+        # Range slice and accumulators vs filtering the frame
+        start, end = T0 + pd.Timedelta(minutes=minute - 20), T0 + pd.Timedelta(minutes=minute - 5)
+        window = expected[(expected["ts_utc"] >= start) & (expected["ts_utc"] < end)]
+        assert buffer.to_frame(to_ns(start), to_ns(end))["close"].tolist() == window["close"].tolist()
+
+        for stats, lo, hi in sessions:
+            in_window = expected[(expected["ts_utc"] >= T0 + pd.Timedelta(minutes=lo))
+                                 & ((expected["ts_utc"] < T0 + pd.Timedelta(minutes=hi)) if hi else True)]
+            assert stats.high == in_window["high"].max() and stats.low == in_window["low"].min()
+            typical = (in_window["high"] + in_window["low"] + in_window["close"]) / 3
+            assert np.isclose(stats.vwap, (typical * in_window["volume"]).sum() / in_window["volume"].sum())
+
+    # Trim by time
+    cutoff = T0 + pd.Timedelta(minutes=minute - 10)
+    buffer.trim(to_ns(cutoff))
+    assert len(buffer) == 11 and buffer.to_frame()["ts_utc"].min() == cutoff
+
+
+def test_loader_session_queries_stay_in_memory():
+    rng = np.random.default_rng(1)
+    loader = LiveDataLoader.__new__(LiveDataLoader)
+    loader.symbol = "MGC"
+    loader.con = None  # Any database access would raise
+    loader.feed = None
+    loader.bars_df = pd.DataFrame([_bar(m, rng) for m in range(30)])
+
+    start, end = (T0 + pd.Timedelta(minutes=10)).tz_convert("Australia/Brisbane"), (T0 + pd.Timedelta(minutes=15)).tz_convert("Australia/Brisbane")
+    expected = loader.bars_df.iloc[10:15]
+    hl = loader.get_session_high_low(start, end)
+    assert hl == {"high": expected["high"].max(), "low": expected["low"].min(), "range": expected["high"].max() - expected["low"].min()}
+    assert loader.get_bars_in_range(start, end)["close"].tolist() == expected["close"].tolist()
+    assert loader.get_latest_bar()["close"] == loader.bars_df["close"].iloc[-1]
+    assert np.isclose(loader.calculate_vwap(start),
+                      ((loader.bars_df.iloc[10:][["high", "low", "close"]].sum(axis=1) / 3) * loader.bars_df.iloc[10:]["volume"]).sum()
+                      / loader.bars_df.iloc[10:]["volume"].sum())
@@ -0,0 +1,64 @@
+"""
+BarStore slices must match the bars_1m queries they replace.
+"""
+
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import duckdb
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "research"))
+
+from bar_store import BarStore
+
+from tests.test_build_daily_features_v2_bulk import _seed_bars
+
+TZ_LOCAL = ZoneInfo("Australia/Brisbane")
+
+
+def _query(db_path, start, end, op=">="):
+    con = duckdb.connect(db_path, read_only=True)
+    try:
+        return con.execute(f"""
+            SELECT epoch_ms(ts_utc), open, high, low, close, volume
+            FROM bars_1m WHERE symbol = 'MGC' AND ts_utc {op} ? AND ts_utc < ?
+            ORDER BY ts_utc
+        """, [start, end]).fetchnumpy()
+    finally:
+        con.close()
+
+
+def _assert_same(slice_, cols):
+    assert np.array_equal(slice_.ts_ms, cols["epoch_ms(ts_utc)"])
+    for name in ("open", "high", "low", "close", "volume"):
+        assert np.array_equal(getattr(slice_, name), cols[name])
+
+
+def test_day_slice_and_window_match_sql(tmp_path):
+    db_path = str(tmp_path / "bars.db")
+    _seed_bars(db_path)
+    store = BarStore.load("MGC", db_path)
+
+    for d in (date(2025, 1, 6), date(2025, 1, 10), date(2025, 1, 11), date(2025, 2, 3)):
+        start = datetime(d.year, d.month, d.day, 9, 0, tzinfo=TZ_LOCAL)
+        day = store.day_slice(d)
+        _assert_same(day, _query(db_path, start, start + timedelta(days=1)))
+        _assert_same(store.window(start, start + timedelta(days=1)), _query(db_path, start, start + timedelta(days=1)))
+
+    # Naive = local, exclusive start, UTC-aware bounds
+    start = datetime(2025, 1, 7, 23, 0)
+    end = datetime(2025, 1, 8, 1, 30)
+    _assert_same(store.window(start, end, include_start=False),
+                 _query(db_path, start.replace(tzinfo=TZ_LOCAL), end.replace(tzinfo=TZ_LOCAL), op=">"))
+    utc_start = datetime(2025, 1, 20, tzinfo=timezone.utc)
+    _assert_same(store.window(utc_start, utc_start + timedelta(days=2)),
+                 _query(db_path, utc_start, utc_start + timedelta(days=2)))
+
+    # Zero-copy views; Saturday (no bars) is empty
+    assert np.shares_memory(store.day_slice(date(2025, 1, 6)).close, store.close)
+    assert len(store.day_slice(date(2025, 1, 11))) < 1440
+    assert len(store.day_slice(date(2030, 1, 1))) == 0
+    assert store.day_slice(date(2025, 1, 6)).to_frame()["ts_utc"].iloc[0] == datetime(2025, 1, 5, 23, 0, tzinfo=timezone.utc)
@@ -0,0 +1,93 @@
+"""
+Incremental bar aggregation must match a from-scratch GROUP BY.
+
+Covers watermark updates (appended 1m bars, partial last bucket), explicit
+range refresh of replaced history, 15m/1h rollups and non-MGC source tables.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from build_5m import AGG_SECONDS, get_watermark, refresh_bar_aggregates, update_bar_aggregates
+
+T0 = datetime(2025, 3, 3, 0, 0, tzinfo=timezone.utc)
+
+
+def _bars(start_min: int, n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.round(100.0 + np.cumsum(rng.integers(-3, 4, size=n)) / 10.0, 1)
+    return pd.DataFrame({
+        "ts_utc": pd.date_range(T0 + timedelta(minutes=start_min), periods=n, freq="1min"),
+        "symbol": "NQ", "source_symbol": "NQH5",
+        "open": close - 0.1, "high": close + 0.3, "low": close - 0.4, "close": close,
+        "volume": rng.integers(1, 100, size=n),
+    })
+
+
+def _upsert(con, frame: pd.DataFrame) -> None:
+    con.register("frame", frame)
+    con.execute("INSERT OR REPLACE INTO bars_1m_nq SELECT * FROM frame")
+    con.unregister("frame")
+
+
+def _expected(con, seconds: int):
+    return con.execute(f"""
+        SELECT CAST(to_timestamp(floor(epoch(ts_utc) / {seconds}) * {seconds}) AS TIMESTAMPTZ), symbol,
+               arg_max(source_symbol, ts_utc), arg_min(open, ts_utc), max(high), min(low),
+               arg_max(close, ts_utc), sum(volume)
+        FROM bars_1m_nq GROUP BY 1, 2 ORDER BY 1
+    """).fetchall()
+
+
+def _actual(con, table: str):
+    return con.execute(f"SELECT * FROM {table} ORDER BY ts_utc").fetchall()
+
+
+def _assert_consistent(con):
+    assert _actual(con, "bars_5m_nq") == _expected(con, AGG_SECONDS["5m"])
+    assert _actual(con, "bars_15m_nq") == _expected(con, AGG_SECONDS["15m"])
+    assert _actual(con, "bars_1h_nq") == _expected(con, AGG_SECONDS["1h"])
+
+
+def test_watermark_and_range_refresh(tmp_path):
+    con = duckdb.connect(str(tmp_path / "agg.db"))
+    con.execute("""
+        CREATE TABLE bars_1m_nq (
+          ts_utc TIMESTAMPTZ NOT NULL, symbol TEXT NOT NULL, source_symbol TEXT,
+          open DOUBLE NOT NULL, high DOUBLE NOT NULL, low DOUBLE NOT NULL, close DOUBLE NOT NULL,
+          volume BIGINT NOT NULL, PRIMARY KEY (symbol, ts_utc)
+        )
+    """)
+
+    # First run: full history, ends mid-bucket
+    _upsert(con, _bars(0, 1000, seed=1))
+    update_bar_aggregates(con, "NQ", "bars_1m_nq", rollups=("15m", "1h"))
+    _assert_consistent(con)
+    assert get_watermark(con, "bars_1m_nq", "NQ") == T0 + timedelta(minutes=999)
+
+    # Live append: completes the partial bucket and adds new ones
+    _upsert(con, _bars(1000, 37, seed=2))
+    written = update_bar_aggregates(con, "NQ", "bars_1m_nq", rollups=("15m", "1h"))
+    _assert_consistent(con)
+    assert written == 9  # buckets 995..1035, not the whole archive
+    assert get_watermark(con, "bars_1m_nq", "NQ") == T0 + timedelta(minutes=1036)
+
+    # Nothing new: watermark bucket only
+    assert update_bar_aggregates(con, "NQ", "bars_1m_nq", rollups=("15m", "1h")) == 1
+
+    # Backfill replaces old history behind the watermark: explicit range refresh
+    _upsert(con, _bars(120, 45, seed=3))
+    refresh_bar_aggregates(
+        con, "NQ", T0 + timedelta(minutes=120), T0 + timedelta(minutes=165),
+        source_table="bars_1m_nq", rollups=("15m", "1h"),
+    )
+    _assert_consistent(con)
+    assert get_watermark(con, "bars_1m_nq", "NQ") == T0 + timedelta(minutes=1036)
+    con.close()
@@ -0,0 +1,113 @@
+"""
+Bulk vs per-day parity for FeatureBuilderV2.
+
+build_features_bulk() must write exactly the rows build_features() writes, day by day.
+Runs both paths on identical synthetic bars in two throwaway databases and compares.
+"""
+
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from build_daily_features_v2 import FeatureBuilderV2, V2_COLUMNS
+
+
+START = date(2025, 1, 2)
+END = date(2025, 2, 20)
+
+
+def _seed_bars(db_path: str) -> None:
+    """Random-walk MGC 1m bars on a 0.1 tick grid (weekends removed), plus bars_5m."""
+    rng = np.random.default_rng(7)
+    t0 = datetime(2024, 12, 20, 0, 0, tzinfo=timezone.utc)
+    n = int((END - date(2024, 12, 20)).days + 3) * 1440
+
+    steps = rng.integers(-6, 7, size=n) / 10.0
+    close = np.round(2600.0 + np.cumsum(steps), 1)
+    open_ = np.round(np.concatenate([[2600.0], close[:-1]]), 1)
+    high = np.round(np.maximum(open_, close) + rng.integers(0, 4, size=n) / 10.0, 1)
+    low = np.round(np.minimum(open_, close) - rng.integers(0, 4, size=n) / 10.0, 1)
+    volume = rng.integers(1, 500, size=n)
+
+    bars = pd.DataFrame({
+        "ts_utc": pd.date_range(t0, periods=n, freq="1min"), "symbol": "MGC", "source_symbol": "MGCG5",
+        "open": open_, "high": high, "low": low, "close": close, "volume": volume,
+    })
+    bars = bars[bars["ts_utc"].dt.weekday != 5]  # Saturday gap
+
+    con = duckdb.connect(db_path)
+    con.execute("""
+        CREATE TABLE bars_1m (
+          ts_utc TIMESTAMPTZ NOT NULL, symbol TEXT NOT NULL, source_symbol TEXT,
+          open DOUBLE NOT NULL, high DOUBLE NOT NULL, low DOUBLE NOT NULL, close DOUBLE NOT NULL,
+          volume BIGINT NOT NULL, PRIMARY KEY (symbol, ts_utc)
+        )
+    """)
+    con.execute("CREATE TABLE bars_5m AS SELECT * FROM bars_1m LIMIT 0")
+    con.execute("INSERT INTO bars_1m SELECT * FROM bars")
+    con.execute("""
+        INSERT INTO bars_5m
+        SELECT to_timestamp(floor(epoch(ts_utc) / 300) * 300), symbol, NULL,
+               arg_min(open, ts_utc), max(high), min(low), arg_max(close, ts_utc), sum(volume)
+        FROM bars_1m GROUP BY 1, 2
+    """)
+    con.close()
+
+
+def _dump(db_path: str, table: str):
+    con = duckdb.connect(db_path)
+    try:
+        return con.execute(
+            f"SELECT {', '.join(V2_COLUMNS)} FROM {table} ORDER BY date_local"
+        ).fetchall()
+    finally:
+        con.close()
+
+
+@pytest.mark.parametrize("sl_mode", ["full", "half"])
+def test_bulk_matches_per_day(tmp_path, sl_mode):
+    table = "daily_features_v2_half" if sl_mode == "half" else "daily_features_v2"
+    per_day_db = str(tmp_path / "per_day.db")
+    bulk_db = str(tmp_path / "bulk.db")
+    _seed_bars(per_day_db)
+    _seed_bars(bulk_db)
+
+    for db_path in (per_day_db, bulk_db):
+        # ATR always reads daily_features_v2, so it must exist in half mode too
+        b = FeatureBuilderV2(db_path=db_path, sl_mode="full", table_name="daily_features_v2")
+        b.init_schema_v2()
+        b.close()
+
+    builder = FeatureBuilderV2(db_path=per_day_db, sl_mode=sl_mode, table_name=table)
+    builder.init_schema_v2()
+    cur = START
+    while cur <= END:
+        builder.build_features(cur)
+        cur += timedelta(days=1)
+    builder.close()
+
+    builder = FeatureBuilderV2(db_path=bulk_db, sl_mode=sl_mode, table_name=table)
+    builder.init_schema_v2()
+    written = builder.build_features_bulk(START, END)
+    builder.close()
+
+    expected = _dump(per_day_db, table)
+    actual = _dump(bulk_db, table)
+
+    assert written == (END - START).days + 1
+    assert len(actual) == len(expected)
+    for exp_row, act_row in zip(expected, actual):
+        assert act_row == exp_row, f"mismatch on {exp_row[0]}"
+
+    # Sanity: the fixture actually exercises trades (and ATR, which reads daily_features_v2)
+    outcomes = {row[V2_COLUMNS.index("orb_0900_outcome")] for row in actual}
+    assert {"WIN", "LOSS"} <= outcomes
+    if sl_mode == "full":
+        assert any(row[V2_COLUMNS.index("atr_20")] is not None for row in actual)
@@ -0,0 +1,67 @@
+"""
+cloud_mode connection manager: one root connection per process, cheap
+cursors for callers, health-checked and reopened when it goes away.
+"""
+
+import threading
+
+import pytest
+
+import cloud_mode
+from cloud_mode import ConnectionManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    import duckdb
+
+    path = str(tmp_path / "pool.db")
+    opened = []
+
+    def connect():
+        con = duckdb.connect(path)
+        opened.append(con)
+        return con
+
+    return ConnectionManager(), path, connect, opened
+
+
+def test_cursors_share_one_root(manager):
+    pool, path, connect, opened = manager
+    writer = pool.cursor(path, connect)
+    writer.execute("CREATE TABLE t AS SELECT 42 AS x")
+    writer.close()  # Callers' close() only drops the cursor
+
+    results = []
+
+    def read():
+        con = pool.cursor(path, connect)
+        results.append(con.execute("SELECT x FROM t").fetchone()[0])
+        con.close()
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [42] * 8
+    assert len(opened) == 1
+
+
+def test_reconnects_after_root_is_lost(manager, monkeypatch):
+    pool, path, connect, opened = manager
+    pool.cursor(path, connect).execute("CREATE TABLE t AS SELECT 1 AS x")
+
+    opened[0].close()  # cursor() on a closed root fails -> reopen
+    assert pool.cursor(path, connect).execute("SELECT x FROM t").fetchone() == (1,)
+    assert len(opened) == 2
+
+    opened[1].close()  # Stale root caught by the periodic health check
+    monkeypatch.setattr(cloud_mode, "HEALTH_CHECK_SECONDS", -1.0)
+    assert pool.cursor(path, connect).execute("SELECT x FROM t").fetchone() == (1,)
+    assert len(opened) == 3
+
+    pool.close()
+    pool.cursor(path, connect)
+    assert len(opened) == 4
@@ -0,0 +1,89 @@
+"""
+Day context: ATR, ORB size thresholds and prior-day levels are read once per
+instrument per trading day and shared by every loader.
+"""
+
+from datetime import date, datetime
+
+import duckdb
+import pytest
+
+import config_generator
+import day_context
+from config import TZ_LOCAL
+from data_loader import LiveDataLoader
+from day_context import bump_setups_version, get_day_context, trade_date_for
+
+
+@pytest.fixture
+def gold_db(tmp_path, monkeypatch):
+    path = tmp_path / "gold.db"
+    con = duckdb.connect(str(path))
+    con.execute("""
+        CREATE TABLE daily_features_v2 (
+            date_local DATE, instrument VARCHAR, atr_20 DOUBLE,
+            asia_high DOUBLE, asia_low DOUBLE, london_high DOUBLE, london_low DOUBLE,
+            ny_high DOUBLE, ny_low DOUBLE
+        )
+    """)
+    con.execute("""
+        INSERT INTO daily_features_v2 VALUES
+            ('2026-01-05', 'MGC', 30.0, 2710, 2690, 2720, 2695, 2730, 2700),
+            ('2026-01-06', 'MGC', NULL, NULL, NULL, NULL, NULL, NULL, NULL)
+    """)
+    con.close()
+    monkeypatch.setenv("GOLD_DB_PATH", str(path))
+
+    loads = []
+
+    def load_instrument_configs(instrument, db_path=None):
+        loads.append(instrument)
+        return {}, {"2300": [0.155, 0.2], "1000": [None, None], "1100": None}
+
+    monkeypatch.setattr(config_generator, "load_instrument_configs", load_instrument_configs)
+    day_context.clear_day_contexts()
+    yield loads
+    day_context.clear_day_contexts()
+
+
+def test_trade_date_rolls_at_0900():
+    assert trade_date_for(datetime(2026, 1, 7, 8, 59, tzinfo=TZ_LOCAL)) == date(2026, 1, 6)
+    assert trade_date_for(datetime(2026, 1, 7, 9, 0, tzinfo=TZ_LOCAL)) == date(2026, 1, 7)
+
+
+def test_context_built_once_per_day_and_version(gold_db):
+    now = datetime(2026, 1, 6, 10, 0, tzinfo=TZ_LOCAL)
+    ctx = get_day_context("MGC", now)
+
+    assert ctx.atr == 30.0  # Today's ATR missing -> yesterday's
+    assert ctx.orb_size_thresholds == {"2300": 0.155, "1000": None, "1100": None}
+    assert ctx.prior_day == {"asia_high": 2710, "asia_low": 2690, "london_high": 2720,
+                             "london_low": 2695, "ny_high": 2730, "ny_low": 2700}
+
+    # Same trading day (even after midnight): cached
+    assert get_day_context("MGC", now.replace(hour=23)) is ctx
+    assert get_day_context("MGC", datetime(2026, 1, 7, 1, 0, tzinfo=TZ_LOCAL)) is ctx
+    assert gold_db == ["MGC"]
+
+    bump_setups_version()
+    assert get_day_context("MGC", now) is not ctx
+    assert get_day_context("MGC", datetime(2026, 1, 7, 9, 0, tzinfo=TZ_LOCAL)).prior_day is None
+    assert gold_db == ["MGC", "MGC", "MGC"]
+
+
+def test_loader_filter_reads_cached_context(gold_db, monkeypatch):
+    monkeypatch.setattr(day_context, "datetime", type("Clock", (datetime,), {
+        "now": classmethod(lambda cls, tz=None: datetime(2026, 1, 6, 23, 10, tzinfo=TZ_LOCAL))}))
+    loaders = []
+    for _ in range(2):
+        loader = LiveDataLoader.__new__(LiveDataLoader)
+        loader.symbol = "MGC"
+        loaders.append(loader)
+
+    rejected = loaders[0].check_orb_size_filter(2706.0, 2700.0, "2300")  # 6 / 30 = 0.2 > 0.155
+    passed = loaders[1].check_orb_size_filter(2704.0, 2700.0, "2300")
+    assert (rejected["pass"], rejected["threshold"], rejected["atr"]) == (False, 0.155, 30.0)
+    assert passed["pass"] and loaders[1].get_position_size_multiplier("2300", passed["pass"]) == 1.15
+    assert loaders[0].check_orb_size_filter(2750.0, 2700.0, "1000")["reason"] == "No filter for this ORB"
+    assert loaders[1].get_today_atr() == 30.0
+    assert gold_db == ["MGC"]
@@ -0,0 +1,70 @@
+"""
+front_month_bars: raw OHLCV-1m records collapse to one bar per minute from the
+highest-volume outright (ties: first seen in the file), across a contract roll.
+"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "research" / "scripts"))
+
+pytest.importorskip("databento")
+
+from ingest_databento_dbn_parallel import INSTRUMENTS, NS_PER_MIN, PRICE_SCALE, front_month_bars, init_tables, write_bars_1m
+
+T0 = int(datetime(2025, 3, 3, 14, 0, tzinfo=timezone.utc).timestamp()) * 1_000_000_000
+OLD, NEW, SPREAD = 1, 2, 3
+SYMBOLS = {OLD: "MGCG5", NEW: "MGCJ5"}  # spread id 3 is not an outright
+
+RECORD = np.dtype([
+    ("ts_event", "u8"), ("instrument_id", "u4"),
+    ("open", "i8"), ("high", "i8"), ("low", "i8"), ("close", "i8"), ("volume", "u8"),
+])
+
+
+def _records(rows):
+    """rows: (minute, second, instrument_id, open, high, low, close, volume)"""
+    px = lambda p: int(round(p * PRICE_SCALE))
+    return np.array([
+        (T0 + m * NS_PER_MIN + s * 1_000_000_000, iid, px(o), px(h), px(l), px(c), v)
+        for m, s, iid, o, h, l, c, v in rows
+    ], dtype=RECORD)
+
+
+def test_front_contract_per_minute_across_roll():
+    records = _records([
+        (0, 0, OLD, 2600.0, 2601.0, 2599.0, 2600.5, 100),   # minute 0: old contract leads
+        (0, 0, NEW, 2610.0, 2611.0, 2609.0, 2610.5, 50),
+        (0, 0, SPREAD, 10.0, 11.0, 9.0, 10.0, 999),         # spreads never win
+        (1, 0, OLD, 2600.5, 2602.0, 2600.0, 2601.0, 120),   # minute 1: new contract, two records
+        (1, 0, NEW, 2610.5, 2612.0, 2610.0, 2611.0, 80),
+        (1, 30, NEW, 2611.0, 2613.0, 2609.5, 2612.5, 90),
+        (2, 0, NEW, 2612.5, 2613.0, 2612.0, 2612.0, 10),    # minute 2: tie -> first seen
+        (2, 0, OLD, 2601.0, 2601.5, 2600.5, 2601.0, 10),
+    ])
+
+    bars = front_month_bars(records, SYMBOLS, INSTRUMENTS["MGC"])
+
+    assert bars["source_symbol"].tolist() == ["MGCG5", "MGCJ5", "MGCJ5"]
+    assert bars["ts_utc"].tolist() == [pd.Timestamp(T0 + m * NS_PER_MIN, unit="ns", tz="UTC") for m in range(3)]
+    assert (bars["symbol"] == "MGC").all()
+    # Minute 1 aggregates both NEW records: first open, max high, min low, last close, summed volume
+    assert bars.iloc[1][["open", "high", "low", "close", "volume"]].tolist() == [2610.5, 2613.0, 2609.5, 2612.5, 170]
+
+    con = duckdb.connect()
+    init_tables(con, INSTRUMENTS["MGC"])
+    assert write_bars_1m(con, INSTRUMENTS["MGC"], bars) == 3
+    assert write_bars_1m(con, INSTRUMENTS["MGC"], bars) == 3
+    assert con.execute("SELECT COUNT(*) FROM bars_1m").fetchone()[0] == 3
+
+
+def test_no_outrights_gives_empty_frame():
+    records = _records([(0, 0, SPREAD, 10.0, 11.0, 9.0, 10.0, 5)])
+    assert front_month_bars(records, SYMBOLS, INSTRUMENTS["MGC"]).empty
+    assert front_month_bars(records[:0], SYMBOLS, INSTRUMENTS["MGC"]).empty
@@ -0,0 +1,88 @@
+"""
+BacktestEngine.backtest_batch must equal backtest_candidate run one by one.
+"""
+
+import dataclasses
+import json
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "research" / "ede"))
+
+from build_daily_features_v2 import FeatureBuilderV2
+from backtest_engine import BacktestEngine, ExecutionScenario
+
+from tests.test_build_daily_features_v2_bulk import _seed_bars
+
+
+def _candidates():
+    out = []
+    for start, end in (("23:00:00", "23:05:00"), ("00:00:00", "00:05:00")):
+        for direction in ("long", "short"):
+            for target_r in (1.0, 3.0, None):
+                for filters in (None, json.dumps({"atr_min": 3.0})):
+                    out.append({
+                        "idea_id": f"c{len(out)}", "instrument": "MGC", "entry_type": "break",
+                        "session_window": "orb_test", "entry_time_start": start, "entry_time_end": end,
+                        "stop_type": "fixed_r", "stop_r": 1.0, "target_r": target_r, "filters_json": filters,
+                        "entry_condition_json": json.dumps({"direction": direction}),
+                    })
+    out.append({"idea_id": "fade", "instrument": "MGC", "entry_type": "fade", "session_window": "orb_test",
+                "entry_time_start": "23:00:00", "entry_time_end": "23:05:00", "stop_type": "fixed_r", "target_r": 2.0,
+                "entry_condition_json": "{}"})
+    return out
+
+
+def _dump(result):
+    return None if result is None else json.dumps(dataclasses.asdict(result), default=str, sort_keys=True)
+
+
+@pytest.mark.parametrize("slippage", [0.0, 0.2])
+def test_batch_matches_single(tmp_path, slippage):
+    db_path = str(tmp_path / "ede.db")
+    _seed_bars(db_path)
+    builder = FeatureBuilderV2(db_path=db_path)
+    builder.init_schema_v2()
+    builder.build_features_bulk(date(2025, 1, 2), date(2025, 2, 20))
+    builder.close()
+
+    engine = BacktestEngine(db_path)
+    candidates = _candidates()
+    batch = engine.backtest_batch(candidates, "2025-01-02", "2025-02-20", slippage)
+
+    for candidate in candidates:
+        single = engine.backtest_candidate(candidate, "2025-01-02", "2025-02-20", slippage)
+        assert _dump(batch[candidate["idea_id"]]) == _dump(single), candidate["idea_id"]
+
+    assert batch["fade"] is None
+    assert sum(r is not None for r in batch.values()) >= len(candidates) // 2
+
+
+def test_scenarios_match_single(tmp_path):
+    db_path = str(tmp_path / "ede.db")
+    _seed_bars(db_path)
+    builder = FeatureBuilderV2(db_path=db_path)
+    builder.init_schema_v2()
+    builder.build_features_bulk(date(2025, 1, 2), date(2025, 2, 20))
+    builder.close()
+
+    engine = BacktestEngine(db_path)
+    slippages = [0.0, 0.1, 0.15, 0.2, 0.25, 0.3, 0.4, 0.5]
+    for candidate in _candidates()[::5]:
+        scenarios = engine.backtest_scenarios(candidate, slippages, "2025-01-02", "2025-02-20")
+        for slippage in slippages:
+            single = engine.backtest_candidate(candidate, "2025-01-02", "2025-02-20", slippage)
+            assert _dump(scenarios[slippage]) == _dump(single), (candidate["idea_id"], slippage)
+
+    # Latency: the fill moves to the close N bars after the signal
+    candidate = _candidates()[0]
+    now, late = ExecutionScenario(0.1), ExecutionScenario(0.1, entry_delay_bars=2)
+    by_scenario = engine.backtest_scenarios(candidate, [now, late], "2025-01-02", "2025-02-20")
+    assert by_scenario[late].total_trades > 0
+    for a, b in zip(by_scenario[now].trades, by_scenario[late].trades):
+        assert b.entry_time - a.entry_time == timedelta(minutes=2)
+        assert b.stop_price == a.stop_price
@@ -0,0 +1,153 @@
+"""
+simulate_orb_trades (batched) must return exactly what the per-date engine it
+replaced returned (frozen below as _reference_trade), including across weekend
+gaps where spans are merged or split.
+sweep_orb_grid must summarise exactly those per-date results for every grid cell.
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "strategies"))
+
+from build_daily_features_v2 import FeatureBuilderV2
+import execution_engine
+from execution_engine import (
+    SYMBOL, _orb_scan_end_local, _simulate_bars, _skipped, simulate_orb_trade, simulate_orb_trades, sweep_orb_grid,
+)
+
+from tests.test_build_daily_features_v2_bulk import _seed_bars, START
+
+END = START + timedelta(days=20)
+
+
+@pytest.fixture(scope="module")
+def con(tmp_path_factory):
+    db_path = str(tmp_path_factory.mktemp("exec") / "gold.db")
+    _seed_bars(db_path)
+    con = duckdb.connect(db_path)
+    builder = FeatureBuilderV2(con=con)
+    builder.init_schema_v2()
+    builder.build_features_bulk(START, END)
+    yield con
+    con.close()
+
+
+def _reference_trade(con, d, orb, mode="1m", confirm_bars=1, rr=1.0, sl_mode="full", buffer_ticks=0,
+                     entry_delay_bars=0, max_stop_ticks=999999, asia_tp_cap_ticks=999999,
+                     apply_size_filter=False, size_filter_threshold=None):
+    """
+    The per-date reads of simulate_orb_trade before batching: two daily_features_v2
+    lookups and a local-time bars predicate. Entry/outcome logic is shared.
+    """
+    execution_params = {
+        'date_local': str(d), 'orb': orb, 'mode': mode, 'confirm_bars': confirm_bars, 'rr': rr,
+        'sl_mode': sl_mode, 'buffer_ticks': buffer_ticks, 'entry_delay_bars': entry_delay_bars,
+        'max_stop_ticks': max_stop_ticks, 'asia_tp_cap_ticks': asia_tp_cap_ticks,
+    }
+    execution_mode = f"{mode}_confirm{confirm_bars}_rr{rr}_{sl_mode}"
+
+    row = con.execute(f"SELECT orb_{orb}_high, orb_{orb}_low FROM daily_features_v2 WHERE date_local = ?",
+                      [d]).fetchone()
+    if not row or row[0] is None or row[1] is None or row[0] - row[1] <= 0:
+        return _skipped('SKIPPED_NO_ORB', execution_mode, execution_params)
+    orb_high, orb_low = row
+
+    if apply_size_filter and size_filter_threshold is not None:
+        atr_row = con.execute("SELECT atr_20 FROM daily_features_v2 WHERE date_local = ?", [d]).fetchone()
+        if atr_row and atr_row[0] is not None and atr_row[0] > 0:
+            if (orb_high - orb_low) / atr_row[0] > size_filter_threshold:
+                return _skipped('SKIPPED_LARGE_ORB', execution_mode, execution_params)
+
+    h, m = execution_engine.ORB_TIMES[orb]
+    start_date = d + timedelta(days=1) if orb == "0030" else d
+    bars = con.execute(f"""
+        SELECT (ts_utc AT TIME ZONE 'Australia/Brisbane') AS ts_local, high, low, close
+        FROM {"bars_1m" if mode == "1m" else "bars_5m"}
+        WHERE symbol = ?
+          AND (ts_utc AT TIME ZONE 'Australia/Brisbane') > CAST(? AS TIMESTAMP)
+          AND (ts_utc AT TIME ZONE 'Australia/Brisbane') <= CAST(? AS TIMESTAMP)
+        ORDER BY ts_local
+    """, [SYMBOL, f"{start_date} {h:02d}:{m + 5:02d}:00", _orb_scan_end_local(orb, d)]).fetchall()
+
+    return _simulate_bars(
+        orb, orb_high, orb_low, bars, confirm_bars=confirm_bars, rr=rr, sl_mode=sl_mode,
+        buffer_ticks=buffer_ticks, max_stop_ticks=max_stop_ticks, asia_tp_cap_ticks=asia_tp_cap_ticks,
+        execution_mode=execution_mode, execution_params=execution_params,
+    )
+
+
+@pytest.mark.parametrize("orb", ["0900", "1000", "1100", "1800", "2300", "0030"])
+@pytest.mark.parametrize("params", [
+    {},
+    {"mode": "5m", "confirm_bars": 2, "rr": 2.0, "sl_mode": "half"},
+    {"buffer_ticks": 2, "max_stop_ticks": 30, "rr": 3.0},
+    {"asia_tp_cap_ticks": 20, "apply_size_filter": True, "size_filter_threshold": 0.1},
+])
+def test_batch_matches_per_date_reference(con, monkeypatch, orb, params):
+    dates = [START + timedelta(days=i) for i in range((END - START).days + 1)]
+    # Out-of-order input plus a date with no features row
+    dates = dates[::-1] + [END + timedelta(days=30)]
+
+    reference = [_reference_trade(con, d, orb, **params).to_dict() for d in dates]
+    assert reference[-1]["outcome"] == "SKIPPED_NO_ORB"
+    assert {"WIN", "LOSS"} & {r["outcome"] for r in reference}
+    assert [r.to_dict() for r in simulate_orb_trades(con, dates, orb, **params)] == reference
+    assert [simulate_orb_trade(con, d, orb, **params).to_dict() for d in dates] == reference
+
+    # One bars query per span: no merging gives the same answer
+    monkeypatch.setattr(execution_engine, "BATCH_MERGE_GAP", timedelta(0))
+    assert [r.to_dict() for r in simulate_orb_trades(con, dates, orb, **params)] == reference
+
+
+@pytest.mark.parametrize("params", [{}, {"mode": "5m", "max_stop_ticks": 25, "asia_tp_cap_ticks": 20}])
+def test_sweep_matches_per_date_engine(con, params):
+    grid = sweep_orb_grid(
+        con, START, END, orbs=["1000", "2300"],
+        rr_values=[1.0, 2.5], confirm_bars_values=[1, 2], sl_modes=["full", "half"], buffer_ticks_values=[0, 2],
+        **params,
+    )
+    assert len(grid) == 2 * 2 * 2 * 2 * 2
+    dates = [START + timedelta(days=i) for i in range((END - START).days + 1)]
+
+    for cell in grid.itertuples():
+        results = simulate_orb_trades(
+            con, dates, cell.orb, rr=cell.rr, confirm_bars=cell.confirm_bars,
+            sl_mode=cell.sl_mode, buffer_ticks=cell.buffer_ticks, **params,
+        )
+        outcomes = [r.outcome for r in results]
+        r = np.array([r.r_multiple for r in results])
+        equity = np.cumsum(r)
+        max_dd = (np.maximum.accumulate(np.concatenate([[0.0], equity]))[1:] - equity).max()
+
+        assert (cell.wins, cell.losses, cell.open) == (
+            outcomes.count("WIN"), outcomes.count("LOSS"), outcomes.count("NO_TRADE"))
+        assert cell.trades + cell.open + cell.skipped == len(dates)
+        assert cell.total_r == pytest.approx(r.sum())
+        assert cell.max_dd_r == pytest.approx(max_dd)
+        if cell.trades:
+            assert cell.expectancy == pytest.approx(r.sum() / cell.trades)
+
+
+def test_levels_read_for_symbol_only(con):
+    dates = [START + timedelta(days=i) for i in range((END - START).days + 1)]
+    expected = [r.to_dict() for r in simulate_orb_trades(con, dates, "1000")]
+    grid = sweep_orb_grid(con, START, END, orbs=["1000"], rr_values=[1.0, 2.0])
+
+    # Another instrument's rows for the same dates must not replace MGC's levels
+    con.begin()
+    try:
+        con.execute("""
+            INSERT INTO daily_features_v2 (date_local, instrument, orb_1000_high, orb_1000_low, atr_20)
+            SELECT date_local, 'ZZZ', orb_1000_high + 50, orb_1000_low - 50, atr_20 FROM daily_features_v2
+        """)
+        assert [r.to_dict() for r in simulate_orb_trades(con, dates, "1000")] == expected
+        assert sweep_orb_grid(con, START, END, orbs=["1000"], rr_values=[1.0, 2.0]).equals(grid)
+    finally:
+        con.rollback()
@@ -0,0 +1,75 @@
+"""
+Level interaction: vectorized checks must match the per-bar loop rules for
+every level, and StrategyEngine must read them off the ring buffer.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from config import TZ_LOCAL
+from data_loader import LiveDataLoader
+from level_interaction import closed_back_inside, closes_beyond, first_touch
+from strategy_engine import StrategyEngine
+
+
+def _loop_failure(high, low, close, level, direction):
+    """Reference: the old iterrows() acceptance-failure check."""
+    for h, l, c in zip(high, low, close):
+        if direction == "UP" and h > level and c < level:
+            return True
+        if direction == "DOWN" and l < level and c > level:
+            return True
+    return False
+
+
+def test_matches_per_bar_loop():
+    rng = np.random.default_rng(7)
+    close = 2700 + rng.normal(0, 2, 50).cumsum()
+    high = close + rng.uniform(0, 2, 50)
+    low = close - rng.uniform(0, 2, 50)
+    levels = np.linspace(close.min() - 3, close.max() + 3, 25)
+
+    for direction in ("UP", "DOWN"):
+        failed = closed_back_inside(high, low, close, levels, direction)
+        assert failed.tolist() == [_loop_failure(high, low, close, lv, direction) for lv in levels]
+
+        counts = closes_beyond(close, levels, direction)
+        beyond = close[None, :] > levels[:, None] if direction == "UP" else close[None, :] < levels[:, None]
+        assert counts.tolist() == beyond.sum(axis=1).tolist()
+
+        first = first_touch(high, low, levels, direction)
+        for lv, idx in zip(levels, first):
+            touched = np.flatnonzero(high >= lv if direction == "UP" else low <= lv)
+            assert idx == (touched[0] if len(touched) else -1)
+
+
+def test_mixed_directions_in_one_call():
+    high = np.array([10.0, 12.0, 11.0])
+    low = np.array([8.0, 9.0, 7.0])
+    close = np.array([9.0, 10.5, 10.0])
+
+    assert closed_back_inside(high, low, close, [11.0, 8.0], ["UP", "DOWN"]).tolist() == [True, True]
+    assert closes_beyond(close, [9.5, 9.5], ["UP", "DOWN"]).tolist() == [2, 1]
+    assert first_touch(high, low, [12.0, 6.0], ["UP", "DOWN"]).tolist() == [1, -1]
+
+
+def test_engine_uses_ring_buffer_tail():
+    start = datetime(2026, 1, 6, 23, 0, tzinfo=TZ_LOCAL)
+    closes = [2700.0, 2700.0, 2705.0, 2699.0]
+    highs = [2700.5, 2700.5, 2706.5, 2702.0]  # Last bar: swept 2701 and closed back under
+    loader = LiveDataLoader.__new__(LiveDataLoader)
+    loader.symbol = "MGC"
+    loader.con = None
+    loader.feed = None
+    loader.bars_df = pd.DataFrame({
+        "ts_utc": [pd.Timestamp(start + timedelta(minutes=m)).tz_convert("UTC") for m in range(4)],
+        "open": closes, "high": highs, "low": [c - 1.0 for c in closes],
+        "close": closes, "volume": 1,
+    })
+    engine = StrategyEngine(loader)
+
+    assert engine._acceptance_failures([2701.0, 2710.0, 2699.5], ["UP", "UP", "DOWN"], 1) == [True, False, False]
+    assert engine._check_acceptance_failure(2701.0, "UP", bars_to_check=1)
+    assert not engine._check_acceptance_failure(2701.0, "UP", bars_to_check=5)  # Not enough bars
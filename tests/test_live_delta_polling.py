@@ -0,0 +1,136 @@
+"""
+LiveDataLoader delta polling must rebuild the same window as a full refetch.
+"""
+
+from datetime import datetime, timedelta
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_loader import LiveDataLoader
+from config import DATA_WINDOW_HOURS, TZ_UTC
+
+COLUMNS = ["ts_utc", "open", "high", "low", "close", "volume"]
+
+
+class FakeProjectX:
+    """retrieveBars stand-in: 1m bars up to now, last one still forming."""
+
+    def __init__(self):
+        self.calls = []
+        self.tick = 0
+
+    def __call__(self, start_utc, end_utc, limit=20000):
+        self.calls.append((start_utc, limit))
+        self.tick += 1
+        ts = pd.date_range(
+            pd.Timestamp(start_utc).ceil("1min"), pd.Timestamp(end_utc).floor("1min"), freq="1min"
+        )
+        minute = (ts.asi8 // 60_000_000_000) % 10_000
+        close = 2700.0 + minute * 0.1
+        # The forming bar changes between polls
+        close = np.where(ts == ts.max(), close + self.tick, close)
+        return pd.DataFrame({
+            "ts_utc": ts, "open": close, "high": close + 1, "low": close - 1,
+            "close": close, "volume": np.full(len(ts), 10, dtype=np.int64),
+        })
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    monkeypatch.setenv("FORCE_LOCAL_DB", "1")
+    loader = LiveDataLoader.__new__(LiveDataLoader)
+    loader.symbol = "MGC"
+    loader.con = duckdb.connect(":memory:")
+    loader._setup_tables()
+    loader.bars_df = pd.DataFrame()
+    loader.feed = None
+    loader.incremental = True
+    loader._last_closed_ts = None
+    loader._window_minutes = None
+    loader.projectx_token = "token"
+    loader.projectx_contract_id = "CON.F.US.MGC"
+    loader._retrieve_bars = FakeProjectX()
+    yield loader
+    loader.con.close()
+
+
+def test_delta_poll_matches_full_fetch(loader):
+    loader.fetch_latest_bars()
+    first = loader._retrieve_bars.calls[-1]
+    assert loader._last_closed_ts is not None
+
+    inserted = []
+    original_insert = loader.insert_bars
+    loader.insert_bars = lambda bars: (inserted.extend(bars.to_dict("records")), original_insert(bars))[1]
+    loader.refresh()
+
+    start, limit = loader._retrieve_bars.calls[-1]
+    assert start > first[0] + timedelta(hours=DATA_WINDOW_HOURS) - timedelta(minutes=5)
+    assert limit <= 5 and 1 <= len(inserted) <= 3
+
+    # Same window as a fresh full load, forming bar updated in place
+    delta = loader.bars_df[COLUMNS].reset_index(drop=True)
+    stored = loader.con.execute(
+        "SELECT ts_utc, open, high, low, close, volume FROM live_bars WHERE symbol = 'MGC' AND ts_utc >= ? ORDER BY ts_utc",
+        [delta["ts_utc"].iloc[0]],
+    ).fetchdf()
+    stored["ts_utc"] = pd.to_datetime(stored["ts_utc"], utc=True)
+    assert delta["ts_utc"].is_monotonic_increasing and delta["ts_utc"].is_unique
+    assert np.allclose(delta["close"].to_numpy(), stored["close"].to_numpy()[-len(delta):])
+    assert delta["close"].iloc[-1] == loader.get_latest_bar()["close"]
+
+
+def test_full_refresh_and_window_change_refetch_everything(loader):
+    loader.fetch_latest_bars()
+    loader.refresh(full=True)
+    assert loader._retrieve_bars.calls[-1][1] == 20000
+
+    loader.refresh()
+    assert loader._retrieve_bars.calls[-1][1] < 20000
+
+    loader.fetch_latest_bars(lookback_minutes=60)
+    assert loader._retrieve_bars.calls[-1][1] == 20000
+
+    # Long gap: last closed bar older than the window -> full reload
+    loader._last_closed_ts = pd.Timestamp(datetime.now(TZ_UTC) - timedelta(hours=5))
+    loader.fetch_latest_bars(lookback_minutes=60)
+    assert loader._retrieve_bars.calls[-1][1] == 20000
+
+
+def test_batched_upsert_and_attached_backfill(loader, tmp_path, monkeypatch):
+    now = pd.Timestamp.now(tz="UTC").floor("1min")
+    ts = pd.date_range(now - pd.Timedelta(hours=6), now, freq="1min")
+    bars = pd.DataFrame({
+        "ts_utc": ts, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5,
+        "volume": np.arange(len(ts), dtype=np.int64),
+    })
+
+    assert loader.insert_bars(bars) == len(ts)
+    assert loader.insert_bars(bars.assign(close=9.0).tail(2)) == 2  # upsert, no duplicates
+    counts = loader.con.execute(
+        "SELECT count(*), sum(CASE WHEN close = 9.0 THEN 1 ELSE 0 END) FROM live_bars WHERE symbol = 'MGC'"
+    ).fetchone()
+    assert counts == (len(ts), 2)
+
+    # gold.db backfill: one INSERT ... SELECT through ATTACH, keeps the cutoff
+    gold_path = str(tmp_path / "gold.db")
+    gold = duckdb.connect(gold_path)
+    gold.execute("CREATE TABLE bars_1m (ts_utc TIMESTAMPTZ, symbol VARCHAR, open DOUBLE, high DOUBLE, low DOUBLE, close DOUBLE, volume BIGINT)")
+    gold.register("src", bars.assign(ts_utc=bars["ts_utc"] - pd.Timedelta(days=1), symbol="MGC"))
+    gold.execute("INSERT INTO bars_1m SELECT ts_utc, symbol, open, high, low, close, volume FROM src")
+    gold.execute("INSERT INTO bars_1m SELECT ts_utc, 'MPL', open, high, low, close, volume FROM src")
+    gold.close()
+
+    # Backfill must not go through the DataFrame fallback (insert_bars)
+    def no_fallback(frame):
+        raise AssertionError("backfill fell back to fetchdf() + insert_bars")
+
+    monkeypatch.setattr(loader, "insert_bars", no_fallback)
+    loader.backfill_from_gold_db(gold_path, days=2)
+    total = loader.con.execute("SELECT count(*) FROM live_bars WHERE symbol = 'MGC'").fetchone()[0]
+    assert total == 2 * len(ts)
+    assert loader.con.execute("SELECT count(*) FROM live_bars WHERE symbol = 'MPL'").fetchone()[0] == 0
+    assert "backfill_src" not in loader.con.execute("SELECT database_name FROM duckdb_databases()").fetchdf()["database_name"].tolist()
@@ -0,0 +1,129 @@
+"""
+LiveFeedManager polls all instruments in one concurrent round-trip.
+"""
+
+import asyncio
+import json
+import time
+
+import duckdb
+import httpx
+import pandas as pd
+
+import live_feed
+from data_loader import LiveDataLoader
+from live_feed import LiveFeedManager
+from lib.projectx.projectx_client import ProjectXClient
+
+LATENCY = 0.3
+
+
+class FakeClient(ProjectXClient):
+    """Shared client with a fixed token and contracts; bars go through the async transport."""
+
+    def __init__(self):
+        super().__init__("https://px.test", "user", "key", token_cache_path=None)
+
+    def login(self, force=False):
+        return "token"
+
+    def active_contract(self, symbol, live=None):
+        return {"id": f"CON.F.US.{symbol}", "name": symbol}
+
+
+def _transport(requests):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        await asyncio.sleep(LATENCY)
+        ts = pd.date_range(pd.Timestamp(body["startTime"]).ceil("1min"),
+                           pd.Timestamp(body["endTime"]).floor("1min"), freq="1min")
+        base = {"CON.F.US.MGC": 2700.0, "CON.F.US.MNQ": 21000.0, "CON.F.US.MPL": 950.0}[body["contractId"]]
+        bars = [{"t": t.isoformat(), "o": base, "h": base + 1, "l": base - 1, "c": base + len(requests), "v": 5}
+                for t in ts]
+        return httpx.Response(200, json={"success": True, "bars": bars})
+    return httpx.MockTransport(handler)
+
+
+def test_concurrent_poll_and_delta(monkeypatch):
+    monkeypatch.setattr(live_feed, "load_today_atr", lambda symbol: {"MGC": 30.0, "NQ": 150.0}.get(symbol))
+    requests = []
+    feed = LiveFeedManager(lookback_minutes=120, client=FakeClient(), transport=_transport(requests), persist=False)
+
+    async def two_polls():
+        async with feed.http_client() as http:
+            t0 = time.perf_counter()
+            first = await feed.poll_once(http)
+            elapsed = time.perf_counter() - t0
+            second = await feed.poll_once(http)
+            return first, elapsed, second
+
+    first, elapsed, second = asyncio.run(two_polls())
+
+    # Three instruments, one round-trip of latency
+    assert elapsed < 2 * LATENCY
+    assert set(first) == {"MGC", "NQ", "MPL"}
+    assert [r["contractId"] for r in requests[:3]] == ["CON.F.US.MGC", "CON.F.US.MNQ", "CON.F.US.MPL"]
+    assert all(r["limit"] == 20000 for r in requests[:3])
+
+    # Second poll only asks for bars after the last closed one
+    assert all(r["limit"] <= 5 for r in requests[3:])
+    for symbol, snap in second.items():
+        assert len(snap.bars) == len(first[symbol].bars) or len(snap.bars) == len(first[symbol].bars) + 1
+        assert snap.bars["ts_utc"].is_unique and snap.bars["ts_utc"].is_monotonic_increasing
+        assert snap.price == snap.bars["close"].iloc[-1]
+    assert feed.snapshot() is second
+
+    prices, atrs, orb_data = feed.scanner_inputs({"0900": (9, 0, 5)})
+    assert set(prices) == {"MGC", "NQ", "MPL"}
+    assert atrs == {"MGC": 30.0, "NQ": 150.0}
+    assert set(orb_data) == {"MGC", "NQ", "MPL"}
+
+
+def test_failed_instrument_keeps_last_snapshot():
+    requests = []
+    feed = LiveFeedManager(symbols=["MGC"], lookback_minutes=30, client=FakeClient(),
+                           transport=_transport(requests), persist=False)
+    feed._states["MGC"].atr_date = pd.Timestamp.now(tz=live_feed.TZ_LOCAL).date()
+
+    async def poll(transport):
+        async with httpx.AsyncClient(base_url="https://px.test", transport=transport) as http:
+            return await feed.poll_once(http)
+
+    good = asyncio.run(poll(_transport(requests)))["MGC"]
+    bad = asyncio.run(poll(httpx.MockTransport(lambda r: httpx.Response(500))))["MGC"]
+    assert bad.error and bad.bars is good.bars and bad.price == good.price
+
+
+def test_background_feed_serves_loader_and_writes_live_bars(tmp_path, monkeypatch):
+    monkeypatch.setattr(live_feed, "load_today_atr", lambda symbol: None)
+    db_path = str(tmp_path / "live.db")
+    requests = []
+    feed = LiveFeedManager(poll_interval=0.2, client=FakeClient(),
+                           transport=_transport(requests), persist=True, db_path=db_path)
+    feed.start()
+    try:
+        deadline = time.time() + 10
+        while len(feed.snapshot()) < 3 and time.time() < deadline:
+            time.sleep(0.05)
+
+        # Two dashboards, one feed: loaders read the snapshot, no ProjectX calls of their own
+        for symbol in ("MGC", "MNQ"):
+            loader = LiveDataLoader.__new__(LiveDataLoader)
+            loader.symbol = symbol
+            loader.bars_df = pd.DataFrame()
+            loader.projectx_token = loader.projectx_contract_id = None
+            loader.attach_feed(feed)
+            calls_before = len(requests)
+            bars = loader.fetch_latest_bars()
+            assert len(requests) - calls_before <= 3  # only the feed's own cadence
+            assert not bars.empty and loader.get_latest_bar()["close"] == bars["close"].iloc[-1]
+            assert loader.fetch_latest_bars(lookback_minutes=30)["ts_utc"].min() >= bars["ts_utc"].min()
+    finally:
+        feed.stop()
+
+    con = duckdb.connect(db_path, read_only=True)
+    symbols = {row[0] for row in con.execute("SELECT DISTINCT symbol FROM live_bars").fetchall()}
+    con.close()
+    assert symbols == {"MGC", "MNQ", "MPL"}
+    assert feed.snapshot_for("MGC") is None  # stopped feed is never served
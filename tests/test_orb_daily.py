@@ -0,0 +1,114 @@
+"""
+orb_daily: the long-format ORB table maintained by FeatureBuilderV2.
+
+Must hold exactly the daily_features_v2 ORB columns (one row per ORB with data),
+and the query engine / ML training readers must return what the old wide-table
+pivots returned.
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from build_daily_features_v2 import FeatureBuilderV2, ORB_FIELDS, ORB_TIMES
+
+from analysis import query_engine as qe
+from ml.training import prepare_training_data as ptd
+from tests.test_build_daily_features_v2_bulk import _seed_bars, START
+
+END = START + timedelta(days=9)
+
+
+@pytest.fixture
+def con(tmp_path):
+    db_path = str(tmp_path / "gold.db")
+    _seed_bars(db_path)
+    con = duckdb.connect(db_path)
+    con.execute("CREATE TABLE orb_trades_1m_exec (date_local DATE, orb VARCHAR, close_confirmations INTEGER)")
+    con.execute("INSERT INTO orb_trades_1m_exec VALUES (?, '1000', 1), (?, '1000', 3)", [START, START])
+
+    builder = FeatureBuilderV2(con=con)
+    builder.init_schema_v2()
+    builder.build_features_bulk(START, END)
+
+    # Trades view over the wide table (independent of orb_daily)
+    con.execute("CREATE TABLE trades (date_local DATE, instrument VARCHAR, orb_time VARCHAR,"
+                " break_dir VARCHAR, outcome VARCHAR, r_multiple DOUBLE)")
+    for orb in ORB_TIMES:
+        con.execute(f"""
+            INSERT INTO trades SELECT date_local, instrument, '{orb}', orb_{orb}_break_dir,
+                   orb_{orb}_outcome, orb_{orb}_r_multiple
+            FROM daily_features_v2 WHERE orb_{orb}_size IS NOT NULL
+        """)
+    con.execute("""
+        CREATE VIEW v_orb_trades AS
+        SELECT t.*, df.asia_type_code, df.london_type_code, df.pre_ny_type_code, df.atr_20, df.asia_range
+        FROM trades t JOIN daily_features_v2 df USING (date_local, instrument)
+    """)
+    yield con
+    con.close()
+
+
+def test_orb_daily_matches_wide_columns(con):
+    wide = con.execute("SELECT * FROM daily_features_v2 ORDER BY date_local").fetchdf()
+    expected = sorted(
+        (row.date_local.date(), row.instrument, orb) + tuple(getattr(row, f"orb_{orb}_{f}") for f in ORB_FIELDS)
+        for row in wide.itertuples()
+        for orb in ORB_TIMES
+        if pd.notna(getattr(row, f"orb_{orb}_size"))
+    )
+    rows = con.execute(f"SELECT date_local, instrument, orb_time, {', '.join(ORB_FIELDS)} FROM orb_daily").fetchall()
+    assert expected and len(rows) == len(expected)
+    assert pd.DataFrame(sorted(rows)).equals(pd.DataFrame(expected))
+
+    # Rebuilding a day replaces its rows instead of duplicating them
+    FeatureBuilderV2(con=con).build_features_bulk(START, START)
+    assert con.execute("SELECT COUNT(*) FROM orb_daily").fetchone()[0] == len(expected)
+
+
+def test_orb_daily_backfilled_when_created_on_existing_db(con):
+    # Database built before orb_daily existed, then one incremental build
+    total = con.execute("SELECT COUNT(*) FROM orb_daily").fetchone()[0]
+    con.execute("DROP TABLE orb_daily")
+    FeatureBuilderV2(con=con).build_features_bulk(END, END)
+
+    assert con.execute("SELECT COUNT(*) FROM orb_daily").fetchone()[0] == total
+    assert con.execute("SELECT MIN(date_local) FROM orb_daily").fetchone()[0] == START
+
+
+def test_query_engine_base_frame_matches_wide_pivot(con):
+    filters = qe.filters_from_dict({"orb_times": list(ORB_TIMES), "outcomes": ["WIN", "LOSS", "NO_TRADE"]})
+    keys = ["date_local", "orb_time"]
+
+    frame = qe._fetch_base_frame(con, filters).sort_values(keys).reset_index(drop=True)
+    assert len(frame) > 0 and frame["orb_size"].notna().all()
+    assert frame.loc[(frame["date_local"] == pd.Timestamp(START)) & (frame["orb_time"] == "1000"),
+                     "close_confirmations"].tolist() == [3]
+
+    # close_confirmations is read live from orb_trades_1m_exec
+    con.execute("UPDATE orb_trades_1m_exec SET close_confirmations = 5 WHERE close_confirmations = 3")
+    live = qe._fetch_base_frame(con, filters).sort_values(keys).reset_index(drop=True)
+    assert live["close_confirmations"].max() == 5
+
+    # Same frame from the wide daily_features_v2 columns (databases without orb_daily)
+    con.execute("DROP TABLE orb_daily")
+    legacy = qe._fetch_base_frame(con, filters).sort_values(keys).reset_index(drop=True)
+    pd.testing.assert_frame_equal(live, legacy, check_dtype=False)
+
+
+def test_training_rows_read_orb_daily(con):
+    rows = ptd.load_orb_rows(con)
+    days = con.execute("SELECT COUNT(*) FROM daily_features_v2 WHERE orb_0900_size IS NOT NULL").fetchone()[0]
+
+    assert len(rows) == con.execute("SELECT COUNT(*) FROM orb_daily").fetchone()[0]
+    assert (rows["orb_time"] == "0900").sum() == days
+    assert rows["orb_size"].notna().all()
+    first = rows.iloc[0]
+    assert first["orb_time"] == "0900" and first["session_context"] == "ASIA"
+    assert set(rows.loc[rows["orb_time"] == "0030", "session_context"]) == {"NY"}
@@ -0,0 +1,63 @@
+"""
+ORB kernel: vectorized entry/exit must follow the per-bar loop rules.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "research"))
+
+from orb_kernel import first_breakout, scan_exit
+
+
+def _loop_exit(high, low, close, entry, stop, target, direction):
+    """Reference per-bar loop (stop checked first)."""
+    sign = 1.0 if direction == 'long' else -1.0
+    mae = mfe = 0.0
+    for i in range(len(close)):
+        stop_hit = low[i] <= stop if direction == 'long' else high[i] >= stop
+        target_hit = high[i] >= target if direction == 'long' else low[i] <= target
+        if stop_hit:
+            return i, 'stop', mae, mfe
+        if target_hit:
+            return i, 'target', mae, mfe
+        unrealized = sign * (close[i] - entry)
+        mae, mfe = min(mae, unrealized), max(mfe, unrealized)
+    return -1, None, mae, mfe
+
+
+def test_first_breakout():
+    close = np.array([10.0, 10.5, 11.2, 10.8, 11.3, 11.4, 8.0])
+    assert first_breakout(close, 11.0, 9.0) == (2, 'long')
+    assert first_breakout(close, 11.0, 9.0, confirm_bars=2) == (5, 'long')
+    assert first_breakout(close, 12.0, 9.0) == (6, 'short')
+    assert first_breakout(close, 12.0, 7.0) is None
+    assert first_breakout(np.array([]), 1.0, 0.0) is None
+
+
+def test_same_bar_stop_wins():
+    scan = scan_exit([101.0, 106.0], [99.0, 94.0], [100.5, 100.0], 100.0, 95.0, 105.0, 'long')
+    assert (scan.idx, scan.hit) == (1, 'stop')
+    assert scan.close_mae == 0.0 and scan.close_mfe == 0.5
+    assert scan.range_mae == 6.0 and scan.range_mfe == 6.0
+
+
+@pytest.mark.parametrize("direction", ["long", "short"])
+def test_scan_exit_matches_loop(direction):
+    rng = np.random.default_rng(11)
+    for _ in range(200):
+        n = int(rng.integers(0, 60))
+        close = 100.0 + np.cumsum(rng.normal(0, 0.5, n))
+        high = close + rng.uniform(0, 0.6, n)
+        low = close - rng.uniform(0, 0.6, n)
+        if direction == 'long':
+            stop, target = 100.0 - rng.uniform(0.5, 3), 100.0 + rng.uniform(0.5, 5)
+        else:
+            stop, target = 100.0 + rng.uniform(0.5, 3), 100.0 - rng.uniform(0.5, 5)
+
+        scan = scan_exit(high, low, close, 100.0, stop, target, direction)
+        assert (scan.idx, scan.hit, scan.close_mae, scan.close_mfe) == \
+            _loop_exit(high, low, close, 100.0, stop, target, direction)
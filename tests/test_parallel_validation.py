@@ -0,0 +1,73 @@
+"""
+Parallel validation must reproduce the serial ValidationPipeline results.
+"""
+
+import dataclasses
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "research"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "research" / "ede"))
+
+from build_daily_features_v2 import FeatureBuilderV2
+from bar_store import BarStore
+from parallel_validation import ParallelValidationRunner
+
+from tests.test_build_daily_features_v2_bulk import _seed_bars
+from tests.test_ede_backtest_batch import _candidates
+
+
+def _dump(result):
+    return json.dumps(dataclasses.asdict(result), default=str, sort_keys=True)
+
+
+def test_shared_memory_round_trip(tmp_path):
+    db_path = str(tmp_path / "bars.db")
+    _seed_bars(db_path)
+    store = BarStore.load("MGC", db_path)
+
+    block, handle = store.to_shared_memory()
+    try:
+        BarStore.clear_shared()
+        attached = BarStore.attach_shared_memory(handle, db_path)
+        assert BarStore.shared("MGC", db_path) is attached
+        for name in ("ts_ms", "open", "high", "low", "close", "volume"):
+            assert np.array_equal(getattr(attached, name), getattr(store, name))
+        assert attached.trade_dates() == store.trade_dates()
+        assert np.array_equal(attached.day_slice(date(2025, 1, 6)).close, store.day_slice(date(2025, 1, 6)).close)
+
+        # Same pages, not a copy: a write through the creator's mapping shows up
+        np.ndarray((1,), np.int64, block.buf)[0] = -1
+        assert attached.ts_ms[0] == -1
+        del attached
+    finally:
+        BarStore.clear_shared()
+        block.close()
+        block.unlink()
+
+
+def test_parallel_matches_serial(tmp_path):
+    db_path = str(tmp_path / "ede.db")
+    _seed_bars(db_path)
+    builder = FeatureBuilderV2(db_path=db_path)
+    builder.init_schema_v2()
+    builder.build_features_bulk(date(2025, 1, 2), date(2025, 2, 20))
+    builder.close()
+
+    candidates = _candidates()
+    runner = ParallelValidationRunner(db_path, workers=2)
+    parallel = runner.run(candidates, "2025-01-02", "2025-02-20", record=False)
+    assert [r.idea_id for r in parallel] == [c["idea_id"] for c in candidates]
+
+    for candidate, result in zip(candidates, parallel):
+        serial, _ = runner.pipeline.evaluate_candidate(candidate, "2025-01-02", "2025-02-20")
+        assert _dump(result) == _dump(serial), candidate["idea_id"]
+
+    inline = ParallelValidationRunner(db_path, workers=1).run(candidates, "2025-01-02", "2025-02-20", record=False)
+    assert [_dump(r) for r in inline] == [_dump(r) for r in parallel]
+    BarStore.clear_shared()
@@ -0,0 +1,69 @@
+"""
+ProjectXClient reuses its token and per-day contract lookups across calls.
+"""
+
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.projectx.projectx_client import ProjectXClient
+
+
+def _jwt(exp: float) -> str:
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{claims}.sig"
+
+
+def _client(tmp_path, calls, expired_once=False):
+    state = {"rejected": not expired_once}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path == "/api/Auth/loginKey":
+            return httpx.Response(200, json={"success": True, "token": _jwt(time.time() + 3600)})
+        if request.url.path == "/api/Contract/search":
+            return httpx.Response(200, json={"success": True, "contracts": [
+                {"id": "CON.F.US.MGC.Z25", "name": "MGCZ5", "activeContract": True},
+            ]})
+        if request.url.path == "/api/History/retrieveBars":
+            if not state["rejected"]:
+                state["rejected"] = True
+                return httpx.Response(401)
+            return httpx.Response(200, json={"success": True, "bars": [{"t": "2025-01-02T00:00:00Z"}]})
+        return httpx.Response(404)
+
+    client = ProjectXClient("https://px.test", "user", "key", live=False, token_cache_path=tmp_path / "token.json")
+    client._http = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_token_and_contract_cached(tmp_path):
+    calls = []
+    client = _client(tmp_path, calls)
+    for _ in range(3):
+        assert client.active_contract("MGC")["id"] == "CON.F.US.MGC.Z25"
+        client.retrieve_bars("CON.F.US.MGC.Z25", "2025-01-02T00:00:00Z", "2025-01-02T01:00:00Z")
+    assert calls.count("/api/Auth/loginKey") == 1
+    assert calls.count("/api/Contract/search") == 1
+    assert calls.count("/api/History/retrieveBars") == 3
+
+    # A new process picks the token up from disk instead of logging in
+    again = []
+    _client(tmp_path, again).retrieve_bars("CON.F.US.MGC.Z25", "a", "b")
+    assert again == ["/api/History/retrieveBars"]
+
+
+def test_401_forces_one_relogin(tmp_path):
+    calls = []
+    client = _client(tmp_path, calls, expired_once=True)
+    assert client.retrieve_bars("CON.F.US.MGC.Z25", "a", "b")
+    assert calls == [
+        "/api/Auth/loginKey", "/api/History/retrieveBars",
+        "/api/Auth/loginKey", "/api/History/retrieveBars",
+    ]
@@ -0,0 +1,148 @@
+"""
+query_engine: dashboard panels share one memoized base query, invalidated
+when the source tables change (new rows, or days rebuilt in place and
+marked in source_versions).
+"""
+
+import sys
+from pathlib import Path
+
+import duckdb
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from build_daily_features_v2 import FeatureBuilderV2, bump_source_version
+
+from analysis import query_engine as qe
+from tests.test_build_daily_features_v2_bulk import _seed_bars, START
+
+ORBS = qe.ORB_TIMES
+
+
+def _make_db():
+    con = duckdb.connect()
+    orb_cols = ", ".join(f"orb_{o}_{f} DOUBLE" for o in ORBS for f in ("high", "low", "size"))
+    con.execute(f"""
+        CREATE TABLE daily_features_v2 (
+            date_local DATE, instrument VARCHAR,
+            asia_type_code VARCHAR, london_type_code VARCHAR, pre_ny_type_code VARCHAR,
+            asia_range DOUBLE, london_range DOUBLE, pre_ny_range DOUBLE, atr_20 DOUBLE,
+            {orb_cols}
+        )
+    """)
+    con.execute("""
+        CREATE TABLE orb_trades_1m_exec (date_local DATE, orb VARCHAR, close_confirmations INTEGER)
+    """)
+    con.execute("""
+        CREATE TABLE trades (
+            date_local DATE, instrument VARCHAR, orb_time VARCHAR,
+            break_dir VARCHAR, outcome VARCHAR, r_multiple DOUBLE
+        )
+    """)
+    con.execute("""
+        CREATE VIEW v_orb_trades AS
+        SELECT t.*, df.asia_type_code, df.london_type_code, df.pre_ny_type_code, df.atr_20, df.asia_range
+        FROM trades t JOIN daily_features_v2 df USING (date_local, instrument)
+    """)
+    _add_day(con, "2026-01-05", "WIN", 2.0)
+    _add_day(con, "2026-01-06", "LOSS", -1.0)
+    return con
+
+
+def _add_day(con, day, outcome, r):
+    orb_values = ", ".join("2710, 2700, 10" for _ in ORBS)
+    con.execute(f"INSERT INTO daily_features_v2 VALUES ('{day}', 'MGC', 'A1', 'L1', 'N1', 20, 15, 5, 30, {orb_values})")
+    con.execute(f"INSERT INTO trades VALUES ('{day}', 'MGC', '1000', 'UP', '{outcome}', {r})")
+    con.execute(f"INSERT INTO orb_trades_1m_exec VALUES ('{day}', '1000', 2)")
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    qe.clear_cache()
+    calls = []
+    fetch = qe._fetch_base_frame
+
+    def counted(con, filters):
+        calls.append(qe.filters_key(filters))
+        return fetch(con, filters)
+
+    monkeypatch.setattr(qe, "_fetch_base_frame", counted)
+    yield calls
+    qe.clear_cache()
+
+
+def _filters():
+    return qe.filters_from_dict({"orb_times": ["1000"]})
+
+
+def test_dashboard_render_runs_one_base_query_per_filter_set(fetches):
+    con = _make_db()
+    filters, strategy = _filters(), qe.default_strategy()
+
+    stats = qe.headline_stats_with_strategy(con, filters, strategy)
+    qe.equity_curve_with_strategy(con, filters, strategy)
+    qe.histogram_with_strategy(con, filters, strategy)
+    qe.heatmap_with_strategy(con, filters, strategy)
+    drill = qe.drilldown_with_strategy(con, filters, strategy)
+    funnel = qe.entry_funnel(con, filters, strategy)
+
+    # Panel filters + headline's date-only baseline
+    assert len(fetches) == 2
+    assert stats["trades"] == 2 and stats["total_r"] == 1.0
+    assert funnel["wins"] == 1 and len(drill) == 2
+
+    # Strategy toggle reuses the base frame
+    qe.headline_stats_with_strategy(con, filters, qe.PRESETS["Boundary | 1m Break (2 closes)"])
+    assert len(fetches) == 2
+
+
+def test_cache_invalidated_when_source_tables_change(fetches):
+    con = _make_db()
+    filters, strategy = _filters(), qe.default_strategy()
+
+    frame = qe.strategy_dataset(con, filters, strategy)
+    frame["r_multiple"] = 0.0  # Callers get their own copy
+    assert qe.strategy_dataset(con, filters, strategy)["r_multiple"].sum() == 1.0
+    assert len(fetches) == 1
+
+    _add_day(con, "2026-01-07", "WIN", 2.0)
+    assert len(qe.strategy_dataset(con, filters, strategy)) == 3
+    assert len(fetches) == 2
+
+
+def test_cache_invalidated_when_rows_rebuilt_in_place(fetches):
+    con = _make_db()
+    filters, strategy = _filters(), qe.default_strategy()
+
+    assert set(qe.strategy_dataset(con, filters, strategy)["atr_20"]) == {30.0}
+
+    # Same row count, different content: the writer's version bump invalidates
+    con.execute("UPDATE daily_features_v2 SET atr_20 = 99")
+    bump_source_version(con, "daily_features_v2")
+    assert set(qe.strategy_dataset(con, filters, strategy)["atr_20"]) == {99.0}
+
+    con.execute("UPDATE orb_trades_1m_exec SET close_confirmations = 1")
+    bump_source_version(con, "orb_trades_1m_exec")
+    assert set(qe.strategy_dataset(con, filters, strategy)["close_confirmations"]) == {1}
+    assert len(fetches) == 3
+
+    # Unchanged markers: cache hit
+    qe.strategy_dataset(con, filters, strategy)
+    assert len(fetches) == 3
+
+
+def test_feature_builds_bump_source_version(tmp_path):
+    db_path = str(tmp_path / "gold.db")
+    _seed_bars(db_path)
+    con = duckdb.connect(db_path)
+    builder = FeatureBuilderV2(con=con)
+    builder.init_schema_v2()
+    builder.build_features_bulk(START, START)
+    before = qe.db_fingerprint(con)
+
+    # Same day rebuilt in place: row counts unchanged, fingerprint still moves
+    builder.build_features_bulk(START, START)
+    after = qe.db_fingerprint(con)
+    assert after[2:] == before[2:] and after != before
+    con.close()
@@ -0,0 +1,41 @@
+"""
+query_engine._apply_strategy: filtered_out_reason is the first failing check,
+in order no_break, confirm_not_met, retest_not_met, rejection_not_met, stop_too_large.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from analysis import query_engine as qe
+
+
+def _base():
+    return pd.DataFrame({
+        "orb_high": [2710.0] * 5,
+        "orb_low": [2700.0] * 5,
+        "orb_size": [10.0, 10.0, 30.0, np.nan, 10.0],
+        "break_dir": ["UP", "DOWN", "UP", "UP", None],
+        "outcome": ["WIN", "LOSS", "WIN", "WIN", "NO_TRADE"],
+        "close_confirmations": [3, 1, 3, np.nan, np.nan],
+    })
+
+
+def test_fail_reasons_follow_check_order():
+    strategy = replace(qe.PRESETS["Boundary | 1m Break (2 closes)"], max_stop_ticks=20)
+    frame = qe._apply_strategy(_base(), strategy)
+
+    assert frame["filtered_out_reason"].fillna("").tolist() == [
+        "", "confirm_not_met", "stop_too_large", "confirm_not_met", "no_break"
+    ]
+    assert frame["eligible_trade"].tolist() == [True, False, False, False, False]
+
+
+def test_missing_confirmations_default_to_one_close_per_break():
+    strategy = replace(qe.default_strategy(), entry_model="1m_close_break", max_stop_ticks=None)
+    frame = qe._apply_strategy(_base().drop(columns="close_confirmations"), strategy)
+
+    assert frame["confirm_closes_hit"].tolist() == [1, 1, 1, 1, 0]
+    assert frame["filtered_out_reason"].fillna("").tolist() == ["", "", "", "", "no_break"]
+    assert frame["eligible_trade"].sum() == 4
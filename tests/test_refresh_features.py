@@ -0,0 +1,107 @@
+"""
+Incremental feature refresh must equal a full rebuild.
+
+Builds full history, rewrites one day's bars, runs refresh_features() for that day
+only, and compares against a from-scratch rebuild on the same modified bars.
+"""
+
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import duckdb
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from build_daily_features import ensure_daily_features_table, build_features_for_date
+from build_daily_features_v2 import FeatureBuilderV2, TZ_LOCAL
+from refresh_features import refresh_features, atr_dependent_dates
+
+from tests.test_build_daily_features_v2_bulk import _seed_bars, START, END
+
+CHANGED = date(2025, 1, 14)
+
+
+def _full_build(db_path: str) -> None:
+    con = duckdb.connect(db_path)
+    ensure_daily_features_table(con)
+    builder = FeatureBuilderV2(sl_mode="full", table_name="daily_features_v2", con=con)
+    builder.init_schema_v2()
+    cur = START
+    while cur <= END:
+        build_features_for_date(con, cur)
+        cur += timedelta(days=1)
+    builder.build_features_bulk(START, END)
+    con.close()
+
+
+def _rewrite_day(db_path: str, d: date) -> None:
+    """Shift every bar of trade date d (09:00 -> 09:00 local) and rebuild its 5m bars."""
+    start = datetime(d.year, d.month, d.day, 9, 0, tzinfo=TZ_LOCAL)
+    end = start + timedelta(days=1)
+    con = duckdb.connect(db_path)
+    for table in ("bars_1m", "bars_5m"):
+        con.execute(
+            f"""
+            UPDATE {table}
+            SET open = open + 3.0, high = high + 3.7, low = low + 2.9, close = close + 3.1
+            WHERE ts_utc >= ? AND ts_utc < ?
+            """,
+            [start, end],
+        )
+    con.close()
+
+
+def _dump(db_path: str, table: str):
+    con = duckdb.connect(db_path)
+    try:
+        return con.execute(f"SELECT * FROM {table} ORDER BY date_local").fetchall()
+    finally:
+        con.close()
+
+
+def test_refresh_matches_full_rebuild(tmp_path):
+    incremental_db = str(tmp_path / "incremental.db")
+    reference_db = str(tmp_path / "reference.db")
+
+    _seed_bars(incremental_db)
+    _full_build(incremental_db)
+    _rewrite_day(incremental_db, CHANGED)
+
+    con = duckdb.connect(incremental_db)
+    rebuilt = refresh_features(con, [CHANGED])
+    con.close()
+
+    _seed_bars(reference_db)
+    _rewrite_day(reference_db, CHANGED)
+    _full_build(reference_db)
+
+    for table in ("daily_features", "daily_features_v2"):
+        assert _dump(incremental_db, table) == _dump(reference_db, table)
+
+    # Only the changed day, its bar-lookback dependents and the ATR ripple were touched
+    assert rebuilt["daily_features"] == [CHANGED + timedelta(days=k) for k in range(3)]
+    assert rebuilt["daily_features_v2"][:2] == [CHANGED, CHANGED + timedelta(days=1)]
+    assert max(rebuilt["daily_features_v2"]) < END
+
+
+def test_atr_ripple_stops_after_lookback(tmp_path):
+    db_path = str(tmp_path / "ripple.db")
+    con = duckdb.connect(db_path)
+    builder = FeatureBuilderV2(con=con)
+    builder.init_schema_v2()
+    for i in range(40):
+        # every third day has no Asia data and must not count toward the 20 rows
+        asia = None if i % 3 == 2 else 100.0
+        con.execute(
+            "INSERT INTO daily_features_v2 (date_local, instrument, asia_high, asia_low) VALUES (?, 'MGC', ?, ?)",
+            [date(2025, 1, 1) + timedelta(days=i), asia, asia],
+        )
+
+    ripple = atr_dependent_dates(con, "daily_features_v2", [date(2025, 1, 1)])
+    con.close()
+
+    asia_rows = [d for d in ripple if (d - date(2025, 1, 1)).days % 3 != 2]
+    assert len(asia_rows) == 20
+    assert ripple[0] == date(2025, 1, 2)
+    assert ripple[-1] == asia_rows[-1]
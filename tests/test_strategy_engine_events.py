@@ -0,0 +1,131 @@
+"""
+Event-driven StrategyEngine: ORB trackers advance on closed bars only and
+evaluate_all() between bar closes reuses the cached result.
+"""
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+import strategy_engine
+from config import TZ_LOCAL
+from data_loader import LiveDataLoader
+from strategy_engine import ActionType, OrbPhase, StrategyEngine, StrategyState
+
+DAY = datetime(2026, 1, 6, tzinfo=TZ_LOCAL)
+CONFIG = {"0900": {"tier": "DAY", "rr": 1.0, "sl_mode": "HALF"}}
+
+
+def _bars():
+    rows = []
+    start = DAY.replace(hour=8, minute=50)
+    for m in range(40):
+        ts = start + timedelta(minutes=m)
+        close, low = 2700.0, 2699.0
+        if ts >= DAY.replace(hour=9, minute=8):
+            low = 2700.5  # Above the HALF stop after the break
+        if ts.hour == 9 and ts.minute == 7:
+            close = 2702.0  # First close above the ORB
+        elif ts.hour == 9 and ts.minute >= 12:
+            close = 2704.0  # Through the 1R target
+        rows.append({"ts_utc": pd.Timestamp(ts).tz_convert("UTC"), "open": 2700.0,
+                     "high": max(close, 2701.0), "low": low, "close": close, "volume": 10})
+    return pd.DataFrame(rows)
+
+
+def _engine(monkeypatch, event_driven):
+    loader = LiveDataLoader.__new__(LiveDataLoader)
+    loader.symbol = "MGC"
+    loader.con = None
+    loader.feed = None
+    loader.bars_df = _bars()
+
+    calls = {"orb_levels": 0, "filter": 0, "range": 0}
+    orb_window = (DAY.replace(hour=9), DAY.replace(hour=9, minute=5))
+    session_high_low = loader.get_session_high_low
+    get_bars_in_range = loader.get_bars_in_range
+
+    def counted_high_low(start, end):
+        calls["orb_levels"] += (start, end) == orb_window
+        return session_high_low(start, end)
+
+    def counted_range(start, end):
+        calls["range"] += 1
+        return get_bars_in_range(start, end)
+
+    def orb_filter(high, low, orb_name):
+        calls["filter"] += 1
+        return {"pass": True, "atr": 20.0, "reason": "ok"}
+
+    monkeypatch.setattr(loader, "get_session_high_low", counted_high_low)
+    monkeypatch.setattr(loader, "get_bars_in_range", counted_range)
+    monkeypatch.setattr(loader, "check_orb_size_filter", orb_filter)
+
+    engine = StrategyEngine(loader, event_driven=event_driven)
+    engine.orb_configs = CONFIG
+    monkeypatch.setattr(engine, "_get_setup_info", lambda orb_name: None)
+    return engine, calls
+
+
+def _at(monkeypatch, hour, minute, second=0):
+    now = DAY.replace(hour=hour, minute=minute, second=second)
+
+    class Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(strategy_engine, "datetime", Clock)
+
+
+def _day_orb(engine):
+    """evaluate_all() and the DAY_ORB evaluation it used (cascade outranks it before 23:00)."""
+    result = engine.evaluate_all()
+    return result, engine._strategy_cache["DAY_ORB"][1]
+
+
+def test_orb_tracker_advances_on_closed_bars(monkeypatch):
+    engine, calls = _engine(monkeypatch, event_driven=True)
+
+    _at(monkeypatch, 9, 3)
+    assert _day_orb(engine)[1].state == StrategyState.PREPARING
+    assert not engine._orb_trackers  # Nothing to track while the window forms
+
+    _at(monkeypatch, 9, 6, 10)
+    result, inside = _day_orb(engine)
+    tracker = next(iter(engine._orb_trackers.values()))
+    assert tracker.phase == OrbPhase.FORMED and (tracker.orb_high, tracker.orb_low) == (2701.0, 2699.0)
+    assert "inside range" in inside.reasons[1]
+
+    # Same minute: cached result, no bar reads, levels computed once
+    range_calls = calls["range"]
+    _at(monkeypatch, 9, 6, 40)
+    assert engine.evaluate_all() is result
+    assert engine._strategy_cache["DAY_ORB"][1] is inside and calls["range"] == range_calls
+
+    _at(monkeypatch, 9, 8, 5)
+    ready = _day_orb(engine)[1]
+    assert tracker.phase == OrbPhase.BROKEN
+    assert (ready.action, ready.direction, ready.entry_price, ready.stop_price, ready.target_price) == \
+        (ActionType.ENTER, "LONG", 2702.0, 2700.0, 2704.0)
+
+    _at(monkeypatch, 9, 14)
+    resolved = _day_orb(engine)[1]
+    assert (resolved.state, resolved.action) == (StrategyState.EXITED, ActionType.STAND_DOWN)
+    assert tracker.phase == OrbPhase.RESOLVED and tracker.outcome == "TARGET"
+    assert calls["orb_levels"] == 1 and calls["filter"] == 1
+
+
+def test_breakout_matches_legacy_evaluation(monkeypatch):
+    event, _ = _engine(monkeypatch, event_driven=True)
+    legacy, _ = _engine(monkeypatch, event_driven=False)
+
+    _at(monkeypatch, 9, 6, 10)
+    event.evaluate_all()
+    _at(monkeypatch, 9, 8, 5)
+    expected_bars = legacy.loader.bars_df
+    legacy.loader.bars_df = expected_bars[expected_bars["ts_utc"] <= pd.Timestamp(DAY.replace(hour=9, minute=7))]
+
+    expected = legacy._evaluate_day_orb()
+    expected.priority = strategy_engine.STRATEGY_PRIORITY.index("DAY_ORB")  # As set by evaluate_all()
+    assert _day_orb(event)[1] == expected
@@ -27,6 +27,7 @@ from streamlit_autorefresh import st_autorefresh
 
 from config import *
 from data_loader import LiveDataLoader
+from live_feed import get_live_feed
 from strategy_engine import StrategyEngine, ActionType, StrategyState
 from utils import calculate_position_size, format_price, log_to_journal
 from ai_memory import AIMemoryManager
@@ -247,6 +248,8 @@ if not st.session_state.data_loader or not st.session_state.strategy_engine:
             try:
                 # Initialize data loader
                 loader = LiveDataLoader(PRIMARY_INSTRUMENT)
+                if PROJECTX_USERNAME and PROJECTX_API_KEY:
+                    loader.attach_feed(get_live_feed())  # Shared background poller
 
                 # Fetch data (cloud-aware)
                 if is_cloud_deployment():
@@ -303,7 +306,7 @@ if not st.session_state.data_loader or not st.session_state.strategy_engine:
 
                 # Initialize strategy engine
                 st.info("Initializing strategy engine...")
-                st.session_state.strategy_engine = StrategyEngine(loader, ml_engine=ml_engine)
+                st.session_state.strategy_engine = StrategyEngine(loader, ml_engine=ml_engine, event_driven=True)
 
                 st.success(f"[OK] Loaded data for {PRIMARY_INSTRUMENT}")
                 logger.info(f"Data initialized for {PRIMARY_INSTRUMENT}")
@@ -28,6 +28,7 @@ from streamlit_autorefresh import st_autorefresh
 
 from config import *
 from data_loader import LiveDataLoader
+from live_feed import get_live_feed
 from strategy_engine import StrategyEngine, ActionType, StrategyState
 from utils import calculate_position_size, format_price, log_to_journal
 from ai_memory import AIMemoryManager
@@ -257,6 +258,8 @@ with st.sidebar:
             try:
                 # Initialize data loader
                 loader = LiveDataLoader(symbol)
+                if PROJECTX_USERNAME and PROJECTX_API_KEY:
+                    loader.attach_feed(get_live_feed())  # Shared background poller
 
                 # Fetch data (cloud-aware)
                 if is_cloud_deployment():
@@ -311,7 +314,7 @@ with st.sidebar:
                 else:
                     logger.info("ML disabled (ENABLE_ML not set)")
 
-                st.session_state.strategy_engine = StrategyEngine(loader, ml_engine=ml_engine)
+                st.session_state.strategy_engine = StrategyEngine(loader, ml_engine=ml_engine, event_driven=True)
 
                 # Update data quality monitor with latest bar
                 latest_bar = loader.get_latest_bar()
@@ -514,6 +517,8 @@ if not st.session_state.data_loader or not st.session_state.strategy_engine:
     try:
         # Initialize data loader
         loader = LiveDataLoader(symbol)
+        if PROJECTX_USERNAME and PROJECTX_API_KEY:
+            loader.attach_feed(get_live_feed())  # Shared background poller
 
         # Fetch data (cloud-aware)
         if is_cloud_deployment():
@@ -563,7 +568,7 @@ if not st.session_state.data_loader or not st.session_state.strategy_engine:
         else:
             logger.info("ML disabled (ENABLE_ML not set)")
 
-        st.session_state.strategy_engine = StrategyEngine(loader, ml_engine=ml_engine)
+        st.session_state.strategy_engine = StrategyEngine(loader, ml_engine=ml_engine, event_driven=True)
 
         # Update data quality monitor with latest bar
         latest_bar = loader.get_latest_bar()
@@ -1304,6 +1309,26 @@ else:
         height=200
     )
 
+# ============================================================================
+# MULTI-INSTRUMENT SETUP SCANNER (background live feed)
+# ============================================================================
+st.divider()
+
+with st.expander("🔍 Setup Scanner (MGC / NQ / MPL)", expanded=False):
+    if not (PROJECTX_USERNAME and PROJECTX_API_KEY):
+        st.info("Setup scanner needs ProjectX credentials for live prices.")
+    else:
+        try:
+            # One feed per server process, shared by every session; reading never blocks on the network
+            feed = get_live_feed()
+            if not feed.snapshot():
+                st.caption("Waiting for first live feed poll...")
+            prices, atrs, orb_data = feed.scanner_inputs(st.session_state.setup_scanner.orb_times)
+            render_setup_scanner_tab(st.session_state.setup_scanner, prices, atrs, orb_data)
+        except Exception as e:
+            st.error(f"Error loading setup scanner: {e}")
+            logger.error(f"Setup scanner error: {e}")
+
 # ============================================================================
 # EDGE CANDIDATES REVIEW & APPROVAL
 # ============================================================================
@@ -0,0 +1,331 @@
+"""
+BAR BUFFER - Fixed-size NumPy ring buffer of recent 1m bars
+Keeps the last N bars of one instrument in memory for LiveDataLoader and the
+live feed.
+
+- Storage is mirrored (every bar is written at i and i + capacity), so the
+  live window is always one contiguous slice: range lookups are a
+  np.searchsorted on the timestamp array, no copies, no wrap-around logic.
+- append() is O(1): a bar with the last bar's timestamp replaces it (the
+  forming bar), a newer one is appended and the oldest drops off when full.
+- session() returns running high/low/VWAP accumulators for a [start, end)
+  window; appends update them in O(1), so repeated session queries never
+  rescan bars.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import TZ_LOCAL
+
+BAR_COLUMNS = ["ts_utc", "open", "high", "low", "close", "volume"]
+_FIELDS = ["open", "high", "low", "close", "volume"]
+_OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = range(5)
+
+MAX_SESSIONS = 64
+
+
+def to_ns(ts) -> int:
+    """UTC epoch nanoseconds for a datetime/Timestamp (naive = UTC)."""
+    ts = pd.Timestamp(ts)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return int(ts.as_unit("ns").value)
+
+
+def _series_ns(values) -> np.ndarray:
+    idx = pd.DatetimeIndex(pd.to_datetime(values, utc=True))
+    return idx.as_unit("ns").asi8
+
+
+class SessionStats:
+    """
+    Running high/low/VWAP for bars with start <= ts < end.
+
+    Closed bars are folded into totals; the buffer's last (possibly forming)
+    bar is kept separately so replacing it never needs a rescan.
+    """
+
+    __slots__ = ("start_ns", "end_ns", "_high", "_low", "_pv", "_volume", "_count", "_last")
+
+    def __init__(self, start_ns: int, end_ns: Optional[int]):
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self._high = -np.inf
+        self._low = np.inf
+        self._pv = 0.0
+        self._volume = 0.0
+        self._count = 0
+        self._last: Optional[Tuple[float, float, float, float]] = None  # high, low, pv, volume
+
+    def contains(self, ts_ns: int) -> bool:
+        return ts_ns >= self.start_ns and (self.end_ns is None or ts_ns < self.end_ns)
+
+    def add_closed(self, high: np.ndarray, low: np.ndarray, pv: np.ndarray, volume: np.ndarray):
+        if len(high):
+            self._high = max(self._high, float(high.max()))
+            self._low = min(self._low, float(low.min()))
+            self._pv += float(pv.sum())
+            self._volume += float(volume.sum())
+            self._count += len(high)
+
+    def set_last(self, bar: Optional[Tuple[float, float, float, float]]):
+        self._last = bar
+
+    def close_last(self):
+        if self._last is not None:
+            high, low, pv, volume = self._last
+            self._high = max(self._high, high)
+            self._low = min(self._low, low)
+            self._pv += pv
+            self._volume += volume
+            self._count += 1
+            self._last = None
+
+    @property
+    def count(self) -> int:
+        return self._count + (self._last is not None)
+
+    @property
+    def high(self) -> Optional[float]:
+        if not self.count:
+            return None
+        return max(self._high, self._last[0]) if self._last else self._high
+
+    @property
+    def low(self) -> Optional[float]:
+        if not self.count:
+            return None
+        return min(self._low, self._last[1]) if self._last else self._low
+
+    @property
+    def vwap(self) -> Optional[float]:
+        pv = self._pv + (self._last[2] if self._last else 0.0)
+        volume = self._volume + (self._last[3] if self._last else 0.0)
+        return pv / volume if volume else None
+
+
+class BarRingBuffer:
+    """Last `capacity` 1m bars, oldest first, timestamps strictly increasing."""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, int(capacity))
+        self._ts = np.empty(2 * self.capacity, dtype=np.int64)
+        self._data = np.empty((5, 2 * self.capacity), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self.version = 0  # Bumped on every change (frame cache key)
+        self._sessions: Dict[Tuple[int, Optional[int]], SessionStats] = {}
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_version = -1
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    @property
+    def ts(self) -> np.ndarray:
+        """UTC epoch-ns timestamps (read-only view)."""
+        return self._ts[self._start:self._start + self._size]
+
+    def column(self, name: str) -> np.ndarray:
+        """open/high/low/close/volume as a float view."""
+        return self._data[_FIELDS.index(name), self._start:self._start + self._size]
+
+    def last_ts(self) -> Optional[int]:
+        return int(self._ts[self._start + self._size - 1]) if self._size else None
+
+    def bounds(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> Tuple[int, int]:
+        """Index range [i, j) of bars with start_ns <= ts < end_ns (binary search)."""
+        ts = self.ts
+        i = 0 if start_ns is None else int(np.searchsorted(ts, start_ns, side="left"))
+        j = self._size if end_ns is None else int(np.searchsorted(ts, end_ns, side="left"))
+        return i, max(i, j)
+
+    def to_frame(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> pd.DataFrame:
+        """Bars in [start_ns, end_ns) as a DataFrame (ts_utc, OHLCV, ts_local)."""
+        whole = start_ns is None and end_ns is None
+        if whole and self._frame_version == self.version:
+            return self._frame
+
+        i, j = self.bounds(start_ns, end_ns)
+        lo, hi = self._start + i, self._start + j
+        ts_utc = pd.to_datetime(self._ts[lo:hi], utc=True)
+        df = pd.DataFrame({
+            "ts_utc": ts_utc,
+            "open": self._data[_OPEN, lo:hi].copy(),
+            "high": self._data[_HIGH, lo:hi].copy(),
+            "low": self._data[_LOW, lo:hi].copy(),
+            "close": self._data[_CLOSE, lo:hi].copy(),
+            "volume": self._data[_VOLUME, lo:hi].astype(np.int64),
+            "ts_local": ts_utc.tz_convert(TZ_LOCAL),
+        })
+        if whole:
+            self._frame, self._frame_version = df, self.version
+        return df
+
+    def latest(self) -> Optional[dict]:
+        return self.bar_at(self._size - 1) if self._size else None
+
+    def last_before(self, ts_ns: int) -> Optional[dict]:
+        """Newest bar with ts < ts_ns (e.g. the last closed bar before the current minute)."""
+        _, j = self.bounds(None, ts_ns)
+        return self.bar_at(j - 1) if j else None
+
+    def bar_at(self, i: int) -> dict:
+        """Bar i of the window (0 = oldest) as a dict."""
+        p = self._start + i
+        ts_utc = pd.Timestamp(int(self._ts[p]), tz="UTC")
+        return {
+            "ts_utc": ts_utc,
+            "ts_local": ts_utc.tz_convert(TZ_LOCAL),
+            "open": float(self._data[_OPEN, p]),
+            "high": float(self._data[_HIGH, p]),
+            "low": float(self._data[_LOW, p]),
+            "close": float(self._data[_CLOSE, p]),
+            "volume": int(self._data[_VOLUME, p]),
+        }
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def clear(self):
+        self._start = self._size = 0
+        self._sessions.clear()
+        self.version += 1
+
+    def reserve(self, capacity: int):
+        """Grow to hold at least `capacity` bars (keeps contents)."""
+        if capacity <= self.capacity:
+            return
+        ts, data = self.ts.copy(), self._data[:, self._start:self._start + self._size].copy()
+        self.__init__(capacity)
+        self._write_block(ts, data)
+
+    def append(self, ts_ns: int, open_: float, high: float, low: float, close: float, volume: float):
+        """
+        Add one bar. Same timestamp as the last bar replaces it in place; an
+        older timestamp first drops every bar at or after it.
+        """
+        last = self.last_ts()
+        if last is not None and ts_ns < last:
+            self._truncate_from(ts_ns)
+            last = self.last_ts()
+
+        bar = (open_, high, low, close, volume)
+        if last is not None and ts_ns == last:
+            p = (self._start + self._size - 1) % self.capacity
+        else:
+            for stats in self._sessions.values():
+                stats.close_last()
+            if self._size == self.capacity:
+                dropped = int(self._ts[self._start])
+                self._start = (self._start + 1) % self.capacity
+                self._size -= 1
+                self._drop_sessions(lambda s: s.start_ns <= dropped)
+            p = (self._start + self._size) % self.capacity
+            self._size += 1
+
+        self._ts[p] = self._ts[p + self.capacity] = ts_ns
+        self._data[:, p] = self._data[:, p + self.capacity] = bar
+
+        last_bar = (high, low, (high + low + close) / 3.0 * volume, float(volume))
+        for stats in self._sessions.values():
+            stats.set_last(last_bar if stats.contains(ts_ns) else None)
+        self.version += 1
+
+    def merge(self, bars: pd.DataFrame):
+        """
+        Apply a sorted bar frame: bars at or after its first timestamp are
+        replaced. Small deltas go through append(); bulk loads are one copy.
+        """
+        if bars is None or len(bars) == 0:
+            return
+        ts = _series_ns(bars["ts_utc"])
+        if len(bars) <= 8:
+            values = bars[_FIELDS].to_numpy(dtype=np.float64)
+            for k in range(len(ts)):
+                self.append(int(ts[k]), *values[k])
+            return
+
+        self._truncate_from(int(ts[0]))
+        kept_ts, kept = self.ts.copy(), self._data[:, self._start:self._start + self._size].copy()
+        self._start = self._size = 0
+        self._sessions.clear()
+        self._write_block(
+            np.concatenate([kept_ts, ts]),
+            np.concatenate([kept, bars[_FIELDS].to_numpy(dtype=np.float64).T], axis=1),
+        )
+
+    def load(self, bars: pd.DataFrame):
+        """Replace the contents with a sorted bar frame."""
+        self.clear()
+        self.merge(bars)
+
+    def trim(self, cutoff_ns: int):
+        """Drop bars older than cutoff_ns."""
+        k, _ = self.bounds(cutoff_ns, None)
+        if k:
+            self._start = (self._start + k) % self.capacity
+            self._size -= k
+            self._drop_sessions(lambda s: s.start_ns < cutoff_ns)
+            self.version += 1
+
+    def _write_block(self, ts: np.ndarray, data: np.ndarray):
+        """Write ts/data (oldest first) into an empty buffer, keeping the newest capacity bars."""
+        ts, data = ts[-self.capacity:], data[:, -self.capacity:]
+        n = len(ts)
+        self._ts[:n] = self._ts[self.capacity:self.capacity + n] = ts
+        self._data[:, :n] = self._data[:, self.capacity:self.capacity + n] = data
+        self._start, self._size = 0, n
+        self.version += 1
+
+    def _truncate_from(self, ts_ns: int):
+        i, _ = self.bounds(ts_ns, None)
+        if i < self._size:
+            self._size = i
+            self._sessions.clear()
+            self.version += 1
+
+    def _drop_sessions(self, predicate):
+        for key in [k for k, s in self._sessions.items() if predicate(s)]:
+            del self._sessions[key]
+
+    # ------------------------------------------------------------------
+    # Session accumulators
+    # ------------------------------------------------------------------
+
+    def session(self, start_ns: int, end_ns: Optional[int] = None) -> SessionStats:
+        """
+        High/low/VWAP accumulator for [start_ns, end_ns) (end None = open-ended).
+
+        Built from the buffer on first use, then maintained by append().
+        """
+        key = (start_ns, end_ns)
+        stats = self._sessions.get(key)
+        if stats is not None:
+            return stats
+
+        stats = SessionStats(start_ns, end_ns)
+        i, j = self.bounds(start_ns, end_ns)
+        if i < j:
+            lo, hi = self._start + i, self._start + j
+            high, low = self._data[_HIGH, lo:hi], self._data[_LOW, lo:hi]
+            volume = self._data[_VOLUME, lo:hi]
+            pv = (high + low + self._data[_CLOSE, lo:hi]) / 3.0 * volume
+            closed = j - 1 if j == self._size else j  # Buffer's last bar is tracked separately
+            n = closed - i
+            stats.add_closed(high[:n], low[:n], pv[:n], volume[:n])
+            if closed < j:
+                stats.set_last((float(high[-1]), float(low[-1]), float(pv[-1]), float(volume[-1])))
+
+        if len(self._sessions) >= MAX_SESSIONS:
+            self._sessions.pop(next(iter(self._sessions)))
+        self._sessions[key] = stats
+        return stats
@@ -1,9 +1,21 @@
 """
 Cloud Mode Handler - Uses MotherDuck for Streamlit Cloud deployment
+
+get_database_connection() hands out cursors of ONE long-lived read-write
+connection per process (MotherDuck in cloud, gold.db locally):
+- A cursor shares the root's database instance, so it costs no handshake and
+  closing it (callers' conn.close()) leaves the root open.
+- Each cursor is independent, so every Streamlit script thread works on
+  its own cursor; only creating cursors is serialized.
+- The root is health-checked (SELECT 1) at most every HEALTH_CHECK_SECONDS
+  and reopened if the check or cursor() fails.
 """
 
 import os
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 import duckdb
 import logging
 
@@ -12,6 +24,69 @@ logger = logging.getLogger(__name__)
 # Track if we've logged DB mode already (to avoid spam)
 _db_mode_logged = False
 
+HEALTH_CHECK_SECONDS = 30.0
+
+
+class ConnectionManager:
+    """One root connection per target (md: URL or local path), handing out cursors."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._root: Optional[duckdb.DuckDBPyConnection] = None
+        self._target: Optional[str] = None
+        self._checked_at = 0.0
+
+    def cursor(self, target: str, connect) -> duckdb.DuckDBPyConnection:
+        """Cursor on the root for target; connect() opens a new root when needed."""
+        with self._lock:
+            if self._root is not None and self._target != target:
+                self._close_root()
+            if self._root is not None and time.monotonic() - self._checked_at > HEALTH_CHECK_SECONDS:
+                self._check_root()
+            if self._root is None:
+                self._root, self._target = connect(), target
+                self._checked_at = time.monotonic()
+            try:
+                return self._root.cursor()
+            except Exception as e:
+                logger.warning(f"Database connection lost ({e}), reconnecting")
+                self._close_root()
+                self._root, self._target = connect(), target
+                self._checked_at = time.monotonic()
+                return self._root.cursor()
+
+    def close(self):
+        with self._lock:
+            self._close_root()
+
+    def _check_root(self):
+        try:
+            probe = self._root.cursor()
+            try:
+                probe.execute("SELECT 1").fetchone()
+            finally:
+                probe.close()
+            self._checked_at = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Database health check failed ({e}), reconnecting")
+            self._close_root()
+
+    def _close_root(self):
+        if self._root is not None:
+            try:
+                self._root.close()
+            except Exception:
+                pass
+        self._root, self._target = None, None
+
+
+_manager = ConnectionManager()
+
+
+def close_database_connections():
+    """Close the shared root connection (next get_database_connection() reopens it)."""
+    _manager.close()
+
 
 def is_cloud_deployment() -> bool:
     """
@@ -85,13 +160,16 @@ def get_database_connection(read_only: bool = True):
     """
     Get appropriate database connection based on environment.
 
+    Returns a cursor of the process-wide connection (see ConnectionManager);
+    closing it is cheap and leaves the shared connection open.
+
     Args:
-        read_only: If True, connection is read-only (default: True).
-                   For local databases, this enforces read-only mode.
-                   For MotherDuck (cloud), permissions are handled server-side.
+        read_only: Kept for callers' intent. The shared connection is
+                   read-write (DuckDB allows one configuration per file per
+                   process); MotherDuck handles permissions server-side.
 
     Returns:
-        duckdb.Connection - MotherDuck in cloud, local gold.db otherwise
+        duckdb cursor - MotherDuck in cloud, local gold.db otherwise
     """
     global _db_mode_logged
 
@@ -123,28 +201,26 @@ def get_database_connection(read_only: bool = True):
         _db_mode_logged = True
 
     if is_cloud:
-        # Cloud mode - use MotherDuck
-        return get_motherduck_connection(read_only=read_only)
+        # Cloud mode - use MotherDuck (one handshake per process)
+        return _manager.cursor("md:projectx_prod", lambda: get_motherduck_connection(read_only=False))
     else:
         # D) Local mode - use gold.db
         app_dir = Path(__file__).parent
         db_path = app_dir.parent / "data" / "db" / "gold.db"
+        return _manager.cursor(str(db_path), lambda: _connect_local(db_path))
 
-        # Log resolved path
-        logger.info(f"Using local DuckDB at: {db_path}")
 
-        # E) Create parent directory and DB file if it doesn't exist
-        if not db_path.exists():
-            logger.info(f"Local DB file does not exist, creating: {db_path}")
-            db_path.parent.mkdir(parents=True, exist_ok=True)
+def _connect_local(db_path: Path):
+    """Open the process's read-write root connection to the local gold.db."""
+    # Log resolved path
+    logger.info(f"Using local DuckDB at: {db_path}")
 
-            # Create DB file by connecting once with read_only=False
-            temp_conn = duckdb.connect(str(db_path), read_only=False)
-            temp_conn.close()
-            logger.info(f"Created local DB file: {db_path}")
+    # E) Create parent directory if it doesn't exist (connecting creates the file)
+    if not db_path.exists():
+        logger.info(f"Local DB file does not exist, creating: {db_path}")
+        db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Now connect with requested read_only flag
-        return duckdb.connect(str(db_path), read_only=read_only)
+    return duckdb.connect(str(db_path), read_only=False)
 
 
 def get_database_path() -> str:
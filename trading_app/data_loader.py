@@ -5,11 +5,11 @@ Handles real-time 1-minute bar ingestion and rolling window management.
 
 import pandas as pd
 import duckdb
-import httpx
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 import logging
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -17,6 +17,13 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(env_path)
 
+# Repo root on path for the shared ProjectX client (lib/projectx)
+repo_root = str(Path(__file__).parent.parent)
+if repo_root not in sys.path:
+    sys.path.append(repo_root)
+from lib.projectx.projectx_client import ProjectXClient, get_client
+from bar_buffer import BarRingBuffer, to_ns
+from day_context import DayContext, get_day_context
 from config import (
     PROJECTX_USERNAME,
     PROJECTX_API_KEY,
@@ -30,6 +37,87 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# Position sizing from Kelly analysis (applied only when the ORB size filter passed)
+KELLY_MULTIPLIERS = {
+    "2300": 1.15,  # 15% increase for filtered trades
+    "0030": 1.61,  # 61% increase
+    "1100": 1.78,  # 78% increase
+    "1000": 1.23,  # 23% increase
+}
+
+LIVE_BARS_DDL = """
+    CREATE TABLE IF NOT EXISTS live_bars (
+        ts_utc TIMESTAMPTZ NOT NULL,
+        symbol VARCHAR NOT NULL,
+        open DOUBLE,
+        high DOUBLE,
+        low DOUBLE,
+        close DOUBLE,
+        volume BIGINT,
+        PRIMARY KEY (symbol, ts_utc)
+    )
+"""
+
+
+def upsert_live_bars(con: duckdb.DuckDBPyConnection, symbol: str, bars: pd.DataFrame) -> int:
+    """
+    Upsert many bars for one symbol into live_bars in ONE statement.
+
+    Args:
+        bars: DataFrame with ts_utc, open, high, low, close, volume
+
+    Returns:
+        Number of rows written
+    """
+    if bars is None or len(bars) == 0:
+        return 0
+
+    con.register("_live_bars_batch", bars)
+    try:
+        con.execute("""
+            INSERT OR REPLACE INTO live_bars
+            (ts_utc, symbol, open, high, low, close, volume)
+            SELECT ts_utc, ?, open, high, low, close, volume
+            FROM _live_bars_batch
+        """, [symbol])
+    finally:
+        con.unregister("_live_bars_batch")
+    return len(bars)
+
+
+def bars_to_frame(bars: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Convert ProjectX retrieveBars rows ({t, o, h, l, c, v}) to a bar DataFrame.
+
+    Returns:
+        DataFrame (ts_utc, open, high, low, close, volume) sorted by ts_utc
+    """
+    if not bars:
+        return pd.DataFrame(columns=["ts_utc", "open", "high", "low", "close", "volume"])
+
+    raw = pd.DataFrame(bars)
+    result = pd.DataFrame({
+        "ts_utc": pd.to_datetime(raw["t"], utc=True),
+        "open": raw["o"].astype(float),
+        "high": raw["h"].astype(float),
+        "low": raw["l"].astype(float),
+        "close": raw["c"].astype(float),
+        "volume": raw["v"].astype("int64"),
+    })
+    return result.sort_values("ts_utc").reset_index(drop=True)
+
+
+def load_today_atr(symbol: str) -> Optional[float]:
+    """
+    Get ATR(20) for today (else yesterday) from the symbol's daily_features table.
+
+    Served from the shared per-trading-day context (see day_context).
+
+    Returns:
+        ATR value or None if not available
+    """
+    return get_day_context(symbol).atr
+
 
 class LiveDataLoader:
     """
@@ -46,21 +134,25 @@ class LiveDataLoader:
         """
         self.symbol = symbol
 
-        # Use cloud_mode connection in cloud, local DB_PATH otherwise
-        from cloud_mode import get_database_connection, is_cloud_deployment
-        if is_cloud_deployment():
-            # Cloud mode - use MotherDuck
-            self.con = get_database_connection()
-            logger.info(f"Cloud mode: Connected to MotherDuck for {symbol}")
-        else:
-            # Local mode - use gold.db
-            self.con = duckdb.connect(DB_PATH, read_only=False)
-            logger.info(f"Local mode: Connected to {DB_PATH} for {symbol}")
+        # Cursor on the process-wide connection (MotherDuck in cloud, gold.db locally)
+        from cloud_mode import get_database_connection
+        self.con = get_database_connection(read_only=False)
 
         self._setup_tables()
-        self.bars_df = pd.DataFrame()  # In-memory cache
+        self.bars_df = pd.DataFrame()  # In-memory cache (ring buffer, see bars_df property)
+
+        # Incremental polling state: after one full window load, refresh() only
+        # asks ProjectX for bars after the last fully-closed bar
+        self.incremental = True
+        self._last_closed_ts: Optional[pd.Timestamp] = None
+        self._window_minutes: Optional[int] = None
 
-        # ProjectX API client
+        # Shared background feed (live_feed.LiveFeedManager); when attached and
+        # fresh, bars come from its snapshot instead of a ProjectX call
+        self.feed = None
+
+        # ProjectX API client (shared keep-alive session, see lib/projectx)
+        self.projectx: Optional[ProjectXClient] = None
         self.projectx_token: Optional[str] = None
         self.projectx_contract_id: Optional[str] = None
         self.projectx_source_symbol: Optional[str] = None
@@ -79,68 +171,39 @@ class LiveDataLoader:
     def _setup_tables(self):
         """Create live bars table if not exists (local only)."""
         try:
-            self.con.execute(f"""
-                CREATE TABLE IF NOT EXISTS live_bars (
-                    ts_utc TIMESTAMPTZ NOT NULL,
-                    symbol VARCHAR NOT NULL,
-                    open DOUBLE,
-                    high DOUBLE,
-                    low DOUBLE,
-                    close DOUBLE,
-                    volume BIGINT,
-                    PRIMARY KEY (symbol, ts_utc)
-                )
-            """)
+            self.con.execute(LIVE_BARS_DDL)
         except Exception as e:
             # In cloud mode (MotherDuck), can't create tables - that's OK
             logger.info(f"Could not create live_bars table (cloud mode): {e}")
 
     def _login_projectx(self):
-        """Login to ProjectX API and get auth token."""
-        url = f"{PROJECTX_BASE_URL}/api/Auth/loginKey"
-        payload = {
-            "userName": PROJECTX_USERNAME,
-            "apiKey": PROJECTX_API_KEY,
-        }
-        headers = {"Accept": "text/plain", "Content-Type": "application/json"}
-
-        with httpx.Client(timeout=30.0) as client:
-            r = client.post(url, json=payload, headers=headers)
-            r.raise_for_status()
-            data = r.json()
-
-        if not data.get("success"):
-            raise RuntimeError(f"ProjectX login failed: {data}")
-
-        self.projectx_token = data["token"]
-        logger.info("ProjectX authentication successful")
+        """Get an auth token from the shared ProjectX session (disk-cached, pooled)."""
+        self.projectx = get_client(PROJECTX_BASE_URL, PROJECTX_USERNAME, PROJECTX_API_KEY, PROJECTX_LIVE)
+        self.projectx_token = self.projectx.login()
 
     def _get_active_contract(self):
-        """Get active contract ID for the symbol."""
-        url = f"{PROJECTX_BASE_URL}/api/Contract/search"
-        payload = {"searchText": self.symbol, "live": PROJECTX_LIVE}
-        headers = {
-            "Accept": "text/plain",
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.projectx_token}"
-        }
-
-        with httpx.Client(timeout=30.0) as client:
-            r = client.post(url, json=payload, headers=headers)
-            r.raise_for_status()
-            data = r.json()
-
-        contracts = data.get("contracts", [])
-        active = [c for c in contracts if c.get("activeContract")]
-
-        if not active:
-            raise RuntimeError(f"No active {self.symbol} contract found")
-
-        contract = active[0]
+        """Get active contract ID for the symbol (cached per trading day)."""
+        contract = self.projectx.active_contract(self.symbol)
         self.projectx_contract_id = contract["id"]
         self.projectx_source_symbol = contract.get("name", self.symbol)
         logger.info(f"Active contract: {self.projectx_source_symbol} (ID: {self.projectx_contract_id})")
 
+    @property
+    def bars_df(self) -> pd.DataFrame:
+        """Rolling window as a DataFrame (built from the ring buffer, cached until it changes)."""
+        return self._ring().to_frame()
+
+    @bars_df.setter
+    def bars_df(self, bars: pd.DataFrame):
+        self._ring().load(bars)
+
+    def _ring(self) -> BarRingBuffer:
+        """Ring buffer holding the rolling window (created on first use)."""
+        buffer = self.__dict__.get("buffer")
+        if buffer is None:
+            buffer = self.buffer = BarRingBuffer(DATA_WINDOW_HOURS * 60 + 60)
+        return buffer
+
     def fetch_latest_bars(self, lookback_minutes: int = None) -> pd.DataFrame:
         """
         Fetch latest bars from ProjectX API or database.
@@ -153,14 +216,26 @@ class LiveDataLoader:
         """
         if lookback_minutes is None:
             lookback_minutes = DATA_WINDOW_HOURS * 60
+        self._ring().reserve(lookback_minutes + 60)
+
+        # Shared feed snapshot: no network I/O on the caller's thread
+        feed_bars = self._bars_from_feed(lookback_minutes)
+        if feed_bars is not None:
+            self.bars_df = feed_bars
+            return feed_bars
 
         # Try ProjectX API first if available
         if self.projectx_token and self.projectx_contract_id:
             try:
+                if self._can_poll_delta(lookback_minutes):
+                    return self._fetch_delta_from_projectx(lookback_minutes)
                 return self._fetch_from_projectx(lookback_minutes)
             except Exception as e:
                 logger.warning(f"ProjectX fetch failed: {e}. Falling back to database.")
 
+        # Window below doesn't come from ProjectX - next poll must be a full fetch
+        self._last_closed_ts = None
+
         # Fall back to database
         cutoff = datetime.now(TZ_UTC) - timedelta(minutes=lookback_minutes)
 
@@ -200,43 +275,62 @@ class LiveDataLoader:
         self.bars_df = result
         return result
 
-    def _fetch_from_projectx(self, lookback_minutes: int) -> pd.DataFrame:
-        """Fetch bars from ProjectX API and update database."""
-        end_utc = datetime.now(TZ_UTC)
-        start_utc = end_utc - timedelta(minutes=lookback_minutes)
+    def attach_feed(self, feed):
+        """Serve bars from a shared LiveFeedManager (see live_feed.get_live_feed)."""
+        self.feed = feed
+
+    def _bars_from_feed(self, lookback_minutes: int) -> Optional[pd.DataFrame]:
+        """Window from the attached feed's latest snapshot, or None if not usable."""
+        if self.feed is None or lookback_minutes > self.feed.lookback_minutes:
+            return None
+        snap = self.feed.snapshot_for(self.symbol)
+        if snap is None or snap.bars.empty:
+            return None
+        cutoff = datetime.now(TZ_UTC) - timedelta(minutes=lookback_minutes)
+        return snap.bars[snap.bars["ts_utc"] >= cutoff].reset_index(drop=True)
+
+    def _retrieve_bars(self, start_utc: datetime, end_utc: datetime, limit: int = 20000) -> pd.DataFrame:
+        """
+        Call ProjectX History/retrieveBars for [start_utc, end_utc].
 
+        Returns:
+            DataFrame (ts_utc, open, high, low, close, volume) sorted by ts_utc,
+            including the current forming bar
+        """
         # Format as ISO strings
         start_iso = start_utc.isoformat().replace("+00:00", "Z")
         end_iso = end_utc.isoformat().replace("+00:00", "Z")
 
-        url = f"{PROJECTX_BASE_URL}/api/History/retrieveBars"
-        payload = {
-            "contractId": self.projectx_contract_id,
-            "live": PROJECTX_LIVE,
-            "startTime": start_iso,
-            "endTime": end_iso,
-            "unit": 2,  # Minutes
-            "unitNumber": 1,  # 1-minute bars
-            "limit": 20000,
-            "includePartialBar": True,  # Include current forming bar
-        }
-        headers = {
-            "Accept": "text/plain",
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.projectx_token}"
-        }
+        bars = self.projectx.retrieve_bars(
+            self.projectx_contract_id, start_iso, end_iso, limit=limit, include_partial=True
+        )
+        return bars_to_frame(bars)
 
-        with httpx.Client(timeout=60.0) as client:
-            r = client.post(url, json=payload, headers=headers)
-            r.raise_for_status()
-            data = r.json()
+    def _mark_closed(self, bars: pd.DataFrame, as_of_utc: datetime):
+        """Remember the newest bar that had fully closed at as_of_utc (bar ts = minute start)."""
+        if bars.empty:
+            return
+        closed = bars["ts_utc"][bars["ts_utc"] <= as_of_utc - timedelta(minutes=1)]
+        if not closed.empty:
+            self._last_closed_ts = closed.max()
+
+    def _can_poll_delta(self, lookback_minutes: int) -> bool:
+        """True if bars_df holds a full ProjectX window that a delta poll can extend."""
+        if not self.incremental or self._last_closed_ts is None or len(self._ring()) == 0:
+            return False
+        if lookback_minutes != self._window_minutes:
+            return False
+        # After a long gap (sleep, outage) a full reload is cheaper than a huge delta
+        return self._last_closed_ts >= datetime.now(TZ_UTC) - timedelta(minutes=lookback_minutes)
 
-        if not data.get("success"):
-            raise RuntimeError(f"retrieveBars failed: {data}")
+    def _fetch_from_projectx(self, lookback_minutes: int) -> pd.DataFrame:
+        """Fetch the full lookback window from ProjectX API and update database."""
+        end_utc = datetime.now(TZ_UTC)
+        start_utc = end_utc - timedelta(minutes=lookback_minutes)
 
-        bars = data.get("bars") or []
+        bars = self._retrieve_bars(start_utc, end_utc)
 
-        if not bars:
+        if bars.empty:
             logger.warning(f"No bars returned from ProjectX for {self.symbol}")
             return pd.DataFrame(columns=["ts_utc", "open", "high", "low", "close", "volume"])
 
@@ -245,35 +339,15 @@ class LiveDataLoader:
 
         if is_cloud_deployment():
             # Cloud mode: Process bars directly without database writes
-            rows = []
-            for bar in bars:
-                rows.append({
-                    "ts_utc": pd.to_datetime(bar["t"]),
-                    "open": float(bar["o"]),
-                    "high": float(bar["h"]),
-                    "low": float(bar["l"]),
-                    "close": float(bar["c"]),
-                    "volume": int(bar["v"]),
-                })
-
-            result = pd.DataFrame(rows)
+            result = bars
             result["ts_local"] = result["ts_utc"].dt.tz_convert(TZ_LOCAL)
 
             self.bars_df = result
             logger.info(f"Fetched {len(bars)} bars from ProjectX for {self.symbol} (cloud mode)")
-            return result
 
         else:
-            # Local mode: Insert into database
-            for bar in bars:
-                self.insert_bar({
-                    "ts_utc": bar["t"],
-                    "open": float(bar["o"]),
-                    "high": float(bar["h"]),
-                    "low": float(bar["l"]),
-                    "close": float(bar["c"]),
-                    "volume": int(bar["v"]),
-                })
+            # Local mode: Upsert the whole window in one statement
+            self.insert_bars(bars)
 
             # Fetch from database to get standardized format
             cutoff = datetime.now(TZ_UTC) - timedelta(minutes=lookback_minutes)
@@ -289,7 +363,36 @@ class LiveDataLoader:
 
             self.bars_df = result
             logger.info(f"Fetched {len(bars)} bars from ProjectX for {self.symbol}")
-            return result
+
+        self._window_minutes = lookback_minutes
+        self._mark_closed(bars, end_utc)
+        return result
+
+    def _fetch_delta_from_projectx(self, lookback_minutes: int) -> pd.DataFrame:
+        """
+        Fetch only bars after the last fully-closed bar (plus the forming bar).
+
+        Closed bars already in the ring buffer are kept as-is; the previous
+        forming bar is replaced in place. Only the returned rows are persisted.
+        """
+        end_utc = datetime.now(TZ_UTC)
+        start_utc = self._last_closed_ts + timedelta(minutes=1)
+        limit = min(20000, int((end_utc - start_utc).total_seconds() // 60) + 2)
+
+        new_bars = self._retrieve_bars(start_utc, end_utc, limit=limit)
+
+        from cloud_mode import is_cloud_deployment
+        if not is_cloud_deployment():
+            self.insert_bars(new_bars)
+
+        buffer = self._ring()
+        buffer.merge(new_bars)
+        buffer.trim(to_ns(end_utc - timedelta(minutes=lookback_minutes)))
+        result = buffer.to_frame()
+
+        self._mark_closed(new_bars, end_utc)
+        logger.debug(f"Delta poll: {len(new_bars)} bars from ProjectX for {self.symbol}")
+        return result
 
     def get_bars_in_range(self, start_local: datetime, end_local: datetime) -> pd.DataFrame:
         """
@@ -302,37 +405,32 @@ class LiveDataLoader:
         Returns:
             DataFrame of bars in range
         """
-        if self.bars_df.empty:
-            self.fetch_latest_bars()
-
-        if self.bars_df.empty:
+        buffer = self._ensure_bars()
+        if buffer is None:
             return pd.DataFrame()
 
-        # Convert to UTC for filtering
-        start_utc = start_local.astimezone(TZ_UTC)
-        end_utc = end_local.astimezone(TZ_UTC)
-
-        mask = (self.bars_df["ts_utc"] >= start_utc) & (self.bars_df["ts_utc"] < end_utc)
-        return self.bars_df[mask].copy()
+        # Binary search on the buffer's UTC timestamps
+        return buffer.to_frame(to_ns(start_local), to_ns(end_local))
 
     def get_latest_bar(self) -> Optional[dict]:
         """Get the most recent bar."""
-        if self.bars_df.empty:
-            self.fetch_latest_bars()
+        buffer = self._ensure_bars()
+        return buffer.latest() if buffer is not None else None
 
-        if self.bars_df.empty:
+    def get_last_closed_bar(self, now_local: Optional[datetime] = None) -> Optional[dict]:
+        """Most recent bar that has fully closed (bar ts before the current minute)."""
+        buffer = self._ensure_bars()
+        if buffer is None:
             return None
+        now = now_local or datetime.now(TZ_LOCAL)
+        return buffer.last_before(to_ns(now.replace(second=0, microsecond=0)))
 
-        latest = self.bars_df.iloc[-1]
-        return {
-            "ts_utc": latest["ts_utc"],
-            "ts_local": latest["ts_local"],
-            "open": float(latest["open"]),
-            "high": float(latest["high"]),
-            "low": float(latest["low"]),
-            "close": float(latest["close"]),
-            "volume": int(latest["volume"]),
-        }
+    def get_recent_bar_arrays(self, count: int) -> Optional[Dict[str, Any]]:
+        """high/low/close of the last `count` bars as NumPy views of the ring buffer."""
+        buffer = self._ensure_bars()
+        if buffer is None:
+            return None
+        return {name: buffer.column(name)[-count:] for name in ("high", "low", "close")}
 
     def get_session_high_low(self, session_start: datetime, session_end: datetime) -> Optional[dict]:
         """
@@ -345,13 +443,17 @@ class LiveDataLoader:
         Returns:
             {"high": float, "low": float, "range": float} or None
         """
-        bars = self.get_bars_in_range(session_start, session_end)
+        buffer = self._ensure_bars()
+        if buffer is None:
+            return None
 
-        if bars.empty:
+        # Running accumulator, updated as bars arrive (no rescan per call)
+        stats = buffer.session(to_ns(session_start), to_ns(session_end))
+        if not stats.count:
             return None
 
-        high = float(bars["high"].max())
-        low = float(bars["low"].min())
+        high = float(stats.high)
+        low = float(stats.low)
 
         return {
             "high": high,
@@ -370,25 +472,20 @@ class LiveDataLoader:
         Returns:
             VWAP value or None
         """
-        if end_local is None:
-            end_local = datetime.now(TZ_LOCAL)
-
-        bars = self.get_bars_in_range(start_local, end_local)
-
-        if bars.empty:
+        buffer = self._ensure_bars()
+        if buffer is None:
             return None
 
-        # VWAP = sum(price * volume) / sum(volume)
-        bars["typical_price"] = (bars["high"] + bars["low"] + bars["close"]) / 3
-        bars["pv"] = bars["typical_price"] * bars["volume"]
-
-        total_pv = bars["pv"].sum()
-        total_volume = bars["volume"].sum()
-
-        if total_volume == 0:
-            return None
+        # VWAP = sum(typical price * volume) / sum(volume), kept as running sums
+        stats = buffer.session(to_ns(start_local), to_ns(end_local) if end_local is not None else None)
+        return stats.vwap
 
-        return float(total_pv / total_volume)
+    def _ensure_bars(self) -> Optional[BarRingBuffer]:
+        """Ring buffer, loading the window first if it is empty; None if no bars."""
+        buffer = self._ring()
+        if len(buffer) == 0:
+            self.fetch_latest_bars()
+        return buffer if len(buffer) else None
 
     def insert_bar(self, bar: dict):
         """
@@ -411,24 +508,30 @@ class LiveDataLoader:
             bar["volume"],
         ])
 
+    def insert_bars(self, bars: pd.DataFrame) -> int:
+        """
+        Upsert many bars into live_bars in ONE statement.
+
+        Args:
+            bars: DataFrame with ts_utc, open, high, low, close, volume
+
+        Returns:
+            Number of rows written
+        """
+        return upsert_live_bars(self.con, self.symbol, bars)
+
     def backfill_from_gold_db(self, gold_db_path: str, days: int = 2):
         """
         Backfill recent data from existing gold.db for testing.
 
+        Runs as a single INSERT ... SELECT (gold.db ATTACHed read-only when it
+        is a different file), so no rows pass through Python.
+
         Args:
             gold_db_path: Path to gold.db
             days: How many days to backfill
         """
         logger.info(f"Backfilling {days} days from {gold_db_path} for {self.symbol}")
-
-        # If gold_db_path is same as DB_PATH, use existing connection
-        from pathlib import Path
-        if Path(gold_db_path).resolve() == Path(DB_PATH).resolve():
-            gold_con = self.con
-            close_con = False
-        else:
-            gold_con = duckdb.connect(gold_db_path, read_only=True)
-            close_con = True
         cutoff = datetime.now(TZ_UTC) - timedelta(days=days)
 
         # Determine table name based on symbol
@@ -437,51 +540,71 @@ class LiveDataLoader:
             symbol_filter = ""  # No symbol column in bars_1m_nq
         else:
             table_name = "bars_1m"
-            symbol_filter = "WHERE symbol = ?"
+            symbol_filter = "symbol = ? AND"
 
-        # Build query
-        if symbol_filter:
-            query = f"""
-                SELECT ts_utc, open, high, low, close, volume
-                FROM {table_name}
-                {symbol_filter} AND ts_utc >= ?
-                ORDER BY ts_utc
+        def select_sql(source: str) -> str:
+            return f"""
+                SELECT ts_utc, ? AS symbol, open, high, low, close, volume
+                FROM {source}
+                WHERE {symbol_filter} ts_utc >= ?
             """
-            params = [self.symbol, cutoff]
+
+        params = [self.symbol] + ([self.symbol] if symbol_filter else []) + [cutoff]
+
+        # If gold_db_path is same as DB_PATH, copy within the existing connection
+        from pathlib import Path
+        if Path(gold_db_path).resolve() == Path(DB_PATH).resolve():
+            written = self._upsert_select(select_sql(table_name), params)
         else:
-            query = f"""
-                SELECT ts_utc, open, high, low, close, volume
-                FROM {table_name}
-                WHERE ts_utc >= ?
-                ORDER BY ts_utc
-            """
-            params = [cutoff]
-
-        bars = gold_con.execute(query, params).fetchall()
-        logger.info(f"Found {len(bars)} bars to backfill from {table_name}")
-
-        for bar in bars:
-            self.insert_bar({
-                "ts_utc": bar[0],
-                "open": bar[1],
-                "high": bar[2],
-                "low": bar[3],
-                "close": bar[4],
-                "volume": bar[5],
-            })
-
-        if close_con:
-            gold_con.close()
-        logger.info("Backfill complete")
-
-    def refresh(self):
-        """Refresh in-memory cache from database."""
+            try:
+                # ATTACH takes no parameters: inline the path as an escaped literal
+                src_literal = str(gold_db_path).replace("'", "''")
+                self.con.execute(f"ATTACH '{src_literal}' AS backfill_src (READ_ONLY)")
+            except Exception as e:
+                # Already open elsewhere in this process - read it through its own connection
+                logger.info(f"ATTACH failed ({e}); backfilling via a separate connection")
+                gold_con = duckdb.connect(gold_db_path, read_only=True)
+                try:
+                    bars = gold_con.execute(select_sql(table_name), params).fetchdf()
+                finally:
+                    gold_con.close()
+                written = self.insert_bars(bars)
+            else:
+                try:
+                    written = self._upsert_select(select_sql(f"backfill_src.{table_name}"), params)
+                finally:
+                    self.con.execute("DETACH backfill_src")
+
+        logger.info(f"Backfill complete: {written} bars from {table_name}")
+
+    def _upsert_select(self, select_sql: str, params: list) -> int:
+        """INSERT OR REPLACE INTO live_bars from a (symbol-tagged) SELECT; returns rows written."""
+        row = self.con.execute(f"""
+            INSERT OR REPLACE INTO live_bars
+            (ts_utc, symbol, open, high, low, close, volume)
+            {select_sql}
+        """, params).fetchone()
+        return int(row[0]) if row else 0
+
+    def refresh(self, full: bool = False):
+        """
+        Refresh in-memory cache (ProjectX delta poll when possible, else full window).
+
+        Args:
+            full: Force a full DATA_WINDOW_HOURS reload
+        """
+        if full:
+            self._last_closed_ts = None
         self.fetch_latest_bars()
 
     def close(self):
         """Close database connection."""
         self.con.close()
 
+    def day_context(self) -> DayContext:
+        """ATR, ORB size thresholds and prior-day levels for today (cached per trading day)."""
+        return get_day_context(self.symbol)
+
     def get_today_atr(self) -> Optional[float]:
         """
         Get ATR(20) for today from daily_features table.
@@ -489,55 +612,11 @@ class LiveDataLoader:
         Returns:
             ATR value or None if not available
         """
-        today = datetime.now(TZ_LOCAL).date()
-
-        # Map symbol to instrument name and features table
-        if self.symbol == "NQ" or self.symbol == "MNQ":
-            instrument = "NQ"
-            features_table = "daily_features_v2_nq"
-        elif self.symbol == "MPL":
-            instrument = "MPL"
-            features_table = "daily_features_v2_mpl"
-        else:
-            instrument = "MGC"
-            features_table = "daily_features_v2"
+        return self.day_context().atr
 
-        # Try from gold.db if available (separate tables per instrument)
-        try:
-            # Use absolute path to avoid working directory issues
-            gold_db_path = os.getenv("GOLD_DB_PATH", str(Path(__file__).parent.parent / "data/db/gold.db"))
-            gold_con = duckdb.connect(gold_db_path, read_only=True)
-            result = gold_con.execute(f"""
-                SELECT atr_20
-                FROM {features_table}
-                WHERE date_local = ? AND instrument = ?
-            """, [today, instrument]).fetchone()
-
-            if result and result[0] is not None:
-                gold_con.close()
-                return float(result[0])
-
-            # Try yesterday if today not available yet
-            yesterday = today - timedelta(days=1)
-            result = gold_con.execute(f"""
-                SELECT atr_20
-                FROM {features_table}
-                WHERE date_local = ? AND instrument = ?
-            """, [yesterday, instrument]).fetchone()
-
-            gold_con.close()
-
-            if result and result[0] is not None:
-                return float(result[0])
-        except Exception as e:
-            # In cloud mode, gold.db doesn't exist - this is expected
-            from cloud_mode import is_cloud_deployment
-            if not is_cloud_deployment():
-                logger.warning(f"Could not get ATR from gold.db: {e}")
-            else:
-                logger.debug(f"ATR not available from gold.db in cloud mode (expected): {e}")
-
-        return None
+    def get_prior_day_levels(self) -> Optional[Dict[str, float]]:
+        """Previous trading day's Asia/London/NY high/low from daily_features (None if missing)."""
+        return self.day_context().prior_day
 
     def check_orb_size_filter(self, orb_high: float, orb_low: float, orb_name: str) -> dict:
         """
@@ -558,28 +637,13 @@ class LiveDataLoader:
                 "reason": str
             }
         """
-        from config import ENABLE_ORB_SIZE_FILTERS, MGC_ORB_SIZE_FILTERS, NQ_ORB_SIZE_FILTERS
-
-        # Select instrument-specific filters
-        if self.symbol in ["NQ", "MNQ"]:
-            ORB_SIZE_FILTERS = NQ_ORB_SIZE_FILTERS
-        else:
-            ORB_SIZE_FILTERS = MGC_ORB_SIZE_FILTERS
+        from config import ENABLE_ORB_SIZE_FILTERS
 
+        context = self.day_context()
         orb_size = orb_high - orb_low
 
-        # Check if filter enabled and exists for this ORB
-        if not ENABLE_ORB_SIZE_FILTERS or orb_name not in ORB_SIZE_FILTERS:
-            return {
-                "pass": True,
-                "orb_size": orb_size,
-                "orb_size_norm": None,
-                "threshold": None,
-                "atr": None,
-                "reason": "No filter for this ORB"
-            }
-
-        threshold = ORB_SIZE_FILTERS[orb_name]
+        # Threshold from validated_setups (None = no filter for this ORB)
+        threshold = context.orb_size_thresholds.get(orb_name) if ENABLE_ORB_SIZE_FILTERS else None
 
         if threshold is None:
             return {
@@ -592,7 +656,7 @@ class LiveDataLoader:
             }
 
         # Get ATR
-        atr = self.get_today_atr()
+        atr = context.atr
 
         if atr is None or atr == 0:
             # Cannot apply filter without ATR - default to pass
@@ -641,14 +705,6 @@ class LiveDataLoader:
         Returns:
             Position size multiplier (1.0 = baseline, >1.0 = increased size)
         """
-        # Position sizing from Kelly analysis
-        KELLY_MULTIPLIERS = {
-            "2300": 1.15,  # 15% increase for filtered trades
-            "0030": 1.61,  # 61% increase
-            "1100": 1.78,  # 78% increase
-            "1000": 1.23,  # 23% increase
-        }
-
         # Only increase size if filter PASSED (small ORB, better edge)
         if filter_passed and orb_name in KELLY_MULTIPLIERS:
             return KELLY_MULTIPLIERS[orb_name]
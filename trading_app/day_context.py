@@ -0,0 +1,159 @@
+"""
+DAY CONTEXT - Per-trading-day reference data shared by every LiveDataLoader
+
+ATR(20), ORB size-filter thresholds and the prior day's session levels only
+change once per trading day, so they are loaded once per instrument at the
+Brisbane trade-date rollover (09:00, same boundary as the ProjectX contract
+cache) and served from memory on every Streamlit rerun.
+
+- Cache is process-wide and keyed by instrument (MGC, NQ, MPL), so the hub,
+  the scanner and the background feed share one copy.
+- An entry is rebuilt when the trade date changes or when
+  bump_setups_version() is called after validated_setups is modified.
+
+Usage:
+    ctx = get_day_context("MGC")
+    ctx.atr, ctx.orb_size_thresholds.get("2300"), ctx.prior_day
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+import duckdb
+
+from config import TZ_LOCAL
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAY_START_HOUR = 9
+
+# symbol -> (instrument, daily features table)
+_FEATURE_TABLES = {
+    "NQ": ("NQ", "daily_features_v2_nq"),
+    "MNQ": ("NQ", "daily_features_v2_nq"),
+    "MPL": ("MPL", "daily_features_v2_mpl"),
+    "PL": ("MPL", "daily_features_v2_mpl"),
+}
+_DEFAULT_FEATURES = ("MGC", "daily_features_v2")
+
+PRIOR_DAY_COLUMNS = ["asia_high", "asia_low", "london_high", "london_low", "ny_high", "ny_low"]
+
+_CONTEXTS: Dict[str, "DayContext"] = {}
+_CONTEXTS_LOCK = threading.Lock()
+_setups_version = 0
+
+
+@dataclass(frozen=True)
+class DayContext:
+    """Reference data for one instrument on one trading day."""
+    instrument: str
+    trade_date: date
+    setups_version: int
+    atr: Optional[float] = None                                  # ATR(20), today's row else yesterday's
+    orb_size_thresholds: Dict[str, Optional[float]] = field(default_factory=dict)
+    prior_day: Optional[Dict[str, float]] = None                 # PRIOR_DAY_COLUMNS of trade_date - 1
+
+
+def trade_date_for(now_local: datetime) -> date:
+    """Brisbane trading date (09:00 -> 09:00)."""
+    return (now_local - timedelta(hours=TRADING_DAY_START_HOUR)).date()
+
+
+def instrument_for(symbol: str) -> str:
+    return _FEATURE_TABLES.get(symbol, _DEFAULT_FEATURES)[0]
+
+
+def bump_setups_version():
+    """Mark validated_setups as changed: every context is rebuilt on next use."""
+    global _setups_version
+    with _CONTEXTS_LOCK:
+        _setups_version += 1
+
+
+def get_day_context(symbol: str, now_local: Optional[datetime] = None) -> DayContext:
+    """Shared context for symbol's instrument, built on first use each trading day."""
+    instrument, table = _FEATURE_TABLES.get(symbol, _DEFAULT_FEATURES)
+    trade_date = trade_date_for(now_local or datetime.now(TZ_LOCAL))
+    with _CONTEXTS_LOCK:
+        ctx = _CONTEXTS.get(instrument)
+        if ctx is None or ctx.trade_date != trade_date or ctx.setups_version != _setups_version:
+            ctx = _CONTEXTS[instrument] = _build_context(instrument, table, trade_date, _setups_version)
+        return ctx
+
+
+def clear_day_contexts():
+    with _CONTEXTS_LOCK:
+        _CONTEXTS.clear()
+
+
+def _build_context(instrument: str, table: str, trade_date: date, version: int) -> DayContext:
+    atr, prior_day = _load_features(instrument, table, trade_date)
+    logger.info(f"Day context for {instrument} {trade_date}: ATR={atr}")
+    return DayContext(
+        instrument=instrument,
+        trade_date=trade_date,
+        setups_version=version,
+        atr=atr,
+        orb_size_thresholds=_load_size_thresholds(instrument),
+        prior_day=prior_day,
+    )
+
+
+def _load_features(instrument: str, table: str, trade_date: date):
+    """(ATR for today else yesterday, yesterday's session levels) in one daily_features read."""
+    yesterday = trade_date - timedelta(days=1)
+    try:
+        # Explicit GOLD_DB_PATH is opened directly; otherwise a cursor on the shared
+        # connection (a second read-only handle on the same file is refused by DuckDB)
+        gold_db_path = os.getenv("GOLD_DB_PATH")
+        if gold_db_path:
+            gold_con = duckdb.connect(gold_db_path, read_only=True)
+        else:
+            from cloud_mode import get_database_connection
+            gold_con = get_database_connection()
+        with gold_con:
+            rows = gold_con.execute(f"""
+                SELECT date_local, atr_20, {", ".join(PRIOR_DAY_COLUMNS)}
+                FROM {table}
+                WHERE instrument = ? AND date_local IN (?, ?)
+            """, [instrument, trade_date, yesterday]).fetchall()
+    except Exception as e:
+        # In cloud mode the features may be missing - this is expected
+        from cloud_mode import is_cloud_deployment
+        if not is_cloud_deployment():
+            logger.warning(f"Could not get daily features from gold.db: {e}")
+        else:
+            logger.debug(f"Daily features not available from gold.db in cloud mode (expected): {e}")
+        return None, None
+
+    by_date = {row[0]: row[1:] for row in rows}
+    today_row, prior_row = by_date.get(trade_date), by_date.get(yesterday)
+
+    atr = None
+    for row in (today_row, prior_row):
+        if row is not None and row[0] is not None:
+            atr = float(row[0])
+            break
+
+    prior_day = None
+    if prior_row is not None:
+        prior_day = {col: float(v) for col, v in zip(PRIOR_DAY_COLUMNS, prior_row[1:]) if v is not None}
+    return atr, prior_day or None
+
+
+def _load_size_thresholds(instrument: str) -> Dict[str, Optional[float]]:
+    """One threshold per ORB from validated_setups (strictest when an ORB has several setups)."""
+    from config_generator import load_instrument_configs
+
+    _, filters = load_instrument_configs(instrument)
+    thresholds = {}
+    for orb_time, values in filters.items():
+        if not isinstance(values, list):
+            values = [values]
+        values = [v for v in values if v is not None]
+        thresholds[orb_time] = min(values) if values else None
+    return thresholds
@@ -285,6 +285,10 @@ def promote_candidate_to_validated_setups(candidate_id: int, actor: str) -> str:
         # 7) Commit transaction
         conn.commit()
 
+        # Live loaders pick up the new thresholds on their next read
+        from day_context import bump_setups_version
+        bump_setups_version()
+
         logger.info(
             f"Successfully promoted candidate {candidate_id} → validated_setups.setup_id={setup_id} "
             f"by {actor}"
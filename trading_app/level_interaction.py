@@ -0,0 +1,63 @@
+"""
+LEVEL INTERACTION - Vectorized bar-vs-level checks for the live strategies
+
+Answers the questions the liquidity/cascade evaluators ask about price levels,
+for many levels at once, on plain NumPy bar arrays (e.g. ring-buffer views):
+
+    failed = closed_back_inside(high, low, close, levels, directions)   # bool per level
+    counts = closes_beyond(close, levels, directions)                   # int per level
+    first  = first_touch(high, low, levels, directions)                 # bar index per level, -1 = none
+
+Directions are "UP" (level above price, swept by highs) or "DOWN" (level
+below price, swept by lows); one string applies to every level.
+Each call is one (levels x bars) broadcast - no per-bar Python loop.
+"""
+
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+Directions = Union[str, Sequence[str]]
+
+
+def _prepare(levels, directions: Directions) -> Tuple[np.ndarray, np.ndarray]:
+    """levels as a (k, 1) column and a matching (k, 1) bool mask of UP levels."""
+    levels = np.atleast_1d(np.asarray(levels, dtype=np.float64))
+    if isinstance(directions, str):
+        directions = [directions] * len(levels)
+    up = np.asarray([d == "UP" for d in directions], dtype=bool)
+    if len(up) != len(levels):
+        raise ValueError(f"{len(levels)} levels but {len(up)} directions")
+    return levels[:, None], up[:, None]
+
+
+def _beyond(values: np.ndarray, levels: np.ndarray, up: np.ndarray) -> np.ndarray:
+    """(k, n) mask: value strictly above an UP level / below a DOWN level."""
+    values = np.asarray(values, dtype=np.float64)[None, :]
+    return np.where(up, values > levels, values < levels)
+
+
+def closed_back_inside(high, low, close, levels, directions: Directions) -> np.ndarray:
+    """
+    Acceptance failure per level: some bar traded beyond the level but closed
+    back inside it (high > level and close < level for UP, mirrored for DOWN).
+    """
+    levels, up = _prepare(levels, directions)
+    high, low, close = (np.asarray(a, dtype=np.float64)[None, :] for a in (high, low, close))
+    swept = np.where(up, high > levels, low < levels)
+    back_inside = np.where(up, close < levels, close > levels)
+    return (swept & back_inside).any(axis=1)
+
+
+def closes_beyond(close, levels, directions: Directions) -> np.ndarray:
+    """Number of closes beyond each level (acceptance = count >= N)."""
+    levels, up = _prepare(levels, directions)
+    return _beyond(close, levels, up).sum(axis=1)
+
+
+def first_touch(high, low, levels, directions: Directions) -> np.ndarray:
+    """Index of the first bar reaching each level (high >= UP level, low <= DOWN level), -1 if none."""
+    levels, up = _prepare(levels, directions)
+    high, low = (np.asarray(a, dtype=np.float64)[None, :] for a in (high, low))
+    touched = np.where(up, high >= levels, low <= levels)
+    return np.where(touched.any(axis=1), touched.argmax(axis=1), -1)
@@ -0,0 +1,370 @@
+"""
+LIVE FEED - Concurrent multi-instrument ProjectX polling
+Polls every configured instrument in one asyncio round-trip and publishes
+immutable per-instrument snapshots that the UI reads without blocking.
+
+- One background thread owns an asyncio loop and an httpx.AsyncClient; each
+  poll fires retrieveBars for MGC, NQ and MPL concurrently (asyncio.gather),
+  so a scan costs one request latency, not three.
+- Auth and contract lookups reuse the shared ProjectX client (cached token,
+  contracts cached per trading day).
+- Each instrument keeps a BarRingBuffer of the last N 1m bars; after
+  the first full window only bars after the last closed bar are requested.
+- snapshot() returns the last published dict; it never waits on the network.
+- Locally the feed also upserts each poll's new bars into live_bars (one
+  transaction per poll, off the event loop).
+
+get_live_feed() returns the one running feed for the process, so every
+Streamlit session (browser tab) shares a single poller instead of each rerun
+fetching on its own; LiveDataLoader.attach_feed() serves its bars from it.
+Run this module directly for a headless ingest process that only writes
+live_bars.
+
+Usage:
+    feed = get_live_feed()
+    loader.attach_feed(feed)
+    prices, atrs, orb_data = feed.scanner_inputs(scanner.orb_times)
+
+    python trading_app/live_feed.py --interval 5
+"""
+
+import argparse
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import duckdb
+import httpx
+import pandas as pd
+
+from config import (
+    PROJECTX_USERNAME,
+    PROJECTX_API_KEY,
+    PROJECTX_BASE_URL,
+    PROJECTX_LIVE,
+    DATA_WINDOW_HOURS,
+    DB_PATH,
+    TZ_LOCAL,
+    TZ_UTC,
+)
+from bar_buffer import BAR_COLUMNS, BarRingBuffer, to_ns
+from data_loader import LIVE_BARS_DDL, bars_to_frame, load_today_atr, upsert_live_bars
+from lib.projectx.projectx_client import ProjectXClient, get_client
+
+logger = logging.getLogger(__name__)
+
+# Scanner instrument -> ProjectX contract search symbol
+FEED_SYMBOLS = {"MGC": "MGC", "NQ": "MNQ", "MPL": "MPL"}
+
+_FEED: Optional["LiveFeedManager"] = None
+_FEED_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class InstrumentSnapshot:
+    """Published state for one instrument (treat bars as read-only)."""
+    symbol: str
+    contract_id: Optional[str]
+    bars: pd.DataFrame
+    price: Optional[float]
+    atr: Optional[float]
+    updated_at: Optional[datetime]
+    error: Optional[str] = None
+
+    def latest_bar(self) -> Optional[dict]:
+        if self.bars.empty:
+            return None
+        return self.bars.iloc[-1].to_dict()
+
+
+@dataclass
+class _InstrumentState:
+    symbol: str
+    buffer: BarRingBuffer
+    contract_id: Optional[str] = None
+    last_closed_ts: Optional[pd.Timestamp] = None
+    atr: Optional[float] = None
+    atr_date: Optional[date] = None
+    new_bars: Optional[pd.DataFrame] = field(default=None, repr=False)
+    snapshot: Optional[InstrumentSnapshot] = field(default=None, repr=False)
+
+
+class LiveFeedManager:
+    """
+    Background multi-instrument feed.
+
+    All network I/O happens on the feed thread; readers only ever see a fully
+    built dict of InstrumentSnapshots swapped in after each poll.
+    """
+
+    def __init__(
+        self,
+        symbols: Optional[List[str]] = None,
+        lookback_minutes: Optional[int] = None,
+        poll_interval: float = 5.0,
+        client: Optional[ProjectXClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        persist: Optional[bool] = None,
+        db_path: str = DB_PATH,
+    ):
+        """
+        Args:
+            symbols: Scanner instruments to poll (default: MGC, NQ, MPL)
+            lookback_minutes: Bars kept per instrument (default: DATA_WINDOW_HOURS)
+            poll_interval: Seconds between polls
+            client: ProjectX client (default: the shared one from .env)
+            transport: Optional httpx transport for the async client (tests)
+            persist: Upsert new bars into live_bars (default: local mode only)
+            db_path: DuckDB file for live_bars
+        """
+        self.symbols = list(symbols or FEED_SYMBOLS)
+        self.lookback_minutes = lookback_minutes or DATA_WINDOW_HOURS * 60
+        self.poll_interval = poll_interval
+        self.client = client or get_client(PROJECTX_BASE_URL, PROJECTX_USERNAME, PROJECTX_API_KEY, PROJECTX_LIVE)
+        self._transport = transport
+        if persist is None:
+            from cloud_mode import is_cloud_deployment
+            persist = not is_cloud_deployment()
+        self.persist = persist
+        self.db_path = db_path
+        self._con: Optional[duckdb.DuckDBPyConnection] = None
+
+        self._states = {s: _InstrumentState(s, BarRingBuffer(self.lookback_minutes + 1)) for s in self.symbols}
+        self._snapshots: Dict[str, InstrumentSnapshot] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Reader side (UI thread)
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, InstrumentSnapshot]:
+        """Latest published snapshots by symbol (empty until the first poll lands)."""
+        return self._snapshots
+
+    def snapshot_for(self, symbol: str, max_age_seconds: Optional[float] = None) -> Optional[InstrumentSnapshot]:
+        """
+        Snapshot for a scanner or contract symbol (NQ or MNQ), if fresh.
+
+        Args:
+            max_age_seconds: Oldest acceptable poll (default: 3 poll intervals, at least 30s)
+        """
+        if not self.is_running():
+            return None
+        key = next((k for k, v in FEED_SYMBOLS.items() if symbol in (k, v)), symbol)
+        snap = self._snapshots.get(key)
+        if snap is None or snap.updated_at is None:
+            return None
+        if max_age_seconds is None:
+            max_age_seconds = max(30.0, 3 * self.poll_interval)
+        if (datetime.now(TZ_UTC) - snap.updated_at).total_seconds() > max_age_seconds:
+            return None
+        return snap
+
+    def scanner_inputs(
+        self, orb_times: Dict[str, Tuple[int, int, int]]
+    ) -> Tuple[Dict[str, float], Dict[str, float], Dict[str, Dict[str, Dict]]]:
+        """
+        Prices, ATRs and completed ORB levels for SetupScanner.scan_all_setups().
+
+        Args:
+            orb_times: {orb_name: (hour, minute, duration)} (SetupScanner.orb_times)
+        """
+        now_local = datetime.now(TZ_LOCAL)
+        trade_day = (now_local - timedelta(hours=9)).date()
+
+        prices, atrs, orb_data = {}, {}, {}
+        for symbol, snap in self._snapshots.items():
+            if snap.price is not None:
+                prices[symbol] = snap.price
+            if snap.atr is not None:
+                atrs[symbol] = snap.atr
+            if snap.bars.empty:
+                continue
+
+            levels = {}
+            for orb_name, (hour, minute, duration) in orb_times.items():
+                start = datetime(trade_day.year, trade_day.month, trade_day.day, hour, minute, tzinfo=TZ_LOCAL)
+                if hour < 9:
+                    start += timedelta(days=1)
+                end = start + timedelta(minutes=duration)
+                if end > now_local:
+                    continue
+                window = snap.bars[(snap.bars["ts_local"] >= start) & (snap.bars["ts_local"] < end)]
+                if window.empty:
+                    continue
+                high, low = float(window["high"].max()), float(window["low"].min())
+                levels[orb_name] = {"high": high, "low": low, "size": high - low}
+            orb_data[symbol] = levels
+
+        return prices, atrs, orb_data
+
+    # ------------------------------------------------------------------
+    # Feed thread
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the feed thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._run()), name="live-feed", daemon=True)
+        self._thread.start()
+        logger.info(f"Live feed started for {', '.join(self.symbols)} (every {self.poll_interval}s)")
+
+    def stop(self, timeout: float = 10.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+
+    def is_running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def http_client(self) -> httpx.AsyncClient:
+        """AsyncClient for the feed loop (one connection per instrument stays warm)."""
+        return httpx.AsyncClient(
+            base_url=self.client.base_url,
+            transport=self._transport,
+            headers={"Accept": "text/plain", "Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=2 * len(self.symbols), max_keepalive_connections=len(self.symbols)),
+        )
+
+    async def _run(self):
+        async with self.http_client() as http:
+            while not self._stop.is_set():
+                started = time.monotonic()
+                try:
+                    await self.poll_once(http)
+                except Exception as e:
+                    logger.error(f"Live feed poll error: {e}")
+                # Fixed cadence: sleep whatever is left of the interval
+                wait = max(0.0, self.poll_interval - (time.monotonic() - started))
+                await asyncio.to_thread(self._stop.wait, wait)
+
+    async def poll_once(self, http: httpx.AsyncClient) -> Dict[str, InstrumentSnapshot]:
+        """Poll every instrument concurrently, then publish one new snapshot dict."""
+        states = [self._states[s] for s in self.symbols]
+        results = await asyncio.gather(*(self._poll_symbol(http, st) for st in states), return_exceptions=True)
+
+        snapshots = {}
+        for state, result in zip(states, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Live feed poll failed for {state.symbol}: {result}")
+                previous = state.snapshot or InstrumentSnapshot(
+                    state.symbol, state.contract_id, pd.DataFrame(columns=BAR_COLUMNS), None, state.atr, None
+                )
+                result = InstrumentSnapshot(
+                    previous.symbol, previous.contract_id, previous.bars, previous.price,
+                    previous.atr, previous.updated_at, error=str(result),
+                )
+            state.snapshot = result
+            snapshots[state.symbol] = result
+
+        if self.persist:
+            batches = {st.symbol: st.new_bars for st in states if st.new_bars is not None and not st.new_bars.empty}
+            if batches:
+                await asyncio.to_thread(self._write_bars, batches)
+        for state in states:
+            state.new_bars = None
+
+        self._snapshots = snapshots
+        return snapshots
+
+    def _write_bars(self, batches: Dict[str, pd.DataFrame]):
+        """Upsert every instrument's new bars into live_bars in one transaction."""
+        try:
+            if self._con is None:
+                self._con = duckdb.connect(self.db_path)
+                self._con.execute(LIVE_BARS_DDL)
+            self._con.begin()
+            for symbol, bars in batches.items():
+                # Same symbol LiveDataLoader uses for this contract (NQ -> MNQ)
+                upsert_live_bars(self._con, FEED_SYMBOLS.get(symbol, symbol), bars)
+            self._con.commit()
+        except Exception as e:
+            logger.warning(f"Live feed could not write live_bars: {e}")
+            try:
+                self._con.rollback()
+            except Exception:
+                pass
+
+    async def _poll_symbol(self, http: httpx.AsyncClient, state: _InstrumentState) -> InstrumentSnapshot:
+        contract = await asyncio.to_thread(self.client.active_contract, FEED_SYMBOLS.get(state.symbol, state.symbol))
+        if contract["id"] != state.contract_id:
+            # First poll or contract roll: start a fresh window
+            state.contract_id = contract["id"]
+            state.buffer.clear()
+            state.last_closed_ts = None
+
+        today = datetime.now(TZ_LOCAL).date()
+        if state.atr_date != today:
+            state.atr = await asyncio.to_thread(load_today_atr, state.symbol)
+            state.atr_date = today
+
+        end_utc = datetime.now(TZ_UTC)
+        cutoff = end_utc - timedelta(minutes=self.lookback_minutes)
+        if state.last_closed_ts is not None and state.last_closed_ts >= cutoff:
+            start_utc = state.last_closed_ts + timedelta(minutes=1)
+            limit = int((end_utc - start_utc).total_seconds() // 60) + 2
+        else:
+            state.buffer.clear()
+            start_utc, limit = cutoff, 20000
+
+        raw = await self.client.retrieve_bars_async(
+            http, state.contract_id,
+            start_utc.isoformat().replace("+00:00", "Z"), end_utc.isoformat().replace("+00:00", "Z"),
+            limit=limit, include_partial=True,
+        )
+        bars = bars_to_frame(raw)
+        state.new_bars = bars
+        state.buffer.merge(bars)
+        state.buffer.trim(to_ns(cutoff))
+
+        closed = bars["ts_utc"][bars["ts_utc"] <= end_utc - timedelta(minutes=1)] if not bars.empty else bars
+        if not closed.empty:
+            state.last_closed_ts = closed.max()
+
+        frame = state.buffer.to_frame()
+        price = float(frame["close"].iloc[-1]) if not frame.empty else None
+        return InstrumentSnapshot(state.symbol, state.contract_id, frame, price, state.atr, end_utc)
+
+
+def get_live_feed(**kwargs) -> LiveFeedManager:
+    """
+    The process-wide running feed (created and started on first call).
+
+    Streamlit sessions all live in one server process, so every open
+    dashboard shares this feed. kwargs only apply on first creation.
+    """
+    global _FEED
+    with _FEED_LOCK:
+        if _FEED is None:
+            _FEED = LiveFeedManager(**kwargs)
+        _FEED.start()
+        return _FEED
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless live bar ingest (ProjectX -> live_bars)")
+    parser.add_argument("--symbols", nargs="+", default=list(FEED_SYMBOLS), help="Instruments to poll")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between polls")
+    parser.add_argument("--db", default=DB_PATH, help="DuckDB file for live_bars")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    feed = LiveFeedManager(symbols=args.symbols, poll_interval=args.interval, persist=True, db_path=args.db)
+    feed.start()
+    try:
+        while feed.is_running():
+            time.sleep(60)
+            for snap in feed.snapshot().values():
+                logger.info(f"{snap.symbol}: {len(snap.bars)} bars, last {snap.price} ({snap.error or 'ok'})")
+    except KeyboardInterrupt:
+        feed.stop()
@@ -384,6 +384,10 @@ def add_setup_to_production(
         status['database'] = True
         logger.info(f"Added {result.config.instrument} {result.config.orb_time} to database")
 
+        # Live loaders pick up the new thresholds on their next read
+        from day_context import bump_setups_version
+        bump_setups_version()
+
         # Step 2: Generate config snippet for user to add manually
         # (Automatic config editing is risky - better to show user what to add)
         status['config'] = True  # User will add manually
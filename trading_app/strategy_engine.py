@@ -3,14 +3,15 @@ STRATEGY EVALUATION ENGINE
 Evaluates all known strategies and determines state + next action.
 """
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict
+from dataclasses import dataclass, replace
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 import logging
 
 from config import *
 from data_loader import LiveDataLoader
+from level_interaction import closed_back_inside
 
 logger = logging.getLogger(__name__)
 
@@ -60,16 +61,102 @@ class StrategyEvaluation:
     annual_trades: Optional[int] = None       # Annual trade frequency (260, 52)
 
 
+class OrbPhase(Enum):
+    """Event-driven ORB lifecycle (advanced only when a bar closes)."""
+    PREPARING = "PREPARING"    # Window still forming
+    FORMED = "FORMED"          # Window complete; levels + filter memoized
+    BROKEN = "BROKEN"          # First close outside the ORB; entry fixed
+    RESOLVED = "RESOLVED"      # Stop or target touched (or no ORB data)
+
+
+@dataclass
+class OrbTracker:
+    """
+    State machine for one ORB on one day.
+
+    advance() consumes closed bars in order; everything computed at a
+    transition (levels, filter result, entry/stop/target) is kept, so
+    re-evaluating between bar closes costs nothing.
+    """
+    orb_name: str
+    orb_start: datetime
+    orb_end: datetime
+    phase: OrbPhase = OrbPhase.PREPARING
+    last_bar_ts: Optional[datetime] = None
+    last_close: Optional[float] = None
+    orb_high: Optional[float] = None
+    orb_low: Optional[float] = None
+    filter_result: Optional[Dict] = None
+    breakout: Optional[StrategyEvaluation] = None
+    outcome: Optional[str] = None   # "TARGET" or "STOP"
+
+    def advance(self, engine: "StrategyEngine", config: Dict, bars: List[Dict]):
+        """Feed newly closed bars (oldest first)."""
+        for bar in bars:
+            self.last_bar_ts = bar["ts_local"]
+            bar_close_time = bar["ts_local"] + timedelta(minutes=1)
+
+            if self.phase == OrbPhase.PREPARING:
+                if bar_close_time < self.orb_end:
+                    continue
+                # Window complete: memoize levels and filter once
+                orb_hl = engine.loader.get_session_high_low(self.orb_start, self.orb_end)
+                if not orb_hl:
+                    self.phase = OrbPhase.RESOLVED
+                else:
+                    self.orb_high, self.orb_low = orb_hl["high"], orb_hl["low"]
+                    self.filter_result = engine.loader.check_orb_size_filter(self.orb_high, self.orb_low, self.orb_name)
+                    self.phase = OrbPhase.FORMED
+                if bar["ts_local"] < self.orb_end:
+                    continue  # Last ORB bar itself can't be the breakout
+
+            if self.phase == OrbPhase.FORMED:
+                self.last_close = bar["close"]
+                if not self.filter_result["pass"]:
+                    continue
+                if bar["close"] > self.orb_high or bar["close"] < self.orb_low:
+                    direction = "LONG" if bar["close"] > self.orb_high else "SHORT"
+                    self.breakout = engine._orb_breakout_eval(
+                        self.orb_name, config, self.orb_high, self.orb_low, self.filter_result,
+                        bar["close"], direction, engine._setup_info_cached(self.orb_name)
+                    )
+                    self.phase = OrbPhase.BROKEN
+                continue
+
+            if self.phase == OrbPhase.BROKEN:
+                b = self.breakout
+                long = b.direction == "LONG"
+                stopped = bar["low"] <= b.stop_price if long else bar["high"] >= b.stop_price
+                hit = bar["high"] >= b.target_price if long else bar["low"] <= b.target_price
+                if stopped or hit:
+                    # Same-bar ambiguity resolves conservatively to the stop
+                    self.outcome = "STOP" if stopped else "TARGET"
+                    self.phase = OrbPhase.RESOLVED
+
+
 class StrategyEngine:
     """
     Evaluates all strategies and enforces hierarchy.
+
+    event_driven=True caches each strategy's evaluation by its inputs
+    (clock phase, last closed bar, ORB tracker state) and advances per-ORB
+    state machines only when a new bar closes; evaluate_all() between bar
+    closes just returns the cached result.
     """
 
-    def __init__(self, data_loader: LiveDataLoader, ml_engine=None):
+    def __init__(self, data_loader: LiveDataLoader, ml_engine=None, event_driven: bool = False):
         self.loader = data_loader
         self.current_position = None  # Track if in a trade
         self.ml_engine = ml_engine  # Optional ML inference engine
 
+        # Event-driven mode state
+        self.event_driven = event_driven
+        self._orb_trackers: Dict[Tuple[str, datetime], OrbTracker] = {}
+        self._strategy_cache: Dict[str, Tuple[tuple, StrategyEvaluation]] = {}
+        self._result_cache: Optional[Tuple[tuple, StrategyEvaluation]] = None
+        self._setup_info: Dict[str, Optional[Dict]] = {}
+        self._last_closed_bar: Optional[Dict] = None
+
         # Load instrument-specific configs
         self.instrument = data_loader.symbol
         self._load_instrument_configs()
@@ -107,26 +194,38 @@ class StrategyEngine:
         Evaluate all strategies in priority order.
         Return the highest-priority actionable strategy.
         """
+        if self.event_driven:
+            return self._evaluate_all_incremental()
+
         evaluations = []
 
         # Evaluate each strategy
         for idx, strategy_name in enumerate(STRATEGY_PRIORITY):
-            if strategy_name == "MULTI_LIQUIDITY_CASCADE":
-                eval_result = self._evaluate_cascade()
-            elif strategy_name == "PROXIMITY_PRESSURE":
-                eval_result = self._evaluate_proximity()
-            elif strategy_name == "NIGHT_ORB":
-                eval_result = self._evaluate_night_orb()
-            elif strategy_name == "SINGLE_LIQUIDITY":
-                eval_result = self._evaluate_single_liquidity()
-            elif strategy_name == "DAY_ORB":
-                eval_result = self._evaluate_day_orb()
-            else:
+            eval_result = self._evaluate_strategy(strategy_name)
+            if eval_result is None:
                 continue
 
             eval_result.priority = idx
             evaluations.append(eval_result)
 
+        return self._select(evaluations)
+
+    def _evaluate_strategy(self, strategy_name: str) -> Optional[StrategyEvaluation]:
+        """Run one evaluator from STRATEGY_PRIORITY (None if unknown)."""
+        if strategy_name == "MULTI_LIQUIDITY_CASCADE":
+            return self._evaluate_cascade()
+        elif strategy_name == "PROXIMITY_PRESSURE":
+            return self._evaluate_proximity()
+        elif strategy_name == "NIGHT_ORB":
+            return self._evaluate_night_orb()
+        elif strategy_name == "SINGLE_LIQUIDITY":
+            return self._evaluate_single_liquidity()
+        elif strategy_name == "DAY_ORB":
+            return self._evaluate_day_orb()
+        return None
+
+    def _select(self, evaluations: List[StrategyEvaluation]) -> StrategyEvaluation:
+        """Hierarchy: first PREPARING/ACTIVE/READY wins (ML-enhanced), else first INVALID."""
         # Apply hierarchy: highest priority wins
         # If higher-tier is PREPARING or ACTIVE, disable all lower tiers
         active_eval = None
@@ -151,6 +250,148 @@ class StrategyEngine:
         )
         return fallback
 
+    # ========================================================================
+    # EVENT-DRIVEN EVALUATION
+    # ========================================================================
+
+    def _evaluate_all_incremental(self) -> StrategyEvaluation:
+        """
+        evaluate_all() for event_driven mode.
+
+        Each strategy is recomputed only when its input key changes; the final
+        (ML-enhanced) result is reused until any key changes.
+        """
+        now = datetime.now(TZ_LOCAL)
+        self._last_closed_bar = self.loader.get_last_closed_bar(now)
+        bar_ts = self._last_closed_bar["ts_utc"] if self._last_closed_bar else None
+
+        keys = []
+        evaluations = []
+        for idx, strategy_name in enumerate(STRATEGY_PRIORITY):
+            key = self._strategy_key(strategy_name, now, bar_ts)
+            cached = self._strategy_cache.get(strategy_name)
+            if cached and cached[0] == key:
+                eval_result = cached[1]
+            else:
+                eval_result = self._evaluate_strategy(strategy_name)
+                if eval_result is None:
+                    continue
+                eval_result.priority = idx
+                self._strategy_cache[strategy_name] = (key, eval_result)
+            keys.append(key)
+            evaluations.append(eval_result)
+
+        result_key = tuple(keys)
+        if self._result_cache and self._result_cache[0] == result_key:
+            return self._result_cache[1]
+
+        # Enhance a copy so cached per-strategy evaluations are never mutated
+        evaluations = [replace(e, reasons=list(e.reasons)) for e in evaluations]
+        result = self._select(evaluations)
+        self._result_cache = (result_key, result)
+        return result
+
+    def _strategy_key(self, strategy_name: str, now: datetime, bar_ts) -> tuple:
+        """Everything a strategy's evaluation depends on, at bar resolution."""
+        if strategy_name == "PROXIMITY_PRESSURE":
+            return ()
+        if strategy_name == "MULTI_LIQUIDITY_CASCADE":
+            return (now.date(), now.hour >= 23, bar_ts)
+        if strategy_name == "SINGLE_LIQUIDITY":
+            # Before 23:00 it reads no bars
+            return (now.date(), now.hour >= 23, bar_ts if now.hour >= 23 else None)
+
+        if strategy_name == "NIGHT_ORB":
+            if now.hour == 0 and now.minute >= 30:
+                orb_name = "0030"
+            elif now.hour == 23:
+                orb_name = "2300"
+            else:
+                return (None,)
+        elif strategy_name == "DAY_ORB":
+            orb_name = {9: "0900", 10: "1000", 11: "1100"}.get(now.hour)
+            if orb_name is None:
+                return (None,)
+        else:
+            return (now, bar_ts)
+
+        window = self._orb_window(orb_name, now)
+        if not window:
+            return (orb_name,)
+        # While forming only the PREPARING message applies; after that each closed bar
+        # advances the tracker
+        forming = now < window[1]
+        return (orb_name, window[0], forming, None if forming else bar_ts)
+
+    def _check_orb_tracked(self, orb_name: str) -> Optional[StrategyEvaluation]:
+        """_check_orb() backed by an OrbTracker fed with closed bars only."""
+        now = datetime.now(TZ_LOCAL)
+        config = self.orb_configs.get(orb_name)
+        if not config:
+            return None
+        if config.get("tier") == "SKIP":
+            return self._orb_skipped_eval(orb_name)
+
+        window = self._orb_window(orb_name, now)
+        if not window:
+            return None
+        orb_start, orb_end = window
+
+        if now < orb_end:
+            return self._orb_preparing_eval(orb_name, config, orb_start, orb_end)
+
+        tracker = self._orb_trackers.get((orb_name, orb_start))
+        if tracker is None:
+            # New day's ORB: drop finished trackers for this ORB
+            for key in [k for k in self._orb_trackers if k[0] == orb_name]:
+                del self._orb_trackers[key]
+            tracker = self._orb_trackers[(orb_name, orb_start)] = OrbTracker(orb_name, orb_start, orb_end)
+
+        # Feed only bars that closed since the last advance (ring-buffer range slice)
+        since = tracker.last_bar_ts + timedelta(minutes=1) if tracker.last_bar_ts else orb_start
+        until = now.replace(second=0, microsecond=0)
+        if since < until:
+            bars = self.loader.get_bars_in_range(since, until)
+            if not bars.empty:
+                tracker.advance(self, config, bars.to_dict("records"))
+
+        if tracker.phase == OrbPhase.PREPARING:
+            # Window closed but its last bar hasn't arrived yet
+            return self._orb_preparing_eval(orb_name, config, orb_start, orb_end)
+        if tracker.phase == OrbPhase.FORMED:
+            if not tracker.filter_result["pass"]:
+                return self._orb_filter_rejected_eval(orb_name, config, tracker.filter_result)
+            if tracker.last_close is None:
+                return self._orb_preparing_eval(orb_name, config, orb_start, orb_end)
+            return self._orb_inside_eval(orb_name, config, tracker.orb_high, tracker.orb_low, tracker.last_close)
+        if tracker.phase == OrbPhase.BROKEN:
+            return tracker.breakout
+        if tracker.outcome is None:
+            return None  # No ORB data for this window
+
+        b = tracker.breakout
+        hit = b.target_price if tracker.outcome == "TARGET" else b.stop_price
+        return StrategyEvaluation(
+            strategy_name=f"{orb_name}_ORB",
+            priority=self._orb_priority(config),
+            state=StrategyState.EXITED,
+            action=ActionType.STAND_DOWN,
+            reasons=[
+                f"{orb_name} ORB {b.direction} from {b.entry_price:.2f} resolved",
+                f"{'Target' if tracker.outcome == 'TARGET' else 'Stop'} touched at {hit:.2f}",
+            ],
+            next_instruction="Trade resolved - wait for next setup",
+            orb_high=tracker.orb_high,
+            orb_low=tracker.orb_low,
+            direction=b.direction,
+        )
+
+    def _setup_info_cached(self, orb_name: str) -> Optional[Dict]:
+        """_get_setup_info() once per ORB per engine (validated_setups is static intraday)."""
+        if orb_name not in self._setup_info:
+            self._setup_info[orb_name] = self._get_setup_info(orb_name)
+        return self._setup_info[orb_name]
+
     # ========================================================================
     # STRATEGY EVALUATORS (STUBS - FILL WITH REAL LOGIC)
     # ========================================================================
@@ -519,16 +760,16 @@ class StrategyEngine:
                 next_instruction="Monitor for London level sweep"
             )
 
+        # Acceptance failure at both London levels (one pass over the recent bars)
+        failed_high, failed_low = self._acceptance_failures(
+            levels=[london_hl["high"], london_hl["low"]],
+            directions=["UP", "DOWN"],
+            bars_to_check=SINGLE_LIQ_FAILURE_BARS
+        )
+
         # Check UPSIDE sweep (NY sweeps London high)
         if ny_hl["high"] > london_hl["high"]:
-            # Check for acceptance failure
-            acceptance_failed = self._check_acceptance_failure(
-                level=london_hl["high"],
-                direction="UP",
-                bars_to_check=SINGLE_LIQ_FAILURE_BARS
-            )
-
-            if acceptance_failed:
+            if failed_high:
                 # SINGLE LIQUIDITY ACTIVE
                 return StrategyEvaluation(
                     strategy_name="SINGLE_LIQUIDITY",
@@ -563,14 +804,7 @@ class StrategyEngine:
 
         # Check DOWNSIDE sweep (NY sweeps London low)
         if ny_hl["low"] < london_hl["low"]:
-            # Check for acceptance failure
-            acceptance_failed = self._check_acceptance_failure(
-                level=london_hl["low"],
-                direction="DOWN",
-                bars_to_check=SINGLE_LIQ_FAILURE_BARS
-            )
-
-            if acceptance_failed:
+            if failed_low:
                 # SINGLE LIQUIDITY ACTIVE
                 return StrategyEvaluation(
                     strategy_name="SINGLE_LIQUIDITY",
@@ -694,27 +928,15 @@ class StrategyEngine:
         Returns:
             True if acceptance failure detected (close back inside level)
         """
-        # Get recent bars
-        recent_bars = self.loader.fetch_latest_bars(lookback_minutes=bars_to_check * 5)
-
-        if recent_bars.empty or len(recent_bars) < bars_to_check:
-            return False
+        return bool(self._acceptance_failures([level], [direction], bars_to_check)[0])
 
-        # Check last N bars
-        last_n_bars = recent_bars.tail(bars_to_check)
+    def _acceptance_failures(self, levels: List[float], directions: List[str], bars_to_check: int) -> List[bool]:
+        """_check_acceptance_failure() for several levels in one vectorized pass over the last N bars."""
+        bars = self.loader.get_recent_bar_arrays(bars_to_check)
+        if bars is None or len(bars["close"]) < bars_to_check:
+            return [False] * len(levels)
 
-        if direction == "UP":
-            # For upside sweep: check if any bar has high > level AND close < level
-            for _, bar in last_n_bars.iterrows():
-                if bar["high"] > level and bar["close"] < level:
-                    return True
-        elif direction == "DOWN":
-            # For downside sweep: check if any bar has low < level AND close > level
-            for _, bar in last_n_bars.iterrows():
-                if bar["low"] < level and bar["close"] > level:
-                    return True
-
-        return False
+        return closed_back_inside(bars["high"], bars["low"], bars["close"], levels, directions).tolist()
 
     def _check_orb(self, orb_name: str) -> Optional[StrategyEvaluation]:
         """
@@ -726,6 +948,9 @@ class StrategyEngine:
         Returns:
             StrategyEvaluation if ORB is active, None otherwise
         """
+        if self.event_driven:
+            return self._check_orb_tracked(orb_name)
+
         now = datetime.now(TZ_LOCAL)
         config = self.orb_configs.get(orb_name)
 
@@ -734,46 +959,16 @@ class StrategyEngine:
 
         # Check if this ORB is skipped for this instrument (e.g., NQ 2300)
         if config.get("tier") == "SKIP":
-            return StrategyEvaluation(
-                strategy_name=f"{orb_name}_ORB",
-                priority=2 if orb_name in ["2300", "0030"] else 4,
-                state=StrategyState.INVALID,
-                action=ActionType.STAND_DOWN,
-                reasons=[
-                    f"{orb_name} ORB SKIPPED for {self.instrument}",
-                    "Negative expectancy on this instrument",
-                    "Strategy disabled by config"
-                ],
-                next_instruction=f"Skip {orb_name} - use other ORB times or strategies"
-            )
+            return self._orb_skipped_eval(orb_name)
 
-        # Find ORB time
-        orb_time = None
-        for orb in ORB_TIMES:
-            if orb["name"] == orb_name:
-                orb_time = orb
-                break
-
-        if not orb_time:
+        window = self._orb_window(orb_name, now)
+        if not window:
             return None
-
-        # Calculate ORB window
-        orb_start = now.replace(hour=orb_time["hour"], minute=orb_time["min"], second=0, microsecond=0)
-        orb_end = orb_start + timedelta(minutes=ORB_DURATION_MIN)
+        orb_start, orb_end = window
 
         # Are we in ORB formation window?
         if now < orb_end:
-            return StrategyEvaluation(
-                strategy_name=f"{orb_name}_ORB",
-                priority=2 if config["tier"] == "NIGHT" else 4,
-                state=StrategyState.PREPARING,
-                action=ActionType.PREPARE,
-                reasons=[
-                    f"{orb_name} ORB forming",
-                    f"Window: {orb_start.strftime('%H:%M')}-{orb_end.strftime('%H:%M')}"
-                ],
-                next_instruction=f"Wait for ORB completion at {orb_end.strftime('%H:%M')}"
-            )
+            return self._orb_preparing_eval(orb_name, config, orb_start, orb_end)
 
         # ORB complete, check for breakout
         orb_hl = self.loader.get_session_high_low(orb_start, orb_end)
@@ -783,26 +978,13 @@ class StrategyEngine:
 
         orb_high = orb_hl["high"]
         orb_low = orb_hl["low"]
-        orb_mid = (orb_high + orb_low) / 2
-        orb_size = orb_high - orb_low
 
         # Apply ORB size filter (NO LOOKAHEAD - computed at ORB close)
         filter_result = self.loader.check_orb_size_filter(orb_high, orb_low, orb_name)
 
         if not filter_result["pass"]:
             # ORB too large - reject trade
-            return StrategyEvaluation(
-                strategy_name=f"{orb_name}_ORB",
-                priority=2 if config["tier"] == "NIGHT" else 4,
-                state=StrategyState.INVALID,
-                action=ActionType.STAND_DOWN,
-                reasons=[
-                    f"ORB SIZE FILTER REJECTED",
-                    filter_result["reason"],
-                    "Large ORB = exhaustion pattern"
-                ],
-                next_instruction=f"Stand down - wait for next ORB or smaller ORB setup"
-            )
+            return self._orb_filter_rejected_eval(orb_name, config, filter_result)
 
         latest_bar = self.loader.get_latest_bar()
         if not latest_bar:
@@ -813,111 +995,148 @@ class StrategyEngine:
         # Check for breakout
         if current_price > orb_high:
             # LONG breakout
-            # Entry: First close outside ORB (aligned with canonical engine)
-            entry = current_price
-            stop = orb_mid if config["sl_mode"] == "HALF" else orb_low
-            risk = abs(entry - stop)  # Risk from ENTRY to STOP (not ORB high to stop)
-            target = entry + (config["rr"] * risk)
+            return self._orb_breakout_eval(orb_name, config, orb_high, orb_low, filter_result, current_price, "LONG")
+        elif current_price < orb_low:
+            # SHORT breakout
+            return self._orb_breakout_eval(orb_name, config, orb_high, orb_low, filter_result, current_price, "SHORT")
+        else:
+            # Inside ORB range, waiting
+            return self._orb_inside_eval(orb_name, config, orb_high, orb_low, current_price)
 
-            # Calculate position sizing with Kelly multiplier
-            base_risk_pct = RISK_LIMITS["NIGHT_ORB" if config["tier"] == "NIGHT" else "DAY_ORB"]["default"]
-            size_multiplier = self.loader.get_position_size_multiplier(orb_name, filter_result["pass"])
-            adjusted_risk_pct = base_risk_pct * size_multiplier
+    def _orb_window(self, orb_name: str, now: datetime):
+        """(orb_start, orb_end) for orb_name on now's date, or None if unknown."""
+        for orb in ORB_TIMES:
+            if orb["name"] == orb_name:
+                orb_start = now.replace(hour=orb["hour"], minute=orb["min"], second=0, microsecond=0)
+                return orb_start, orb_start + timedelta(minutes=ORB_DURATION_MIN)
+        return None
 
-            size_note = f" | {size_multiplier:.2f}x size" if size_multiplier > 1.0 else ""
+    @staticmethod
+    def _orb_priority(config: Dict) -> int:
+        return 2 if config["tier"] == "NIGHT" else 4
 
-            # Get setup info from database (for tier, win_rate, etc.)
-            setup_info = self._get_setup_info(orb_name)
+    def _orb_skipped_eval(self, orb_name: str) -> StrategyEvaluation:
+        return StrategyEvaluation(
+            strategy_name=f"{orb_name}_ORB",
+            priority=2 if orb_name in ["2300", "0030"] else 4,
+            state=StrategyState.INVALID,
+            action=ActionType.STAND_DOWN,
+            reasons=[
+                f"{orb_name} ORB SKIPPED for {self.instrument}",
+                "Negative expectancy on this instrument",
+                "Strategy disabled by config"
+            ],
+            next_instruction=f"Skip {orb_name} - use other ORB times or strategies"
+        )
 
-            return StrategyEvaluation(
-                strategy_name=f"{orb_name}_ORB",
-                priority=2 if config["tier"] == "NIGHT" else 4,
-                state=StrategyState.READY,
-                action=ActionType.ENTER,
-                reasons=[
-                    f"{orb_name} ORB formed (High: ${orb_high:.2f}, Low: ${orb_low:.2f}, Size: {orb_size:.2f} pts)",
-                    f"ORB size filter PASSED ({orb_size:.2f} pts / {filter_result.get('atr', 0):.1f} ATR < threshold)" if filter_result["pass"] else f"ORB filter N/A (no filter on {orb_name})",
-                    f"First close outside ORB detected (Close: ${current_price:.2f} > High: ${orb_high:.2f})",
-                    f"{setup_info.get('tier', 'N/A')} tier setup ({setup_info.get('win_rate', 0):.1f}% win rate, {setup_info.get('annual_expectancy', 0):.0f}R/year expectancy)" if setup_info else f"Config: RR={config['rr']}, SL={config['sl_mode']}{size_note}"
-                ],
-                next_instruction=f"Enter long at ${entry:.2f}, stop at ${stop:.2f} (ORB {config['sl_mode'].lower()}), target at ${target:.2f} ({config['rr']}R)",
-                entry_price=entry,
-                stop_price=stop,
-                target_price=target,
-                risk_pct=adjusted_risk_pct,
-                # NEW FIELDS
-                setup_name=f"{orb_name} ORB {config['sl_mode']}",
-                setup_tier=setup_info.get('tier') if setup_info else None,
-                orb_high=orb_high,
-                orb_low=orb_low,
-                direction="LONG",
-                position_size=None,  # Will be calculated by UI/position sizing module
-                rr=config["rr"],
-                win_rate=setup_info.get('win_rate') if setup_info else None,
-                avg_r=setup_info.get('avg_r') if setup_info else None,
-                annual_trades=setup_info.get('annual_trades') if setup_info else None
-            )
+    def _orb_preparing_eval(self, orb_name: str, config: Dict, orb_start: datetime, orb_end: datetime) -> StrategyEvaluation:
+        return StrategyEvaluation(
+            strategy_name=f"{orb_name}_ORB",
+            priority=self._orb_priority(config),
+            state=StrategyState.PREPARING,
+            action=ActionType.PREPARE,
+            reasons=[
+                f"{orb_name} ORB forming",
+                f"Window: {orb_start.strftime('%H:%M')}-{orb_end.strftime('%H:%M')}"
+            ],
+            next_instruction=f"Wait for ORB completion at {orb_end.strftime('%H:%M')}"
+        )
 
-        elif current_price < orb_low:
-            # SHORT breakout
-            # Entry: First close outside ORB (aligned with canonical engine)
-            entry = current_price
+    def _orb_filter_rejected_eval(self, orb_name: str, config: Dict, filter_result: Dict) -> StrategyEvaluation:
+        return StrategyEvaluation(
+            strategy_name=f"{orb_name}_ORB",
+            priority=self._orb_priority(config),
+            state=StrategyState.INVALID,
+            action=ActionType.STAND_DOWN,
+            reasons=[
+                f"ORB SIZE FILTER REJECTED",
+                filter_result["reason"],
+                "Large ORB = exhaustion pattern"
+            ],
+            next_instruction=f"Stand down - wait for next ORB or smaller ORB setup"
+        )
+
+    def _orb_inside_eval(self, orb_name: str, config: Dict, orb_high: float, orb_low: float, current_price: float) -> StrategyEvaluation:
+        return StrategyEvaluation(
+            strategy_name=f"{orb_name}_ORB",
+            priority=self._orb_priority(config),
+            state=StrategyState.PREPARING,
+            action=ActionType.PREPARE,
+            reasons=[
+                f"{orb_name} ORB: {orb_low:.2f} - {orb_high:.2f}",
+                f"Current: {current_price:.2f} (inside range)"
+            ],
+            next_instruction=f"Wait for breakout above {orb_high:.2f} or below {orb_low:.2f}"
+        )
+
+    def _orb_breakout_eval(
+        self,
+        orb_name: str,
+        config: Dict,
+        orb_high: float,
+        orb_low: float,
+        filter_result: Dict,
+        current_price: float,
+        direction: str,
+        setup_info: Optional[Dict] = None
+    ) -> StrategyEvaluation:
+        """READY/ENTER evaluation for a first close outside the ORB."""
+        orb_mid = (orb_high + orb_low) / 2
+        orb_size = orb_high - orb_low
+        long = direction == "LONG"
+
+        # Entry: First close outside ORB (aligned with canonical engine)
+        entry = current_price
+        if long:
+            stop = orb_mid if config["sl_mode"] == "HALF" else orb_low
+        else:
             stop = orb_mid if config["sl_mode"] == "HALF" else orb_high
-            risk = abs(entry - stop)  # Risk from ENTRY to STOP (not ORB low to stop)
-            target = entry - (config["rr"] * risk)
+        risk = abs(entry - stop)  # Risk from ENTRY to STOP (not ORB edge to stop)
+        target = entry + (config["rr"] * risk) if long else entry - (config["rr"] * risk)
 
-            # Calculate position sizing with Kelly multiplier
-            base_risk_pct = RISK_LIMITS["NIGHT_ORB" if config["tier"] == "NIGHT" else "DAY_ORB"]["default"]
-            size_multiplier = self.loader.get_position_size_multiplier(orb_name, filter_result["pass"])
-            adjusted_risk_pct = base_risk_pct * size_multiplier
+        # Calculate position sizing with Kelly multiplier
+        base_risk_pct = RISK_LIMITS["NIGHT_ORB" if config["tier"] == "NIGHT" else "DAY_ORB"]["default"]
+        size_multiplier = self.loader.get_position_size_multiplier(orb_name, filter_result["pass"])
+        adjusted_risk_pct = base_risk_pct * size_multiplier
 
-            size_note = f" | {size_multiplier:.2f}x size" if size_multiplier > 1.0 else ""
+        size_note = f" | {size_multiplier:.2f}x size" if size_multiplier > 1.0 else ""
 
-            # Get setup info from database (for tier, win_rate, etc.)
+        # Get setup info from database (for tier, win_rate, etc.)
+        if setup_info is None:
             setup_info = self._get_setup_info(orb_name)
 
-            return StrategyEvaluation(
-                strategy_name=f"{orb_name}_ORB",
-                priority=2 if config["tier"] == "NIGHT" else 4,
-                state=StrategyState.READY,
-                action=ActionType.ENTER,
-                reasons=[
-                    f"{orb_name} ORB formed (High: ${orb_high:.2f}, Low: ${orb_low:.2f}, Size: {orb_size:.2f} pts)",
-                    f"ORB size filter PASSED ({orb_size:.2f} pts / {filter_result.get('atr', 0):.1f} ATR < threshold)" if filter_result["pass"] else f"ORB filter N/A (no filter on {orb_name})",
-                    f"First close outside ORB detected (Close: ${current_price:.2f} < Low: ${orb_low:.2f})",
-                    f"{setup_info.get('tier', 'N/A')} tier setup ({setup_info.get('win_rate', 0):.1f}% win rate, {setup_info.get('annual_expectancy', 0):.0f}R/year expectancy)" if setup_info else f"Config: RR={config['rr']}, SL={config['sl_mode']}{size_note}"
-                ],
-                next_instruction=f"Enter short at ${entry:.2f}, stop at ${stop:.2f} (ORB {config['sl_mode'].lower()}), target at ${target:.2f} ({config['rr']}R)",
-                entry_price=entry,
-                stop_price=stop,
-                target_price=target,
-                risk_pct=adjusted_risk_pct,
-                # NEW FIELDS
-                setup_name=f"{orb_name} ORB {config['sl_mode']}",
-                setup_tier=setup_info.get('tier') if setup_info else None,
-                orb_high=orb_high,
-                orb_low=orb_low,
-                direction="SHORT",
-                position_size=None,  # Will be calculated by UI/position sizing module
-                rr=config["rr"],
-                win_rate=setup_info.get('win_rate') if setup_info else None,
-                avg_r=setup_info.get('avg_r') if setup_info else None,
-                annual_trades=setup_info.get('annual_trades') if setup_info else None
-            )
+        close_vs_orb = (f"Close: ${current_price:.2f} > High: ${orb_high:.2f}" if long
+                        else f"Close: ${current_price:.2f} < Low: ${orb_low:.2f}")
+        side = "long" if long else "short"
 
-        else:
-            # Inside ORB range, waiting
-            return StrategyEvaluation(
-                strategy_name=f"{orb_name}_ORB",
-                priority=2 if config["tier"] == "NIGHT" else 4,
-                state=StrategyState.PREPARING,
-                action=ActionType.PREPARE,
-                reasons=[
-                    f"{orb_name} ORB: {orb_low:.2f} - {orb_high:.2f}",
-                    f"Current: {current_price:.2f} (inside range)"
-                ],
-                next_instruction=f"Wait for breakout above {orb_high:.2f} or below {orb_low:.2f}"
-            )
+        return StrategyEvaluation(
+            strategy_name=f"{orb_name}_ORB",
+            priority=self._orb_priority(config),
+            state=StrategyState.READY,
+            action=ActionType.ENTER,
+            reasons=[
+                f"{orb_name} ORB formed (High: ${orb_high:.2f}, Low: ${orb_low:.2f}, Size: {orb_size:.2f} pts)",
+                f"ORB size filter PASSED ({orb_size:.2f} pts / {filter_result.get('atr', 0):.1f} ATR < threshold)" if filter_result["pass"] else f"ORB filter N/A (no filter on {orb_name})",
+                f"First close outside ORB detected ({close_vs_orb})",
+                f"{setup_info.get('tier', 'N/A')} tier setup ({setup_info.get('win_rate', 0):.1f}% win rate, {setup_info.get('annual_expectancy', 0):.0f}R/year expectancy)" if setup_info else f"Config: RR={config['rr']}, SL={config['sl_mode']}{size_note}"
+            ],
+            next_instruction=f"Enter {side} at ${entry:.2f}, stop at ${stop:.2f} (ORB {config['sl_mode'].lower()}), target at ${target:.2f} ({config['rr']}R)",
+            entry_price=entry,
+            stop_price=stop,
+            target_price=target,
+            risk_pct=adjusted_risk_pct,
+            # NEW FIELDS
+            setup_name=f"{orb_name} ORB {config['sl_mode']}",
+            setup_tier=setup_info.get('tier') if setup_info else None,
+            orb_high=orb_high,
+            orb_low=orb_low,
+            direction=direction,
+            position_size=None,  # Will be calculated by UI/position sizing module
+            rr=config["rr"],
+            win_rate=setup_info.get('win_rate') if setup_info else None,
+            avg_r=setup_info.get('avg_r') if setup_info else None,
+            annual_trades=setup_info.get('annual_trades') if setup_info else None
+        )
 
     # ========================================================================
     # ML INTEGRATION